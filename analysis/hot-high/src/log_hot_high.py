@@ -0,0 +1,67 @@
+# log_hot_high.py
+#
+# Usage: python3 log_hot_high.py /path/to/cfg.json /path/to/log/ [cruise|field]
+#  Reads the configuration JSON file and writes the results to the log directory
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file
+#  /path/to/log/: destination directory for log files
+#  cruise|field: grid altitude (optional; default cruise); cruise varies the
+#   cruise height above the field from 1000 ft to 5000 ft with the mission
+#   profile rescaled at constant range, field varies the field elevation from
+#   0 m to 3000 m with the mission profile kept
+# Output:
+#  Sized design at every altitude and ISA temperature offset from -20 K to
+#  +35 K (hot-high.csv, one row per grid point) and 2-D tables of the sized
+#  MTOW, single EPU mass, total mission energy and hover climb electric power
+#  (hot-high.txt)
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import numpy as np
+import sys
+
+# path to evtolpy package
+sys.path.append('../../../evtol')
+from batch import params_from_config
+from config import load_config
+from hot_high import calc_condition_grid, format_condition_table, write_condition_csv
+
+# constants
+FT_2_M = 0.3048
+
+# grid axes
+CRUISE_HEIGHTS_M = np.arange(1000.0, 5001.0, 250.0)*FT_2_M
+FIELD_ALTS_M = np.arange(0.0, 3001.0, 250.0)
+TEMP_OFFSETS_K = np.arange(-20.0, 36.0, 5.0)
+
+# outputs tabulated in hot-high.txt
+TABLE_OUTPUTS = (
+    "max_takeoff_mass_kg",
+    "single_epu_mass_kg",
+    "total_mission_energy_kw_hr",
+    "hover_climb_avg_electric_power_kw",
+)
+
+if len(sys.argv) in (3, 4):
+    cfg = sys.argv[1]
+    log_dir = sys.argv[2]
+    if log_dir[-1] != '/':
+        log_dir += '/'
+    altitude = sys.argv[3] if len(sys.argv) == 4 else "cruise"
+else:
+    print("Usage: python3 log_hot_high.py /path/to/cfg.json /path/to/log/ [cruise|field]")
+    exit()
+
+params = params_from_config(load_config(cfg))
+alts_m = CRUISE_HEIGHTS_M if altitude == "cruise" else FIELD_ALTS_M
+result = calc_condition_grid(params, alts_m, TEMP_OFFSETS_K, altitude=altitude)
+
+write_condition_csv(result, log_dir + "hot-high.csv")
+with open(log_dir + "hot-high.txt", "w") as txt_file:
+    txt_file.write(f"grid altitude: {altitude}\n\n")
+    txt_file.write("\n\n".join(format_condition_table(result, name) for name in TABLE_OUTPUTS))
+    txt_file.write("\n")
@@ -0,0 +1,73 @@
+# plt_hot_high.py
+#
+# Usage: python3 plt_hot_high.py /path/to/log/ /path/to/plt/
+#  Reads the log CSV file written by log_hot_high.py and saves the plots to the
+#  plt directory
+#  Ensure that the Python virtual environment (venv) is enabled after running
+#  setup_dependencies.sh: source p3-env/bin/activate
+# Parameters:
+#  /path/to/log/: directory with hot-high.csv
+#  /path/to/plt/: destination directory for plot files
+# Output:
+#  Heatmaps of the sized MTOW, single EPU mass, total mission energy and hover
+#  climb electric power over altitude and temperature offset
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv
+import matplotlib.pyplot as plt
+import numpy as np
+import sys
+
+# grid output -> colorbar label
+HEATMAPS = {
+    "max_takeoff_mass_kg": "Sized MTOW (kg)",
+    "single_epu_mass_kg": "Single EPU Mass (kg)",
+    "total_mission_energy_kw_hr": "Total Mission Energy (kWh)",
+    "hover_climb_avg_electric_power_kw": "Hover Climb Electric Power (kW)",
+}
+
+if len(sys.argv) == 3:
+    log_dir = sys.argv[1]
+    out_dir = sys.argv[2]
+    if log_dir[-1] != '/':
+        log_dir += '/'
+    if out_dir[-1] != '/':
+        out_dir += '/'
+else:
+    print("Usage: python3 plt_hot_high.py /path/to/log/ /path/to/plt/")
+    exit()
+
+# read the grid CSV: {column: 2-D array}, rows by altitude, columns by
+# temperature offset (the order written by log_hot_high.py)
+with open(log_dir + "hot-high.csv", "r", newline="") as csvfile:
+    rows = list(csv.DictReader(csvfile))
+temp_offsets_k = sorted({float(row["temp_offset_k"]) for row in rows})
+shape = (len(rows)//len(temp_offsets_k), len(temp_offsets_k))
+grid = {
+    name: np.array([float(row[name]) for row in rows]).reshape(shape)
+    for name in ["alt_m", "field_alt_m"] + list(HEATMAPS)
+}
+
+# cruise-height grids have one field elevation, field grids one per row
+if np.all(grid["field_alt_m"] == grid["field_alt_m"][0, 0]):
+    y_label = "Cruise Height Above Field (m)"
+else:
+    y_label = "Field Elevation (m)"
+alts_m = grid["alt_m"][:, 0]
+
+fig, axes = plt.subplots(2, 2, figsize=(12, 9))
+for ax, (name, label) in zip(axes.ravel(), HEATMAPS.items()):
+    image = ax.pcolormesh(temp_offsets_k, alts_m, np.ma.masked_invalid(grid[name]),
+                          shading="nearest", cmap="viridis")
+    fig.colorbar(image, ax=ax, label=label)
+    ax.set_xlabel("ISA Temperature Offset (K)")
+    ax.set_ylabel(y_label)
+    ax.set_title(label)
+fig.suptitle("Hot/High-Day Sizing")
+fig.tight_layout()
+fig.savefig(out_dir + "hot-high.pdf", format="pdf")
@@ -0,0 +1,57 @@
+# log_payload_range.py
+#
+# Usage: python3 log_payload_range.py /path/to/cfg.json /path/to/log/ [batt_mass_limit_kg]
+#  Reads the configuration JSON file and writes the results to the log directory
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file
+#  /path/to/log/: destination directory for log files
+#  batt_mass_limit_kg: battery (pack) mass limit (optional; default no limit)
+# Output:
+#  Payload-range envelope (payload-range.csv) for payloads from zero to three
+#  times the configured payload, and range-endurance envelope
+#  (range-endurance.csv) for cruise speeds from half to one and a half times
+#  the configured cruise speed, both at the configured MTOW as the MTOW limit
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import numpy as np
+import sys
+
+# path to evtolpy package
+sys.path.append('../../../evtol')
+from batch import params_from_config
+from config import load_config
+from payload_range import calc_payload_range, calc_range_endurance, write_envelope_csv
+
+# envelope points
+N_POINTS = 500
+
+if len(sys.argv) in (3, 4):
+    cfg = sys.argv[1]
+    log_dir = sys.argv[2]
+    if log_dir[-1] != '/':
+        log_dir += '/'
+    batt_mass_limit_kg = float(sys.argv[3]) if len(sys.argv) == 4 else None
+else:
+    print("Usage: python3 log_payload_range.py /path/to/cfg.json /path/to/log/ [batt_mass_limit_kg]")
+    exit()
+
+params = params_from_config(load_config(cfg))
+
+# payload-range envelope
+payloads_kg = np.linspace(0.0, 3.0*params['payload_kg'], N_POINTS)
+write_envelope_csv(
+    calc_payload_range(params, payloads_kg, batt_mass_limit_kg=batt_mass_limit_kg),
+    log_dir + "payload-range.csv"
+)
+
+# range-endurance envelope
+speeds_m_p_s = np.linspace(0.5, 1.5, N_POINTS)*params['cruise_h_m_p_s']
+write_envelope_csv(
+    calc_range_endurance(params, speeds_m_p_s, batt_mass_limit_kg=batt_mass_limit_kg),
+    log_dir + "range-endurance.csv"
+)
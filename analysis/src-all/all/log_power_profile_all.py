@@ -14,13 +14,11 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import csv # csv
 import sys # argv
 
 # path to directory containing evtolpy package; use before deploying as package
 sys.path.append('../../../evtol')
 from aircraft import Aircraft
-from mission import Mission
 
 # parse script arguments
 if len(sys.argv) == 3:
@@ -39,63 +37,5 @@ else:
 # create aircraft object 
 aircraft = Aircraft(cfg)
 
-# create mission object -
-mission = Mission(cfg)
-
-mission_segment_durations = [
-    mission.depart_taxi_s,
-    mission.hover_climb_s,
-    mission.trans_climb_s,
-    mission.depart_proc_s,
-    mission.accel_climb_s,
-    mission.cruise_s,
-    mission.decel_descend_s,
-    mission.arrive_proc_s,
-    mission.trans_descend_s,
-    mission.hover_descend_s,
-    mission.arrive_taxi_s,
-    mission.reserve_hover_climb_s,
-    mission.reserve_trans_climb_s,
-    mission.reserve_accel_climb_s,
-    mission.reserve_cruise_s,
-    mission.reserve_decel_descend_s,
-    mission.reserve_trans_descend_s,
-    mission.reserve_hover_descend_s,
-]
-
-power_values_kw = [
-    aircraft.depart_taxi_avg_electric_power_kw,
-    aircraft.hover_climb_avg_electric_power_kw,
-    aircraft.trans_climb_avg_electric_power_kw,
-    aircraft.depart_proc_avg_electric_power_kw,
-    aircraft.accel_climb_avg_electric_power_kw,
-    aircraft.cruise_avg_electric_power_kw,
-    aircraft.decel_descend_avg_electric_power_kw,
-    aircraft.arrive_proc_avg_electric_power_kw,
-    aircraft.trans_descend_avg_electric_power_kw,
-    aircraft.hover_descend_avg_electric_power_kw,
-    aircraft.arrive_taxi_avg_electric_power_kw,
-    aircraft.reserve_hover_climb_avg_electric_power_kw,
-    aircraft.reserve_trans_climb_avg_electric_power_kw,
-    aircraft.reserve_accel_climb_avg_electric_power_kw,
-    aircraft.reserve_cruise_avg_electric_power_kw,
-    aircraft.reserve_decel_descend_avg_electric_power_kw,
-    aircraft.reserve_trans_descend_avg_electric_power_kw,
-    aircraft.reserve_hover_descend_avg_electric_power_kw,
-]
-
-time_steps = []
-avg_power = []
-current_time = 0.0
-
-for power_kw, duration_s in zip(power_values_kw, mission_segment_durations):
-    for t in range(int(duration_s)):
-        time_steps.append(current_time + t)
-        avg_power.append(power_kw)
-    current_time += duration_s
-
-with open(log + 'power-profile-all.csv', 'w', newline='') as csvfile:
-    csvwriter = csv.writer(csvfile)
-    csvwriter.writerow(['time', 'avg_electric_power_kw'])
-    for t, p in zip(time_steps, avg_power):
-        csvwriter.writerow([f'{t:.3f}', f'{p:.6f}'])
\ No newline at end of file
+# stream the per-second power profile of the main and reserve missions to disk
+aircraft.write_power_profile_csv(log + 'power-profile-all.csv', dt_s=1.0)
@@ -0,0 +1,84 @@
+# plt_payload_range.py
+#
+# Usage: python3 plt_payload_range.py /path/to/log/ /path/to/plt/
+#  Reads the log CSV files written by log_payload_range.py and saves the plots
+#  to the plt directory
+#  Ensure that the Python virtual environment (venv) is enabled after running
+#  setup_dependencies.sh: source p3-env/bin/activate
+# Parameters:
+#  /path/to/log/: directory with payload-range.csv and range-endurance.csv
+#  /path/to/plt/: destination directory for plot files
+# Output:
+#  Payload-range and range-endurance diagrams, marked by binding constraint
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv
+import matplotlib.pyplot as plt
+import sys
+
+# binding constraint -> legend label
+LIMIT_LABELS = {
+    "mtow": "MTOW limited",
+    "battery": "Battery limited",
+    "cruise_s_max": "Cruise time bracket limited",
+}
+
+if len(sys.argv) == 3:
+    log_dir = sys.argv[1]
+    out_dir = sys.argv[2]
+    if log_dir[-1] != '/':
+        log_dir += '/'
+    if out_dir[-1] != '/':
+        out_dir += '/'
+else:
+    print("Usage: python3 plt_payload_range.py /path/to/log/ /path/to/plt/")
+    exit()
+
+# read an envelope CSV: {column: list}, skipping infeasible points
+def read_envelope(path):
+    with open(path, "r", newline="") as csvfile:
+        rows = [row for row in csv.DictReader(csvfile) if row["limit"] != "infeasible"]
+    return {
+        name: [row[name] if name == "limit" else float(row[name]) for row in rows]
+        for name in (rows[0] if rows else [])
+    }
+
+# plot y against x with one marker series per binding constraint
+def plot_by_limit(envelope, x_name, y_name):
+    plt.plot(envelope[x_name], envelope[y_name], "-", color="gray", linewidth=1)
+    for limit, label in LIMIT_LABELS.items():
+        points = [(x, y) for x, y, l in zip(envelope[x_name], envelope[y_name], envelope["limit"])
+                  if l == limit]
+        if points:
+            plt.plot([x for x, y in points], [y for x, y in points], ".", label=label)
+
+# payload-range diagram
+payload_range = read_envelope(log_dir + "payload-range.csv")
+if payload_range:
+    plt.figure(figsize=(10, 6))
+    plot_by_limit(payload_range, "mission_range_mi", "payload_kg")
+    plt.xlabel("Maximum Mission Range (mi)")
+    plt.ylabel("Payload (kg)")
+    plt.title("Payload-Range Diagram")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(out_dir + "payload-range.pdf", format="pdf")
+
+# range-endurance diagram
+range_endurance = read_envelope(log_dir + "range-endurance.csv")
+if range_endurance:
+    plt.figure(figsize=(10, 6))
+    plot_by_limit(range_endurance, "endurance_s", "mission_range_mi")
+    plt.xlabel("Maximum Main Mission Flight Time (s)")
+    plt.ylabel("Maximum Mission Range (mi)")
+    plt.title("Range-Endurance Diagram (Cruise Speed Varied)")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(out_dir + "range-endurance.pdf", format="pdf")
@@ -1,80 +1,136 @@
 # run_all.py
 #
+# Usage: python3 run_all.py [worker_count]
+#  Runs every analysis stage for every case-study configuration in a pool of
+#  worker processes. Log stages across all cases run in parallel; each plot
+#  stage is scheduled as soon as the log stage that writes its CSV finishes.
+#  Stages run in-process with runpy, so each worker imports matplotlib and
+#  evtolpy once and parses each configuration at most once.
+# Parameters:
+#  worker_count: number of worker processes (default: CPU count)
+# Output:
+#  Per-stage status, per-stage wall time summary, and total wall time
+#
 # Written by First Last
 # Other contributors: Khoa Nguyen
 #
 # See the LICENSE file for the license
 
 # import Python modules
-import subprocess
-
-# Run a shell command and print status.
-def run_command(cmd):
-    print(f"\n>>> Running: {cmd}")
-    result = subprocess.run(cmd, shell=True)
-    if result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
-    # else:
-    #     print(f"✅ Finished: {cmd}")
-
-def run_case(base_dir, config):
-    commands = [
-        # Energy
-        f"python log_mission_segment_energy.py {config} {base_dir}",
-        f"python plt_mission_segment_energy.py {base_dir}mission-segment-energy.csv {base_dir}",
-
-        # Power
-        f"python log_power_profile_all.py {config} {base_dir}",
-        f"python plt_power_profile_all.py {base_dir}power-profile-all.csv {base_dir}",
-
-        f"python log_power_all.py {config} {base_dir}",
-        f"python plt_power_all.py {base_dir}power-all.csv {base_dir}",
-
-        # Weight
-        f"python log_mass_breakdown.py {config} {base_dir}",
-        f"python plt_mass_breakdown.py {base_dir}mass-breakdown.csv {base_dir}",
-
-        f"python log_mtow_iteration.py {config} {base_dir}",
-        f"python plt_mtow_iteration.py {base_dir}mtow-iteration.csv {base_dir}",
-
-        # ABU (1): Assisted Takeoff
-        f"python log_mission_segment_abu_analysis_energy.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_energy.py {base_dir}mission-segment-abu-analysis-energy.csv {base_dir}",
-
-        # ABU (2.1): Extended Flight (Attached full-segment)
-        f"python log_mission_segment_abu_analysis_flight_extension.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_flight_extension.py {base_dir}mission-segment-abu-analysis-flight-extension.csv {base_dir}",
-
-        # ABU (2.2): Extended Flight (Detach-on-Depletion or End-of-Cruise)
-        f"python log_mission_segment_abu_analysis_flight_extension_detach_on_depletion_or_end.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_flight_extension_detach_on_depletion_or_end.py {base_dir}mission-segment-abu-analysis-flight-extension-detach-on-depletion-or-end.csv {base_dir}",
-
-        # ABU (3): Safety Landing
-        f"python log_mission_segment_abu_analysis_landing_safety_loiter.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_landing_safety_loiter.py {base_dir}mission-segment-abu-analysis-landing-safety-loiter.csv {base_dir}",
-
-        # ABU (3*): Safety Landing (No-ABU)
-        f"python log_mission_segment_abu_analysis_landing_safety_divert_baseline.py {config} {base_dir}",
-
-        # ABU (4.1): Common Case Economics (Baseline, non-ABU)
-        f"python log_mission_segment_abu_analysis_common_case_economics_baseline.py {config} {base_dir}",
-
-        # ABU (4.2): Common Case Economics (ABU, Assisted Takeoff, Overlap Charging, Daily Utilization, ABU Queuing)
-        f"python log_mission_segment_abu_analysis_common_case_economics_assisted_takeoff_overlap_charging_queuing_timeline.py {config} {base_dir}",
-
-        # ABU (4.3): Common Case Economics (ABU, Extended Flight Powered by ABU, Overlap Charging, Daily Utilization with Queuing)
-        f"python log_mission_segment_abu_analysis_common_case_economics_extended_flight_overlap_charging_queuing_timeline.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_common_case_economics_extended_flight_overlap_charging_queuing_timeline.py {base_dir}mission-segment-abu-analysis-common-case-economics-extended-flight-overlap-charging-queuing-timeline.csv {base_dir}",
-
-        # ABU (4.4): Common Case Economics (Combined: Assisted Takeoff + Extended Flight ABU, Overlap Charging, Daily Utilization with Queuing)
-        f"python log_mission_segment_abu_analysis_common_case_economics_combined_flight_overlap_charging_queuing_timeline.py {config} {base_dir}",
-        f"python plt_mission_segment_abu_analysis_common_case_economics_combined_flight_overlap_charging_queuing_timeline.py {base_dir}mission-segment-abu-analysis-common-case-economics-combined-flight-overlap-charging-queuing-timeline.csv {base_dir}",
-
-    ]
-
-    for cmd in commands:
-        run_command(cmd)
-
+import concurrent.futures # ProcessPoolExecutor, wait
+import os                 # cpu_count
+import runpy              # run_path
+import sys                # argv, path
+import time               # perf_counter
+import traceback          # format_exc
+
+# path to directory containing evtolpy package; use before deploying as package
+sys.path.append('../../../evtol')
+from config import load_config
+
+# comment above and uncomment below when ready to deploy as package
+#from ...config import load_config
+
+# Analysis stages per case: (log script, CSV written by the log script,
+# plot script reading that CSV or None)
+STAGES = [
+    # Energy
+    ("log_mission_segment_energy.py",
+     "mission-segment-energy.csv",
+     "plt_mission_segment_energy.py"),
+
+    # Power
+    ("log_power_profile_all.py",
+     "power-profile-all.csv",
+     "plt_power_profile_all.py"),
+    ("log_power_all.py",
+     "power-all.csv",
+     "plt_power_all.py"),
+
+    # Weight
+    ("log_mass_breakdown.py",
+     "mass-breakdown.csv",
+     "plt_mass_breakdown.py"),
+    ("log_mtow_iteration.py",
+     "mtow-iteration.csv",
+     "plt_mtow_iteration.py"),
+
+    # ABU (1): Assisted Takeoff
+    ("log_mission_segment_abu_analysis_energy.py",
+     "mission-segment-abu-analysis-energy.csv",
+     "plt_mission_segment_abu_analysis_energy.py"),
+
+    # ABU (2.1): Extended Flight (Attached full-segment)
+    ("log_mission_segment_abu_analysis_flight_extension.py",
+     "mission-segment-abu-analysis-flight-extension.csv",
+     "plt_mission_segment_abu_analysis_flight_extension.py"),
+
+    # ABU (2.2): Extended Flight (Detach-on-Depletion or End-of-Cruise)
+    ("log_mission_segment_abu_analysis_flight_extension_detach_on_depletion_or_end.py",
+     "mission-segment-abu-analysis-flight-extension-detach-on-depletion-or-end.csv",
+     "plt_mission_segment_abu_analysis_flight_extension_detach_on_depletion_or_end.py"),
+
+    # ABU (3): Safety Landing
+    ("log_mission_segment_abu_analysis_landing_safety_loiter.py",
+     "mission-segment-abu-analysis-landing-safety-loiter.csv",
+     "plt_mission_segment_abu_analysis_landing_safety_loiter.py"),
+
+    # ABU (3*): Safety Landing (No-ABU)
+    ("log_mission_segment_abu_analysis_landing_safety_divert_baseline.py",
+     None,
+     None),
+
+    # ABU (4.1): Common Case Economics (Baseline, non-ABU)
+    ("log_mission_segment_abu_analysis_common_case_economics_baseline.py",
+     None,
+     None),
+
+    # ABU (4.2): Common Case Economics (ABU, Assisted Takeoff, Overlap Charging, Daily Utilization, ABU Queuing)
+    ("log_mission_segment_abu_analysis_common_case_economics_assisted_takeoff_overlap_charging_queuing_timeline.py",
+     None,
+     None),
+
+    # ABU (4.3): Common Case Economics (ABU, Extended Flight Powered by ABU, Overlap Charging, Daily Utilization with Queuing)
+    ("log_mission_segment_abu_analysis_common_case_economics_extended_flight_overlap_charging_queuing_timeline.py",
+     "mission-segment-abu-analysis-common-case-economics-extended-flight-overlap-charging-queuing-timeline.csv",
+     "plt_mission_segment_abu_analysis_common_case_economics_extended_flight_overlap_charging_queuing_timeline.py"),
+
+    # ABU (4.4): Common Case Economics (Combined: Assisted Takeoff + Extended Flight ABU, Overlap Charging, Daily Utilization with Queuing)
+    ("log_mission_segment_abu_analysis_common_case_economics_combined_flight_overlap_charging_queuing_timeline.py",
+     "mission-segment-abu-analysis-common-case-economics-combined-flight-overlap-charging-queuing-timeline.csv",
+     "plt_mission_segment_abu_analysis_common_case_economics_combined_flight_overlap_charging_queuing_timeline.py"),
+]
+
+# Worker initializer: import heavy modules once per worker process.
+def init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot # noqa: F401
+    import aircraft          # noqa: F401
+
+# Run one analysis script in this process as if invoked from the command line.
+# Returns (script, args, ok, wall time [s], error message).
+def run_stage(script, args):
+    import matplotlib.pyplot as plt
+    argv = sys.argv
+    sys.argv = [script] + list(args)
+    t_start = time.perf_counter()
+    ok = True
+    error = ''
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        # scripts call exit() on bad arguments
+        if e.code not in (None, 0):
+            ok = False
+            error = f"exit code {e.code}"
+    except Exception:
+        ok = False
+        error = traceback.format_exc()
+    finally:
+        sys.argv = argv
+        plt.close('all')
+    return script, args, ok, time.perf_counter()-t_start, error
 
 def main():
     # Case study
@@ -130,9 +186,62 @@ def main():
          "../../cfg-case-study/low-altitude-1500-ft/supernal/60-miles/Supernal-S-A2-1500-60.json"),
     ]
 
-    # Run all active cases
+    # parse script arguments
+    if len(sys.argv) == 2:
+        worker_count = int(sys.argv[1])
+    elif len(sys.argv) == 1:
+        worker_count = os.cpu_count() or 1
+    else:
+        print('Usage: python3 run_all.py [worker_count]')
+        exit()
+
+    # Parse every configuration once up front; forked workers inherit the
+    # parsed configurations and other start methods parse each at most once.
     for base_dir, config in cases:
-        run_case(base_dir, config)
+        load_config(config)
+
+    t_start = time.perf_counter()
+    stage_times = {}
+    failures = []
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=worker_count, initializer=init_worker
+    ) as pool:
+        # All log stages are independent; submit them at once.
+        pending = {}
+        for base_dir, config in cases:
+            for log_script, csv_name, plt_script in STAGES:
+                future = pool.submit(run_stage, log_script, (config, base_dir))
+                pending[future] = (base_dir, csv_name, plt_script)
+
+        # Schedule each plot stage as soon as its CSV has been written.
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                base_dir, csv_name, plt_script = pending.pop(future)
+                script, args, ok, wall_s, error = future.result()
+                stage_times.setdefault(script, []).append(wall_s)
+                status = 'ok' if ok else 'FAILED'
+                print(f"[{status}] {wall_s:8.3f} s  {script} {' '.join(args)}")
+                if not ok:
+                    failures.append((script, args, error))
+                    continue
+                if plt_script is not None:
+                    plt_future = pool.submit(
+                        run_stage, plt_script, (base_dir + csv_name, base_dir)
+                    )
+                    pending[plt_future] = (base_dir, None, None)
+    total_s = time.perf_counter()-t_start
+
+    # Per-stage wall time summary across cases
+    print(f"\n{'stage':<110}{'runs':>6}{'total_s':>10}{'max_s':>10}")
+    for script, times in sorted(stage_times.items(), key=lambda kv: -sum(kv[1])):
+        print(f"{script:<110}{len(times):>6}{sum(times):>10.3f}{max(times):>10.3f}")
+    print(f"\n{len(failures)} failed stage(s); wall time {total_s:.3f} s "
+          f"with {worker_count} worker(s)")
+    for script, args, error in failures:
+        print(f"\n❌ {script} {' '.join(args)}\n{error}")
 
 
 if __name__ == "__main__":
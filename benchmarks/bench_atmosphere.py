@@ -0,0 +1,60 @@
+# bench_atmosphere.py
+#
+# Usage: python3 bench_atmosphere.py [designs]
+#  Compares ISA table lookups against analytic evaluation for scalars and
+#  arrays, and times the batched MTOW solver with fixed and ISA environs
+# Parameters:
+#  designs: designs per MTOW solve (default 10000)
+# Output:
+#  Time per evaluation of each path and the ISA overhead of the MTOW solver
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # argv
+import time        # perf_counter
+import numpy as np # arrays
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from atmosphere import ISA_TABLE, calc_isa
+from batch import params_from_config, solve_batch_mtow
+from config import load_config
+
+# best wall time [s] of repeat calls of f
+def best_time_s(f, repeat=5):
+  times = []
+  for i in range(repeat):
+    t_start = time.perf_counter()
+    f()
+    times.append(time.perf_counter()-t_start)
+  return min(times)
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+rng = np.random.default_rng(0)
+
+print(f"{'path':>34}{'points':>10}{'time_us':>12}")
+for points in (1, 1000, 1000000):
+  alt_m = 500.0 if points == 1 else rng.uniform(0.0, 5000.0, points)
+  calls = max(1, 10000//points)
+  for label, f in (('analytic, all properties', lambda: calc_isa(alt_m, 15.0)),
+                   ('table, all properties', lambda: ISA_TABLE.lookup(alt_m, 15.0)),
+                   ('analytic, density', lambda: calc_isa(alt_m, 15.0)['air_density_kg_p_m3']),
+                   ('table, density', lambda: ISA_TABLE.air_density_kg_p_m3(alt_m, 15.0))):
+    t_s = best_time_s(lambda: [f() for i in range(calls)])/calls
+    print(f"{label:>34}{points:>10}{t_s*1e6:>12.1f}")
+
+ijson = load_config('../sample-inputs/test-all.json')
+params = params_from_config(ijson)
+params['payload_kg'] = np.linspace(200.0, 600.0, n)
+ijson['environ'] = {'g_m_p_s2': 9.81, 'atmosphere': 'isa', 'field_alt_m': 457.2,
+                    'max_alt_m': 1524.0, 'temp_offset_k': 15.0}
+isa = params_from_config(ijson)
+isa['payload_kg'] = params['payload_kg']
+t_fixed_s = best_time_s(lambda: solve_batch_mtow(params), 3)
+t_isa_s = best_time_s(lambda: solve_batch_mtow(isa), 3)
+print(f"MTOW solve of {n} designs: fixed {t_fixed_s:.3f} s, ISA {t_isa_s:.3f} s "
+      f"({100.0*(t_isa_s/t_fixed_s-1.0):+.1f}%)")
@@ -0,0 +1,76 @@
+# bench_batch.py
+#
+# Usage: python3 bench_batch.py [/path/to/cfg.json] [design_count]
+#  Measures mission-energy throughput of the vectorized batch engine against
+#  the scalar Aircraft model
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+#  design_count: number of candidate designs in the batch (default 100000)
+# Output:
+#  Designs per second for the scalar and batch evaluations, and the speedup
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy        # deepcopy
+import sys         # argv
+import time        # perf_counter
+import numpy as np # random designs
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import calc_batch_mission_energy, params_from_config
+from config import load_config
+
+# designs evaluated one at a time with the scalar model
+SCALAR_DESIGN_COUNT = 200
+
+# fields varied across designs, each uniform within +/-10% of the config value
+VARIED_FIELDS = [
+ ('aircraft', 'max_takeoff_mass_kg'),
+ ('aircraft', 'wingspan_m'),
+ ('aircraft', 'payload_kg'),
+ ('mission', 'cruise_h_m_p_s'),
+ ('mission', 'cruise_s'),
+ ('power', 'batt_spec_energy_w_h_p_kg'),
+ ('propulsion', 'rotor_diameter_m')
+]
+
+if len(sys.argv) > 3:
+  print("Usage: python3 bench_batch.py [/path/to/cfg.json] [design_count]")
+  exit()
+cfg = sys.argv[1] if len(sys.argv) > 1 else '../sample-inputs/test-all.json'
+design_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+ijson = load_config(cfg)
+rng = np.random.default_rng(0)
+params = params_from_config(ijson)
+for section, field in VARIED_FIELDS:
+  params[field] = \
+   ijson[section][field]*rng.uniform(0.9, 1.1, size=design_count)
+
+# scalar model: one Aircraft per design
+t_start = time.perf_counter()
+for i in range(SCALAR_DESIGN_COUNT):
+  design = copy.deepcopy(ijson)
+  for section, field in VARIED_FIELDS:
+    design[section][field] = float(params[field][i])
+  Aircraft.from_dict(design).battery_mass_kg
+t_scalar_s = time.perf_counter()-t_start
+scalar_rate = SCALAR_DESIGN_COUNT/t_scalar_s
+
+# batch engine: all designs at once
+t_start = time.perf_counter()
+calc_batch_mission_energy(params)
+t_batch_s = time.perf_counter()-t_start
+batch_rate = design_count/t_batch_s
+
+print(f"scalar: {SCALAR_DESIGN_COUNT} designs in {t_scalar_s:.4f} s, "
+      f"{scalar_rate:.0f} designs/s")
+print(f"batch:  {design_count} designs in {t_batch_s:.4f} s, "
+      f"{batch_rate:.0f} designs/s")
+print(f"speedup: {batch_rate/scalar_rate:.0f}x")
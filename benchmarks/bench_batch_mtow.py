@@ -0,0 +1,74 @@
+# bench_batch_mtow.py
+#
+# Usage: python3 bench_batch_mtow.py [/path/to/cfg.json] [design_count]
+#  Compares the batched MTOW solver against per-design Aircraft._iterate_mtow
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+#  design_count: number of candidate designs in the batch (default 10000)
+# Output:
+#  Designs per second and iteration counts for each solver
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy        # deepcopy
+import sys         # argv
+import time        # perf_counter
+import numpy as np # random designs
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import params_from_config, solve_batch_mtow
+from config import load_config
+
+# designs sized one at a time with Aircraft._iterate_mtow
+SCALAR_DESIGN_COUNT = 20
+
+# fields varied across designs, each uniform within +/-10% of the config value
+VARIED_FIELDS = [
+ ('aircraft', 'payload_kg'),
+ ('aircraft', 'wingspan_m'),
+ ('mission', 'cruise_s'),
+ ('power', 'batt_spec_energy_w_h_p_kg'),
+ ('propulsion', 'rotor_diameter_m')
+]
+
+if len(sys.argv) > 3:
+  print("Usage: python3 bench_batch_mtow.py [/path/to/cfg.json] [design_count]")
+  exit()
+cfg = sys.argv[1] if len(sys.argv) > 1 else '../sample-inputs/test-all.json'
+design_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+ijson = load_config(cfg)
+rng = np.random.default_rng(0)
+params = params_from_config(ijson)
+for section, field in VARIED_FIELDS:
+  params[field] = \
+   ijson[section][field]*rng.uniform(0.9, 1.1, size=design_count)
+
+# scalar solver: one Aircraft per design
+iterations = []
+t_start = time.perf_counter()
+for i in range(SCALAR_DESIGN_COUNT):
+  design = copy.deepcopy(ijson)
+  for section, field in VARIED_FIELDS:
+    design[section][field] = float(params[field][i])
+  mtow_kg, history = Aircraft.from_dict(design)._iterate_mtow()
+  iterations.append(len(history))
+t_scalar_s = time.perf_counter()-t_start
+print(f"{'_iterate_mtow':<22}{SCALAR_DESIGN_COUNT/t_scalar_s:>12.0f} designs/s"
+      f"{np.mean(iterations):>8.1f} mean iterations")
+
+# batched solvers: all designs at once
+for method in ('fixed_point', 'secant'):
+  t_start = time.perf_counter()
+  result = solve_batch_mtow(params, method=method)
+  t_batch_s = time.perf_counter()-t_start
+  print(f"{'batch '+method:<22}{design_count/t_batch_s:>12.0f} designs/s"
+        f"{result['iterations'].mean():>8.1f} mean iterations"
+        f"{int(result['converged'].sum()):>8d} converged"
+        f"{int(result['diverged'].sum()):>6d} diverged")
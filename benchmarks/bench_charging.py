@@ -0,0 +1,67 @@
+# bench_charging.py
+#
+# Usage: python3 bench_charging.py [combination_count]
+#  Measures CC-CV charge time throughput of the scalar Aircraft method against
+#  the vectorized function and the tabulated charger lookup
+# Parameters:
+#  combination_count: number of pack/SOC combinations (default 1000000)
+# Output:
+#  Combinations per second for each path, speedups, and the maximum relative
+#  error of the table against the exact result
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # argv
+import time        # perf_counter
+import numpy as np # random combinations
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from charging import calc_cccv_charge_time_hr, get_cccv_charge_table
+
+# combinations evaluated one at a time with the scalar method
+SCALAR_COMBINATION_COUNT = 20000
+
+# charger shared by all combinations
+P_CHARGER_AC_KW = 115.0
+C_RATE_MAX      = 1.5
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+rng = np.random.default_rng(0)
+E_pack_kwh = rng.uniform(50.0, 300.0, n)
+soc_start = rng.uniform(0.0, 0.9, n)
+
+aircraft = Aircraft('../sample-inputs/test-all.json')
+n_scalar = min(n, SCALAR_COMBINATION_COUNT)
+t_start = time.perf_counter()
+for i in range(n_scalar):
+  aircraft._estimate_cccv_charge_time_hr(
+    float(E_pack_kwh[i]), P_CHARGER_AC_KW, c_rate_max=C_RATE_MAX,
+    soc_start=float(soc_start[i])
+  )
+rate_scalar = n_scalar/(time.perf_counter()-t_start)
+
+t_start = time.perf_counter()
+exact = calc_cccv_charge_time_hr(E_pack_kwh, P_CHARGER_AC_KW, c_rate_max=C_RATE_MAX,
+                                 soc_start=soc_start)
+rate_vector = n/(time.perf_counter()-t_start)
+
+t_start = time.perf_counter()
+table = get_cccv_charge_table(P_CHARGER_AC_KW, 50.0, 300.0, c_rate_max=C_RATE_MAX)
+t_build_s = time.perf_counter()-t_start
+t_start = time.perf_counter()
+approx = table.t_charge_hr(E_pack_kwh, soc_start)
+rate_table = n/(time.perf_counter()-t_start)
+
+rel_err = np.max(np.abs(approx['t_charge_hr']-exact['t_charge_hr'])/exact['t_charge_hr'])
+print(f"combinations: {n}")
+print(f"scalar:  {rate_scalar:12.0f} combinations/s")
+print(f"vector:  {rate_vector:12.0f} combinations/s ({rate_vector/rate_scalar:.0f}x)")
+print(f"table:   {rate_table:12.0f} combinations/s ({rate_table/rate_scalar:.0f}x), "
+      f"built in {t_build_s*1e3:.2f} ms")
+print(f"table max relative error: {rel_err:.2e}")
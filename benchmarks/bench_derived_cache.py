@@ -0,0 +1,72 @@
+# bench_derived_cache.py
+#
+# Usage: python3 bench_derived_cache.py [/path/to/cfg.json]
+#  Times the MTOW iteration and the ABU evaluators with and without the
+#  Aircraft derived-quantity cache
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+# Output:
+#  Wall time per workload with the cache disabled and enabled, and the speedup
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys  # argv
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+
+# assisted-takeoff candidate shared by the ABU workloads
+CANDIDATES = [{
+  "name": "after_accel_climb",
+  "segments": ["depart_taxi","hover_climb","trans_climb","depart_proc","accel_climb"]
+}]
+E_ABU_KWH_LIST = list(range(5, 51, 5))
+
+WORKLOADS = [
+  ("_iterate_mtow",
+   lambda a: a._iterate_mtow()),
+  ("evaluate_abu_detach_candidates",
+   lambda a: a.evaluate_abu_detach_candidates(CANDIDATES)),
+  ("_evaluate_extended_flight",
+   lambda a: a._evaluate_extended_flight(E_ABU_KWH_LIST)),
+  ("_evaluate_extended_flight_detach_on_depletion_or_end",
+   lambda a: a._evaluate_extended_flight_detach_on_depletion_or_end(E_ABU_KWH_LIST)),
+  ("_evaluate_landing_safety_loiter",
+   lambda a: a._evaluate_landing_safety_loiter(E_ABU_KWH_LIST, 10.0, 300.0, 60.0)),
+  ("_evaluate_landing_safety_divert_baseline",
+   lambda a: a._evaluate_landing_safety_divert_baseline(10.0, 300.0, 60.0)),
+  ("_evaluate_common_case_abu_combined_flight_overlap_charging_queuing",
+   lambda a: a._evaluate_common_case_abu_combined_flight_overlap_charging_queuing(
+    CANDIDATES, E_ABU_KWH_LIST)),
+]
+
+# run workload on a freshly constructed aircraft and return wall time [s]
+def time_workload(cfg, workload, use_cache):
+  aircraft = Aircraft(cfg)
+  aircraft._cache.enabled = use_cache
+  t_start = time.perf_counter()
+  workload(aircraft)
+  return time.perf_counter()-t_start
+
+if len(sys.argv) == 2:
+  cfg = sys.argv[1]
+elif len(sys.argv) == 1:
+  cfg = '../sample-inputs/test-all.json'
+else:
+  print("Usage: python3 bench_derived_cache.py [/path/to/cfg.json]")
+  exit()
+
+print(f"{'workload':<70}{'uncached_s':>12}{'cached_s':>12}{'speedup':>10}")
+for name, workload in WORKLOADS:
+  t_uncached_s = time_workload(cfg, workload, False)
+  t_cached_s = time_workload(cfg, workload, True)
+  print(
+   f"{name:<70}{t_uncached_s:>12.4f}{t_cached_s:>12.4f}"
+   f"{t_uncached_s/max(t_cached_s, 1e-12):>9.1f}x"
+  )
@@ -0,0 +1,51 @@
+# bench_fleet.py
+#
+# Usage: python3 bench_fleet.py
+#  Times the fleet operations simulation for growing fleets and horizons
+# Parameters:
+#  None
+# Output:
+#  Simulated flights, wall time, and simulated flights per second
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import time # perf_counter
+import sys  # path
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from fleet import simulate_fleet_ops
+
+# (n_aircraft, n_vertiports, n_chargers_per_vertiport, n_abu_pool_per_vertiport)
+FLEETS = [
+  (10, 2, 3, 2),
+  (50, 5, 6, 4),
+  (200, 10, 12, 8),
+  (1000, 40, 15, 10),
+]
+HORIZONS_HR = [24.0, 24.0*7]
+
+print(
+ f"{'aircraft':>9}{'vertiports':>11}{'horizon_hr':>11}"
+ f"{'flights':>9}{'wall_s':>9}{'flights_per_s':>15}{'charger_util':>14}"
+)
+for n_aircraft, n_vertiports, n_chargers, n_abu_pool in FLEETS:
+  for daily_operation_hr in HORIZONS_HR:
+    t_start = time.perf_counter()
+    result = simulate_fleet_ops(
+      n_aircraft, n_vertiports, n_chargers, n_abu_pool,
+      t_flight_hr=0.31, t_ground_ops_hr=0.2833, t_charge_hr_main=0.6,
+      t_attach_hr=0.065, t_return_abu_hr=0.14, t_charge_hr_abu=0.5,
+      daily_operation_hr=daily_operation_hr
+    )
+    t_wall_s = time.perf_counter()-t_start
+    n_flights = result["n_flights_completed"]
+    print(
+     f"{n_aircraft:>9}{n_vertiports:>11}{daily_operation_hr:>11.0f}"
+     f"{n_flights:>9}{t_wall_s:>9.3f}{n_flights/max(t_wall_s, 1e-12):>15.0f}"
+     f"{result['charger_utilization_avg']:>14.3f}"
+    )
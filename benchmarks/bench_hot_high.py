@@ -0,0 +1,77 @@
+# bench_hot_high.py
+#
+# Usage: python3 bench_hot_high.py [altitudes] [temp_offsets]
+#  Times the hot/high-day condition grid of the sample design, one vectorized
+#  MTOW solve over all (cruise height, temperature offset) points, against a
+#  per-condition loop of the same function and against per-condition Aircraft
+#  sizing, as one config per condition would be run
+# Parameters:
+#  altitudes: cruise heights in the grid (default 40)
+#  temp_offsets: temperature offsets in the grid (default 25)
+# Output:
+#  Wall time and points per second of each path
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy        # deepcopy
+import sys         # argv
+import time        # perf_counter
+import numpy as np # grids
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import params_from_config
+from config import load_config
+from hot_high import calc_condition_grid, scale_cruise_height
+
+# per-condition paths are slow; time this many points and scale
+N_LOOP = 20
+
+n_alt = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+n_temp = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+ijson = load_config('../sample-inputs/test-all.json')
+params = params_from_config(ijson)
+alts_m = np.linspace(300.0, 1500.0, n_alt)
+temp_offsets_k = np.linspace(-20.0, 35.0, n_temp)
+n = n_alt*n_temp
+points = [(alts_m[i % n_alt], temp_offsets_k[i % n_temp]) for i in range(N_LOOP)]
+
+# one Aircraft per condition, sized from its own config
+def aircraft_mtow_kg(alt_m, temp_offset_k):
+  point = copy.deepcopy(ijson)
+  point['environ'] = {
+   'g_m_p_s2': ijson['environ']['g_m_p_s2'], 'atmosphere': 'isa', 'field_alt_m': 0.0,
+   'max_alt_m': alt_m, 'temp_offset_k': temp_offset_k
+  }
+  scaled = scale_cruise_height(params, alt_m)
+  for name in point['mission']:
+    point['mission'][name] = float(scaled[name])
+  return Aircraft.from_dict(point)._iterate_mtow()[0]
+
+t_start = time.perf_counter()
+for alt_m, temp_offset_k in points:
+  aircraft_mtow_kg(alt_m, temp_offset_k)
+t_aircraft_s = (time.perf_counter()-t_start)*n/N_LOOP
+
+t_start = time.perf_counter()
+for alt_m, temp_offset_k in points:
+  calc_condition_grid(params, [alt_m], [temp_offset_k])
+t_loop_s = (time.perf_counter()-t_start)*n/N_LOOP
+
+t_start = time.perf_counter()
+result = calc_condition_grid(params, alts_m, temp_offsets_k)
+t_grid_s = time.perf_counter()-t_start
+
+print(f"{'path':>28}{'points':>8}{'time_s':>9}{'points_p_s':>12}")
+for path, t_s in (('Aircraft per point (est.)', t_aircraft_s),
+                  ('grid per point (est.)', t_loop_s),
+                  ('grid vectorized', t_grid_s)):
+  print(f"{path:>28}{n:>8}{t_s:>9.3f}{n/t_s:>12.0f}")
+print(f"converged: {int(result['converged'].sum())}/{n}")
+print(f"sized MTOW range [kg]: {np.nanmin(result['max_takeoff_mass_kg']):.1f}"
+      f" to {np.nanmax(result['max_takeoff_mass_kg']):.1f}")
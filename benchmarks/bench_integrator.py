@@ -0,0 +1,81 @@
+# bench_integrator.py
+#
+# Usage: python3 bench_integrator.py [/path/to/cfg.json]
+#  Times the vectorized time-stepped mission integrator at several step sizes
+#  against a loop that evaluates the segment force models one step at a time,
+#  for a mission with an ABU detaching after the accelerate climb
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+# Output:
+#  Steps, best wall time and mission energy for each path and step size
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys  # argv
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from batch import S_P_HR, SEGMENTS, _calc_geometry, _calc_segment_shaft_power_kw, \
+ broadcast_params, params_from_config
+from config import load_config
+from integrator import integrate_mission
+
+M_ABU_KG = 150.0
+DETACH_SEGMENT = 'accel_climb'
+DT_S_LIST = [1.0, 0.1, 0.01]
+LOOP_DT_S_LIST = [1.0, 0.1]
+REPEATS = 5
+
+# one step at a time: segment force models at the current mass of each step
+def loop_mission_energy(params, dt_s):
+  p = broadcast_params(params)
+  g = _calc_geometry(p)
+  mass_kg = params['max_takeoff_mass_kg']
+  energy_kw_hr = 0.0
+  n_steps = 0
+  for name, duration_field in SEGMENTS:
+    n = max(int(round(params[duration_field]/dt_s)), 1)
+    step_s = params[duration_field]/n
+    for k in range(n):
+      p_step = dict(p, max_takeoff_mass_kg=mass_kg)
+      shaft_power_kw = float(_calc_segment_shaft_power_kw(p_step, g)[name])
+      energy_kw_hr += shaft_power_kw/params['epu_effic']*step_s/S_P_HR
+      n_steps += 1
+    if name == DETACH_SEGMENT:
+      mass_kg -= M_ABU_KG
+  return n_steps, energy_kw_hr
+
+# return the best wall time of f() and its last result
+def best_time(f, repeats):
+  times_s = []
+  for i in range(repeats):
+    t_start = time.perf_counter()
+    result = f()
+    times_s.append(time.perf_counter()-t_start)
+  return min(times_s), result
+
+if len(sys.argv) == 2:
+  cfg = sys.argv[1]
+elif len(sys.argv) == 1:
+  cfg = '../sample-inputs/test-all.json'
+else:
+  print("Usage: python3 bench_integrator.py [/path/to/cfg.json]")
+  exit()
+
+params = params_from_config(load_config(cfg))
+print(f"{'path':>12}{'dt_s':>7}{'steps':>9}{'time_ms':>11}{'energy_kwh':>12}")
+for dt_s in DT_S_LIST:
+  t_s, result = best_time(
+    lambda: integrate_mission(params, dt_s, mass_changes=[(DETACH_SEGMENT, -M_ABU_KG)]),
+    REPEATS
+  )
+  print(f"{'vectorized':>12}{dt_s:>7}{len(result['dt_s']):>9}{t_s*1e3:>11.2f}"
+        f"{result['energy_kw_hr'][-1]:>12.4f}")
+for dt_s in LOOP_DT_S_LIST:
+  t_s, (n_steps, energy_kw_hr) = best_time(lambda: loop_mission_energy(params, dt_s), 1)
+  print(f"{'loop':>12}{dt_s:>7}{n_steps:>9}{t_s*1e3:>11.2f}{energy_kw_hr:>12.4f}")
@@ -0,0 +1,67 @@
+# bench_montecarlo.py
+#
+# Usage: python3 bench_montecarlo.py [n_samples] [n_workers] [/path/to/cfg.json]
+#  Runs a streaming Monte Carlo propagation of battery specific energy, hover
+#  power efficiency, mass margin and drag uncertainty through MTOW sizing,
+#  mission energy and an ABU assisted takeoff
+# Parameters:
+#  n_samples        : total samples (default 1000000)
+#  n_workers        : worker processes (default 1)
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+# Output:
+#  Progress every 10 batches, then throughput, peak memory of this process and
+#  the summary statistics of each output
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import resource    # getrusage
+import sys         # argv
+import time        # perf_counter
+import numpy as np # log
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from batch import params_from_config
+from config import load_config
+from montecarlo import BATCH_SIZE, QUANTILES, iter_monte_carlo
+
+ABU_SEGMENTS = ['depart_taxi', 'hover_climb', 'trans_climb', 'depart_proc', 'accel_climb']
+
+if __name__ == '__main__':
+  if len(sys.argv) > 4:
+    print("Usage: python3 bench_montecarlo.py [n_samples] [n_workers] [/path/to/cfg.json]")
+    exit()
+  n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+  n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+  cfg = sys.argv[3] if len(sys.argv) > 3 else '../sample-inputs/test-all.json'
+
+  params = params_from_config(load_config(cfg))
+  spec_energy = params['batt_spec_energy_w_h_p_kg']
+  distributions = {
+    'batt_spec_energy_w_h_p_kg': ('normal', spec_energy, 0.05*spec_energy),
+    'hover_power_effic': ('triangular', 0.65, params['hover_power_effic'], 0.75),
+    'mass_margin_factor': ('uniform', 0.03, 0.1),
+    'trim_drag_factor': ('lognormal', float(np.log(params['trim_drag_factor'])), 0.05),
+    'excres_protub_factor': ('lognormal', float(np.log(params['excres_protub_factor'])), 0.05)
+  }
+
+  t_start = time.perf_counter()
+  for i, (n_done, stats) in enumerate(iter_monte_carlo(
+      params, distributions, n_samples, n_workers=n_workers,
+      evaluator_kwargs={'abu_segments': ABU_SEGMENTS})):
+    if (i+1)%10 == 0:
+      mtow = stats['mtow_converged_kg']
+      print(f"{n_done:>9} samples  MTOW mean {mtow.mean:.2f} +/- {mtow.std/mtow.n**0.5:.2f} kg")
+  elapsed_s = time.perf_counter()-t_start
+  peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0
+  print(f"{n_samples} samples in {elapsed_s:.2f} s ({n_samples/elapsed_s:.0f} samples/s), "
+        f"batch size {BATCH_SIZE}, peak memory {peak_mb:.0f} MB")
+  print(f"{'output':<32}{'valid':>9}{'mean':>12}{'std':>11}"+''.join(f"{'q'+str(q):>11}" for q in QUANTILES))
+  for name, running in stats.items():
+    s = running.summary()
+    print(f"{name:<32}{s['count']:>9}{s['mean']:>12.4f}{s['std']:>11.4f}"
+          +''.join(f"{v:>11.4f}" for v in s['quantiles'].values()))
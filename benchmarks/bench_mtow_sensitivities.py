@@ -0,0 +1,59 @@
+# bench_mtow_sensitivities.py
+#
+# Usage: python3 bench_mtow_sensitivities.py
+#  Compares MTOW sensitivities to every input from implicit differentiation of
+#  the converged sizing loop against forward differences that re-converge the
+#  loop once per input
+# Parameters:
+#  None
+# Output:
+#  Inputs, wall time and MTOW convergences for each path, and the largest
+#  difference between the two
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy # deepcopy
+import sys  # path
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import SECTIONS
+from config import load_config
+
+CFG = '../sample-inputs/test-all.json'
+
+# relative forward-difference step
+H_REL = 1e-6
+
+t_start = time.perf_counter()
+mtow_kg, history, implicit = Aircraft(CFG)._iterate_mtow(sensitivities=True)
+t_implicit_s = time.perf_counter()-t_start
+
+ijson = load_config(CFG)
+t_start = time.perf_counter()
+base_kg = Aircraft(CFG)._iterate_mtow(tol=1e-9)[0]
+forward = {}
+for section in SECTIONS:
+  for name, value in ijson[section].items():
+    if name not in implicit:
+      continue
+    h = H_REL*(abs(value) or 1.0)
+    perturbed = copy.deepcopy(ijson)
+    perturbed[section][name] = value+h
+    forward[name] = (Aircraft.from_dict(perturbed)._iterate_mtow(tol=1e-9)[0]-base_kg)/h
+t_forward_s = time.perf_counter()-t_start
+
+max_rel_diff = max(
+  abs(forward[name]-implicit[name])/max(abs(implicit[name]), 1.0) for name in forward
+)
+print(f"inputs: {len(implicit)}")
+print(f"{'path':>10}{'time_s':>9}{'solves':>8}")
+print(f"{'implicit':>10}{t_implicit_s:>9.3f}{1:>8}")
+print(f"{'forward':>10}{t_forward_s:>9.3f}{len(forward)+1:>8}")
+print(f"max relative difference: {max_rel_diff:.1e}")
@@ -0,0 +1,51 @@
+# bench_optimize.py
+#
+# Usage: python3 bench_optimize.py [points_per_axis]
+#  Compares the gradient-based minimum-MTOW design search against a brute-force
+#  grid of batched MTOW sizings over the same four design variables
+# Parameters:
+#  points_per_axis: grid points per design variable (default 12)
+# Output:
+#  Model evaluations, wall time and minimum MTOW for each path
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # argv
+import time        # perf_counter
+import numpy as np # grids
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from batch import params_from_config, solve_batch_mtow
+from config import load_config
+from optimize import minimize_design
+
+BOUNDS = {
+ 'wingspan_m': (8.0, 16.0),
+ 'rotor_diameter_m': (2.0, 4.0),
+ 'cruise_h_m_p_s': (40.0, 80.0),
+ 'batt_spec_energy_w_h_p_kg': (200.0, 400.0)
+}
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+params = params_from_config(load_config('../sample-inputs/test-all.json'))
+
+t_start = time.perf_counter()
+grid = dict(params)
+axes = np.meshgrid(*[np.linspace(low, high, n) for low, high in BOUNDS.values()])
+grid.update({name: axis.ravel() for name, axis in zip(BOUNDS, axes)})
+solution = solve_batch_mtow(grid)
+grid_kg = np.min(solution['max_takeoff_mass_kg'][solution['converged']])
+t_grid_s = time.perf_counter()-t_start
+
+t_start = time.perf_counter()
+result = minimize_design(params, BOUNDS)
+t_opt_s = time.perf_counter()-t_start
+
+print(f"{'path':>10}{'evaluations':>13}{'time_s':>9}{'mtow_kg':>11}")
+print(f"{'grid':>10}{n**len(BOUNDS):>13}{t_grid_s:>9.3f}{grid_kg:>11.2f}")
+print(f"{'gradient':>10}{result['evaluations']:>13}{t_opt_s:>9.3f}{result['objective']:>11.2f}")
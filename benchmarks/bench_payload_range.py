@@ -0,0 +1,61 @@
+# bench_payload_range.py
+#
+# Usage: python3 bench_payload_range.py [points]
+#  Times the payload-range and range-endurance envelopes of the sample design,
+#  each a vectorized bisection on the cruise time, against per-point
+#  bisections of the same solver
+# Parameters:
+#  points: envelope points (default 500)
+# Output:
+#  Wall time and points per second of each path
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # argv
+import time        # perf_counter
+import numpy as np # grids
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from batch import calc_batch_mission_energy, params_from_config, solve_batch_mtow
+from config import load_config
+from payload_range import calc_payload_range, calc_range_endurance
+
+# per-point bisections are slow; time this many and scale
+N_LOOP = 20
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+params = params_from_config(load_config('../sample-inputs/test-all.json'))
+payloads_kg = np.linspace(0.0, 3.0*params['payload_kg'], n)
+speeds_m_p_s = np.linspace(0.5, 1.5, n)*params['cruise_h_m_p_s']
+# battery limit at the sized pack of the nominal mission, so that both limits
+# bind somewhere on the envelopes
+sized = dict(params, max_takeoff_mass_kg=solve_batch_mtow(params)['max_takeoff_mass_kg'])
+batt_mass_limit_kg = float(calc_batch_mission_energy(sized)['battery_mass_kg'])
+
+t_start = time.perf_counter()
+for payload_kg in payloads_kg[::max(n//N_LOOP, 1)]:
+  calc_payload_range(params, [payload_kg], batt_mass_limit_kg=batt_mass_limit_kg)
+t_loop_s = (time.perf_counter()-t_start)*n/len(payloads_kg[::max(n//N_LOOP, 1)])
+
+t_start = time.perf_counter()
+payload_range = calc_payload_range(params, payloads_kg, batt_mass_limit_kg=batt_mass_limit_kg)
+t_payload_s = time.perf_counter()-t_start
+
+t_start = time.perf_counter()
+range_endurance = calc_range_endurance(params, speeds_m_p_s,
+                                       batt_mass_limit_kg=batt_mass_limit_kg)
+t_endurance_s = time.perf_counter()-t_start
+
+print(f"{'path':>28}{'points':>8}{'time_s':>9}{'points_p_s':>12}")
+for path, t_s in (('payload-range loop (est.)', t_loop_s),
+                  ('payload-range vectorized', t_payload_s),
+                  ('range-endurance vectorized', t_endurance_s)):
+  print(f"{path:>28}{n:>8}{t_s:>9.3f}{n/t_s:>12.0f}")
+for name, result in (('payload-range', payload_range), ('range-endurance', range_endurance)):
+  limits, counts = np.unique(result['limit'], return_counts=True)
+  print(f"{name} limits: "+', '.join(f"{l} {c}" for l, c in zip(limits, counts)))
@@ -0,0 +1,77 @@
+# bench_power_profile.py
+#
+# Usage: python3 bench_power_profile.py [flight_count] [dt_s]
+#  Compares per-sample list building and CSV writing against the streaming
+#  power profile writer for a day of back-to-back flights
+# Parameters:
+#  flight_count: number of flights in the profile (default 40)
+#  dt_s: sample interval in seconds (default 0.1)
+# Output:
+#  Samples, wall time and peak traced memory for each path
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv         # writer
+import os          # path
+import sys         # argv
+import tempfile    # TemporaryDirectory
+import time        # perf_counter
+import tracemalloc # start, stop, get_traced_memory
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from power_profile import repeat_segments
+
+# ground time between flights [s]
+T_GROUND_S = 1020.0
+
+# list building and per-row csv.writer output of the original log script
+def write_lists(path, segments, dt_s):
+  time_steps = []
+  avg_power = []
+  current_time = 0.0
+  for name, duration_s, power_kw in segments:
+    for k in range(int(duration_s/dt_s)):
+      time_steps.append(current_time + k*dt_s)
+      avg_power.append(power_kw)
+    current_time += duration_s
+  with open(path, 'w', newline='') as csvfile:
+    csvwriter = csv.writer(csvfile)
+    csvwriter.writerow(['time', 'avg_electric_power_kw'])
+    for t, p in zip(time_steps, avg_power):
+      csvwriter.writerow([f'{t:.3f}', f'{p:.6f}'])
+  return len(time_steps)
+
+# return (samples, wall time [s], peak traced memory [MB])
+def run(fn):
+  tracemalloc.start()
+  t_start = time.perf_counter()
+  n = fn()
+  t_wall_s = time.perf_counter()-t_start
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return n, t_wall_s, peak/1e6
+
+n_flights = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+dt_s = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+aircraft = Aircraft('../sample-inputs/test-all.json')
+segments = aircraft.power_profile_segments()
+
+print(f"{'path':>10}{'samples':>12}{'time_s':>9}{'peak_MB':>10}")
+with tempfile.TemporaryDirectory() as tmp:
+  path = os.path.join(tmp, 'profile.csv')
+  for label, fn in (
+    ("lists", lambda: write_lists(
+      path, list(repeat_segments(segments, n_flights, T_GROUND_S)), dt_s
+    )),
+    ("streaming", lambda: aircraft.write_power_profile_csv(
+      path, dt_s=dt_s, n_flights=n_flights, t_ground_s=T_GROUND_S
+    )),
+  ):
+    n, t_wall_s, peak_mb = run(fn)
+    print(f"{label:>10}{n:>12}{t_wall_s:>9.2f}{peak_mb:>10.1f}")
@@ -0,0 +1,58 @@
+# bench_profiler.py
+#
+# Usage: python3 bench_profiler.py [/path/to/cfg.json]
+#  Times the MTOW iteration before, during and after derived-quantity
+#  profiling, and prints the most expensive quantities of an uncached iteration
+# Parameters:
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+# Output:
+#  Best wall time per phase, and calls and times of the top quantities
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys  # argv
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+
+REPEATS = 10
+
+# return the best wall time of an MTOW iteration on a fresh aircraft [s]
+def time_iterate_mtow(cfg, profile=False):
+  times_s = []
+  for i in range(REPEATS):
+    aircraft = Aircraft(cfg)
+    t_start = time.perf_counter()
+    if profile:
+      with aircraft.profile():
+        aircraft._iterate_mtow()
+    else:
+      aircraft._iterate_mtow()
+    times_s.append(time.perf_counter()-t_start)
+  return min(times_s)
+
+if len(sys.argv) == 2:
+  cfg = sys.argv[1]
+elif len(sys.argv) == 1:
+  cfg = '../sample-inputs/test-all.json'
+else:
+  print("Usage: python3 bench_profiler.py [/path/to/cfg.json]")
+  exit()
+
+print(f"{'phase':>16}{'time_ms':>10}")
+for phase, profile in [('before', False), ('profiling', True), ('after', False)]:
+  print(f"{phase:>16}{time_iterate_mtow(cfg, profile)*1e3:>10.3f}")
+
+aircraft = Aircraft(cfg)
+aircraft._cache.enabled = False
+with aircraft.profile() as profiler:
+  aircraft._iterate_mtow()
+print()
+print("uncached MTOW iteration:")
+print(profiler.format_stats(10))
@@ -0,0 +1,111 @@
+# bench_queuing.py
+#
+# Usage: python3 bench_queuing.py
+#  Times the heap-based ABU pool simulation against the list-scan loop it
+#  replaced, for growing pool sizes and operating horizons
+# Parameters:
+#  None
+# Output:
+#  Wall time and flights per second for each pool size and horizon
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import time # perf_counter
+import sys  # path
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from queuing import ResourcePool, simulate_daily_ops
+
+# short flights with long ABU charges keep most of the pool busy
+T_FLIGHT_HR     = 0.25
+T_GROUND_OPS_HR = 0.0
+T_CHARGE_HR     = 0.0
+T_ATTACH_HR     = 0.05
+T_RETURN_HR     = 0.05
+
+POOL_SIZES  = [10, 100, 1000, 5000]
+HORIZONS_HR = [24.0, 24.0*7, 24.0*28]
+
+# list-scan loop previously inlined in the Aircraft ABU pool evaluators
+def list_scan_daily_ops(n_pool, t_charge_abu_hr, daily_operation_hr):
+  t_aircraft_ready_hr = 0.0
+  abu_available_times = [0.0 for _ in range(n_pool)]
+  abu_busy_time = [0.0 for _ in range(n_pool)]
+  abu_timelines = {j: [] for j in range(n_pool)}
+  n_flights_completed = 0
+  while True:
+    t_earliest = t_aircraft_ready_hr
+    ready_abus = [j for j in range(n_pool) if abu_available_times[j] <= t_earliest]
+    if len(ready_abus) > 0:
+      j_min = min(ready_abus)
+    else:
+      j_min = min(range(n_pool), key=lambda j: abu_available_times[j])
+    t_depart = max(t_earliest, abu_available_times[j_min])
+    if t_depart+T_FLIGHT_HR > daily_operation_hr:
+      break
+    t_detach = t_depart+T_ATTACH_HR
+    t_return_done = t_detach+T_RETURN_HR
+    t_charge_done = t_return_done+t_charge_abu_hr
+    for t_hr, event in ((t_depart, "abu_attach"), (t_detach, "abu_detach"),
+                        (t_return_done, "abu_return_done"),
+                        (t_return_done, "abu_charge_start"),
+                        (t_charge_done, "abu_charge_done")):
+      abu_timelines[j_min].append({
+        "t_hr": t_hr, "event": event,
+        "flight_index": n_flights_completed, "abu_index": j_min
+      })
+    abu_available_times[j_min] = t_charge_done
+    abu_busy_time[j_min] += (t_charge_done-t_depart)
+    t_aircraft_ready_hr = t_depart+T_FLIGHT_HR+T_GROUND_OPS_HR+T_CHARGE_HR
+    n_flights_completed += 1
+  return n_flights_completed
+
+def heap_daily_ops(n_pool, t_charge_abu_hr, daily_operation_hr):
+  sim = simulate_daily_ops(
+    T_FLIGHT_HR, T_GROUND_OPS_HR, T_CHARGE_HR, daily_operation_hr,
+    [{
+      "pool": ResourcePool(n_pool),
+      "t_attach_offset_hr": 0.0,
+      "t_carry_start_hr": 0.0,
+      "t_attach_hr": T_ATTACH_HR,
+      "t_return_hr": T_RETURN_HR,
+      "t_charge_hr": t_charge_abu_hr,
+      "events": ("abu_attach", "abu_detach", "abu_return_done",
+                 "abu_charge_start", "abu_charge_done"),
+      "log_abu_index": True,
+      "log_detach_on_aircraft": False,
+    }]
+  )
+  return sim["n_flights_completed"]
+
+# return (flights, wall time [s])
+def time_run(fn, n_pool, t_charge_abu_hr, daily_operation_hr):
+  t_start = time.perf_counter()
+  n_flights = fn(n_pool, t_charge_abu_hr, daily_operation_hr)
+  return n_flights, time.perf_counter()-t_start
+
+print(
+ f"{'pool':>6}{'horizon_hr':>12}{'flights':>9}"
+ f"{'list_scan_s':>13}{'heap_s':>10}{'speedup':>10}"
+)
+for n_pool in POOL_SIZES:
+  # ABU charge sized so the pool is just large enough to avoid waiting
+  t_charge_abu_hr = T_FLIGHT_HR*n_pool-T_ATTACH_HR-T_RETURN_HR
+  for daily_operation_hr in HORIZONS_HR:
+    n_flights, t_scan_s = time_run(
+      list_scan_daily_ops, n_pool, t_charge_abu_hr, daily_operation_hr
+    )
+    n_flights_heap, t_heap_s = time_run(
+      heap_daily_ops, n_pool, t_charge_abu_hr, daily_operation_hr
+    )
+    assert n_flights == n_flights_heap
+    print(
+     f"{n_pool:>6}{daily_operation_hr:>12.0f}{n_flights:>9}"
+     f"{t_scan_s:>13.4f}{t_heap_s:>10.4f}"
+     f"{t_scan_s/max(t_heap_s, 1e-12):>9.1f}x"
+    )
@@ -0,0 +1,63 @@
+# bench_records.py
+#
+# Usage: python3 bench_records.py [variant_count]
+#  Measures memory, copy-with-changes and hashing cost of Mission design
+#  variants held as slotted records, against the same fields held in a
+#  per-instance dict
+# Parameters:
+#  variant_count: number of Mission variants (default 100000)
+# Output:
+#  Memory per variant and total, replace() and hash throughput, and the number
+#  of distinct variants after deduplication
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # argv
+import time        # perf_counter
+import tracemalloc # start, stop, get_traced_memory
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from mission import Mission
+
+# dict-backed object with the same private fields (the pre-record layout)
+class DictMission:
+  pass
+
+def dict_variant(values, cruise_s):
+  obj = DictMission()
+  for name, value in values.items():
+    setattr(obj, '_'+name, value)
+  obj._cruise_s = cruise_s
+  return obj
+
+# return (variants, traced memory [MB], wall time [s])
+def build(fn, n):
+  tracemalloc.start()
+  t_start = time.perf_counter()
+  variants = [fn(float(i % 1000)) for i in range(n)]
+  t_wall_s = time.perf_counter()-t_start
+  memory_mb = tracemalloc.get_traced_memory()[0]/1e6
+  tracemalloc.stop()
+  return variants, memory_mb, t_wall_s
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+mission = Mission('../sample-inputs/test-all.json')
+values = mission.to_dict()
+
+print(f"{'layout':>8}{'variants':>10}{'MB':>8}{'B/variant':>11}{'build_s':>9}")
+for label, fn in (
+  ("dict", lambda cruise_s: dict_variant(values, cruise_s)),
+  ("slots", lambda cruise_s: mission.replace(cruise_s=cruise_s)),
+):
+  variants, memory_mb, t_wall_s = build(fn, n)
+  print(f"{label:>8}{n:>10}{memory_mb:>8.1f}{memory_mb*1e6/n:>11.0f}{t_wall_s:>9.3f}")
+
+t_start = time.perf_counter()
+distinct = set(variants)
+t_hash_s = time.perf_counter()-t_start
+print(f"deduplicated {n} variants to {len(distinct)} in {t_hash_s:.3f} s")
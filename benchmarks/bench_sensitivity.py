@@ -0,0 +1,63 @@
+# bench_sensitivity.py
+#
+# Usage: python3 bench_sensitivity.py [report.txt] [n_workers] [/path/to/cfg.json]
+#  Ranks the design drivers of mission energy, empty mass and flights per day:
+#  Morris screening of every non-zero float input at +/-10%, then Sobol
+#  indices of the inputs that rank in the top 10 of any output
+# Parameters:
+#  report.txt       : output path of the ranked Sobol report (default
+#                     sensitivity_report.txt)
+#  n_workers        : worker processes (default 1)
+#  /path/to/cfg.json: path to configuration JSON file (optional)
+# Output:
+#  Evaluations and wall time of each stage, and the top 5 inputs per output
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys  # argv
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from batch import params_from_config
+from config import load_config
+from sensitivity import default_bounds, format_sensitivity_report, run_morris, \
+ run_sobol, top_inputs, write_sensitivity_report
+
+N_TRAJECTORIES = 40
+N_SCREENED = 10
+N_BASE = 4096
+
+if __name__ == '__main__':
+  if len(sys.argv) > 4:
+    print("Usage: python3 bench_sensitivity.py [report.txt] [n_workers] [/path/to/cfg.json]")
+    exit()
+  report_path = sys.argv[1] if len(sys.argv) > 1 else 'sensitivity_report.txt'
+  n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+  cfg = sys.argv[3] if len(sys.argv) > 3 else '../sample-inputs/test-all.json'
+
+  params = params_from_config(load_config(cfg))
+  bounds = default_bounds(params)
+
+  t_start = time.perf_counter()
+  morris = run_morris(params, bounds, N_TRAJECTORIES, n_workers=n_workers)
+  t_morris_s = time.perf_counter()-t_start
+  screened = []
+  for output in morris['outputs']:
+    screened += [name for name in top_inputs(morris, output, N_SCREENED) if name not in screened]
+  print(f"morris: {len(bounds)} inputs, {morris['n_evaluations']} evaluations, "
+        f"{t_morris_s:.2f} s, {len(screened)} inputs kept")
+
+  t_start = time.perf_counter()
+  sobol = run_sobol(params, {name: bounds[name] for name in screened}, N_BASE,
+                    n_workers=n_workers)
+  t_sobol_s = time.perf_counter()-t_start
+  print(f"sobol : {len(screened)} inputs, {sobol['n_evaluations']} evaluations, "
+        f"{t_sobol_s:.2f} s")
+  write_sensitivity_report(sobol, report_path)
+  print(format_sensitivity_report(sobol, top=5))
+  print(f"full report written to {report_path}")
@@ -0,0 +1,54 @@
+# bench_surrogate.py
+#
+# Usage: python3 bench_surrogate.py [n_samples]
+#  Fits a Gaussian process surrogate of the divert-reserve evaluator and
+#  compares its query time and accuracy against the true model
+# Parameters:
+#  n_samples: training evaluations (default 32)
+# Output:
+#  Fit time, per-query time of each path and the largest surrogate error
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys  # argv
+import time # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from surrogate import fit_surrogate
+from sweep import evaluate_point, latin_hypercube
+
+CFG = '../sample-inputs/test-all.json'
+EVALUATOR = '_evaluate_landing_safety_divert_baseline'
+BOUNDS = {'divert_distance_mi': (2.0, 15.0), 't_hover_s': (60.0, 300.0)}
+KWARGS = {'t_hover_descend_s': 30.0}
+OUTPUTS = ('mtow_converged_kg', 'total_required_kwh')
+N_QUERIES = 200
+
+n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+
+t_start = time.perf_counter()
+surrogate = fit_surrogate(CFG, BOUNDS, EVALUATOR, OUTPUTS, n_samples, KWARGS)
+t_fit_s = time.perf_counter()-t_start
+
+points = latin_hypercube(BOUNDS, N_QUERIES, seed=1)
+t_start = time.perf_counter()
+approx = [surrogate.query(point) for point in points]
+t_surrogate_s = (time.perf_counter()-t_start)/N_QUERIES
+
+t_start = time.perf_counter()
+exact = [evaluate_point(CFG, point, EVALUATOR, KWARGS) for point in points]
+t_true_s = (time.perf_counter()-t_start)/N_QUERIES
+
+print(f"samples: {n_samples}, fit time: {t_fit_s:.3f} s, "
+      f"fallbacks: {surrogate.n_fallbacks}/{N_QUERIES}")
+print(f"{'path':>10}{'query_us':>11}")
+print(f"{'true':>10}{t_true_s*1e6:>11.1f}")
+print(f"{'surrogate':>10}{t_surrogate_s*1e6:>11.1f}")
+for output in OUTPUTS:
+  max_err = max(abs(a[output]-e[output]) for a, e in zip(approx, exact))
+  print(f"max {output} error: {max_err:.2e}")
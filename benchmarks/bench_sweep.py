@@ -0,0 +1,73 @@
+# bench_sweep.py
+#
+# Usage: python3 bench_sweep.py [point_count] [worker_count]
+#  Compares a script-style loop of MTOW sizings over Latin hypercube samples
+#  against serial and parallel sweeps, and a cached re-run of the sweep
+# Parameters:
+#  point_count: number of design points (default 400)
+#  worker_count: sweep worker processes (default one per CPU)
+# Output:
+#  Wall time and points per second for each path
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import os       # cpu_count
+import sys      # argv
+import tempfile # TemporaryDirectory
+import time     # perf_counter
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from config import load_config
+from sweep import apply_point, latin_hypercube, run_sweep
+
+CFG = '../sample-inputs/test-all.json'
+
+# sampled inputs
+BOUNDS = {
+  'payload_kg': (300.0, 500.0),
+  'cruise_s': (400.0, 900.0),
+  'batt_spec_energy_w_h_p_kg': (250.0, 350.0)
+}
+
+# converged MTOW [kg] of one design
+def sized_mtow_kg(aircraft):
+  return aircraft._iterate_mtow()[0]
+
+# script-style loop: one aircraft per point, evaluated in this process
+def run_loop(points):
+  ijson = load_config(CFG)
+  results = []
+  for point in points:
+    spec, kwargs = apply_point(ijson, {}, point)
+    results.append(sized_mtow_kg(Aircraft.from_dict(spec)))
+  return results
+
+def timed(fn):
+  t_start = time.perf_counter()
+  results = fn()
+  return results, time.perf_counter()-t_start
+
+if __name__ == '__main__':
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+  n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+  points = latin_hypercube(BOUNDS, n, seed=0)
+  print(f"points: {n}, workers: {n_workers}")
+  print(f"{'path':>10}{'time_s':>9}{'points/s':>11}")
+  expected, t_wall_s = timed(lambda: run_loop(points))
+  print(f"{'loop':>10}{t_wall_s:>9.2f}{n/t_wall_s:>11.0f}")
+  with tempfile.TemporaryDirectory() as tmp:
+    for label, kwargs in (
+      ("serial", {'n_workers': 1}),
+      ("parallel", {'n_workers': n_workers}),
+      ("cold", {'n_workers': n_workers, 'cache_dir': tmp}),
+      ("cached", {'n_workers': n_workers, 'cache_dir': tmp}),
+    ):
+      results, t_wall_s = timed(lambda: run_sweep(CFG, points, sized_mtow_kg, **kwargs))
+      assert results == expected
+      print(f"{label:>10}{t_wall_s:>9.2f}{n/t_wall_s:>11.0f}")
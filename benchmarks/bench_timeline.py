@@ -0,0 +1,103 @@
+# bench_timeline.py
+#
+# Usage: python3 bench_timeline.py
+#  Compares memory and export time of dict and columnar timelines from the
+#  ABU pool operations simulation over growing horizons
+# Parameters:
+#  None
+# Output:
+#  Events, peak traced memory, retained timeline memory, simulation time and
+#  CSV export time for each timeline format, and NPZ export time
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv         # DictWriter
+import os          # path
+import sys         # path
+import tempfile    # TemporaryDirectory
+import time        # perf_counter
+import tracemalloc # start, stop, get_traced_memory
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from queuing import ResourcePool, simulate_daily_ops
+
+N_POOL      = 100
+HORIZONS_HR = [24.0*7, 24.0*28, 24.0*112]
+
+def legs():
+  return [{
+    "pool": ResourcePool(N_POOL),
+    "t_attach_offset_hr": 0.0,
+    "t_carry_start_hr": 0.0,
+    "t_attach_hr": 0.02,
+    "t_return_hr": 0.03,
+    "t_charge_hr": 1.0,
+    "events": ("abu_attach", "abu_detach", "abu_return_done",
+               "abu_charge_start", "abu_charge_done"),
+    "log_abu_index": True,
+    "log_detach_on_aircraft": False,
+  }]
+
+# return (result, peak traced memory [MB], retained memory [MB], wall time [s])
+def run(daily_operation_hr, timeline_format):
+  tracemalloc.start()
+  t_start = time.perf_counter()
+  sim = simulate_daily_ops(0.1, 0.0, 0.05, daily_operation_hr, legs(),
+                           timeline_format=timeline_format)
+  t_wall_s = time.perf_counter()-t_start
+  retained, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return sim, peak/1e6, retained/1e6, t_wall_s
+
+# write the timelines the way the log scripts do (one dict per CSV row)
+def write_csv_dicts(sim, path):
+  rows = []
+  for entry in sim["aircraft_timeline"]:
+    rows.append({"timeline_type": "aircraft", "abu_index": "",
+                 "flight_index": entry["flight_index"], "t_hr": f"{entry['t_hr']:.6f}",
+                 "event": entry["event"]})
+  for abu_index, events in sim["timelines"][0].items():
+    for entry in events:
+      rows.append({"timeline_type": "abu", "abu_index": abu_index,
+                   "flight_index": entry["flight_index"], "t_hr": f"{entry['t_hr']:.6f}",
+                   "event": entry["event"]})
+  with open(path, mode='w', newline='') as csv_file:
+    writer = csv.DictWriter(csv_file, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+
+def write_csv_columns(sim, path):
+  sim["aircraft_timeline"].write_csv(path, extra={"timeline_type": "aircraft"})
+  sim["timelines"][0].write_csv(path, extra={"timeline_type": "abu"},
+                                write_header=False, mode='a')
+
+print(
+ f"{'horizon_hr':>10}{'format':>9}{'events':>9}{'peak_MB':>9}{'kept_MB':>9}"
+ f"{'sim_s':>8}{'csv_s':>8}{'npz_s':>8}"
+)
+with tempfile.TemporaryDirectory() as tmp:
+  for daily_operation_hr in HORIZONS_HR:
+    for timeline_format in ("dicts", "columns"):
+      sim, peak_mb, kept_mb, t_sim_s = run(daily_operation_hr, timeline_format)
+      t_start = time.perf_counter()
+      if timeline_format == "dicts":
+        n_events = len(sim["aircraft_timeline"])+sum(len(v) for v in sim["timelines"][0].values())
+        write_csv_dicts(sim, os.path.join(tmp, 'tl.csv'))
+      else:
+        n_events = len(sim["aircraft_timeline"])+len(sim["timelines"][0])
+        write_csv_columns(sim, os.path.join(tmp, 'tl.csv'))
+      t_csv_s = time.perf_counter()-t_start
+      npz = ''
+      if timeline_format == "columns":
+        t_start = time.perf_counter()
+        sim["timelines"][0].write_npz(os.path.join(tmp, 'tl.npz'))
+        npz = f"{time.perf_counter()-t_start:.3f}"
+      print(
+       f"{daily_operation_hr:>10.0f}{timeline_format:>9}{n_events:>9}"
+       f"{peak_mb:>9.1f}{kept_mb:>9.1f}{t_sim_s:>8.3f}{t_csv_s:>8.3f}{npz:>8}"
+      )
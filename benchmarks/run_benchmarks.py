@@ -0,0 +1,230 @@
+# run_benchmarks.py
+#
+# Usage: python3 run_benchmarks.py [results.json] [baseline.json] [sizes]
+#  Times the model's hot paths (Aircraft construction, segment power calls,
+#  mission energy, the MTOW iteration, the ABU evaluators and the three ABU
+#  pool queuing simulations) at small, medium and large input sizes, writes
+#  the timings as JSON and compares them against a saved baseline
+# Parameters:
+#  results.json : output path of the timings (default results.json)
+#  baseline.json: timings of an earlier run on the same machine to compare
+#                 against (optional; "" for none when selecting sizes)
+#  sizes        : comma-separated subset of small,medium,large (default all)
+# Output:
+#  Best time per case and, with a baseline, the time ratio of each case with
+#  regressions flagged; exits with status 1 if any case regressed
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import datetime    # datetime
+import gc          # disable, enable
+import json        # dump, load
+import platform    # node, python_version
+import statistics  # median
+import sys         # argv, exit
+import time        # perf_counter
+import numpy as np # version
+
+# path to evtolpy package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import SEGMENTS
+from config import load_config
+from sweep import apply_point
+
+CFG = '../sample-inputs/test-all.json'
+
+# workload scale of each input size: design variants for the aircraft-level
+# cases and divert distances, ABU energies (x10) and detach candidates for the
+# ABU evaluators, and operating weeks for the queuing simulations
+SIZES = {'small': 1, 'medium': 4, 'large': 16}
+
+# timed repeats per case; the best repeat is reported
+REPEATS = 5
+
+# shortest repeat; fast cases run several times per repeat to reach it
+MIN_REPEAT_S = 0.02
+
+# a case regresses when its best time exceeds the baseline's by this fraction
+THRESHOLD = 0.25
+
+CANDIDATE = {
+  'name': 'after_accel_climb',
+  'segments': ['depart_taxi', 'hover_climb', 'trans_climb', 'depart_proc', 'accel_climb']
+}
+
+# return n specifications with maximum takeoff masses spread over +/-10%
+def _variants(n):
+  ijson = load_config(CFG)
+  mtow_kg = ijson['aircraft']['max_takeoff_mass_kg']
+  scales = np.linspace(0.9, 1.1, n) if n > 1 else [1.0]
+  return [apply_point(ijson, {}, {'max_takeoff_mass_kg': mtow_kg*s})[0] for s in scales]
+
+# return n aircraft with the derived-quantity cache disabled, so that every
+# call recomputes
+def _uncached_aircraft(n):
+  aircraft = [Aircraft.from_dict(spec) for spec in _variants(n)]
+  for a in aircraft:
+    a._cache.enabled = False
+  return aircraft
+
+# return n ABU energies [kWh]
+def _abu_energies(n):
+  return np.linspace(5.0, 50.0, 10*n).tolist()
+
+# Each case maps a workload scale n to a zero-argument function that runs the
+# workload; setup happens before the function is returned and is not timed
+
+def _construction(n):
+  specs = _variants(n)
+  return lambda: [Aircraft.from_dict(spec) for spec in specs]
+
+def _segment_power(segment):
+  def case(n):
+    methods = [getattr(a, '_calc_'+segment+'_avg_electric_power_kw') for a in _uncached_aircraft(n)]
+    return lambda: [method() for method in methods]
+  return case
+
+def _mission_energy(n):
+  aircraft = _uncached_aircraft(n)
+  return lambda: [a._calc_total_mission_energy_kw_hr() for a in aircraft]
+
+def _iterate_mtow(n):
+  aircraft = [Aircraft.from_dict(spec) for spec in _variants(n)]
+  return lambda: [a._iterate_mtow() for a in aircraft]
+
+def _detach_candidates(n):
+  aircraft = Aircraft(CFG)
+  candidates = [dict(CANDIDATE, name=CANDIDATE['name']+str(i)) for i in range(n)]
+  return lambda: aircraft.evaluate_abu_detach_candidates(candidates)
+
+def _extended_flight(n):
+  aircraft = Aircraft(CFG)
+  energies_kwh = _abu_energies(n)
+  return lambda: aircraft._evaluate_extended_flight(energies_kwh)
+
+def _extended_flight_detach(n):
+  aircraft = Aircraft(CFG)
+  energies_kwh = _abu_energies(n)
+  return lambda: aircraft._evaluate_extended_flight_detach_on_depletion_or_end(energies_kwh)
+
+def _landing_safety_loiter(n):
+  aircraft = Aircraft(CFG)
+  energies_kwh = _abu_energies(n)
+  return lambda: aircraft._evaluate_landing_safety_loiter(energies_kwh, 10.0, 300.0, 60.0)
+
+def _landing_safety_divert(n):
+  distances_mi = np.linspace(5.0, 15.0, n).tolist()
+  aircraft = [Aircraft(CFG) for d in distances_mi]
+  return lambda: [a._evaluate_landing_safety_divert_baseline(d, 300.0, 60.0)
+                  for a, d in zip(aircraft, distances_mi)]
+
+def _queuing_assisted_takeoff(n):
+  aircraft = Aircraft(CFG)
+  return lambda: aircraft._evaluate_common_case_abu_assisted_takeoff_overlap_charging_queuing(
+    [CANDIDATE], n_abu_pool=3, daily_operation_hr=24.0*7*n)
+
+def _queuing_extended_flight(n):
+  aircraft = Aircraft(CFG)
+  return lambda: aircraft._evaluate_common_case_abu_extended_flight_overlap_charging_queuing(
+    [10.0, 20.0, 30.0], daily_operation_hr=24.0*7*n)
+
+def _queuing_combined_flight(n):
+  aircraft = Aircraft(CFG)
+  return lambda: aircraft._evaluate_common_case_abu_combined_flight_overlap_charging_queuing(
+    [CANDIDATE], [10.0, 20.0, 30.0], daily_operation_hr=24.0*7*n)
+
+CASES = [('aircraft_construction', _construction)] + \
+        [('segment_power.'+segment, _segment_power(segment)) for segment, duration in SEGMENTS] + [
+  ('total_mission_energy', _mission_energy),
+  ('iterate_mtow', _iterate_mtow),
+  ('evaluate_abu_detach_candidates', _detach_candidates),
+  ('evaluate_extended_flight', _extended_flight),
+  ('evaluate_extended_flight_detach_on_depletion_or_end', _extended_flight_detach),
+  ('evaluate_landing_safety_loiter', _landing_safety_loiter),
+  ('evaluate_landing_safety_divert_baseline', _landing_safety_divert),
+  ('queuing_assisted_takeoff', _queuing_assisted_takeoff),
+  ('queuing_extended_flight', _queuing_extended_flight),
+  ('queuing_combined_flight', _queuing_combined_flight)
+]
+
+# return timing statistics of one case at workload scale n; each run uses a
+# fresh setup, so runs that modify their aircraft do not speed up later runs,
+# and garbage collection is paused while timing, as in timeit
+def time_case(case, n):
+  run = case(n)
+  t_start = time.perf_counter()
+  run()
+  number = max(1, int(np.ceil(MIN_REPEAT_S/max(time.perf_counter()-t_start, 1e-9))))
+  times_s = []
+  for i in range(REPEATS):
+    runs = [case(n) for j in range(number)]
+    gc.disable()
+    t_start = time.perf_counter()
+    for run in runs:
+      run()
+    times_s.append((time.perf_counter()-t_start)/number)
+    gc.enable()
+  return {'min_s': min(times_s), 'median_s': statistics.median(times_s),
+          'repeats': REPEATS, 'number': number}
+
+# return the timings of every case at the given sizes, keyed 'case[size]'
+def run_benchmarks(sizes):
+  results = {}
+  for name, case in CASES:
+    for size in sizes:
+      results[name+'['+size+']'] = time_case(case, SIZES[size])
+  return {
+    'created': datetime.datetime.now().isoformat(timespec='seconds'),
+    'machine': {'node': platform.node(), 'python': platform.python_version(),
+                'numpy': np.__version__},
+    'results': results
+  }
+
+# return [(key, baseline_s, current_s, ratio, status)] for keys in both runs;
+# status is 'regression' or 'improvement' when the best time changed by more
+# than threshold, else 'ok'
+def compare_results(baseline, current, threshold=THRESHOLD):
+  rows = []
+  for key, timing in current['results'].items():
+    if key not in baseline['results']:
+      continue
+    baseline_s = baseline['results'][key]['min_s']
+    ratio = timing['min_s']/baseline_s
+    if ratio > 1.0+threshold:
+      status = 'regression'
+    elif ratio < 1.0/(1.0+threshold):
+      status = 'improvement'
+    else:
+      status = 'ok'
+    rows.append((key, baseline_s, timing['min_s'], ratio, status))
+  return rows
+
+if __name__ == '__main__':
+  if len(sys.argv) > 4:
+    print("Usage: python3 run_benchmarks.py [results.json] [baseline.json] [sizes]")
+    exit()
+  results_path = sys.argv[1] if len(sys.argv) > 1 else 'results.json'
+  baseline_path = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] else None
+  sizes = sys.argv[3].split(',') if len(sys.argv) > 3 else list(SIZES)
+
+  current = run_benchmarks(sizes)
+  with open(results_path, 'w') as ofile:
+    json.dump(current, ofile, indent=1)
+  if baseline_path is None:
+    print(f"{'case':<70}{'min_ms':>10}{'median_ms':>11}")
+    for key, timing in current['results'].items():
+      print(f"{key:<70}{timing['min_s']*1e3:>10.3f}{timing['median_s']*1e3:>11.3f}")
+  else:
+    with open(baseline_path, 'r') as ifile:
+      baseline = json.load(ifile)
+    rows = compare_results(baseline, current)
+    print(f"{'case':<70}{'base_ms':>10}{'min_ms':>10}{'ratio':>8}  status")
+    for key, baseline_s, current_s, ratio, status in rows:
+      print(f"{key:<70}{baseline_s*1e3:>10.3f}{current_s*1e3:>10.3f}{ratio:>8.2f}  {status}")
+    if any(row[4] == 'regression' for row in rows):
+      sys.exit(1)
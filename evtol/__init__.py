@@ -9,8 +9,27 @@
 
 __all__ = [
  'aircraft',
+ 'atmosphere',
+ 'batch',
+ 'cache',
+ 'charging',
+ 'config',
  'environ',
+ 'fleet',
+ 'hot_high',
+ 'integrator',
  'mission',
+ 'montecarlo',
+ 'optimize',
+ 'payload_range',
  'power',
- 'propulsion'
+ 'power_profile',
+ 'profiler',
+ 'propulsion',
+ 'queuing',
+ 'record',
+ 'sensitivity',
+ 'surrogate',
+ 'sweep',
+ 'timeline'
 ]
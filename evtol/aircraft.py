@@ -8,23 +8,44 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import copy # deepcopy
-import json # json parsing
+import copy # copy
 import math # log10, pi
 import sys  # not needed when using as a package
 
 # path to directory with other classes; use before deploying as package
 sys.path.append('../evtol')
+from atmosphere import CRUISE_SEGMENTS, calc_segment_air_density_kg_p_m3
+from batch import SEGMENTS, params_from_aircraft
+from cache import DerivedCache
+from config import load_config
 from environ import Environ
+from fleet import simulate_fleet_ops
+from integrator import integrate_mission
 from mission import Mission
+from optimize import calc_mtow_sensitivities
 from power import Power
+from power_profile import iter_power_samples, power_breakpoints, \
+ repeat_segments, write_power_profile_csv
+from profiler import bind_view, profile_calls
 from propulsion import Propulsion
+from queuing import ResourcePool, simulate_daily_ops
 
 # comment above and uncomment below when ready to deploy as package
+#from .atmosphere import CRUISE_SEGMENTS, calc_segment_air_density_kg_p_m3
+#from .batch import SEGMENTS, params_from_aircraft
+#from .cache import DerivedCache
+#from .config import load_config
 #from .environ import Environ
+#from .fleet import simulate_fleet_ops
+#from .integrator import integrate_mission
 #from .mission import Mission
+#from .optimize import calc_mtow_sensitivities
 #from .power import Power
+#from .power_profile import iter_power_samples, power_breakpoints, \
+# repeat_segments, write_power_profile_csv
+#from .profiler import bind_view, profile_calls
 #from .propulsion import Propulsion
+#from .queuing import ResourcePool, simulate_daily_ops
 
 # constants
 W_P_KW = 1000.0
@@ -34,13 +55,27 @@ M_2_FT = 3.28084
 M_P_S_2_KTS = 1.9438
 N_P_M2_2_LB_P_FT2 = 0.0209
 
+# inputs whose reads are recorded by the derived-quantity cache
+TRACKED_INPUTS = ('max_takeoff_mass_kg', 'environ', 'mission', 'power', 'propulsion')
+
 # Aircraft class
 class Aircraft:
   # class constructor
   def __init__(self, path_to_json: str):
-    # open and load JSON specification
-    ifile = open(path_to_json, 'r')
-    ijson = json.load(ifile)
+    # load JSON specification; parsed once per file version
+    self._load(load_config(path_to_json))
+
+  # alternate constructor from an already parsed JSON specification
+  @classmethod
+  def from_dict(cls, ijson: dict):
+    obj = cls.__new__(cls)
+    obj._load(ijson)
+    return obj
+
+  # populate properties from a parsed JSON specification
+  def _load(self, ijson: dict):
+    # cache of derived quantities; entries are evicted when their inputs change
+    self._cache = DerivedCache()
     # aircraft properties
     self._max_takeoff_mass_kg = ijson['aircraft']['max_takeoff_mass_kg']
     self._payload_kg = ijson['aircraft']['payload_kg']
@@ -78,19 +113,16 @@ class Aircraft:
     # has-a classes: add classes if they exist in JSON
     self._environ = None
     if 'environ' in ijson:
-      self._environ = Environ(path_to_json)
+      self._environ = Environ.from_dict(ijson)
     self._mission = None
     if 'mission' in ijson:
-      self._mission = Mission(path_to_json)
+      self._mission = Mission.from_dict(ijson)
     self._power = None
     if 'power' in ijson:
-      self._power = Power(path_to_json)
+      self._power = Power.from_dict(ijson)
     self._propulsion = None
     if 'propulsion' in ijson:
-      self._propulsion = Propulsion(path_to_json)
-
-    # close JSON file
-    ifile.close()
+      self._propulsion = Propulsion.from_dict(ijson)
 
   # ratio of payload mass to max takeoff mass
   def _calc_payload_mass_frac(self):
@@ -100,8 +132,8 @@ class Aircraft:
   # use MTOM to calculate kg per disk area m2
   # return None if propulsion object not populated
   def _calc_disk_loading_kg_p_m2(self):
-    if self.propulsion != None:
-      return self.max_takeoff_mass_kg/self.propulsion.disk_area_m2
+    if self._shared_propulsion != None:
+      return self.max_takeoff_mass_kg/self._shared_propulsion.disk_area_m2
     else:
       return None
 
@@ -123,7 +155,7 @@ class Aircraft:
        ((
         (self.environ.g_m_p_s2*self.max_takeoff_mass_kg)**1.5/
         (2.0*self.environ.air_density_sea_lvl_kg_p_m3*\
-         self.propulsion.disk_area_m2)**0.5
+         self._shared_propulsion.disk_area_m2)**0.5
        )/self.power.hover_power_effic)/W_P_KW
     else:
       return None
@@ -303,9 +335,9 @@ class Aircraft:
   # requires propulsion disk_area_m2
   # return None if aircraft field or propulsion object not populated
   def _calc_stopped_rotor_cd0(self):
-    if self.wing_area_m2 != None and self.propulsion.disk_area_m2 != None:
+    if self.wing_area_m2 != None and self._shared_propulsion.disk_area_m2 != None:
       return \
-       (self.propulsion.disk_area_m2/self.ratio_disk_to_stopped_rotor_area)/\
+       (self._shared_propulsion.disk_area_m2/self.ratio_disk_to_stopped_rotor_area)/\
        self.wing_area_m2
     else:
       return None
@@ -361,23 +393,23 @@ class Aircraft:
   
   # calculates the over-torque factor for the propulsion system.
   def _calc_over_torque_factor(self):
-    if self.propulsion == None:
+    if self._shared_propulsion == None:
       return None
     else:
-      return self.propulsion.rotor_count/(self.propulsion.rotor_count-2)+0.3
+      return self._shared_propulsion.rotor_count/(self._shared_propulsion.rotor_count-2)+0.3
 
   # Parametric EPU mass estimation model (FHE / Magicall datasheet based)
   # Uses hover torque and over-torque scaling to compute motor torque at max thrust
   # Scales rotor RPM to account for sea-level vs. minimum air density conditions
   # Computes maximum motor power and applies empirical regression to estimate single EPU mass
   def _calc_single_epu_mass_kg(self):
-    if self.propulsion == None and self.environ == None:
+    if self._shared_propulsion == None and self.environ == None:
       return None
     else:
       # Hover torque
-      rpm_hover_rpm = (self.environ.sound_speed_m_p_s*self.propulsion.tip_mach/(self.propulsion.rotor_diameter_m/2.0))*60.0/(2.0*math.pi)
+      rpm_hover_rpm = (self.environ.sound_speed_m_p_s*self._shared_propulsion.tip_mach/(self._shared_propulsion.rotor_diameter_m/2.0))*60.0/(2.0*math.pi)
       omega_hover_rad_s = 2.0*math.pi*rpm_hover_rpm/60.0
-      torque_hover_nm = (self.hover_shaft_power_kw*1000.0/self.propulsion.rotor_count)/omega_hover_rad_s
+      torque_hover_nm = (self.hover_shaft_power_kw*1000.0/self._shared_propulsion.rotor_count)/omega_hover_rad_s
       torque_max_nm = self.over_torque_factor * torque_hover_nm
 
       # Max RPM (min density)
@@ -392,23 +424,49 @@ class Aircraft:
   # estimates rotor solidity from thrust coefficient at hover
   # based on MTOW, air density, rotor geometry, and tip Mach hover RPM
   def _calc_rotor_solidity(self):
-    if self.propulsion is None or self.environ is None:
+    if self._shared_propulsion is None or self.environ is None:
       return None
     else:
       # Hover RPM at sea level 
-      rpm_hover_rpm = (self.environ.sound_speed_m_p_s*self.propulsion.tip_mach/(self.propulsion.rotor_diameter_m/2.0))*60.0/(2.0*math.pi)
+      rpm_hover_rpm = (self.environ.sound_speed_m_p_s*self._shared_propulsion.tip_mach/(self._shared_propulsion.rotor_diameter_m/2.0))*60.0/(2.0*math.pi)
       omega_hover_sl_rad_s = rpm_hover_rpm*math.pi/30.0 # Convert to rad/s
 
       # Rotor thrust coefficient at hover 
       ct_hover = (
-        (self.max_takeoff_mass_kg*self.environ.g_m_p_s2/self.propulsion.rotor_count)
+        (self.max_takeoff_mass_kg*self.environ.g_m_p_s2/self._shared_propulsion.rotor_count)
         /(self.environ.air_density_sea_lvl_kg_p_m3
-          *math.pi*(self.propulsion.rotor_diameter_m/2.0)**4
+          *math.pi*(self._shared_propulsion.rotor_diameter_m/2.0)**4
           *(omega_hover_sl_rad_s**2.0))
       )
       # Rotor solidity 
-      rotor_solidity = ct_hover*6.0/self.propulsion.rotor_avg_cl
+      rotor_solidity = ct_hover*6.0/self._shared_propulsion.rotor_avg_cl
       return rotor_solidity
+
+  # requires environ air_density_sea_lvl_kg_p_m3, air_density_max_alt_kg_p_m3
+  # air density of each mission segment, {segment name: density}: max-altitude
+  # density for cruise segments and sea-level density otherwise, or for an ISA
+  # environ the density at mid-segment altitude from the mission profile
+  # (cached, so table lookups stay out of the MTOW iteration)
+  # return None if environ object, or mission object of an ISA environ, not
+  # populated
+  def _calc_segment_air_density_kg_p_m3(self):
+    if self.environ == None:
+      return None
+    elif self.environ.atmosphere == 'isa':
+      if self.mission == None:
+        return None
+      return {
+        segment: float(density) for segment, density in calc_segment_air_density_kg_p_m3(
+          self.mission.to_dict(), self.environ.field_alt_m, self.environ.max_alt_m,
+          self.environ.temp_offset_k
+        ).items()
+      }
+    else:
+      return {
+        segment: self.environ.air_density_max_alt_kg_p_m3 if segment in CRUISE_SEGMENTS
+        else self.environ.air_density_sea_lvl_kg_p_m3
+        for segment, duration_field in SEGMENTS
+      }
   
 # ----- Depart Taxi (Segment A) -----
   # requires mission depart_taxi_avg_h_m_p_s, depart_taxi_s
@@ -424,7 +482,7 @@ class Aircraft:
       a_h_m_p_s2 = vf_h_m_p_s**2.0/(2.0*d_h_m)
       return \
        (self.max_takeoff_mass_kg*a_h_m_p_s2*\
-        self.mission.depart_taxi_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+        self.mission.depart_taxi_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -459,7 +517,7 @@ class Aircraft:
   # required for vertical acceleration during climb
   # return None if mission or propulsion object not populated
   def _calc_hover_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None:
+    if self.mission != None and self._shared_propulsion != None:
         
         # vertical kinematics (upward positive)
         d_v_m = self.mission.hover_climb_avg_v_m_p_s*self.mission.hover_climb_s
@@ -471,12 +529,12 @@ class Aircraft:
 
         # induced velocity in hover (prop thrust momentum theory)
         v_i_hover = math.sqrt(T_required_N/\
-                              (2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+                              (2.0*self.segment_air_density_kg_p_m3['hover_climb']*self._shared_propulsion.disk_area_m2))
 
         # induced power (hover)
         P_hover_W = T_required_N*v_i_hover
 
-        return P_hover_W/(self.propulsion.rotor_effic*W_P_KW)
+        return P_hover_W/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
         return None
 
@@ -510,8 +568,8 @@ class Aircraft:
   # vertical velocity: constant throughout (no vertical acceleration)
   # return None if mission, propulsion, or environment object not populated
   def _calc_trans_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.trans_climb_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['trans_climb']*self.mission.trans_climb_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.trans_climb_v_m_p_s, self.mission.trans_climb_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -541,7 +599,7 @@ class Aircraft:
       T_required_N = max(0.0, weight_n - lift_n + self.max_takeoff_mass_kg*a_v_m_p_s2)
 
       # induced velocity in transition (momentum theory)
-      v_i_hover = math.sqrt(T_required_N/(2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+      v_i_hover = math.sqrt(T_required_N/(2.0*self.segment_air_density_kg_p_m3['trans_climb']*self._shared_propulsion.disk_area_m2))
 
       # induced power (hover assist)
       P_hover_W = T_required_N*v_i_hover
@@ -551,7 +609,7 @@ class Aircraft:
 
       # total shaft power
       return (P_hover_W + force_h_n*self.mission.trans_climb_avg_h_m_p_s) / \
-            (self.propulsion.rotor_effic*W_P_KW)
+            (self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
     
@@ -584,8 +642,8 @@ class Aircraft:
   # includes aerodynamic lift, induced drag, parasite drag, and horizontal drag
   # return None if mission, propulsion, or environment object not populated
   def _calc_depart_proc_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.depart_proc_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['depart_proc']*self.mission.depart_proc_h_m_p_s**2.0
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
       lift_n = weight_n
       
@@ -602,7 +660,7 @@ class Aircraft:
       # force components 
       force_h_n = total_drag_n
 
-      return (force_h_n*self.mission.depart_proc_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (force_h_n*self.mission.depart_proc_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -633,8 +691,8 @@ class Aircraft:
   # vertical velocity: initial = 0, accelerates to accel_climb_v_m_p_s
   # return None if mission, propulsion, or environment object not populated
   def _calc_accel_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.accel_climb_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['accel_climb']*self.mission.accel_climb_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.accel_climb_v_m_p_s, self.mission.accel_climb_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -667,7 +725,7 @@ class Aircraft:
       force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
       force_v_n = (weight_n-lift_n)+self.max_takeoff_mass_kg*a_v_m_p_s2
 
-      return (force_h_n*self.mission.accel_climb_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW)
+      return (force_h_n*self.mission.accel_climb_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -700,8 +758,8 @@ class Aircraft:
   # includes aerodynamic lift, induced drag, parasite drag, and horizontal drag
   # return None if mission, propulsion, or environment object not populated
   def _calc_cruise_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_max_alt_kg_p_m3*self.mission.cruise_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['cruise']*self.mission.cruise_h_m_p_s**2.0
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
       lift_n = weight_n
       
@@ -719,7 +777,7 @@ class Aircraft:
       # total drag
       total_drag_n = (di_n+dp_n)*self.trim_drag_factor*self.excres_protub_factor
 
-      return (total_drag_n*self.mission.cruise_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (total_drag_n*self.mission.cruise_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -753,8 +811,8 @@ class Aircraft:
   # provide vertical thrust assist and spoiler drag (if needed)
   # return None if mission, propulsion, or environment object not populated
   def _calc_decel_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:     
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.decel_descend_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:     
+      q = 0.5*self.segment_air_density_kg_p_m3['decel_descend']*self.mission.decel_descend_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.decel_descend_v_m_p_s, self.mission.decel_descend_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -788,13 +846,13 @@ class Aircraft:
       force_v_n = (weight_n-lift_n)-self.max_takeoff_mass_kg*a_v_m_p_s2 # physical: downward, speeding up
 
       # compute shaft power baseline
-      shaft_power_kw = (force_h_n*self.mission.decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW)
+      shaft_power_kw = (force_h_n*self.mission.decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW)
 
       # check vertical deficit: if gravity cannot provide enough, add vertical thrust assist shaft power
       vertical_deficit_n = self.max_takeoff_mass_kg*a_v_m_p_s2-(weight_n-lift_n)
       shaft_power_deficit_kw = 0.0
       if vertical_deficit_n > 0.0:
-        shaft_power_deficit_kw = (vertical_deficit_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW)
+        shaft_power_deficit_kw = (vertical_deficit_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW)
 
       # total shaft power (baseline + vertical assist)
       shaft_power_kw += shaft_power_deficit_kw
@@ -813,7 +871,7 @@ class Aircraft:
         force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
 
         # total shaft power (with spoiler drag and vertical assist)
-        shaft_power_kw = (force_h_n*self.mission.decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW) + shaft_power_deficit_kw
+        shaft_power_kw = (force_h_n*self.mission.decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW) + shaft_power_deficit_kw
 
       return shaft_power_kw
     else:
@@ -848,8 +906,8 @@ class Aircraft:
   # includes aerodynamic lift, induced drag, parasite drag, and horizontal drag
   # return None if mission, propulsion, or environment object not populated
   def _calc_arrive_proc_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.arrive_proc_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['arrive_proc']*self.mission.arrive_proc_h_m_p_s**2.0
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
       # horizontal component
       lift_n = weight_n
@@ -866,7 +924,7 @@ class Aircraft:
       # force components
       force_h_n = total_drag_n
 
-      return (force_h_n*self.mission.arrive_proc_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (force_h_n*self.mission.arrive_proc_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -898,8 +956,8 @@ class Aircraft:
   # vertical velocity: initial = decel_descend_v_m_p_s, final = trans_descend_v_m_p_s
   # return None if mission, propulsion, or environment object not populated
   def _calc_trans_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.trans_descend_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['trans_descend']*self.mission.trans_descend_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.trans_descend_v_m_p_s, self.mission.trans_descend_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -935,13 +993,13 @@ class Aircraft:
       T_req_n = max(0.0, (weight_n - lift_n) + self.max_takeoff_mass_kg*a_v_m_p_s2)
 
       # induced velocity (momentum theory)
-      v_i_hover = math.sqrt(T_req_n/(2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+      v_i_hover = math.sqrt(T_req_n/(2.0*self.segment_air_density_kg_p_m3['trans_descend']*self._shared_propulsion.disk_area_m2))
 
       # hover-induced (assist) power
       P_hover_W = T_req_n*v_i_hover
 
       # baseline shaft power (vertical assist + horizontal forces)
-      shaft_power_kw = (P_hover_W+force_h_n*self.mission.trans_descend_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      shaft_power_kw = (P_hover_W+force_h_n*self.mission.trans_descend_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
       
       # check for negative power → apply spoiler drag to dissipate excess
       if shaft_power_kw < 0.0:
@@ -954,7 +1012,7 @@ class Aircraft:
         force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
 
         # recompute total shaft power with spoiler drag
-        shaft_power_kw = (P_hover_W+force_h_n*self.mission.trans_descend_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+        shaft_power_kw = (P_hover_W+force_h_n*self.mission.trans_descend_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
 
       return shaft_power_kw
     else:
@@ -990,7 +1048,7 @@ class Aircraft:
   # compute induced power from actual thrust
   # return None if mission, propulsion, or environment object not populated
   def _calc_hover_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
         
         # vertical kinematics (upward positive)
         v0_v_m_p_s = 2.0*self.mission.hover_descend_avg_v_m_p_s
@@ -1003,13 +1061,13 @@ class Aircraft:
 
         # induced velocity in hover (momentum theory)
         v_i_hover = math.sqrt(T_required_N / \
-                              (2.0*self.environ.air_density_sea_lvl_kg_p_m3 * self.propulsion.disk_area_m2))
+                              (2.0*self.segment_air_density_kg_p_m3['hover_descend'] * self._shared_propulsion.disk_area_m2))
 
         # induced power from actual thrust
         P_hover_W = T_required_N * v_i_hover
 
         # total shaft power (apply rotor efficiency once)
-        return P_hover_W / (self.propulsion.rotor_effic * W_P_KW)
+        return P_hover_W / (self._shared_propulsion.rotor_effic * W_P_KW)
     else:
         return None
 
@@ -1041,7 +1099,7 @@ class Aircraft:
   # includes horizontal acceleration effects (drag neglected)
   # return None if mission, propulsion, or environment object not populated
   def _calc_arrive_taxi_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
       # horizontal accelerations
       v0_h_m_p_s = 0.0
       vf_h_m_p_s = 2.0*self.mission.arrive_taxi_avg_h_m_p_s
@@ -1051,7 +1109,7 @@ class Aircraft:
       # horizontal force 
       force_h_n = self.max_takeoff_mass_kg*a_h_m_p_s2
 
-      return (force_h_n*self.mission.arrive_taxi_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (force_h_n*self.mission.arrive_taxi_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -1086,7 +1144,7 @@ class Aircraft:
   # required for vertical acceleration during reserve hover climb
   # return None if mission or propulsion object not populated
   def _calc_reserve_hover_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None:
+    if self.mission != None and self._shared_propulsion != None:
         
         # vertical kinematics (upward positive)
         d_v_m = self.mission.reserve_hover_climb_avg_v_m_p_s*self.mission.reserve_hover_climb_s
@@ -1098,12 +1156,12 @@ class Aircraft:
 
         # induced velocity in hover (prop thrust momentum theory)
         v_i_hover = math.sqrt(T_required_N/\
-                              (2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+                              (2.0*self.segment_air_density_kg_p_m3['reserve_hover_climb']*self._shared_propulsion.disk_area_m2))
 
         # induced power (hover)
         P_hover_W = T_required_N*v_i_hover
 
-        return P_hover_W/(self.propulsion.rotor_effic*W_P_KW)
+        return P_hover_W/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
         return None
 
@@ -1136,8 +1194,8 @@ class Aircraft:
   # vertical velocity: constant throughout the segment (no vertical acceleration)
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_trans_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.reserve_trans_climb_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['reserve_trans_climb']*self.mission.reserve_trans_climb_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.reserve_trans_climb_v_m_p_s, self.mission.reserve_trans_climb_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -1167,7 +1225,7 @@ class Aircraft:
       T_required_N = max(0.0, weight_n - lift_n + self.max_takeoff_mass_kg*a_v_m_p_s2)
 
       # induced velocity in transition (momentum theory)
-      v_i_hover = math.sqrt(T_required_N/(2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+      v_i_hover = math.sqrt(T_required_N/(2.0*self.segment_air_density_kg_p_m3['reserve_trans_climb']*self._shared_propulsion.disk_area_m2))
 
       # induced power (hover assist)
       P_hover_W = T_required_N*v_i_hover
@@ -1177,7 +1235,7 @@ class Aircraft:
 
       # total shaft power
       return (P_hover_W + force_h_n*self.mission.reserve_trans_climb_avg_h_m_p_s) / \
-            (self.propulsion.rotor_effic*W_P_KW)
+            (self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -1210,8 +1268,8 @@ class Aircraft:
   # vertical velocity: constant throughout the segment (no vertical acceleration)
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_accel_climb_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.reserve_accel_climb_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['reserve_accel_climb']*self.mission.reserve_accel_climb_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.reserve_accel_climb_v_m_p_s, self.mission.reserve_accel_climb_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -1240,7 +1298,7 @@ class Aircraft:
       # force components
       force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
       force_v_n = (weight_n-lift_n)+self.max_takeoff_mass_kg*a_v_m_p_s2
-      return (force_h_n*self.mission.reserve_accel_climb_avg_h_m_p_s+force_v_n*self.mission.reserve_accel_climb_v_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (force_h_n*self.mission.reserve_accel_climb_avg_h_m_p_s+force_v_n*self.mission.reserve_accel_climb_v_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -1272,8 +1330,8 @@ class Aircraft:
   # includes aerodynamic lift, induced drag, parasite drag, weight, and horizontal motion
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_cruise_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_max_alt_kg_p_m3*self.mission.reserve_cruise_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['reserve_cruise']*self.mission.reserve_cruise_h_m_p_s**2.0
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
       lift_n = weight_n
       
@@ -1291,7 +1349,7 @@ class Aircraft:
       # total drag
       total_drag_n = (di_n+dp_n)*self.trim_drag_factor*self.excres_protub_factor
 
-      return (total_drag_n*self.mission.reserve_cruise_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      return (total_drag_n*self.mission.reserve_cruise_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
     else:
       return None
 
@@ -1323,8 +1381,8 @@ class Aircraft:
   # provide vertical thrust assist and spoiler drag (if needed)
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_decel_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.reserve_decel_descend_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
+      q = 0.5*self.segment_air_density_kg_p_m3['reserve_decel_descend']*self.mission.reserve_decel_descend_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.reserve_decel_descend_v_m_p_s, self.mission.reserve_decel_descend_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -1358,14 +1416,14 @@ class Aircraft:
       force_v_n = (weight_n-lift_n)-self.max_takeoff_mass_kg*a_v_m_p_s2 # physical: downward, speeding up
 
       # compute shaft power baseline
-      shaft_power_kw = (force_h_n*self.mission.reserve_decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW)
+      shaft_power_kw = (force_h_n*self.mission.reserve_decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW)
       
       # check vertical deficit: if gravity cannot provide enough, add vertical thrust assist shaft power
       vertical_deficit_n = self.max_takeoff_mass_kg*a_v_m_p_s2-(weight_n-lift_n)
       shaft_power_deficit_kw = 0.0
       if vertical_deficit_n > 0.0:
         # convert deficit to power explicitly
-        shaft_power_deficit_kw = (vertical_deficit_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW)
+        shaft_power_deficit_kw = (vertical_deficit_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW)
       
       # total shaft power (baseline + vertical assist)
       shaft_power_kw += shaft_power_deficit_kw
@@ -1384,7 +1442,7 @@ class Aircraft:
         force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
       
         # total shaft power
-        shaft_power_kw = (force_h_n*self.mission.reserve_decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self.propulsion.rotor_effic*W_P_KW) + shaft_power_deficit_kw
+        shaft_power_kw = (force_h_n*self.mission.reserve_decel_descend_avg_h_m_p_s+force_v_n*(0.5*(v0_v_m_p_s+vf_v_m_p_s)))/(self._shared_propulsion.rotor_effic*W_P_KW) + shaft_power_deficit_kw
 
       return shaft_power_kw
     else:
@@ -1419,8 +1477,8 @@ class Aircraft:
   # horizontal velocity: initial from reserve decel segment to 0; vertical velocity changes from previous segment to final
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_trans_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:    
-      q = 0.5*self.environ.air_density_sea_lvl_kg_p_m3*self.mission.reserve_trans_descend_avg_h_m_p_s**2.0
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:    
+      q = 0.5*self.segment_air_density_kg_p_m3['reserve_trans_descend']*self.mission.reserve_trans_descend_avg_h_m_p_s**2.0
       theta = math.atan2(self.mission.reserve_trans_descend_v_m_p_s, self.mission.reserve_trans_descend_avg_h_m_p_s)
 
       weight_n = self.max_takeoff_mass_kg*self.environ.g_m_p_s2
@@ -1456,13 +1514,13 @@ class Aircraft:
       T_req_n = max(0.0, (weight_n - lift_n) + self.max_takeoff_mass_kg*a_v_m_p_s2)
 
       # induced velocity (momentum theory)
-      v_i_hover = math.sqrt(T_req_n/(2.0*self.environ.air_density_sea_lvl_kg_p_m3*self.propulsion.disk_area_m2))
+      v_i_hover = math.sqrt(T_req_n/(2.0*self.segment_air_density_kg_p_m3['reserve_trans_descend']*self._shared_propulsion.disk_area_m2))
 
       # hover-induced (assist) power
       P_hover_W = T_req_n*v_i_hover
 
       # baseline shaft power (vertical assist + horizontal forces)
-      shaft_power_kw = (P_hover_W+force_h_n*self.mission.reserve_trans_descend_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+      shaft_power_kw = (P_hover_W+force_h_n*self.mission.reserve_trans_descend_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
       
       # check for negative power → apply spoiler drag to dissipate excess
       if shaft_power_kw < 0.0:
@@ -1475,7 +1533,7 @@ class Aircraft:
         force_h_n = total_drag_n+self.max_takeoff_mass_kg*a_h_m_p_s2
 
         # recompute total shaft power with spoiler drag
-        shaft_power_kw = (P_hover_W+force_h_n*self.mission.reserve_trans_descend_avg_h_m_p_s)/(self.propulsion.rotor_effic*W_P_KW)
+        shaft_power_kw = (P_hover_W+force_h_n*self.mission.reserve_trans_descend_avg_h_m_p_s)/(self._shared_propulsion.rotor_effic*W_P_KW)
 
       return shaft_power_kw
     else:
@@ -1511,7 +1569,7 @@ class Aircraft:
   # compute induced power from actual thrust
   # return None if mission, propulsion, or environment object not populated
   def _calc_reserve_hover_descend_avg_shaft_power_kw(self):
-    if self.mission != None and self.propulsion != None and self.environ != None:
+    if self.mission != None and self._shared_propulsion != None and self.environ != None:
         
         # vertical kinematics (upward positive)
         v0_v_m_p_s = 2.0*self.mission.reserve_hover_descend_avg_v_m_p_s
@@ -1524,13 +1582,13 @@ class Aircraft:
 
         # induced velocity in hover (momentum theory)
         v_i_hover = math.sqrt(T_required_N / \
-                              (2.0*self.environ.air_density_sea_lvl_kg_p_m3 * self.propulsion.disk_area_m2))
+                              (2.0*self.segment_air_density_kg_p_m3['reserve_hover_descend'] * self._shared_propulsion.disk_area_m2))
 
         # induced power from actual thrust
         P_hover_W = T_required_N * v_i_hover
 
         # total shaft power (apply rotor efficiency once)
-        return P_hover_W / (self.propulsion.rotor_effic * W_P_KW)
+        return P_hover_W / (self._shared_propulsion.rotor_effic * W_P_KW)
     else:
         return None
 
@@ -1684,11 +1742,11 @@ class Aircraft:
   # estimates boom structural mass [kg] using NDARC engine support model and cowling equations
   # based on EPU weight, rotor count, rotor diameter, and wing MAC
   def _calc_boom_mass_kg(self):
-    if self.propulsion is None:
+    if self._shared_propulsion is None:
       return None
     single_epu_mass_lb = self.single_epu_mass_kg*KG_2_LB
-    rotor_count = self.propulsion.rotor_count
-    rotor_diameter_m = self.propulsion.rotor_diameter_m
+    rotor_count = self._shared_propulsion.rotor_count
+    rotor_diameter_m = self._shared_propulsion.rotor_diameter_m
     wing_mac_m = self.wing_mac_m
 
     boom_mass_kg = (
@@ -1706,27 +1764,30 @@ class Aircraft:
   # using parametric model from FHE based on Magicall datasheet 
   # scales single EPU mass by number of rotors
   def _calc_epu_mass_kg(self):
-    if self.propulsion is None:
+    if self._shared_propulsion is None:
       return None
     else:
-      return self.single_epu_mass_kg*self.propulsion.rotor_count
+      return self.single_epu_mass_kg*self._shared_propulsion.rotor_count
     
   # NDARC Section 19.2 AFDD00 rotor + hub mass model
   # assumes 2-bladed rotors, flap natural frequency at 1.1 × max RPM
-  # returns lift rotor + hub mass [kg]
-  def _calc_lift_rotor_hub_mass_kg(self):
-    if self.propulsion is None or self.environ is None:
+  # returns lift rotor + hub mass [kg] of lift_rotor_count rotors (default:
+  # propulsion lift_rotor_count); e.g. the rotors of n ABUs
+  def _calc_lift_rotor_hub_mass_kg(self, lift_rotor_count=None):
+    if self._shared_propulsion is None or self.environ is None:
       return None
-    rotor_radius_ft = (self.propulsion.rotor_diameter_m / 2.0) * M_2_FT
+    if lift_rotor_count is None:
+      lift_rotor_count = self._shared_propulsion.lift_rotor_count
+    rotor_radius_ft = (self._shared_propulsion.rotor_diameter_m / 2.0) * M_2_FT
     solidity = self.rotor_solidity
     sound_speed_m_p_s = self.environ.sound_speed_m_p_s
-    tip_mach = self.propulsion.tip_mach
+    tip_mach = self._shared_propulsion.tip_mach
     rho_sl = self.environ.air_density_sea_lvl_kg_p_m3
     rho_alt = self.environ.air_density_max_alt_kg_p_m3
     over_torque_factor = self.over_torque_factor
 
     # common geometric term:
-    term_common = (math.pi / 2.0/ 2.0) * self.propulsion.rotor_diameter_m * solidity * M_2_FT
+    term_common = (math.pi / 2.0/ 2.0) * self._shared_propulsion.rotor_diameter_m * solidity * M_2_FT
 
     tip_speed_ft_s = (
       sound_speed_m_p_s
@@ -1739,7 +1800,7 @@ class Aircraft:
     lift_rotor_hub_mass_lb = (
       (
         0.0024419
-        * (self.propulsion.lift_rotor_count)
+        * lift_rotor_count
         * (2.0 ** 0.53479)
         * (rotor_radius_ft ** 1.74231)
         * (term_common ** 0.77291)
@@ -1748,7 +1809,7 @@ class Aircraft:
       )
       + (
         0.00037547
-        * (self.propulsion.lift_rotor_count)
+        * lift_rotor_count
         * (2.0 ** 0.71443)
         * (rotor_radius_ft ** 1.99321)
         * (term_common ** 0.79577)
@@ -1763,19 +1824,19 @@ class Aircraft:
   # assumes 3-bladed rotors, flap natural frequency at 1.1 × max RPM
   # returns tilt rotor mass [kg]
   def _calc_tilt_rotor_mass_kg(self):
-    if self.propulsion is None or self.environ is None:
+    if self._shared_propulsion is None or self.environ is None:
       return None
     
-    rotor_radius_ft = (self.propulsion.rotor_diameter_m / 2.0) * M_2_FT
+    rotor_radius_ft = (self._shared_propulsion.rotor_diameter_m / 2.0) * M_2_FT
     solidity = self.rotor_solidity
     sound_speed_m_p_s = self.environ.sound_speed_m_p_s
-    tip_mach = self.propulsion.tip_mach
+    tip_mach = self._shared_propulsion.tip_mach
     rho_sl = self.environ.air_density_sea_lvl_kg_p_m3
     rho_alt = self.environ.air_density_max_alt_kg_p_m3
     over_torque_factor = self.over_torque_factor
 
     # common geometric term 
-    term_common = (math.pi / 2.0 / 3.0) * self.propulsion.rotor_diameter_m * solidity * M_2_FT
+    term_common = (math.pi / 2.0 / 3.0) * self._shared_propulsion.rotor_diameter_m * solidity * M_2_FT
 
     tip_speed_ft_s = (
       sound_speed_m_p_s
@@ -1788,7 +1849,7 @@ class Aircraft:
     tilt_rotor_mass_lb = (
       (
         0.0024419 * 1.1794
-        * (self.propulsion.tilt_rotor_count)
+        * (self._shared_propulsion.tilt_rotor_count)
         * (3.0 ** 0.53479)
         * (rotor_radius_ft ** 1.74231)
         * (term_common ** 0.77291)
@@ -1797,7 +1858,7 @@ class Aircraft:
       )
       + (
         0.00037547 * (1.1794 ** 1.02958)
-        * (self.propulsion.tilt_rotor_count)
+        * (self._shared_propulsion.tilt_rotor_count)
         * (3.0 ** 0.71443)
         * (rotor_radius_ft ** 1.99321)
         * (term_common ** 0.79577)
@@ -1832,8 +1893,56 @@ class Aircraft:
     subtotal = structural_mass + subsys_mass
     return subtotal * (1.0 + self.mass_margin_factor)
 
+  # energy [kW*hr] of mission segment seg_name (e.g. 'hover_descend')
+  # with duration_s given, the energy is computed as if the mission segment
+  # lasted duration_s; this aircraft and its mission are not modified, so
+  # evaluators may run concurrently on different aircraft
+  def segment_energy_kw_hr(self, seg_name, duration_s=None):
+    if duration_s is None:
+      return getattr(self, seg_name+'_energy_kw_hr')
+    mission = self._mission.replace(**{seg_name+'_s': duration_s})
+    return getattr(self.with_overrides(mission=mission), seg_name+'_energy_kw_hr')
+
+  # return a what-if copy of this aircraft with the given inputs replaced, e.g.
+  #  aircraft.with_overrides(max_takeoff_mass_kg=3500.0)
+  # inputs are aircraft properties loaded from JSON (max_takeoff_mass_kg,
+  # payload_kg, ...) or the has-a objects (environ, mission, power, propulsion)
+  # the copy starts from this aircraft's cached quantities and recomputes only
+  # those that depend on a tracked input (max_takeoff_mass_kg or a has-a
+  # object); any other input recomputes everything
+  # this aircraft is not modified
+  def with_overrides(self, **inputs):
+    view = copy.copy(self)
+    view._cache = self._cache.copy()
+    for name, value in inputs.items():
+      if not isinstance(getattr(type(self), name, None), property) or \
+         not hasattr(self, '_'+name):
+        raise ValueError(f"'{name}' is not an Aircraft input")
+      setattr(view, '_'+name, value)
+    if all(name in TRACKED_INPUTS for name in inputs):
+      view._cache.invalidate(*inputs)
+    else:
+      view._cache.clear()
+    bind_view(view)
+    return view
+
+  # return a context that counts and times the _calc_* calls of this aircraft
+  # and of what-if views made from it, e.g.
+  #  with aircraft.profile() as profiler:
+  #    aircraft._iterate_mtow()
+  #  print(profiler.format_tree())
+  #  profiler.write_folded('mtow.folded') # input to flamegraph.pl or speedscope
+  # profiling is off outside the context and then costs nothing (see profiler.py)
+  def profile(self):
+    return profile_calls(self)
+
   # iterate Maximum Takeoff Weight (MTOW) until convergence
-  def _iterate_mtow(self, tol=1e-3, max_iter=150):
+  # with sensitivities=True, also returns {input name: dMTOW/dinput} for every
+  # numeric input, from implicit differentiation of the converged fixed point
+  # MTOW = empty(MTOW) + payload + battery(MTOW) (see optimize.py); the
+  # sensitivities are None if the iteration did not converge within max_iter,
+  # as the fixed point they differentiate was not reached
+  def _iterate_mtow(self, tol=1e-3, max_iter=150, sensitivities=False):
     mtow_guess = self.max_takeoff_mass_kg
     history = []
 
@@ -1868,12 +1977,16 @@ class Aircraft:
 
       if abs(delta) < tol:
         self.max_takeoff_mass_kg = new_mtow
+        if sensitivities:
+          return new_mtow, history, calc_mtow_sensitivities(params_from_aircraft(self))
         return new_mtow, history
       
       mtow_guess = new_mtow
     
     self.max_takeoff_mass_kg = mtow_guess
 
+    if sensitivities:
+      return mtow_guess, history, None
     return mtow_guess, history
 
   # ABU Evaluator 1 - Assisted Takeoff
@@ -1907,9 +2020,9 @@ class Aircraft:
 
     ## helpers
     # get per-segment energy (kWh)
-    def _get_seg_energy_kwh(seg_name):
+    def _get_seg_energy_kwh(seg_name, aircraft=self):
       try:
-        val = getattr(self, f"{seg_name}_energy_kw_hr")
+        val = getattr(aircraft, f"{seg_name}_energy_kw_hr")
         return 0.0 if val is None else float(val)
       except AttributeError:
         return 0.0
@@ -1927,26 +2040,6 @@ class Aircraft:
         return 0.0
       return (e_kwh * 1000.0) / usable_wh_per_kg
 
-    # estimate ABU rotor+hub mass using NDARC Section 19.2 AFDD00 rotor + hub mass model
-    def _calc_single_lift_rotor_hub_mass_kg():
-      """
-      Quick patch: temporarily override lift_rotor_count in propulsion
-      to reuse existing NDARC rotor+hub mass function.
-      """
-      # save original getter
-      orig_getter = type(self.propulsion).lift_rotor_count.fget
-
-      try:
-        # monkey patch to force number of rotors
-        type(self.propulsion).lift_rotor_count = property(lambda _self: n_abus)
-
-        # call original mass function
-        return self._calc_lift_rotor_hub_mass_kg()
-
-      finally:
-        # restore original getter 
-        type(self.propulsion).lift_rotor_count = property(orig_getter)
-
     ## baseline values (no ABU attached)
     baseline_batt_mass_kg = self._calc_battery_mass_kg()
     empty_mass_kg = self._calc_empty_mass_kg()
@@ -1956,7 +2049,6 @@ class Aircraft:
     prev_mtow_kg = self.max_takeoff_mass_kg  # baseline MTOW
 
     # baseline total mission energy (kWh)
-    self._max_takeoff_mass_kg = prev_mtow_kg
     ordered_segments = [
       "depart_taxi","hover_climb","trans_climb","depart_proc","accel_climb",
       "cruise","decel_descend","arrive_proc","trans_descend","hover_descend","arrive_taxi",
@@ -1971,7 +2063,7 @@ class Aircraft:
     m_batt_ops_per_abu_kg = _energy_kwh_to_batt_kg(E_ops_per_abu_kwh)
 
     # rotor mass per ABU 
-    rot_hub_single_kg = _calc_single_lift_rotor_hub_mass_kg()
+    rot_hub_single_kg = self._calc_lift_rotor_hub_mass_kg(n_abus)
     m_rotor_per_abu_kg = rot_hub_single_kg
 
     # total ABU mass per unit
@@ -2002,8 +2094,8 @@ class Aircraft:
       # Stage A: Pre-detach evaluation with ABU(s) attached
       # ----------------------------
       # MTOW while ABU(s) are attached
-      MTOW_attached = self._max_takeoff_mass_kg + m_abu_total_all_kg
-      self._max_takeoff_mass_kg = MTOW_attached
+      MTOW_attached = prev_mtow_kg + m_abu_total_all_kg
+      attached = self.with_overrides(max_takeoff_mass_kg=MTOW_attached)
 
       # sequentially step through the candidate's pre-detach segments
       # consume ABU mission energy 
@@ -2014,7 +2106,7 @@ class Aircraft:
 
       # for each pre-detach segment
       for s in segs:
-        seg_total_kwh = _get_seg_energy_kwh(s)
+        seg_total_kwh = _get_seg_energy_kwh(s, attached)
         # ABU supplies up to remaining mission energy it still has
         # if ABU mission energy exhausted before finishing candidate segments, the logic below already handles it because supplied_by_abu_kwh will be 0
         supplied_by_abu_kwh = min(seg_total_kwh, E_abu_remaining_kwh)
@@ -2045,7 +2137,7 @@ class Aircraft:
       # ----------------------------
       # Stage C: Post-detach evaluation at lighter MTOW (ABUs detached)
       # ----------------------------
-      self._max_takeoff_mass_kg = MTOW_detached
+      detached = self.with_overrides(max_takeoff_mass_kg=MTOW_detached)
 
       post_detach_log = {}
       # aircraft battery supply post-detach
@@ -2064,7 +2156,7 @@ class Aircraft:
 
       # calculations for each remaining segment
       for rs in remaining_segs:
-        seg_kwh = _get_seg_energy_kwh(rs) # evaluated at MTOW_detached
+        seg_kwh = _get_seg_energy_kwh(rs, detached) # evaluated at MTOW_detached
         post_detach_log[rs] = seg_kwh
         remaining_energy_kwh_post += seg_kwh
 
@@ -2089,9 +2181,6 @@ class Aircraft:
       # the amount of energy the aircraft must supply over the whole mission
       aircraft_total_kwh_after = aircraft_energy_pre_detach_kwh + remaining_energy_kwh_post
 
-      # restore MTOW to baseline 
-      self._max_takeoff_mass_kg = prev_mtow_kg
-
       # ABU mass breakdown details
       abu_mass_breakdown = {
         "n_abus": n_abus,
@@ -2133,7 +2222,7 @@ class Aircraft:
   # saved baseline battery energy is converted into extra flight time and range.
   # structural + integration overheads are modeled per ABU specs.
   def _evaluate_extended_flight(self, E_mission_kwh_per_abu_list, abu_spec=None):
-    if self.mission == None or self.propulsion == None or self.environ == None or self.power == None:
+    if self.mission == None or self._shared_propulsion == None or self.environ == None or self.power == None:
       return None
 
     results = []
@@ -2158,25 +2247,9 @@ class Aircraft:
         "integration_frac": 0.05,        # integration hardware fraction of battery mass
       }
 
-    # estimate ABU rotor+hub mass using NDARC Section 19.2 AFDD00 rotor + hub mass model
-    def _calc_single_lift_rotor_hub_mass_kg():
-      """
-      Quick patch: temporarily override lift_rotor_count in propulsion
-      to reuse existing NDARC rotor+hub mass function.
-      """
-      # save original getter
-      orig_getter = type(self.propulsion).lift_rotor_count.fget
-
-      try:
-        # monkey patch to force number of rotors
-        type(self.propulsion).lift_rotor_count = property(lambda _self: n_abus)
-
-        # call original mass function
-        return self._calc_lift_rotor_hub_mass_kg()
-
-      finally:
-        # restore original getter 
-        type(self.propulsion).lift_rotor_count = property(orig_getter)
+    # the rotor mass of each sweep point after the first is evaluated at the
+    # previous point's attached MTOW
+    rotor_mass_aircraft = self
 
     # sweep ABU mission energy levels
     for E_abu_kwh in E_mission_kwh_per_abu_list:
@@ -2195,7 +2268,7 @@ class Aircraft:
       )
 
       # rotor mass per ABU 
-      m_rot_hub_kg = _calc_single_lift_rotor_hub_mass_kg()
+      m_rot_hub_kg = rotor_mass_aircraft._calc_lift_rotor_hub_mass_kg(n_abus)
 
       # add structural and integration overhead
       m_abu_struct_kg = abu_spec["struct_frac"] * m_abu_batt_kg
@@ -2205,11 +2278,12 @@ class Aircraft:
       m_abu_total_kg = m_abu_batt_kg + m_abu_struct_kg + m_abu_integ_kg + m_rot_hub_kg
       m_abu_total_all_kg = n_abus * m_abu_total_kg
 
-      # temporarily increase MTOW during ABU-assisted cruise
-      self.max_takeoff_mass_kg = baseline_mtow_kg + m_abu_total_all_kg
+      # heavier MTOW during ABU-assisted cruise
+      attached = self.with_overrides(max_takeoff_mass_kg=baseline_mtow_kg + m_abu_total_all_kg)
+      rotor_mass_aircraft = attached
 
       # compute cruise energy with ABU-attached configuration
-      E_cruise_attach_kwh = self._calc_cruise_energy_kw_hr()
+      E_cruise_attach_kwh = attached._calc_cruise_energy_kw_hr()
 
       # ABU provides up to its mission energy capacity
       E_abu_used_kwh = min(E_mission_kwh_per_abu * n_abus, E_cruise_attach_kwh)
@@ -2241,9 +2315,6 @@ class Aircraft:
         "extra_range_mi": extra_range_mi
       })
 
-    # restore original MTOW
-    self.max_takeoff_mass_kg = baseline_mtow_kg
-
     # return results for all ABU cases
     return results
 
@@ -2253,7 +2324,7 @@ class Aircraft:
   # splits segment into two phases: attached (ABU supplies power) and post-detach (aircraft only)
   # structural + integration overheads are modeled per ABU specs.
   def _evaluate_extended_flight_detach_on_depletion_or_end(self, E_mission_kwh_per_abu_list, abu_spec=None):
-    if self.mission == None or self.propulsion == None or self.environ == None or self.power == None:
+    if self.mission == None or self._shared_propulsion == None or self.environ == None or self.power == None:
       return None
 
     results = []
@@ -2278,25 +2349,9 @@ class Aircraft:
         "integration_frac": 0.05,        # integration hardware fraction of battery mass
       }
 
-    # estimate ABU rotor+hub mass using NDARC Section 19.2 AFDD00 rotor + hub mass model
-    def _calc_single_lift_rotor_hub_mass_kg():
-      """
-      Quick patch: temporarily override lift_rotor_count in propulsion
-      to reuse existing NDARC rotor+hub mass function.
-      """
-      # save original getter
-      orig_getter = type(self.propulsion).lift_rotor_count.fget
-
-      try:
-        # monkey patch to force number of rotors
-        type(self.propulsion).lift_rotor_count = property(lambda _self: n_abus)
-
-        # call original mass function
-        return self._calc_lift_rotor_hub_mass_kg()
-
-      finally:
-        # restore original getter 
-        type(self.propulsion).lift_rotor_count = property(orig_getter)
+    # the rotor mass of each sweep point after the first is evaluated at the
+    # previous point's attached MTOW
+    rotor_mass_aircraft = self
 
     # sweep ABU mission energies
     for E_abu_kwh in E_mission_kwh_per_abu_list:
@@ -2315,7 +2370,7 @@ class Aircraft:
       )
 
       # rotor mass per ABU 
-      m_rot_hub_kg = _calc_single_lift_rotor_hub_mass_kg()
+      m_rot_hub_kg = rotor_mass_aircraft._calc_lift_rotor_hub_mass_kg(n_abus)
 
       # add structural and integration overhead
       m_abu_struct_kg = abu_spec["struct_frac"] * m_abu_batt_kg
@@ -2328,8 +2383,9 @@ class Aircraft:
       # ------------------------------
       # Phase 1: Attached (ABU supplies power)
       # ------------------------------
-      self.max_takeoff_mass_kg = baseline_mtow_kg + m_abu_total_all_kg
-      P_cruise_attach_kw = self._calc_cruise_avg_electric_power_kw()
+      attached = self.with_overrides(max_takeoff_mass_kg=baseline_mtow_kg + m_abu_total_all_kg)
+      rotor_mass_aircraft = attached
+      P_cruise_attach_kw = attached._calc_cruise_avg_electric_power_kw()
       if P_cruise_attach_kw == None:
         continue
 
@@ -2401,9 +2457,6 @@ class Aircraft:
         "full_coverage_flag": full_coverage_flag
       })
 
-    # restore MTOW
-    self.max_takeoff_mass_kg = baseline_mtow_kg
-
     return results
 
   # ABU Evaluator 3: Landing Safety with ABU (loiter + divert + descend to alternate)
@@ -2429,7 +2482,7 @@ class Aircraft:
                                       t_hover_s,
                                       t_hover_descend_s,
                                       abu_spec=None):
-    if self.mission is None or self.propulsion is None or self.environ is None or self.power is None:
+    if self.mission is None or self._shared_propulsion is None or self.environ is None or self.power is None:
       return None
 
     results = []
@@ -2451,26 +2504,6 @@ class Aircraft:
         "integration_frac": 0.05,        # integration hardware fraction of battery mass
       }
 
-    # estimate ABU rotor+hub mass using NDARC Section 19.2 AFDD00 rotor + hub mass model
-    def _calc_single_lift_rotor_hub_mass_kg():
-      """
-      Quick patch: temporarily override lift_rotor_count in propulsion
-      to reuse existing NDARC rotor+hub mass function.
-      """
-      # save original getter
-      orig_getter = type(self.propulsion).lift_rotor_count.fget
-
-      try:
-        # monkey patch to force number of rotors
-        type(self.propulsion).lift_rotor_count = property(lambda _self: n_abus)
-
-        # call original mass function
-        return self._calc_lift_rotor_hub_mass_kg()
-
-      finally:
-        # restore original getter 
-        type(self.propulsion).lift_rotor_count = property(orig_getter)
-
     # sweep ABU mission energies
     for E_mission_kwh_per_abu in E_mission_kwh_per_abu_list:
 
@@ -2487,7 +2520,7 @@ class Aircraft:
       )
 
       # rotor mass per ABU 
-      m_rot_hub_kg = _calc_single_lift_rotor_hub_mass_kg()
+      m_rot_hub_kg = self._calc_lift_rotor_hub_mass_kg(n_abus)
 
       # add structural and integration overhead
       m_abu_struct_kg = abu_spec["struct_frac"] * m_abu_batt_kg
@@ -2498,81 +2531,60 @@ class Aircraft:
       m_abu_total_all_kg     = n_abus * m_abu_total_per_abu_kg
 
       # attach ABU to compute attached powers
-      try:
-        self.max_takeoff_mass_kg = baseline_mtow_kg + m_abu_total_all_kg
-
-        # hover & cruise powers with ABU attached
-        P_hover_attach_kw  = self._calc_hover_electric_power_kw()
-        P_cruise_attach_kw = self._calc_cruise_avg_electric_power_kw()
+      attached = self.with_overrides(max_takeoff_mass_kg=baseline_mtow_kg + m_abu_total_all_kg)
 
-        # 1. hover energy
-        E_hover_kwh = P_hover_attach_kw * (t_hover_s / 3600.0)
+      # hover & cruise powers with ABU attached
+      P_hover_attach_kw  = attached._calc_hover_electric_power_kw()
+      P_cruise_attach_kw = attached._calc_cruise_avg_electric_power_kw()
 
-        # 2. divert cruise to alternate 
-        t_divert_s = divert_distance_mi * 1609.34 / V_cruise_m_p_s
-        E_divert_kwh = P_cruise_attach_kw * (t_divert_s / 3600.0)
+      # 1. hover energy
+      E_hover_kwh = P_hover_attach_kw * (t_hover_s / 3600.0)
 
-        # 3. hover descent (landing) energy
-        E_hover_descend_kwh = 0.0
+      # 2. divert cruise to alternate 
+      t_divert_s = divert_distance_mi * 1609.34 / V_cruise_m_p_s
+      E_divert_kwh = P_cruise_attach_kw * (t_divert_s / 3600.0)
 
-        try:
-          # save original property getter
-          orig_prop = type(self.mission).hover_descend_s
-          orig_getter = getattr(type(self.mission), 'hover_descend_s', None)
+      # 3. hover descent (landing) energy with the custom hover-descent time
+      E_hover_descend_kwh = attached.segment_energy_kw_hr('hover_descend', t_hover_descend_s)
 
-          # temporarily override to return custom hover-descent time
-          type(self.mission).hover_descend_s = property(lambda _self: t_hover_descend_s)
+      # 4. ABU ops reserve 
+      E_ops_kwh_total = n_abus * E_ops_kwh_per_abu
 
-          # compute energy with patched mission segment
-          E_hover_descend_kwh = self._calc_hover_descend_energy_kw_hr()
+      # 5. energy available for loiter
+      E_abu_mission_total_kwh = n_abus * E_mission_kwh_per_abu
+      E_required_after_loiter_kwh = E_hover_kwh + E_divert_kwh + E_hover_descend_kwh + E_ops_kwh_total
+      E_available_for_loiter_kwh  = E_abu_mission_total_kwh - E_required_after_loiter_kwh
 
-        finally:
-          # Restore the original property definition
-          if orig_getter is not None:
-            type(self.mission).hover_descend_s = orig_prop
+      # 6. maximum extra safe loiter (hover) time 
+      t_loiter_hover_max_s = max(0.0, E_available_for_loiter_kwh / P_hover_attach_kw * 3600.0)
 
-        # 4. ABU ops reserve 
-        E_ops_kwh_total = n_abus * E_ops_kwh_per_abu
-
-        # 5. energy available for loiter
-        E_abu_mission_total_kwh = n_abus * E_mission_kwh_per_abu
-        E_required_after_loiter_kwh = E_hover_kwh + E_divert_kwh + E_hover_descend_kwh + E_ops_kwh_total
-        E_available_for_loiter_kwh  = E_abu_mission_total_kwh - E_required_after_loiter_kwh
-
-        # 6. maximum extra safe loiter (hover) time 
-        t_loiter_hover_max_s = max(0.0, E_available_for_loiter_kwh / P_hover_attach_kw * 3600.0)
-
-        feasible = (E_available_for_loiter_kwh >= 0.0)
-        margin_kwh = E_available_for_loiter_kwh  # negative means shortfall
-
-        results.append({
-          "n_abus": n_abus,
-          "E_abu_mission_kwh": E_mission_kwh_per_abu,
-          "E_abu_total_kwh": E_total_kwh_per_abu,
-          "m_abu_batt_kg": m_abu_batt_kg,
-          "m_abu_struct_kg": m_abu_struct_kg,
-          "m_abu_integ_kg": m_abu_integ_kg,
-          "m_rot_hub_kg": m_rot_hub_kg,
-          "m_abu_total_all_kg": m_abu_total_all_kg,
-          "P_hover_attach_kw": P_hover_attach_kw,
-          "P_cruise_attach_kw": P_cruise_attach_kw,
-          "t_divert_s": t_divert_s,
-          "divert_distance_mi": divert_distance_mi,
-          "E_divert_kwh": E_divert_kwh,
-          "t_hover_s": t_hover_s,
-          "E_hover_kwh": E_hover_kwh,
-          "t_hover_descend_s": t_hover_descend_s,
-          "E_hover_descend_kwh": E_hover_descend_kwh,
-          "E_ops_kwh_total": E_ops_kwh_total,
-          "t_loiter_hover_max_s": t_loiter_hover_max_s,
-          "feasible": feasible,
-          "margin_kwh": margin_kwh,
-          "note": "feasible" if feasible else "Insufficient ABU mission energy"
-        })
+      feasible = (E_available_for_loiter_kwh >= 0.0)
+      margin_kwh = E_available_for_loiter_kwh  # negative means shortfall
 
-      finally:
-        # restore MTOW
-        self.max_takeoff_mass_kg = baseline_mtow_kg
+      results.append({
+        "n_abus": n_abus,
+        "E_abu_mission_kwh": E_mission_kwh_per_abu,
+        "E_abu_total_kwh": E_total_kwh_per_abu,
+        "m_abu_batt_kg": m_abu_batt_kg,
+        "m_abu_struct_kg": m_abu_struct_kg,
+        "m_abu_integ_kg": m_abu_integ_kg,
+        "m_rot_hub_kg": m_rot_hub_kg,
+        "m_abu_total_all_kg": m_abu_total_all_kg,
+        "P_hover_attach_kw": P_hover_attach_kw,
+        "P_cruise_attach_kw": P_cruise_attach_kw,
+        "t_divert_s": t_divert_s,
+        "divert_distance_mi": divert_distance_mi,
+        "E_divert_kwh": E_divert_kwh,
+        "t_hover_s": t_hover_s,
+        "E_hover_kwh": E_hover_kwh,
+        "t_hover_descend_s": t_hover_descend_s,
+        "E_hover_descend_kwh": E_hover_descend_kwh,
+        "E_ops_kwh_total": E_ops_kwh_total,
+        "t_loiter_hover_max_s": t_loiter_hover_max_s,
+        "feasible": feasible,
+        "margin_kwh": margin_kwh,
+        "note": "feasible" if feasible else "Insufficient ABU mission energy"
+      })
 
     return results
 
@@ -2602,7 +2614,7 @@ class Aircraft:
                                               t_hover_descend_s,
                                               tol=1e-3,
                                               max_iter=100):
-    if self.mission is None or self.propulsion is None or self.environ is None or self.power is None:
+    if self.mission is None or self._shared_propulsion is None or self.environ is None or self.power is None:
       return None
 
     # battery sizing parameters
@@ -2633,105 +2645,87 @@ class Aircraft:
 
     # iterate MTOW increment due to added contingency battery mass
     for i in range(max_iter):
-      try:
-        self.max_takeoff_mass_kg = mtow_guess
-
-        # baseline mission energy at this (temporary) MTOW
-        E_baseline_kwh = self._calc_total_mission_energy_kw_hr()
-        if E_baseline_kwh is None:
-          return None
+      guess = self.with_overrides(max_takeoff_mass_kg=mtow_guess)
 
-        # compute powers at this MTOW
-        P_hover_kw = self._calc_hover_electric_power_kw()
-        P_cruise_kw = self._calc_cruise_avg_electric_power_kw()
-        if P_hover_kw is None or P_cruise_kw is None:
-          return None
-
-        V_cruise_m_p_s = self.mission.cruise_h_m_p_s
-        if V_cruise_m_p_s is None or V_cruise_m_p_s <= 0.0:
-          return None
-
-        # 1) loiter/hover energy
-        E_hover_loiter_kwh = P_hover_kw * (t_hover_s / 3600.0)
+      # baseline mission energy at this MTOW guess
+      E_baseline_kwh = guess._calc_total_mission_energy_kw_hr()
+      if E_baseline_kwh is None:
+        return None
 
-        # 2) divert cruise energy
-        t_divert_s = divert_distance_mi * 1609.34 / V_cruise_m_p_s
-        E_divert_kwh = P_cruise_kw * (t_divert_s / 3600.0)
+      # compute powers at this MTOW
+      P_hover_kw = guess._calc_hover_electric_power_kw()
+      P_cruise_kw = guess._calc_cruise_avg_electric_power_kw()
+      if P_hover_kw is None or P_cruise_kw is None:
+        return None
 
-        # 3) hover descent (landing) energy with patched hover_descend_s
-        E_hover_descend_kwh = 0.0
+      V_cruise_m_p_s = self.mission.cruise_h_m_p_s
+      if V_cruise_m_p_s is None or V_cruise_m_p_s <= 0.0:
+        return None
 
-        try:
-          orig_prop = type(self.mission).hover_descend_s
-          orig_getter = getattr(type(self.mission), 'hover_descend_s', None)
+      # 1) loiter/hover energy
+      E_hover_loiter_kwh = P_hover_kw * (t_hover_s / 3600.0)
 
-          type(self.mission).hover_descend_s = property(lambda _self: t_hover_descend_s)
+      # 2) divert cruise energy
+      t_divert_s = divert_distance_mi * 1609.34 / V_cruise_m_p_s
+      E_divert_kwh = P_cruise_kw * (t_divert_s / 3600.0)
 
-          E_hover_descend_kwh = self._calc_hover_descend_energy_kw_hr()
-          if E_hover_descend_kwh is None:
-            return None
+      # 3) hover descent (landing) energy with the custom hover_descend_s
+      E_hover_descend_kwh = guess.segment_energy_kw_hr('hover_descend', t_hover_descend_s)
+      if E_hover_descend_kwh is None:
+        return None
 
-        finally:
-          if orig_getter is not None:
-            type(self.mission).hover_descend_s = orig_prop
+      # contingency energy required for landing disruption
+      E_divert_required_kwh = E_hover_loiter_kwh + E_divert_kwh + E_hover_descend_kwh
 
-        # contingency energy required for landing disruption
-        E_divert_required_kwh = E_hover_loiter_kwh + E_divert_kwh + E_hover_descend_kwh
+      # 4) incremental battery mass required for the contingency ONLY
+      # (do not re-size baseline pack; just add mass on top of baseline aircraft)
+      delta_batt_mass_kg = _battery_mass_from_energy_kwh(E_divert_required_kwh)
 
-        # 4) incremental battery mass required for the contingency ONLY
-        # (do not re-size baseline pack; just add mass on top of baseline aircraft)
-        delta_batt_mass_kg = _battery_mass_from_energy_kwh(E_divert_required_kwh)
+      # new MTOW = baseline MTOW + incremental contingency battery mass
+      new_mtow_kg = baseline_mtow_kg + delta_batt_mass_kg
+      delta_kg = new_mtow_kg - mtow_guess
 
-        # new MTOW = baseline MTOW + incremental contingency battery mass
-        new_mtow_kg = baseline_mtow_kg + delta_batt_mass_kg
-        delta_kg = new_mtow_kg - mtow_guess
+      # total energy required
+      E_total_required_kwh = E_baseline_kwh + E_divert_required_kwh
 
-        # total energy required
-        E_total_required_kwh = E_baseline_kwh + E_divert_required_kwh
+      history.append({
+        "iteration": i,
+        "mtow_guess_kg": mtow_guess,
+        "new_mtow_kg": new_mtow_kg,
+        "delta_kg": delta_kg,
+        "baseline_mtow_kg": baseline_mtow_kg,
+        "E_baseline_kwh": E_baseline_kwh,
+        "E_divert_required_kwh": E_divert_required_kwh,
+        "E_total_required_kwh": E_total_required_kwh,
+        "P_hover_kw": P_hover_kw,
+        "P_cruise_kw": P_cruise_kw,
+        "t_divert_s": t_divert_s,
+        "E_hover_loiter_kwh": E_hover_loiter_kwh,
+        "E_divert_cruise_kwh": E_divert_kwh,
+        "E_hover_descend_kwh": E_hover_descend_kwh,
+        "delta_batt_mass_kg": delta_batt_mass_kg,
+      })
 
-        history.append({
-          "iteration": i,
-          "mtow_guess_kg": mtow_guess,
-          "new_mtow_kg": new_mtow_kg,
-          "delta_kg": delta_kg,
+      if abs(delta_kg) < tol:
+        return {
           "baseline_mtow_kg": baseline_mtow_kg,
-          "E_baseline_kwh": E_baseline_kwh,
-          "E_divert_required_kwh": E_divert_required_kwh,
-          "E_total_required_kwh": E_total_required_kwh,
+          "mtow_converged_kg": new_mtow_kg,
+          "delta_battery_mass_converged_kg": delta_batt_mass_kg,
+          "baseline_converged_total_mission_kwh": E_baseline_kwh,
+          "divert_required_kwh": E_divert_required_kwh,
+          "total_required_kwh": E_total_required_kwh,
           "P_hover_kw": P_hover_kw,
           "P_cruise_kw": P_cruise_kw,
           "t_divert_s": t_divert_s,
           "E_hover_loiter_kwh": E_hover_loiter_kwh,
           "E_divert_cruise_kwh": E_divert_kwh,
           "E_hover_descend_kwh": E_hover_descend_kwh,
-          "delta_batt_mass_kg": delta_batt_mass_kg,
-        })
+          "history": history,
+        }
+
+      mtow_guess = new_mtow_kg
 
-        if abs(delta_kg) < tol:
-          return {
-            "baseline_mtow_kg": baseline_mtow_kg,
-            "mtow_converged_kg": new_mtow_kg,
-            "delta_battery_mass_converged_kg": delta_batt_mass_kg,
-            "baseline_converged_total_mission_kwh": E_baseline_kwh,
-            "divert_required_kwh": E_divert_required_kwh,
-            "total_required_kwh": E_total_required_kwh,
-            "P_hover_kw": P_hover_kw,
-            "P_cruise_kw": P_cruise_kw,
-            "t_divert_s": t_divert_s,
-            "E_hover_loiter_kwh": E_hover_loiter_kwh,
-            "E_divert_cruise_kwh": E_divert_kwh,
-            "E_hover_descend_kwh": E_hover_descend_kwh,
-            "history": history,
-          }
-
-        mtow_guess = new_mtow_kg
-
-      finally:
-        # keep looping; MTOW restored after loop
-        pass
-
-    # if not converged, still return last iterate + history
-    self.max_takeoff_mass_kg = baseline_mtow_kg
+  # if not converged, still return last iterate + history
 
     if len(history) == 0:
       return None
@@ -3217,6 +3211,8 @@ class Aircraft:
   #   h_detach_takeoff_ft            : takeoff-ABU detach altitude [ft]
   #   daily_operation_hr             : daily operation window [hr]
   #   mission_time_s                 : optional mission duration [s]; if None, sum main-mission segments
+  #   timeline_format                : "dicts" (one dict per event) or "columns" (TimelineColumns;
+  #                                    abu_timelines is then one table with an abu_index column)
   def _evaluate_common_case_abu_assisted_takeoff_overlap_charging_queuing(self,
                                                                           candidates,
                                                                           abu_spec=None,
@@ -3234,9 +3230,10 @@ class Aircraft:
                                                                           V_abu_vertical_m_p_s=5.1,
                                                                           h_detach_ft=3000.0,
                                                                           daily_operation_hr = 24.0,
-                                                                          mission_time_s=None):
+                                                                          mission_time_s=None,
+                                                                          timeline_format="dicts"):
 
-    if self.mission is None or self.propulsion is None or self.environ is None or self.power is None:
+    if self.mission is None or self._shared_propulsion is None or self.environ is None or self.power is None:
       return None
 
     results = []
@@ -3301,148 +3298,45 @@ class Aircraft:
                                      t_charge_hr_abu_local,
                                      t_ground_ops_hr_local):
 
-      t_aircraft_ready_hr = 0.0
-
       # ABU pool availability
       n_pool = max(1, n_abu_pool_local)
-      abu_available_times = [0.0 for _ in range(n_pool)]
-      abu_busy_time       = [0.0 for _ in range(n_pool)]
-
-      # timeline logs
-      aircraft_timeline = []
-      abu_timelines     = {j: [] for j in range(n_pool)}
-
-      n_flights_completed = 0
-      t_wait_abu_day_hr   = 0.0
-
-      # simulation loop 
-      while True:
-
-        t_earliest = t_aircraft_ready_hr
-        ready_abus = [j for j in range(n_pool) if abu_available_times[j] <= t_earliest]
-
-        if len(ready_abus) > 0:
-          j_min = min(ready_abus)
-          t_min = abu_available_times[j_min]
-        else:
-          j_min = min(range(n_pool), key=lambda j: abu_available_times[j])
-          t_min = abu_available_times[j_min]
-
-        t_block = t_min
-        t_depart = max(t_earliest, t_block)
-
-        # check if flight fits before N (hours) of daily operation
-        if t_depart + t_flight_hr_local > daily_operation_hr:
-          break
-
-        # waiting time due to ABU bottleneck
-        if t_block > t_aircraft_ready_hr:
-          t_wait_abu_day_hr += (t_block - t_aircraft_ready_hr)
-
-        flight_idx = n_flights_completed
-
-        # -------------------------------------------------
-        # aircraft timeline events
-        # -------------------------------------------------
-        aircraft_timeline.append({
-          "t_hr": t_depart,
-          "event": "aircraft_depart",
-          "flight_index": flight_idx
-        })
-
-        t_arrive = t_depart + t_flight_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_arrive,
-          "event": "aircraft_arrive",
-          "flight_index": flight_idx
-        })
-
-        t_after_ground = t_arrive + t_ground_ops_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_after_ground,
-          "event": "aircraft_ground_ops_done",
-          "flight_index": flight_idx
-        })
-
-        t_after_main_charge = t_after_ground + t_charge_hr_main_local
-        aircraft_timeline.append({
-          "t_hr": t_after_main_charge,
-          "event": "aircraft_charge_done",
-          "flight_index": flight_idx
-        })
-
-        t_aircraft_ready_hr = t_after_main_charge
-
-        # -------------------------------------------------
-        # ABU timeline events
-        # -------------------------------------------------
-        # attach
-        t_attach_start = t_depart
-        abu_timelines[j_min].append({
-          "t_hr": t_attach_start,
-          "event": "abu_attach",
-          "flight_index": flight_idx,
-          "abu_index": j_min
-        })
-
-        # detach
-        t_detach = t_attach_start + t_attach_hr_local
-        abu_timelines[j_min].append({
-          "t_hr": t_detach,
-          "event": "abu_detach",
-          "flight_index": flight_idx,
-          "abu_index": j_min
-        })
-
-        # return complete
-        t_return_done = t_detach + t_return_abu_hr_local
-        abu_timelines[j_min].append({
-          "t_hr": t_return_done,
-          "event": "abu_return_done",
-          "flight_index": flight_idx,
-          "abu_index": j_min
-        })
-
-        # charge start
-        t_charge_start = t_return_done
-        abu_timelines[j_min].append({
-          "t_hr": t_charge_start,
-          "event": "abu_charge_start",
-          "flight_index": flight_idx,
-          "abu_index": j_min
-        })
-
-        # charge complete
-        t_charge_done = t_charge_start + t_charge_hr_abu_local
-        abu_timelines[j_min].append({
-          "t_hr": t_charge_done,
-          "event": "abu_charge_done",
-          "flight_index": flight_idx,
-          "abu_index": j_min
-        })
-
-        # update ABU availability state
-        abu_available_times[j_min] = t_charge_done
-        abu_busy_time[j_min]      += (t_charge_done - t_depart)
-
-        n_flights_completed += 1
+      pool = ResourcePool(n_pool)
+
+      sim = simulate_daily_ops(
+        t_flight_hr_local, t_ground_ops_hr_local, t_charge_hr_main_local,
+        daily_operation_hr,
+        [{
+          "pool": pool,
+          "t_attach_offset_hr": 0.0,
+          "t_carry_start_hr": 0.0,
+          "t_attach_hr": t_attach_hr_local,
+          "t_return_hr": t_return_abu_hr_local,
+          "t_charge_hr": t_charge_hr_abu_local,
+          "events": ("abu_attach", "abu_detach", "abu_return_done",
+                     "abu_charge_start", "abu_charge_done"),
+          "log_abu_index": True,
+          "log_detach_on_aircraft": False,
+        }],
+        timeline_format=timeline_format
+      )
+      n_flights_completed = sim["n_flights_completed"]
 
       # end simulation day 
       t_flight_day_hr = n_flights_completed * t_flight_hr_local
-      t_used_hr       = min(daily_operation_hr, t_aircraft_ready_hr)
+      t_used_hr       = min(daily_operation_hr, sim["t_aircraft_ready_hr"])
       t_slack_hr      = max(0.0, daily_operation_hr - t_used_hr)
 
-      total_busy      = sum(abu_busy_time)
+      total_busy      = pool.total_busy_time_hr()
       abu_util_avg    = total_busy / (daily_operation_hr * n_pool)
 
       return {
         "n_flights_completed": n_flights_completed,
         "t_flight_day_hr": t_flight_day_hr,
         "t_slack_hr": t_slack_hr,
-        "t_wait_abu_day_hr": t_wait_abu_day_hr,
+        "t_wait_abu_day_hr": sim["t_wait_hr"][0],
         "abu_utilization_avg": abu_util_avg,
-        "aircraft_timeline": aircraft_timeline,
-        "abu_timelines": abu_timelines,
+        "aircraft_timeline": sim["aircraft_timeline"],
+        "abu_timelines": sim["timelines"][0],
       }
 
     # main loop for each candidate
@@ -3592,6 +3486,8 @@ class Aircraft:
   #   h_detach_ft                : ABU detach altitude above landing zone [ft]
   #   daily_operation_hr         : daily operation window [hr]
   #   mission_time_s             : optional mission duration override [s]; if None, sum segments
+  #   timeline_format            : "dicts" (one dict per event) or "columns" (TimelineColumns;
+  #                                abu_timelines is then one table with an abu_index column)
   def _evaluate_common_case_abu_extended_flight_overlap_charging_queuing(self,
                                                                          E_mission_kwh_per_abu_list,
                                                                          abu_spec=None,
@@ -3609,9 +3505,10 @@ class Aircraft:
                                                                          V_abu_vertical_m_p_s=5.1,
                                                                          h_detach_ft=3000.0,
                                                                          daily_operation_hr = 24.0,
-                                                                         mission_time_s=None):
+                                                                         mission_time_s=None,
+                                                                         timeline_format="dicts"):
 
-    if self.mission is None or self.propulsion is None or self.environ is None or self.power is None:
+    if self.mission is None or self._shared_propulsion is None or self.environ is None or self.power is None:
       return None
 
     results = []
@@ -3654,18 +3551,9 @@ class Aircraft:
                                          t_return_abu_hr_local,
                                          t_charge_hr_abu_local,
                                          t_ground_ops_hr_local):
-      
-      # initialize aircraft and ABUs
-      t_aircraft_ready_hr = 0.0  # time when aircraft is ready to depart (main charged + ground ops done); initially 0 = ready at start of day
-      abu_available_times_hr = [0.0 for _ in range(max(1, n_abu_pool_local))] # time when ABU j will next be ready (fully charged)
-      abu_busy_time_hr = [0.0 for _ in range(max(1, n_abu_pool_local))] # how much of the N-hours ABU j was actively busy (for utilization calculation)
-
-      # new: timeline logs
-      aircraft_timeline = []
-      abu_timelines = {j: [] for j in range(max(1, n_abu_pool_local))}
 
-      n_flights_completed = 0
-      t_wait_abu_day_hr = 0.0
+      # ABU pool at the landing zone
+      pool = ResourcePool(max(1, n_abu_pool_local))
 
       # compute attach-start time (pre-cruise)
       t_attach_start_hr_local = (
@@ -3676,150 +3564,44 @@ class Aircraft:
         + float(getattr(self.mission, "accel_climb_s", 0.0) or 0.0)
       ) / 3600.0
 
-      # while True, keep flying flights until time runs past the defined operating hours
-      while True:
-
-        # aircraft earliest departure (based on its own readiness; eVTOL must wait until its previous flight + ground ops + main battery charge are done)
-        t_aircraft_earliest_depart_hr = t_aircraft_ready_hr
-
-        # find ABU choice for this departure
-        # first, list ABUs already available by aircraft earliest departure
-        ready_indices = []
-        for j in range(len(abu_available_times_hr)):
-          if abu_available_times_hr[j] <= t_aircraft_earliest_depart_hr:
-            ready_indices.append(j)
-
-        if len(ready_indices) > 0:
-          # at least one ABU is already ready; then pick the lowest index; no additional ABU wait
-          j_min = min(ready_indices)
-          t_abu_min_hr = abu_available_times_hr[j_min]
-          t_depart_hr = t_aircraft_earliest_depart_hr
-        else:
-          # no ABU ready yet; then aircraft must wait for earliest ABU to become available
-          j_min = 0
-          t_abu_min_hr = abu_available_times_hr[0]
-          for j in range(1, len(abu_available_times_hr)):
-            if abu_available_times_hr[j] < t_abu_min_hr:
-              t_abu_min_hr = abu_available_times_hr[j]
-              j_min = j
-          t_depart_hr = max(t_aircraft_earliest_depart_hr, t_abu_min_hr)
-
-        # check if a full mission can be completed within N-hr
-        if t_depart_hr + t_flight_hr_local > daily_operation_hr:
-          break
-
-        # log ABU bottleneck wait time (if any; meaning if ABU wasn’t ready, aircraft waited)
-        if t_abu_min_hr > t_aircraft_earliest_depart_hr:
-          t_wait_abu_day_hr += (t_abu_min_hr - t_aircraft_earliest_depart_hr) # accumulate daily ABU-caused delay
-
-        ## timeline logging 
-
-        flight_idx = n_flights_completed
-
-        # aircraft depart
-        aircraft_timeline.append({
-          "t_hr": t_depart_hr,
-          "event": "aircraft_depart",
-          "flight_index": flight_idx
-        })
-
-        # ABU attached at depart
-        abu_timelines[j_min].append({
-          "t_hr": t_depart_hr,
-          "event": "abu_attached",
-          "flight_index": flight_idx
-        })
-
-        # compute detach time
-        t_detach_hr = t_depart_hr + t_attach_start_hr_local + t_attach_hr_local
-
-        # ABU detaches
-        aircraft_timeline.append({
-          "t_hr": t_detach_hr,
-          "event": "abu_detach",
-          "flight_index": flight_idx
-        })
-        abu_timelines[j_min].append({
-          "t_hr": t_detach_hr,
-          "event": "abu_detach",
-          "flight_index": flight_idx
-        })
-
-        # ABU return
-        t_return_done_hr = t_detach_hr + t_return_abu_hr_local
-        abu_timelines[j_min].append({
-          "t_hr": t_return_done_hr,
-          "event": "abu_return_done",
-          "flight_index": flight_idx
-        })
-
-        # ABU charge
-        t_charge_start_abu_hr = t_return_done_hr
-        t_charge_done_abu_hr = t_charge_start_abu_hr + t_charge_hr_abu_local
-
-        abu_timelines[j_min].append({
-          "t_hr": t_charge_start_abu_hr,
-          "event": "abu_charge_start",
-          "flight_index": flight_idx
-        })
-        abu_timelines[j_min].append({
-          "t_hr": t_charge_done_abu_hr,
-          "event": "abu_charge_done",
-          "flight_index": flight_idx
-        })
-
-        # update ABU availability
-        # mark ABU j_min as busy for this interval (from depart through end of charge)
-        abu_available_times_hr[j_min] = t_charge_done_abu_hr
-        abu_busy_time_hr[j_min] += (t_charge_done_abu_hr - t_depart_hr) # count its busy duration to compute utilization
-
-        # aircraft arrival
-        t_arrive_hr = t_depart_hr + t_flight_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_arrive_hr,
-          "event": "aircraft_arrive",
-          "flight_index": flight_idx
-        })
-
-        # ground ops done
-        t_after_ground_hr = t_arrive_hr + t_ground_ops_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_after_ground_hr,
-          "event": "aircraft_ground_ops_done",
-          "flight_index": flight_idx
-        })
-
-        # main battery charge
-        t_after_charge_main_hr = t_after_ground_hr + t_charge_hr_main_local  # aircraft cycle = flight + ground ops + main battery chargin
-        aircraft_timeline.append({
-          "t_hr": t_after_charge_main_hr,
-          "event": "aircraft_charge_done",
-          "flight_index": flight_idx
-        })
-
-        t_aircraft_ready_hr = t_after_charge_main_hr
-
-        # total flights per day that fit inside N-hours
-        n_flights_completed += 1
+      # ABU attached at depart, detaches after pre-cruise + attached duration
+      sim = simulate_daily_ops(
+        t_flight_hr_local, t_ground_ops_hr_local, t_charge_hr_main_local,
+        daily_operation_hr,
+        [{
+          "pool": pool,
+          "t_attach_offset_hr": 0.0,
+          "t_carry_start_hr": t_attach_start_hr_local,
+          "t_attach_hr": t_attach_hr_local,
+          "t_return_hr": t_return_abu_hr_local,
+          "t_charge_hr": t_charge_hr_abu_local,
+          "events": ("abu_attached", "abu_detach", "abu_return_done",
+                     "abu_charge_start", "abu_charge_done"),
+          "log_abu_index": False,
+          "log_detach_on_aircraft": True,
+        }],
+        timeline_format=timeline_format
+      )
+      n_flights_completed = sim["n_flights_completed"]
 
       # after simulation: compute daily stats
       # aircraft metrics
       t_flight_day_hr_local = n_flights_completed * t_flight_hr_local
-      t_total_used_hr = min(daily_operation_hr, t_aircraft_ready_hr)
+      t_total_used_hr = min(daily_operation_hr, sim["t_aircraft_ready_hr"])
       t_slack_hr_local = max(0.0, daily_operation_hr - t_total_used_hr)
 
       # ABU utilization
-      total_busy_hr = sum(abu_busy_time_hr)
+      total_busy_hr = pool.total_busy_time_hr()
       abu_utilization_avg = total_busy_hr / (daily_operation_hr * float(n_abu_pool_local)) if n_abu_pool_local > 0 else 0.0 # fraction of day the ABU pool is busy/ active
 
       return {
         "n_flights_completed": n_flights_completed,
         "t_flight_day_hr": t_flight_day_hr_local,
         "t_slack_hr": t_slack_hr_local,
-        "t_wait_abu_day_hr": t_wait_abu_day_hr,
+        "t_wait_abu_day_hr": sim["t_wait_hr"][0],
         "abu_utilization_avg": abu_utilization_avg,
-        "aircraft_timeline": aircraft_timeline, #timeline outputs
-        "abu_timelines": abu_timelines, #timeline outputs
+        "aircraft_timeline": sim["aircraft_timeline"], #timeline outputs
+        "abu_timelines": sim["timelines"][0], #timeline outputs
       }
 
     # precompute post-cruise segment horizontal distances (aircraft mission geometry)
@@ -4052,6 +3834,8 @@ class Aircraft:
   #   h_detach_cruise_ft             : cruise-ABU detach altitude [ft]
   #   daily_operation_hr             : daily operation window [hr]
   #   mission_time_s                 : optional mission duration [s]; if None, sum main-mission segments
+  #   timeline_format                : "dicts" (one dict per event) or "columns" (TimelineColumns;
+  #                                    each ABU timeline is then one table with an abu_index column)
   def _evaluate_common_case_abu_combined_flight_overlap_charging_queuing(self,
                                                                          candidates,
                                                                          E_mission_kwh_per_abu_list,
@@ -4075,9 +3859,10 @@ class Aircraft:
                                                                          V_cruise_abu_vertical_m_p_s=5.1,
                                                                          h_detach_cruise_ft=3000.0,
                                                                          daily_operation_hr = 24.0,
-                                                                         mission_time_s=None):
+                                                                         mission_time_s=None,
+                                                                         timeline_format="dicts"):
 
-    if self.mission is None or self.propulsion is None or self.environ is None or self.power is None:
+    if self.mission is None or self._shared_propulsion is None or self.environ is None or self.power is None:
       return None
 
     results = []
@@ -4118,15 +3903,6 @@ class Aircraft:
           mission_time_s += float(getattr(self.mission, nm, 0.0) or 0.0)
     t_flight_hr = (mission_time_s or 0.0) / 3600.0
 
-    # helper: rotor+hub mass per ABU using NDARC-based function
-    def _calc_rotor_hub_mass_for_n_abus(n_abus):
-      orig_getter = type(self.propulsion).lift_rotor_count.fget
-      try:
-        type(self.propulsion).lift_rotor_count = property(lambda _self: n_abus)
-        return self._calc_lift_rotor_hub_mass_kg()
-      finally:
-        type(self.propulsion).lift_rotor_count = property(orig_getter)
-
     # battery parameters (for ABU mass inference)
     spec_energy_Wh_p_kg = self.power.batt_spec_energy_w_h_p_kg
     batt_int_factor = self.power.batt_int_factor
@@ -4199,201 +3975,54 @@ class Aircraft:
                                                   t_charge_cruise_abu_hr_local,
                                                   t_ground_ops_hr_local):
 
-      # initialize aircraft & ABU pools
-      t_aircraft_ready_hr = 0.0
-
+      # initialize ABU pools
       n_takeoff_pool = max(1, n_abu_pool_takeoff_local)
       n_cruise_pool  = max(1, n_abu_pool_cruise_local)
 
-      takeoff_available_times_hr = [0.0 for _ in range(n_takeoff_pool)]
-      takeoff_busy_time_hr       = [0.0 for _ in range(n_takeoff_pool)]
-      cruise_available_times_hr  = [0.0 for _ in range(n_cruise_pool)]
-      cruise_busy_time_hr        = [0.0 for _ in range(n_cruise_pool)]
-
-      # timeline logs
-      aircraft_timeline       = []
-      takeoff_abu_timelines   = {j: [] for j in range(n_takeoff_pool)}
-      cruise_abu_timelines    = {j: [] for j in range(n_cruise_pool)}
-
-      n_flights_completed     = 0
-      t_wait_takeoff_abu_day_hr = 0.0
-      t_wait_cruise_abu_day_hr  = 0.0
-
-      # loop flights until the defined operating hours
-      while True:
-        t_aircraft_earliest_depart_hr = t_aircraft_ready_hr
-
-        # --- takeoff ABU selection ---
-        ready_takeoff = [
-          j for j in range(n_takeoff_pool)
-          if takeoff_available_times_hr[j] <= t_aircraft_earliest_depart_hr
-        ]
-
-        if len(ready_takeoff) > 0:
-          # use lowest-index among ready ABUs
-          j_to_min = min(ready_takeoff)
-          t_to_min = takeoff_available_times_hr[j_to_min]
-        else:
-          # no ABUs ready; then pick ABU with minimum availability time
-          j_to_min = min(range(n_takeoff_pool),
-                         key=lambda j: takeoff_available_times_hr[j])
-          t_to_min = takeoff_available_times_hr[j_to_min]
-
-        # --- cruise ABU selection ---
-        ready_cruise = [
-          j for j in range(n_cruise_pool)
-          if cruise_available_times_hr[j] <= t_aircraft_earliest_depart_hr
-        ]
-
-        if len(ready_cruise) > 0:
-          j_cr_min = min(ready_cruise)
-          t_cr_min = cruise_available_times_hr[j_cr_min]
-        else:
-          j_cr_min = min(range(n_cruise_pool),
-                         key=lambda j: cruise_available_times_hr[j])
-          t_cr_min = cruise_available_times_hr[j_cr_min]
-
-        # departure time limited by aircraft readiness + ABU availability
-        t_block_abu_hr = max(t_to_min, t_cr_min)
-        t_depart_hr = max(t_aircraft_earliest_depart_hr, t_block_abu_hr)
-
-        # if departure cannot finish full mission within N-hr, stop
-        if t_depart_hr + t_flight_hr_local > daily_operation_hr:
-          break
-
-        # attribute ABU-caused waiting (whichever ABU is the bottleneck vs aircraft readiness)
-        if t_block_abu_hr > t_aircraft_earliest_depart_hr:
-          if t_to_min >= t_cr_min:
-            t_wait_takeoff_abu_day_hr += (t_block_abu_hr - t_aircraft_earliest_depart_hr)
-          else:
-            t_wait_cruise_abu_day_hr += (t_block_abu_hr - t_aircraft_earliest_depart_hr)
-
-        flight_idx = n_flights_completed
-
-        # --- aircraft events ---
-        aircraft_timeline.append({
-          "t_hr": t_depart_hr,
-          "event": "aircraft_depart",
-          "flight_index": flight_idx
-        })
-
-        # arrival at end of mission
-        t_arrive_hr = t_depart_hr + t_flight_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_arrive_hr,
-          "event": "aircraft_arrive",
-          "flight_index": flight_idx
-        })
-
-        # ground ops
-        t_after_ground_hr = t_arrive_hr + t_ground_ops_hr_local
-        aircraft_timeline.append({
-          "t_hr": t_after_ground_hr,
-          "event": "aircraft_ground_ops_done",
-          "flight_index": flight_idx
-        })
-
-        # main battery charge
-        t_after_main_charge_hr = t_after_ground_hr + t_charge_hr_main_local
-        aircraft_timeline.append({
-          "t_hr": t_after_main_charge_hr,
-          "event": "aircraft_charge_done",
-          "flight_index": flight_idx
-        })
-
-        t_aircraft_ready_hr = t_after_main_charge_hr
-
-        # --- takeoff ABU timeline ---
-        # attach from departure; detach after takeoff attach duration
-        t_takeoff_attach_start_hr = t_depart_hr
-        t_takeoff_detach_hr = t_takeoff_attach_start_hr + t_takeoff_attach_hr_local
-
-        takeoff_abu_timelines[j_to_min].append({
-          "t_hr": t_takeoff_attach_start_hr,
-          "event": "takeoff_abu_attached",
-          "flight_index": flight_idx
-        })
-        takeoff_abu_timelines[j_to_min].append({
-          "t_hr": t_takeoff_detach_hr,
-          "event": "takeoff_abu_detach",
-          "flight_index": flight_idx
-        })
-
-        # return & charge
-        t_takeoff_return_done_hr = t_takeoff_detach_hr + t_return_takeoff_abu_hr_local
-        takeoff_abu_timelines[j_to_min].append({
-          "t_hr": t_takeoff_return_done_hr,
-          "event": "takeoff_abu_return_done",
-          "flight_index": flight_idx
-        })
-
-        t_takeoff_charge_start_hr = t_takeoff_return_done_hr
-        t_takeoff_charge_done_hr = t_takeoff_charge_start_hr + t_charge_takeoff_abu_hr_local
-
-        takeoff_abu_timelines[j_to_min].append({
-          "t_hr": t_takeoff_charge_start_hr,
-          "event": "takeoff_abu_charge_start",
-          "flight_index": flight_idx
-        })
-        takeoff_abu_timelines[j_to_min].append({
-          "t_hr": t_takeoff_charge_done_hr,
-          "event": "takeoff_abu_charge_done",
-          "flight_index": flight_idx
-        })
-
-        takeoff_available_times_hr[j_to_min] = t_takeoff_charge_done_hr
-        takeoff_busy_time_hr[j_to_min] += (t_takeoff_charge_done_hr - t_depart_hr)
-
-        # --- cruise ABU timeline ---
-        # attach sometime into the mission (start of cruise)
-        t_cruise_attach_start_hr = t_depart_hr + t_cruise_attach_start_hr_local
-        t_cruise_detach_hr = t_cruise_attach_start_hr + t_cruise_attach_hr_local
-
-        cruise_abu_timelines[j_cr_min].append({
-          "t_hr": t_cruise_attach_start_hr,
-          "event": "cruise_abu_attached",
-          "flight_index": flight_idx
-        })
-        cruise_abu_timelines[j_cr_min].append({
-          "t_hr": t_cruise_detach_hr,
-          "event": "cruise_abu_detach",
-          "flight_index": flight_idx
-        })
-
-        t_cruise_return_done_hr = t_cruise_detach_hr + t_return_cruise_abu_hr_local
-        cruise_abu_timelines[j_cr_min].append({
-          "t_hr": t_cruise_return_done_hr,
-          "event": "cruise_abu_return_done",
-          "flight_index": flight_idx
-        })
-
-        t_cruise_charge_start_hr = t_cruise_return_done_hr
-        t_cruise_charge_done_hr = t_cruise_charge_start_hr + t_charge_cruise_abu_hr_local
-
-        cruise_abu_timelines[j_cr_min].append({
-          "t_hr": t_cruise_charge_start_hr,
-          "event": "cruise_abu_charge_start",
-          "flight_index": flight_idx
-        })
-        cruise_abu_timelines[j_cr_min].append({
-          "t_hr": t_cruise_charge_done_hr,
-          "event": "cruise_abu_charge_done",
-          "flight_index": flight_idx
-        })
-
-        cruise_available_times_hr[j_cr_min] = t_cruise_charge_done_hr
-        cruise_busy_time_hr[j_cr_min] += (t_cruise_charge_done_hr - t_depart_hr)
-
-        # increment completed flights
-        n_flights_completed += 1
+      takeoff_pool = ResourcePool(n_takeoff_pool)
+      cruise_pool  = ResourcePool(n_cruise_pool)
+
+      # takeoff ABU attached from departure; cruise ABU from start of cruise
+      # ABU-caused waiting is attributed to whichever pool is the bottleneck
+      sim = simulate_daily_ops(
+        t_flight_hr_local, t_ground_ops_hr_local, t_charge_hr_main_local,
+        daily_operation_hr,
+        [{
+          "pool": takeoff_pool,
+          "t_attach_offset_hr": 0.0,
+          "t_carry_start_hr": 0.0,
+          "t_attach_hr": t_takeoff_attach_hr_local,
+          "t_return_hr": t_return_takeoff_abu_hr_local,
+          "t_charge_hr": t_charge_takeoff_abu_hr_local,
+          "events": ("takeoff_abu_attached", "takeoff_abu_detach",
+                     "takeoff_abu_return_done", "takeoff_abu_charge_start",
+                     "takeoff_abu_charge_done"),
+          "log_abu_index": False,
+          "log_detach_on_aircraft": False,
+        }, {
+          "pool": cruise_pool,
+          "t_attach_offset_hr": t_cruise_attach_start_hr_local,
+          "t_carry_start_hr": t_cruise_attach_start_hr_local,
+          "t_attach_hr": t_cruise_attach_hr_local,
+          "t_return_hr": t_return_cruise_abu_hr_local,
+          "t_charge_hr": t_charge_cruise_abu_hr_local,
+          "events": ("cruise_abu_attached", "cruise_abu_detach",
+                     "cruise_abu_return_done", "cruise_abu_charge_start",
+                     "cruise_abu_charge_done"),
+          "log_abu_index": False,
+          "log_detach_on_aircraft": False,
+        }],
+        timeline_format=timeline_format
+      )
+      n_flights_completed = sim["n_flights_completed"]
 
       # after simulation: compute daily stats
       t_flight_day_hr_local = n_flights_completed * t_flight_hr_local
-      t_total_used_hr = min(daily_operation_hr, t_aircraft_ready_hr)
+      t_total_used_hr = min(daily_operation_hr, sim["t_aircraft_ready_hr"])
       t_slack_hr_local = max(0.0, daily_operation_hr - t_total_used_hr)
 
-      total_busy_takeoff_hr = sum(takeoff_busy_time_hr)
-      total_busy_cruise_hr  = sum(cruise_busy_time_hr)
+      total_busy_takeoff_hr = takeoff_pool.total_busy_time_hr()
+      total_busy_cruise_hr  = cruise_pool.total_busy_time_hr()
 
       abu_utilization_avg_takeoff = total_busy_takeoff_hr / (daily_operation_hr * float(n_takeoff_pool)) if n_takeoff_pool > 0 else 0.0
       abu_utilization_avg_cruise  = total_busy_cruise_hr / (daily_operation_hr * float(n_cruise_pool)) if n_cruise_pool > 0 else 0.0
@@ -4402,13 +4031,13 @@ class Aircraft:
         "n_flights_completed": n_flights_completed,
         "t_flight_day_hr": t_flight_day_hr_local,
         "t_slack_hr": t_slack_hr_local,
-        "t_wait_takeoff_abu_day_hr": t_wait_takeoff_abu_day_hr,
-        "t_wait_cruise_abu_day_hr": t_wait_cruise_abu_day_hr,
+        "t_wait_takeoff_abu_day_hr": sim["t_wait_hr"][0],
+        "t_wait_cruise_abu_day_hr": sim["t_wait_hr"][1],
         "abu_utilization_avg_takeoff": abu_utilization_avg_takeoff,
         "abu_utilization_avg_cruise": abu_utilization_avg_cruise,
-        "aircraft_timeline": aircraft_timeline,
-        "takeoff_abu_timelines": takeoff_abu_timelines,
-        "cruise_abu_timelines": cruise_abu_timelines,
+        "aircraft_timeline": sim["aircraft_timeline"],
+        "takeoff_abu_timelines": sim["timelines"][0],
+        "cruise_abu_timelines": sim["timelines"][1],
       }
 
     # iterate combined scenarios (for each assisted-takeoff candidate & cruise-ABU energy level)
@@ -4455,24 +4084,20 @@ class Aircraft:
         )
         m_struct_per_abu_kg = struct_frac * m_abu_batt_per_abu_kg
         m_integ_per_abu_kg  = integ_frac * m_abu_batt_per_abu_kg
-        m_rotor_per_abu_kg  = _calc_rotor_hub_mass_for_n_abus(n_abus_cruise) / max(n_abus_cruise, 1)
+        m_rotor_per_abu_kg  = self._calc_lift_rotor_hub_mass_kg(n_abus_cruise) / max(n_abus_cruise, 1)
         m_abu_total_all_kg  = n_abus_cruise * (
           m_abu_batt_per_abu_kg + m_struct_per_abu_kg + m_integ_per_abu_kg + m_rotor_per_abu_kg
         )
 
         # recompute cruise powers at POST-TAKEOFF MTOW
-        prev_mtow = self.max_takeoff_mass_kg
-        try:
-          # baseline (no cruise ABUs) at post-takeoff MTOW
-          self.max_takeoff_mass_kg = MTOW_detached
-          baseline_cruise_power_kw = float(self._calc_cruise_avg_electric_power_kw() or 0.0)
-          baseline_cruise_energy_kwh = float(self._calc_cruise_energy_kw_hr() or 0.0)
-
-          # attached cruise with ABUs (heavier by m_abu_total_all_kg)
-          self.max_takeoff_mass_kg = MTOW_detached + m_abu_total_all_kg
-          P_cruise_attach_kw = float(self._calc_cruise_avg_electric_power_kw() or 0.0)
-        finally:
-          self.max_takeoff_mass_kg = prev_mtow
+        # baseline (no cruise ABUs) at post-takeoff MTOW
+        detached = self.with_overrides(max_takeoff_mass_kg=MTOW_detached)
+        baseline_cruise_power_kw = float(detached._calc_cruise_avg_electric_power_kw() or 0.0)
+        baseline_cruise_energy_kwh = float(detached._calc_cruise_energy_kw_hr() or 0.0)
+
+        # attached cruise with ABUs (heavier by m_abu_total_all_kg)
+        attached = self.with_overrides(max_takeoff_mass_kg=MTOW_detached + m_abu_total_all_kg)
+        P_cruise_attach_kw = float(attached._calc_cruise_avg_electric_power_kw() or 0.0)
 
         if P_cruise_attach_kw <= 0.0 or baseline_cruise_power_kw <= 0.0:
           continue
@@ -4701,17 +4326,223 @@ class Aircraft:
           "cruise_abu_timelines": cruise_abu_timelines,
         })
 
-    # restore MTOW
-    self.max_takeoff_mass_kg = orig_mtow
     return results
 
+  # ABU Evaluator 4.5: Fleet Operations (Multiple Aircraft and Vertiports, Shared Chargers, ABU Queuing)
+  #
+  # simulates daily operations of a fleet flying round-robin between vertiports
+  # that share a fixed number of chargers per pad between aircraft main packs and ABUs
+  #   without candidates (or without ABU pools), flight and charge times come from Evaluator 4.1
+  #   with candidates, flight, ABU attach/return and charge times come from Evaluator 4.2
+  #
+  # Inputs:
+  #   candidates                     : list of ABU assisted-takeoff detach cases (None = no ABUs)
+  #   abu_spec                       : ABU spec used for assisted takeoff
+  #   n_aircraft                     : fleet size
+  #   n_vertiports                   : number of vertiports
+  #   n_chargers_per_vertiport       : chargers at each vertiport, shared by aircraft and ABUs
+  #   n_abu_pool_per_vertiport       : takeoff ABUs at each vertiport
+  #   P_charger_ac_kw ... mission_time_s : as in Evaluator 4.2
+  #   record_timeline                : True to include the fleet event timeline
+  #   timeline_format                : "dicts" or "columns" (TimelineColumns) for the fleet timeline
+  def _evaluate_common_case_fleet_ops(self,
+                                      candidates=None,
+                                      abu_spec=None,
+                                      n_aircraft=20,
+                                      n_vertiports=4,
+                                      n_chargers_per_vertiport=2,
+                                      n_abu_pool_per_vertiport=0,
+                                      P_charger_ac_kw=115.0,
+                                      eta_charger_dc=0.95,
+                                      c_rate_max=1.0,
+                                      v_pack_nom_v_main=800.0,
+                                      v_pack_nom_v_abu=400.0,
+                                      i_term_c=0.05,
+                                      soc_target=1.0,
+                                      soc_cc_end=0.80,
+                                      t_ground_ops_hr=0.2833,
+                                      V_abu_horizontal_m_p_s=30.0,
+                                      V_abu_vertical_m_p_s=5.1,
+                                      h_detach_ft=3000.0,
+                                      daily_operation_hr=24.0,
+                                      mission_time_s=None,
+                                      record_timeline=False,
+                                      timeline_format="dicts"):
+
+    # per-flight timing for each case
+    cases = []
+    if candidates is None or n_abu_pool_per_vertiport <= 0:
+      base = self._evaluate_common_case_baseline(
+        P_charger_ac_kw=P_charger_ac_kw,
+        eta_charger_dc=eta_charger_dc,
+        c_rate_max=c_rate_max,
+        v_pack_nom_v=v_pack_nom_v_main,
+        i_term_c=i_term_c,
+        soc_target=soc_target,
+        soc_cc_end=soc_cc_end,
+        t_ground_ops_hr=t_ground_ops_hr,
+        daily_operation_hr=daily_operation_hr,
+        mission_time_s=mission_time_s
+      )
+      if base is None:
+        return None
+      cases.append({
+        "candidate_name": "baseline",
+        "n_abu_pool_per_vertiport": 0,
+        "t_flight_hr": base["t_flight_hr"],
+        "t_charge_hr_main": base["t_charge_hr"],
+        "t_takeoff_attach_hr": 0.0,
+        "t_return_abu_hr": 0.0,
+        "t_charge_hr_abu": 0.0,
+      })
+    else:
+      single = self._evaluate_common_case_abu_assisted_takeoff_overlap_charging_queuing(
+        candidates,
+        abu_spec=abu_spec,
+        n_abu_pool=1,
+        P_charger_ac_kw=P_charger_ac_kw,
+        eta_charger_dc=eta_charger_dc,
+        c_rate_max=c_rate_max,
+        v_pack_nom_v_main=v_pack_nom_v_main,
+        v_pack_nom_v_abu=v_pack_nom_v_abu,
+        i_term_c=i_term_c,
+        soc_target=soc_target,
+        soc_cc_end=soc_cc_end,
+        t_ground_ops_hr=t_ground_ops_hr,
+        V_abu_horizontal_m_p_s=V_abu_horizontal_m_p_s,
+        V_abu_vertical_m_p_s=V_abu_vertical_m_p_s,
+        h_detach_ft=h_detach_ft,
+        daily_operation_hr=daily_operation_hr,
+        mission_time_s=mission_time_s,
+        timeline_format="columns"
+      )
+      if not single:
+        return None
+      for row in single:
+        cases.append({
+          "candidate_name": row["candidate_name"],
+          "n_abu_pool_per_vertiport": n_abu_pool_per_vertiport,
+          "t_flight_hr": row["t_flight_hr"],
+          "t_charge_hr_main": row["t_charge_hr_main"],
+          "t_takeoff_attach_hr": row["t_takeoff_attach_hr"],
+          "t_return_abu_hr": row["t_return_abu_hr"],
+          "t_charge_hr_abu": row["t_charge_hr_abu"],
+        })
+
+    results = []
+    for case in cases:
+      sim = simulate_fleet_ops(
+        n_aircraft=n_aircraft,
+        n_vertiports=n_vertiports,
+        n_chargers_per_vertiport=n_chargers_per_vertiport,
+        n_abu_pool_per_vertiport=case["n_abu_pool_per_vertiport"],
+        t_flight_hr=case["t_flight_hr"],
+        t_ground_ops_hr=t_ground_ops_hr,
+        t_charge_hr_main=case["t_charge_hr_main"],
+        t_attach_hr=case["t_takeoff_attach_hr"],
+        t_return_abu_hr=case["t_return_abu_hr"],
+        t_charge_hr_abu=case["t_charge_hr_abu"],
+        daily_operation_hr=daily_operation_hr,
+        record_timeline=record_timeline,
+        timeline_format=timeline_format
+      )
+      if sim is None:
+        return None
+      result = dict(case)
+      result.update(sim)
+      results.append(result)
+
+    return results
+
+  # mission power profile as a list of (segment name, duration_s, P_kw) with
+  # the average electric power of each segment, in flight order
+  #   include_reserve : False to stop after arrive_taxi
+  def power_profile_segments(self, include_reserve=True):
+    mission = self.mission
+    segments = []
+    for name, duration_field in SEGMENTS:
+      if not include_reserve and name.startswith('reserve_'):
+        break
+      segments.append((
+        name,
+        getattr(mission, duration_field),
+        getattr(self, name+'_avg_electric_power_kw')
+      ))
+    return segments
+
+  # segments of n_flights consecutive missions separated by t_ground_s on the
+  # ground at P_ground_kw; generated lazily
+  def _power_profile_flights(self, include_reserve, n_flights, t_ground_s, P_ground_kw):
+    return repeat_segments(
+      self.power_profile_segments(include_reserve), n_flights, t_ground_s, P_ground_kw
+    )
+
+  # piecewise-constant power profile as a list of
+  # (segment name, t_start_s, t_end_s, P_kw)
+  def power_profile_breakpoints(self,
+                                include_reserve=True,
+                                n_flights=1,
+                                t_ground_s=0.0,
+                                P_ground_kw=0.0):
+    return power_breakpoints(
+      self._power_profile_flights(include_reserve, n_flights, t_ground_s, P_ground_kw)
+    )
+
+  # yield (t_s, P_kw) power profile samples every dt_s without building the
+  # whole profile
+  def iter_power_profile(self,
+                         dt_s=1.0,
+                         include_reserve=True,
+                         n_flights=1,
+                         t_ground_s=0.0,
+                         P_ground_kw=0.0):
+    return iter_power_samples(
+      self._power_profile_flights(include_reserve, n_flights, t_ground_s, P_ground_kw),
+      dt_s
+    )
+
+  # write the power profile sampled every dt_s to a CSV file in chunks
+  # returns the number of samples written
+  def write_power_profile_csv(self,
+                              path,
+                              dt_s=1.0,
+                              include_reserve=True,
+                              n_flights=1,
+                              t_ground_s=0.0,
+                              P_ground_kw=0.0):
+    return write_power_profile_csv(
+      path,
+      self._power_profile_flights(include_reserve, n_flights, t_ground_s, P_ground_kw),
+      dt_s
+    )
+
+  # time-stepped mission power, energy, SOC and mass traces in steps of at
+  # most dt_s, with mass changes such as ABU detachment, e.g.
+  #  aircraft.integrate_mission(mass_changes=[('accel_climb', -m_abu_kg)])
+  # see integrator.integrate_mission for the arguments and results
+  def integrate_mission(self,
+                        dt_s=0.1,
+                        mass_changes=(),
+                        soc_start=1.0,
+                        E_pack_kwh=None,
+                        include_reserve=True):
+    segments = None if include_reserve else \
+     [name for name, duration_field in SEGMENTS if not name.startswith('reserve_')]
+    return integrate_mission(
+      params_from_aircraft(self), dt_s, mass_changes, soc_start, E_pack_kwh, segments
+    )
+
   @property
   def max_takeoff_mass_kg(self):
+    self._cache.note_input('max_takeoff_mass_kg')
     return self._max_takeoff_mass_kg
   
+  # the setter evicts only the cached quantities that depend on MTOW
   @max_takeoff_mass_kg.setter
   def max_takeoff_mass_kg(self, value):
-    self._max_takeoff_mass_kg = value
+    if value != self._max_takeoff_mass_kg:
+      self._max_takeoff_mass_kg = value
+      self._cache.invalidate('max_takeoff_mass_kg')
 
   @property
   def payload_kg(self):
@@ -4817,386 +4648,405 @@ class Aircraft:
   def mass_margin_factor(self):
     return self._mass_margin_factor
 
+  # has-a records are immutable (see record.py), so they are shared rather
+  # than copied
   @property
   def environ(self):
-    return copy.deepcopy(self._environ)
+    self._cache.note_input('environ')
+    return self._environ
 
   @property
   def mission(self):
-    return copy.deepcopy(self._mission)
+    self._cache.note_input('mission')
+    return self._mission
 
   @property
   def power(self):
-    return copy.deepcopy(self._power)
+    self._cache.note_input('power')
+    return self._power
 
+  # Propulsion.rotor_count changes a record in place, so the aircraft's record
+  # is handed out as a copy: p = aircraft.propulsion; p.rotor_count = 2 leaves
+  # the aircraft unchanged; use aircraft.with_overrides(propulsion=p) for that
   @property
   def propulsion(self):
-    return copy.deepcopy(self._propulsion)
+    self._cache.note_input('propulsion')
+    return None if self._propulsion is None else self._propulsion.replace()
+
+  # the aircraft's own Propulsion record, for its derived-quantity methods
+  @property
+  def _shared_propulsion(self):
+    self._cache.note_input('propulsion')
+    return self._propulsion
 
   @property
   def hover_shaft_power_kw(self):
-    return self._calc_hover_shaft_power_kw()
+    return self._cache.get('hover_shaft_power_kw', self._calc_hover_shaft_power_kw)
+
+  @property
+  def segment_air_density_kg_p_m3(self):
+    return self._cache.get('segment_air_density_kg_p_m3', self._calc_segment_air_density_kg_p_m3)
 
   @property
   def wing_area_m2(self):
-    return self._calc_wing_area_m2()
+    return self._cache.get('wing_area_m2', self._calc_wing_area_m2)
 
   @property
   def cruise_cl(self):
-    return self._calc_cruise_cl()
+    return self._cache.get('cruise_cl', self._calc_cruise_cl)
 
   @property
   def fuselage_fineness_ratio(self):
-    return self._calc_fuselage_fineness_ratio()
+    return self._cache.get('fuselage_fineness_ratio', self._calc_fuselage_fineness_ratio)
 
   @property
   def fuselage_cd0_p_cf(self):
-    return self._calc_fuselage_cd0_p_cf()
+    return self._cache.get('fuselage_cd0_p_cf', self._calc_fuselage_cd0_p_cf)
 
   @property
   def fuselage_cruise_reynolds(self):
-    return self._calc_fuselage_cruise_reynolds()
+    return self._cache.get('fuselage_cruise_reynolds', self._calc_fuselage_cruise_reynolds)
 
   @property
   def fuselage_cf(self):
-    return self._calc_fuselage_cf()
+    return self._cache.get('fuselage_cf', self._calc_fuselage_cf)
 
   @property
   def fuselage_cd0(self):
-    return self._calc_fuselage_cd0()
+    return self._cache.get('fuselage_cd0', self._calc_fuselage_cd0)
 
   @property
   def wing_aspect_ratio(self):
-    return self._calc_wing_aspect_ratio()
+    return self._cache.get('wing_aspect_ratio', self._calc_wing_aspect_ratio)
 
   @property
   def induced_drag_cdi(self):
-    return self._calc_induced_drag_cdi()
+    return self._cache.get('induced_drag_cdi', self._calc_induced_drag_cdi)
 
   @property
   def wing_root_chord_m(self):
-    return self._calc_wing_root_chord_m()
+    return self._cache.get('wing_root_chord_m', self._calc_wing_root_chord_m)
 
   @property
   def wing_mac_m(self):
-    return self._calc_wing_mac_m()
+    return self._cache.get('wing_mac_m', self._calc_wing_mac_m)
 
   @property
   def horiz_tail_area_m2(self):
-    return self._calc_horiz_tail_area_m2()
+    return self._cache.get('horiz_tail_area_m2', self._calc_horiz_tail_area_m2)
 
   @property
   def vert_tail_area_m2(self):
-    return self._calc_vert_tail_area_m2()
+    return self._cache.get('vert_tail_area_m2', self._calc_vert_tail_area_m2)
 
   @property
   def horiz_tail_cd0(self):
-    return self._calc_horiz_tail_cd0()
+    return self._cache.get('horiz_tail_cd0', self._calc_horiz_tail_cd0)
 
   @property
   def vert_tail_cd0(self):
-    return self._calc_vert_tail_cd0()
+    return self._cache.get('vert_tail_cd0', self._calc_vert_tail_cd0)
 
   @property
   def landing_gear_cd0(self):
-    return self._calc_landing_gear_cd0()
+    return self._cache.get('landing_gear_cd0', self._calc_landing_gear_cd0)
 
   @property
   def stopped_rotor_cd0(self):
-    return self._calc_stopped_rotor_cd0()
+    return self._cache.get('stopped_rotor_cd0', self._calc_stopped_rotor_cd0)
 
   @property
   def cruise_cd(self):
-    return self._calc_cruise_cd()
+    return self._cache.get('cruise_cd', self._calc_cruise_cd)
 
   @property
   def cruise_l_p_d(self):
-    return self._calc_cruise_l_p_d()
+    return self._cache.get('cruise_l_p_d', self._calc_cruise_l_p_d)
 
   @property
   def total_drag_coef(self):
-    return self._calc_total_drag_coef()
+    return self._cache.get('total_drag_coef', self._calc_total_drag_coef)
     
   @property
   def fuselage_wetted_area_m2(self):
-    return self._calc_fuselage_wetted_area_m2()
+    return self._cache.get('fuselage_wetted_area_m2', self._calc_fuselage_wetted_area_m2)
 
   @property
   def over_torque_factor(self):
-    return self._calc_over_torque_factor()
+    return self._cache.get('over_torque_factor', self._calc_over_torque_factor)
 
   @property
   def single_epu_mass_kg(self):
-    return self._calc_single_epu_mass_kg()
+    return self._cache.get('single_epu_mass_kg', self._calc_single_epu_mass_kg)
 
   @property
   def rotor_solidity(self):
-    return self._calc_rotor_solidity()
+    return self._cache.get('rotor_solidity', self._calc_rotor_solidity)
 
   @property
   def depart_taxi_avg_shaft_power_kw(self):
-    return self._calc_depart_taxi_avg_shaft_power_kw()
+    return self._cache.get('depart_taxi_avg_shaft_power_kw', self._calc_depart_taxi_avg_shaft_power_kw)
 
   @property
   def depart_taxi_avg_electric_power_kw(self):
-    return self._calc_depart_taxi_avg_electric_power_kw()
+    return self._cache.get('depart_taxi_avg_electric_power_kw', self._calc_depart_taxi_avg_electric_power_kw)
 
   @property
   def depart_taxi_energy_kw_hr(self):
-    return self._calc_depart_taxi_energy_kw_hr()
+    return self._cache.get('depart_taxi_energy_kw_hr', self._calc_depart_taxi_energy_kw_hr)
 
   @property
   def hover_climb_avg_shaft_power_kw(self):
-    return self._calc_hover_climb_avg_shaft_power_kw()
+    return self._cache.get('hover_climb_avg_shaft_power_kw', self._calc_hover_climb_avg_shaft_power_kw)
 
   @property
   def hover_climb_avg_electric_power_kw(self):
-    return self._calc_hover_climb_avg_electric_power_kw()
+    return self._cache.get('hover_climb_avg_electric_power_kw', self._calc_hover_climb_avg_electric_power_kw)
 
   @property
   def hover_climb_energy_kw_hr(self):
-    return self._calc_hover_climb_energy_kw_hr()
+    return self._cache.get('hover_climb_energy_kw_hr', self._calc_hover_climb_energy_kw_hr)
     
   @property
   def trans_climb_avg_shaft_power_kw(self):
-    return self._calc_trans_climb_avg_shaft_power_kw()
+    return self._cache.get('trans_climb_avg_shaft_power_kw', self._calc_trans_climb_avg_shaft_power_kw)
   
   @property
   def trans_climb_avg_electric_power_kw(self):
-    return self._calc_trans_climb_avg_electric_power_kw()
+    return self._cache.get('trans_climb_avg_electric_power_kw', self._calc_trans_climb_avg_electric_power_kw)
   
   @property
   def trans_climb_energy_kw_hr(self):
-    return self._calc_trans_climb_energy_kw_hr()
+    return self._cache.get('trans_climb_energy_kw_hr', self._calc_trans_climb_energy_kw_hr)
 
   @property
   def depart_proc_avg_shaft_power_kw(self):
-    return self._calc_depart_proc_avg_shaft_power_kw()
+    return self._cache.get('depart_proc_avg_shaft_power_kw', self._calc_depart_proc_avg_shaft_power_kw)
   
   @property
   def depart_proc_avg_electric_power_kw(self):
-    return self._calc_depart_proc_avg_electric_power_kw()
+    return self._cache.get('depart_proc_avg_electric_power_kw', self._calc_depart_proc_avg_electric_power_kw)
   
   @property
   def depart_proc_energy_kw_hr(self):
-    return self._calc_depart_proc_energy_kw_hr()
+    return self._cache.get('depart_proc_energy_kw_hr', self._calc_depart_proc_energy_kw_hr)
 
   @property
   def accel_climb_avg_shaft_power_kw(self):
-    return self._calc_accel_climb_avg_shaft_power_kw()
+    return self._cache.get('accel_climb_avg_shaft_power_kw', self._calc_accel_climb_avg_shaft_power_kw)
   
   @property
   def accel_climb_avg_electric_power_kw(self):
-    return self._calc_accel_climb_avg_electric_power_kw()
+    return self._cache.get('accel_climb_avg_electric_power_kw', self._calc_accel_climb_avg_electric_power_kw)
   
   @property
   def accel_climb_energy_kw_hr(self):
-    return self._calc_accel_climb_energy_kw_hr()
+    return self._cache.get('accel_climb_energy_kw_hr', self._calc_accel_climb_energy_kw_hr)
 
   @property
   def cruise_avg_shaft_power_kw(self):
-    return self._calc_cruise_avg_shaft_power_kw()
+    return self._cache.get('cruise_avg_shaft_power_kw', self._calc_cruise_avg_shaft_power_kw)
   
   @property
   def cruise_avg_electric_power_kw(self):
-    return self._calc_cruise_avg_electric_power_kw()
+    return self._cache.get('cruise_avg_electric_power_kw', self._calc_cruise_avg_electric_power_kw)
 
   @property
   def cruise_energy_kw_hr(self):
-    return self._calc_cruise_energy_kw_hr()
+    return self._cache.get('cruise_energy_kw_hr', self._calc_cruise_energy_kw_hr)
   
   @property
   def decel_descend_avg_shaft_power_kw(self):
-    return self._calc_decel_descend_avg_shaft_power_kw()
+    return self._cache.get('decel_descend_avg_shaft_power_kw', self._calc_decel_descend_avg_shaft_power_kw)
   
   @property
   def decel_descend_avg_electric_power_kw(self):
-    return self._calc_decel_descend_avg_electric_power_kw()
+    return self._cache.get('decel_descend_avg_electric_power_kw', self._calc_decel_descend_avg_electric_power_kw)
 
   @property
   def decel_descend_energy_kw_hr(self):
-    return self._calc_decel_descend_energy_kw_hr()
+    return self._cache.get('decel_descend_energy_kw_hr', self._calc_decel_descend_energy_kw_hr)
     
   @property
   def arrive_proc_avg_shaft_power_kw(self):
-    return self._calc_arrive_proc_avg_shaft_power_kw()
+    return self._cache.get('arrive_proc_avg_shaft_power_kw', self._calc_arrive_proc_avg_shaft_power_kw)
   
   @property
   def arrive_proc_avg_electric_power_kw(self):
-    return self._calc_arrive_proc_avg_electric_power_kw()
+    return self._cache.get('arrive_proc_avg_electric_power_kw', self._calc_arrive_proc_avg_electric_power_kw)
 
   @property
   def arrive_proc_energy_kw_hr(self):
-    return self._calc_arrive_proc_energy_kw_hr()
+    return self._cache.get('arrive_proc_energy_kw_hr', self._calc_arrive_proc_energy_kw_hr)
   
   @property
   def trans_descend_avg_shaft_power_kw(self):
-    return self._calc_trans_descend_avg_shaft_power_kw()
+    return self._cache.get('trans_descend_avg_shaft_power_kw', self._calc_trans_descend_avg_shaft_power_kw)
   
   @property
   def trans_descend_avg_electric_power_kw(self):
-    return self._calc_trans_descend_avg_electric_power_kw()
+    return self._cache.get('trans_descend_avg_electric_power_kw', self._calc_trans_descend_avg_electric_power_kw)
 
   @property
   def trans_descend_energy_kw_hr(self):
-    return self._calc_trans_descend_energy_kw_hr()
+    return self._cache.get('trans_descend_energy_kw_hr', self._calc_trans_descend_energy_kw_hr)
 
   @property
   def hover_descend_avg_shaft_power_kw(self):
-    return self._calc_hover_descend_avg_shaft_power_kw()
+    return self._cache.get('hover_descend_avg_shaft_power_kw', self._calc_hover_descend_avg_shaft_power_kw)
   
   @property
   def hover_descend_avg_electric_power_kw(self):
-    return self._calc_hover_descend_avg_electric_power_kw()
+    return self._cache.get('hover_descend_avg_electric_power_kw', self._calc_hover_descend_avg_electric_power_kw)
 
   @property
   def hover_descend_energy_kw_hr(self):
-    return self._calc_hover_descend_energy_kw_hr()
+    return self._cache.get('hover_descend_energy_kw_hr', self._calc_hover_descend_energy_kw_hr)
   
   @property
   def arrive_taxi_avg_shaft_power_kw(self):
-    return self._calc_arrive_taxi_avg_shaft_power_kw()
+    return self._cache.get('arrive_taxi_avg_shaft_power_kw', self._calc_arrive_taxi_avg_shaft_power_kw)
   
   @property
   def arrive_taxi_avg_electric_power_kw(self):
-    return self._calc_arrive_taxi_avg_electric_power_kw()
+    return self._cache.get('arrive_taxi_avg_electric_power_kw', self._calc_arrive_taxi_avg_electric_power_kw)
   
   @property
   def arrive_taxi_energy_kw_hr(self):
-    return self._calc_arrive_taxi_energy_kw_hr()
+    return self._cache.get('arrive_taxi_energy_kw_hr', self._calc_arrive_taxi_energy_kw_hr)
 
   @property
   def reserve_hover_climb_avg_shaft_power_kw(self):
-    return self._calc_reserve_hover_climb_avg_shaft_power_kw()
+    return self._cache.get('reserve_hover_climb_avg_shaft_power_kw', self._calc_reserve_hover_climb_avg_shaft_power_kw)
   
   @property
   def reserve_hover_climb_avg_electric_power_kw(self):
-    return self._calc_reserve_hover_climb_avg_electric_power_kw()
+    return self._cache.get('reserve_hover_climb_avg_electric_power_kw', self._calc_reserve_hover_climb_avg_electric_power_kw)
 
   @property
   def reserve_hover_climb_energy_kw_hr(self):
-    return self._calc_reserve_hover_climb_energy_kw_hr()
+    return self._cache.get('reserve_hover_climb_energy_kw_hr', self._calc_reserve_hover_climb_energy_kw_hr)
 
   @property
   def reserve_trans_climb_avg_shaft_power_kw(self):
-    return self._calc_reserve_trans_climb_avg_shaft_power_kw()
+    return self._cache.get('reserve_trans_climb_avg_shaft_power_kw', self._calc_reserve_trans_climb_avg_shaft_power_kw)
   
   @property
   def reserve_trans_climb_avg_electric_power_kw(self):
-    return self._calc_reserve_trans_climb_avg_electric_power_kw()
+    return self._cache.get('reserve_trans_climb_avg_electric_power_kw', self._calc_reserve_trans_climb_avg_electric_power_kw)
 
   @property
   def reserve_trans_climb_energy_kw_hr(self):
-    return self._calc_reserve_trans_climb_energy_kw_hr()
+    return self._cache.get('reserve_trans_climb_energy_kw_hr', self._calc_reserve_trans_climb_energy_kw_hr)
   
   @property
   def reserve_accel_climb_avg_shaft_power_kw(self):
-    return self._calc_reserve_accel_climb_avg_shaft_power_kw()
+    return self._cache.get('reserve_accel_climb_avg_shaft_power_kw', self._calc_reserve_accel_climb_avg_shaft_power_kw)
   
   @property
   def reserve_accel_climb_avg_electric_power_kw(self):
-    return self._calc_reserve_accel_climb_avg_electric_power_kw()
+    return self._cache.get('reserve_accel_climb_avg_electric_power_kw', self._calc_reserve_accel_climb_avg_electric_power_kw)
 
   @property
   def reserve_accel_climb_energy_kw_hr(self):
-    return self._calc_reserve_accel_climb_energy_kw_hr()
+    return self._cache.get('reserve_accel_climb_energy_kw_hr', self._calc_reserve_accel_climb_energy_kw_hr)
   
   @property
   def reserve_cruise_avg_shaft_power_kw(self):
-    return self._calc_reserve_cruise_avg_shaft_power_kw()
+    return self._cache.get('reserve_cruise_avg_shaft_power_kw', self._calc_reserve_cruise_avg_shaft_power_kw)
   
   @property
   def reserve_cruise_avg_electric_power_kw(self):
-    return self._calc_reserve_cruise_avg_electric_power_kw()
+    return self._cache.get('reserve_cruise_avg_electric_power_kw', self._calc_reserve_cruise_avg_electric_power_kw)
 
   @property
   def reserve_cruise_energy_kw_hr(self):
-    return self._calc_reserve_cruise_energy_kw_hr()
+    return self._cache.get('reserve_cruise_energy_kw_hr', self._calc_reserve_cruise_energy_kw_hr)
 
   @property
   def reserve_decel_descend_avg_shaft_power_kw(self):
-    return self._calc_reserve_decel_descend_avg_shaft_power_kw()
+    return self._cache.get('reserve_decel_descend_avg_shaft_power_kw', self._calc_reserve_decel_descend_avg_shaft_power_kw)
   
   @property
   def reserve_decel_descend_avg_electric_power_kw(self):
-    return self._calc_reserve_decel_descend_avg_electric_power_kw()
+    return self._cache.get('reserve_decel_descend_avg_electric_power_kw', self._calc_reserve_decel_descend_avg_electric_power_kw)
 
   @property
   def reserve_decel_descend_energy_kw_hr(self):
-    return self._calc_reserve_decel_descend_energy_kw_hr()
+    return self._cache.get('reserve_decel_descend_energy_kw_hr', self._calc_reserve_decel_descend_energy_kw_hr)
 
   @property
   def reserve_trans_descend_avg_shaft_power_kw(self):
-    return self._calc_reserve_trans_descend_avg_shaft_power_kw()
+    return self._cache.get('reserve_trans_descend_avg_shaft_power_kw', self._calc_reserve_trans_descend_avg_shaft_power_kw)
 
   @property
   def reserve_trans_descend_avg_electric_power_kw(self):
-    return self._calc_reserve_trans_descend_avg_electric_power_kw()
+    return self._cache.get('reserve_trans_descend_avg_electric_power_kw', self._calc_reserve_trans_descend_avg_electric_power_kw)
 
   @property
   def reserve_trans_descend_energy_kw_hr(self):
-    return self._calc_reserve_trans_descend_energy_kw_hr()
+    return self._cache.get('reserve_trans_descend_energy_kw_hr', self._calc_reserve_trans_descend_energy_kw_hr)
 
   @property
   def reserve_hover_descend_avg_shaft_power_kw(self):
-    return self._calc_reserve_hover_descend_avg_shaft_power_kw()
+    return self._cache.get('reserve_hover_descend_avg_shaft_power_kw', self._calc_reserve_hover_descend_avg_shaft_power_kw)
 
   @property
   def reserve_hover_descend_avg_electric_power_kw(self):
-    return self._calc_reserve_hover_descend_avg_electric_power_kw()
+    return self._cache.get('reserve_hover_descend_avg_electric_power_kw', self._calc_reserve_hover_descend_avg_electric_power_kw)
 
   @property
   def reserve_hover_descend_energy_kw_hr(self):
-    return self._calc_reserve_hover_descend_energy_kw_hr()
+    return self._cache.get('reserve_hover_descend_energy_kw_hr', self._calc_reserve_hover_descend_energy_kw_hr)
 
   @property
   def total_mission_energy_kw_hr(self):
-    return self._calc_total_mission_energy_kw_hr()
+    return self._cache.get('total_mission_energy_kw_hr', self._calc_total_mission_energy_kw_hr)
 
   @property
   def total_reserve_mission_energy_kw_hr(self):
-    return self._calc_total_reserve_mission_energy_kw_hr()
+    return self._cache.get('total_reserve_mission_energy_kw_hr', self._calc_total_reserve_mission_energy_kw_hr)
 
   @property
   def battery_mass_kg(self):
-    return self._calc_battery_mass_kg()
+    return self._cache.get('battery_mass_kg', self._calc_battery_mass_kg)
 
   @property
   def wing_mass_kg(self):
-    return self._calc_wing_mass_kg()
+    return self._cache.get('wing_mass_kg', self._calc_wing_mass_kg)
 
   @property
   def horiz_tail_mass_kg(self):
-    return self._calc_horiz_tail_mass_kg()
+    return self._cache.get('horiz_tail_mass_kg', self._calc_horiz_tail_mass_kg)
 
   @property
   def vert_tail_mass_kg(self):
-    return self._calc_vert_tail_mass_kg()
+    return self._cache.get('vert_tail_mass_kg', self._calc_vert_tail_mass_kg)
 
   @property
   def fuselage_mass_kg(self):
-    return self._calc_fuselage_mass_kg()
+    return self._cache.get('fuselage_mass_kg', self._calc_fuselage_mass_kg)
 
   @property
   def boom_mass_kg(self):
-    return self._calc_boom_mass_kg()
+    return self._cache.get('boom_mass_kg', self._calc_boom_mass_kg)
 
   @property
   def landing_gear_mass_kg(self):
-    return self._calc_landing_gear_mass_kg()
+    return self._cache.get('landing_gear_mass_kg', self._calc_landing_gear_mass_kg)
 
   @property
   def epu_mass_kg(self):
-    return self._calc_epu_mass_kg()
+    return self._cache.get('epu_mass_kg', self._calc_epu_mass_kg)
 
   @property
   def lift_rotor_hub_mass_kg(self):
-    return self._calc_lift_rotor_hub_mass_kg()
+    return self._cache.get('lift_rotor_hub_mass_kg', self._calc_lift_rotor_hub_mass_kg)
 
   @property
   def tilt_rotor_mass_kg(self):
-    return self._calc_tilt_rotor_mass_kg()
+    return self._cache.get('tilt_rotor_mass_kg', self._calc_tilt_rotor_mass_kg)
 
   @property
   def empty_mass_kg(self):
-    return self._calc_empty_mass_kg()
\ No newline at end of file
+    return self._cache.get('empty_mass_kg', self._calc_empty_mass_kg)
@@ -0,0 +1,242 @@
+# atmosphere.py
+#
+# Python functions and class for the International Standard Atmosphere (ISA)
+# with temperature offsets, analytic and by precomputed lookup tables
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import numpy as np # arrays, vectorized math
+
+# constants of the ISA (ICAO Doc 7488) up to 20 km geopotential altitude
+R_J_P_KG_K = 287.05287
+GAMMA = 1.4
+G0_M_P_S2 = 9.80665
+T0_K = 288.15
+P0_PA = 101325.0
+LAPSE_K_P_M = 0.0065
+TROPOPAUSE_M = 11000.0
+T_TROPOPAUSE_K = T0_K-LAPSE_K_P_M*TROPOPAUSE_M
+P_TROPOPAUSE_PA = P0_PA*(T_TROPOPAUSE_K/T0_K)**(G0_M_P_S2/(R_J_P_KG_K*LAPSE_K_P_M))
+
+# Sutherland's law of the dynamic viscosity of air
+SUTHERLAND_BETA = 1.458e-6
+SUTHERLAND_S_K = 110.4
+
+# default table range and spacing; linear interpolation on this grid is
+# within 1e-6 (relative) of the analytic atmosphere
+ALT_MIN_M = -1000.0
+ALT_MAX_M = 20000.0
+ALT_STEP_M = 10.0
+
+# An ISA day with temperature offset temp_offset_k [K] has the standard
+# pressure at each altitude and a temperature raised by the offset, so the
+# density falls and the speed of sound rises on hot days. Altitudes [m] are
+# geopotential above mean sea level; all functions take scalars or arrays,
+# real or complex (complex-step derivatives, see optimize.py).
+
+# Environ fields set from the altitudes and temperature offset of an ISA
+# environ (see calc_environ_air_properties)
+ISA_DERIVED_FIELDS = (
+ 'sound_speed_m_p_s',
+ 'air_density_sea_lvl_kg_p_m3',
+ 'air_density_max_alt_kg_p_m3',
+ 'kinematic_viscosity_sea_lvl_m2_p_s',
+ 'kinematic_viscosity_max_alt_m2_p_s'
+)
+
+# x as a float64 array, or complex128 if x is complex
+def _as_array(x):
+  x = np.asarray(x)
+  return x if np.iscomplexobj(x) else x.astype(np.float64)
+
+# absolute value that is analytic for complex-step inputs (sign of the real part)
+def _abs(x):
+  if np.iscomplexobj(x):
+    return np.where(np.real(x) < 0.0, -x, x)
+  return np.abs(x)
+
+# standard temperature [K] at altitude alt_m [m]
+def calc_isa_temperature_k(alt_m):
+  alt_m = _as_array(alt_m)
+  return T0_K-LAPSE_K_P_M*np.where(np.real(alt_m) < TROPOPAUSE_M, alt_m, TROPOPAUSE_M)
+
+# standard pressure [Pa] at altitude alt_m [m]
+def calc_isa_pressure_pa(alt_m):
+  alt_m = _as_array(alt_m)
+  troposphere_pa = \
+   P0_PA*(calc_isa_temperature_k(alt_m)/T0_K)**(G0_M_P_S2/(R_J_P_KG_K*LAPSE_K_P_M))
+  stratosphere_pa = \
+   P_TROPOPAUSE_PA*np.exp(-G0_M_P_S2*(alt_m-TROPOPAUSE_M)/(R_J_P_KG_K*T_TROPOPAUSE_K))
+  return np.where(np.real(alt_m) <= TROPOPAUSE_M, troposphere_pa, stratosphere_pa)
+
+# dynamic viscosity [Pa*s] of air at temperature temperature_k [K]
+def calc_dynamic_viscosity_pa_s(temperature_k):
+  temperature_k = _as_array(temperature_k)
+  return SUTHERLAND_BETA*temperature_k*np.sqrt(temperature_k)/(temperature_k+SUTHERLAND_S_K)
+
+# analytic atmosphere at altitude alt_m [m] and temperature offset
+# temp_offset_k [K]; returns {name: value} with temperature_k, pressure_pa,
+# air_density_kg_p_m3, sound_speed_m_p_s and kinematic_viscosity_m2_p_s
+def calc_isa(alt_m, temp_offset_k=0.0):
+  temperature_k = calc_isa_temperature_k(alt_m)+temp_offset_k
+  pressure_pa = calc_isa_pressure_pa(alt_m)
+  air_density_kg_p_m3 = pressure_pa/(R_J_P_KG_K*temperature_k)
+  return {
+    'temperature_k': temperature_k,
+    'pressure_pa': pressure_pa,
+    'air_density_kg_p_m3': air_density_kg_p_m3,
+    'sound_speed_m_p_s': np.sqrt(GAMMA*R_J_P_KG_K*temperature_k),
+    'kinematic_viscosity_m2_p_s':
+     calc_dynamic_viscosity_pa_s(temperature_k)/air_density_kg_p_m3
+  }
+
+# index and fraction of x on the uniform grid start + i*step, i < n; values
+# outside the grid are clamped to its ends
+# the index follows the real part of a complex x; inside the grid the fraction
+# keeps the imaginary part, so complex-step derivatives are the table slopes
+def _locate(x, start, step, n):
+  u = (_as_array(x)-start)/step
+  u_clamped = np.clip(np.real(u), 0.0, n-1.0)
+  i = np.minimum(u_clamped.astype(np.intp), n-2)
+  if np.iscomplexobj(u):
+    return i, np.where(np.real(u) == u_clamped, u, u_clamped)-i
+  return i, u_clamped-i
+
+# AtmosphereTable class
+# the standard temperature and pressure tabulated over altitude, so that any
+# temperature offset shares one table; lookups locate the altitude once and
+# interpolate linearly, which replaces the power and exponential of the
+# pressure in calc_isa; the other quantities follow from the temperature
+class AtmosphereTable:
+  # class constructor
+  def __init__(self, alt_min_m=ALT_MIN_M, alt_max_m=ALT_MAX_M, alt_step_m=ALT_STEP_M):
+    self.alt_min_m = alt_min_m
+    self.alt_step_m = alt_step_m
+    alt_m = alt_min_m+alt_step_m*np.arange(int(round((alt_max_m-alt_min_m)/alt_step_m))+1)
+    self.alt_max_m = float(alt_m[-1])
+    self._temperature_k = calc_isa_temperature_k(alt_m)
+    self._d_temperature_k = np.diff(self._temperature_k)
+    self._pressure_pa = calc_isa_pressure_pa(alt_m)
+    self._d_pressure_pa = np.diff(self._pressure_pa)
+
+  # interpolated temperature [K] and pressure [Pa]
+  def _temperature_pressure(self, alt_m, temp_offset_k):
+    i, f = _locate(alt_m, self.alt_min_m, self.alt_step_m, len(self._temperature_k))
+    temperature_k = self._temperature_k[i]+f*self._d_temperature_k[i]+temp_offset_k
+    pressure_pa = self._pressure_pa[i]+f*self._d_pressure_pa[i]
+    return temperature_k, pressure_pa
+
+  # atmosphere at altitude alt_m [m] and temperature offset temp_offset_k [K];
+  # returns {name: value} with the same names as calc_isa
+  def lookup(self, alt_m, temp_offset_k=0.0):
+    temperature_k, pressure_pa = self._temperature_pressure(alt_m, temp_offset_k)
+    air_density_kg_p_m3 = pressure_pa/(R_J_P_KG_K*temperature_k)
+    return {
+      'temperature_k': temperature_k,
+      'pressure_pa': pressure_pa,
+      'air_density_kg_p_m3': air_density_kg_p_m3,
+      'sound_speed_m_p_s': np.sqrt(GAMMA*R_J_P_KG_K*temperature_k),
+      'kinematic_viscosity_m2_p_s':
+       calc_dynamic_viscosity_pa_s(temperature_k)/air_density_kg_p_m3
+    }
+
+  # air density [kg/m^3] only, for the segment models
+  def air_density_kg_p_m3(self, alt_m, temp_offset_k=0.0):
+    temperature_k, pressure_pa = self._temperature_pressure(alt_m, temp_offset_k)
+    return pressure_pa/(R_J_P_KG_K*temperature_k)
+
+# table shared by the Environ class and the batch engine
+ISA_TABLE = AtmosphereTable()
+
+# reference air properties of an ISA environ (see environ.py): sea-level
+# properties and speed of sound at the field elevation field_alt_m, max-altitude
+# properties at the cruise altitude max_alt_m
+# returns {Environ field name: value}
+def calc_environ_air_properties(field_alt_m, max_alt_m, temp_offset_k=0.0, table=ISA_TABLE):
+  field = table.lookup(field_alt_m, temp_offset_k)
+  cruise = table.lookup(max_alt_m, temp_offset_k)
+  return {
+    'sound_speed_m_p_s': field['sound_speed_m_p_s'],
+    'air_density_sea_lvl_kg_p_m3': field['air_density_kg_p_m3'],
+    'air_density_max_alt_kg_p_m3': cruise['air_density_kg_p_m3'],
+    'kinematic_viscosity_sea_lvl_m2_p_s': field['kinematic_viscosity_m2_p_s'],
+    'kinematic_viscosity_max_alt_m2_p_s': cruise['kinematic_viscosity_m2_p_s']
+  }
+
+# cruise segments, which fly at the cruise altitude max_alt_m
+CRUISE_SEGMENTS = ('cruise', 'reserve_cruise')
+
+# height [m] above the field at the middle of each mission segment
+#  p: {field name: scalar or array} with the Mission fields
+# returns {segment name: height}; climbs and descents follow the vertical
+# kinematics of the segment power models, main and reserve climbs start at the
+# field and descents are stacked up from the field, and cruise segments are at
+# the top of their climb
+def calc_segment_mid_height_m(p: dict):
+  h = {}
+  # main mission climb
+  hover_climb_m = p['hover_climb_avg_v_m_p_s']*p['hover_climb_s']
+  trans_climb_m = p['trans_climb_v_m_p_s']*p['trans_climb_s']
+  accel_climb_m = 0.5*p['accel_climb_v_m_p_s']*p['accel_climb_s']
+  h['depart_taxi'] = 0.0*hover_climb_m
+  h['hover_climb'] = 0.5*hover_climb_m
+  h['trans_climb'] = hover_climb_m+0.5*trans_climb_m
+  h['depart_proc'] = hover_climb_m+trans_climb_m
+  h['accel_climb'] = h['depart_proc']+0.5*accel_climb_m
+  h['cruise'] = h['depart_proc']+accel_climb_m
+  # main mission descent
+  hover_descend_m = p['hover_descend_avg_v_m_p_s']*p['hover_descend_s']
+  trans_descend_m = \
+   0.5*(_abs(p['decel_descend_v_m_p_s'])+_abs(p['trans_descend_v_m_p_s']))*\
+   p['trans_descend_s']
+  decel_descend_m = 0.5*_abs(p['decel_descend_v_m_p_s'])*p['decel_descend_s']
+  h['decel_descend'] = hover_descend_m+trans_descend_m+0.5*decel_descend_m
+  h['arrive_proc'] = hover_descend_m+trans_descend_m
+  h['trans_descend'] = hover_descend_m+0.5*trans_descend_m
+  h['hover_descend'] = 0.5*hover_descend_m
+  h['arrive_taxi'] = 0.0*hover_descend_m
+  # reserve mission climb
+  reserve_hover_climb_m = \
+   p['reserve_hover_climb_avg_v_m_p_s']*p['reserve_hover_climb_s']
+  reserve_trans_climb_m = \
+   p['reserve_trans_climb_v_m_p_s']*p['reserve_trans_climb_s']
+  reserve_accel_climb_m = \
+   p['reserve_accel_climb_v_m_p_s']*p['reserve_accel_climb_s']
+  h['reserve_hover_climb'] = 0.5*reserve_hover_climb_m
+  h['reserve_trans_climb'] = reserve_hover_climb_m+0.5*reserve_trans_climb_m
+  h['reserve_accel_climb'] = \
+   reserve_hover_climb_m+reserve_trans_climb_m+0.5*reserve_accel_climb_m
+  h['reserve_cruise'] = \
+   reserve_hover_climb_m+reserve_trans_climb_m+reserve_accel_climb_m
+  # reserve mission descent
+  reserve_hover_descend_m = \
+   p['reserve_hover_descend_avg_v_m_p_s']*p['reserve_hover_descend_s']
+  reserve_trans_descend_m = \
+   0.5*(_abs(p['reserve_decel_descend_v_m_p_s'])+\
+        _abs(p['reserve_trans_descend_v_m_p_s']))*p['reserve_trans_descend_s']
+  reserve_decel_descend_m = \
+   0.5*_abs(p['reserve_decel_descend_v_m_p_s'])*p['reserve_decel_descend_s']
+  h['reserve_decel_descend'] = \
+   reserve_hover_descend_m+reserve_trans_descend_m+0.5*reserve_decel_descend_m
+  h['reserve_trans_descend'] = \
+   reserve_hover_descend_m+0.5*reserve_trans_descend_m
+  h['reserve_hover_descend'] = 0.5*reserve_hover_descend_m
+  return h
+
+# air density [kg/m^3] of each mission segment of an ISA day: cruise
+# segments at max_alt_m, the others at their mid-segment height above the
+# field at field_alt_m (altitudes above mean sea level [m])
+#  p: {field name: scalar or array} with the Mission fields
+# returns {segment name: density}
+def calc_segment_air_density_kg_p_m3(p: dict, field_alt_m, max_alt_m, temp_offset_k=0.0,
+                                     table=ISA_TABLE):
+  return {
+    segment: table.air_density_kg_p_m3(
+      max_alt_m if segment in CRUISE_SEGMENTS else field_alt_m+height_m, temp_offset_k
+    )
+    for segment, height_m in calc_segment_mid_height_m(p).items()
+  }
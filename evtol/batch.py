@@ -0,0 +1,801 @@
+# batch.py
+#
+# Python functions for vectorized mission power, energy, mass, and MTOW sizing
+# of aircraft designs
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import numpy as np # arrays, vectorized math
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from atmosphere import CRUISE_SEGMENTS, ISA_DERIVED_FIELDS, _abs, \
+ calc_environ_air_properties, calc_segment_air_density_kg_p_m3
+from charging import calc_cccv_charge_time_hr
+
+# comment above and uncomment below when ready to deploy as package
+#from .atmosphere import CRUISE_SEGMENTS, ISA_DERIVED_FIELDS, _abs, \
+# calc_environ_air_properties, calc_segment_air_density_kg_p_m3
+#from .charging import calc_cccv_charge_time_hr
+
+# constants
+W_P_KW = 1000.0
+S_P_HR = 3600.0
+KG_2_LB = 2.20462
+M_2_FT = 3.28084
+M_P_S_2_KTS = 1.9438
+N_P_M2_2_LB_P_FT2 = 0.0209
+
+# JSON specification sections read by the batch engine
+SECTIONS = ('aircraft', 'environ', 'mission', 'power', 'propulsion')
+
+# mission segments in flight order; name -> mission duration field
+SEGMENTS = (
+ ('depart_taxi', 'depart_taxi_s'),
+ ('hover_climb', 'hover_climb_s'),
+ ('trans_climb', 'trans_climb_s'),
+ ('depart_proc', 'depart_proc_s'),
+ ('accel_climb', 'accel_climb_s'),
+ ('cruise', 'cruise_s'),
+ ('decel_descend', 'decel_descend_s'),
+ ('arrive_proc', 'arrive_proc_s'),
+ ('trans_descend', 'trans_descend_s'),
+ ('hover_descend', 'hover_descend_s'),
+ ('arrive_taxi', 'arrive_taxi_s'),
+ ('reserve_hover_climb', 'reserve_hover_climb_s'),
+ ('reserve_trans_climb', 'reserve_trans_climb_s'),
+ ('reserve_accel_climb', 'reserve_accel_climb_s'),
+ ('reserve_cruise', 'reserve_cruise_s'),
+ ('reserve_decel_descend', 'reserve_decel_descend_s'),
+ ('reserve_trans_descend', 'reserve_trans_descend_s'),
+ ('reserve_hover_descend', 'reserve_hover_descend_s')
+)
+
+# return a flat parameter dict {field name: value} from a parsed JSON
+# specification; field names are unique across sections
+# an ISA environ contributes field_alt_m, max_alt_m and temp_offset_k and its
+# air properties (see environ.py); the atmosphere name is dropped
+def params_from_config(ijson: dict):
+  params = {}
+  for section in SECTIONS:
+    params.update(ijson[section])
+  if params.pop('atmosphere', 'fixed') == 'isa':
+    params.setdefault('field_alt_m', 0.0)
+    params.setdefault('temp_offset_k', 0.0)
+    params = isa_params(params)
+  return params
+
+# return params with the air properties of an ISA environ set from its
+# field_alt_m, max_alt_m and temp_offset_k (scalars or arrays), e.g. after
+# replacing these by a grid of altitudes and temperature offsets
+def isa_params(params: dict):
+  return dict(params, **calc_environ_air_properties(
+    params['field_alt_m'], params['max_alt_m'], params['temp_offset_k']
+  ))
+
+# return a flat parameter dict {field name: value} from an Aircraft object
+# an ISA environ contributes field_alt_m, max_alt_m and temp_offset_k but not
+# its air properties, which broadcast_params derives from them
+def params_from_aircraft(aircraft):
+  params = {}
+  for section in SECTIONS:
+    obj = aircraft if section == 'aircraft' else getattr(aircraft, section)
+    skip = ISA_DERIVED_FIELDS if section == 'environ' and obj.atmosphere == 'isa' else ()
+    for name, attr in type(obj).__dict__.items():
+      if isinstance(attr, property) and hasattr(obj, '_'+name) and name not in skip:
+        value = getattr(obj, name)
+        if isinstance(value, (int, float)):
+          params[name] = value
+  return params
+
+# return params with every value as a float64 array of one common shape
+# scalars broadcast against arrays, e.g. a (n,) MTOW array with a scalar config
+# if any value is complex, every array is complex128 (complex-step derivatives)
+# an ISA environ (field_alt_m in params) gets its air properties from its
+# altitudes and temperature offset, so that derivatives with respect to these
+# include the air properties
+def broadcast_params(params: dict):
+  if 'field_alt_m' in params:
+    params = isa_params(params)
+  names = list(params)
+  if any(np.iscomplexobj(params[name]) for name in names):
+    dtype = np.complex128
+  else:
+    dtype = np.float64
+  arrays = np.broadcast_arrays(
+   *[np.asarray(params[name], dtype=dtype) for name in names]
+  )
+  return {name: np.array(array) for name, array in zip(names, arrays)}
+
+# cosine of the flight-path angle atan2(v, h); arctan2 has no complex form, so
+# complex-step inputs use the equivalent h/sqrt(h^2+v^2)
+def _cos_flight_path(v_m_p_s, h_m_p_s):
+  if np.iscomplexobj(v_m_p_s) or np.iscomplexobj(h_m_p_s):
+    return h_m_p_s/np.sqrt(h_m_p_s**2.0+v_m_p_s**2.0)
+  return np.cos(np.arctan2(v_m_p_s, h_m_p_s))
+
+# derived geometry and drag coefficients shared by the segment models
+# mirrors the Aircraft _calc_* methods of the same names
+def _calc_geometry(p):
+  g = {}
+  g['disk_area_m2'] = p['rotor_count']*np.pi*(p['rotor_diameter_m']/2.0)**2.0
+  g['wing_area_m2'] = \
+   (2.0*p['max_takeoff_mass_kg']*p['g_m_p_s2'])/\
+   (p['air_density_sea_lvl_kg_p_m3']*(p['stall_speed_m_p_s']**2.0)*\
+    p['vehicle_cl_max'])
+  g['wing_aspect_ratio'] = p['wingspan_m']**2.0/g['wing_area_m2']
+  g['fuselage_fineness_ratio'] = fineness_ratio = \
+   2.0*p['fuselage_l_m']/(p['fuselage_w_m']+p['fuselage_h_m'])
+  fuselage_cd0_p_cf = \
+   3.0*fineness_ratio+4.5/fineness_ratio**0.5+21.0/fineness_ratio**2.0
+  fuselage_cruise_reynolds = \
+   p['cruise_h_m_p_s']*p['fuselage_l_m']/\
+   p['kinematic_viscosity_max_alt_m2_p_s']
+  fuselage_cf = 0.455/np.log10(fuselage_cruise_reynolds)**2.58
+  fuselage_reference_area = \
+   np.pi*((p['fuselage_w_m']+p['fuselage_h_m'])/4.0)**2.0
+  g['fuselage_wetted_area_m2'] = 3.0*fineness_ratio*fuselage_reference_area
+  fuselage_cd0 = \
+   fuselage_cd0_p_cf*fuselage_cf*fuselage_reference_area/g['wing_area_m2']
+  wing_root_chord_m = \
+   2.0*g['wing_area_m2']/(p['wingspan_m']*(1.0+p['wing_taper_ratio']))
+  g['wing_mac_m'] = wing_mac_m = \
+   (2.0/3.0)*wing_root_chord_m*\
+   (1.0+p['wing_taper_ratio']**2.0/(1.0+p['wing_taper_ratio']))
+  g['horiz_tail_area_m2'] = horiz_tail_area_m2 = \
+   (p['horiz_tail_vol_coeff']*g['wing_area_m2']*wing_mac_m)/\
+   (0.5*p['fuselage_l_m'])
+  g['vert_tail_area_m2'] = vert_tail_area_m2 = \
+   (p['vert_tail_vol_coeff']*p['wingspan_m']*g['wing_area_m2'])/\
+   (0.5*p['fuselage_l_m'])
+  horiz_tail_cd0 = \
+   (horiz_tail_area_m2/g['wing_area_m2'])*p['empennage_airfoil_cd0']
+  vert_tail_cd0 = \
+   (vert_tail_area_m2/g['wing_area_m2'])*p['empennage_airfoil_cd0']
+  landing_gear_cd0 = p['landing_gear_drag_area_m2']/g['wing_area_m2']
+  g['stopped_rotor_cd0'] = \
+   (g['disk_area_m2']/p['ratio_disk_to_stopped_rotor_area'])/g['wing_area_m2']
+  g['total_drag_coef'] = \
+   fuselage_cd0+horiz_tail_cd0+vert_tail_cd0+landing_gear_cd0
+  return g
+
+# dynamic pressure, lift, and pre-factor drag components at flight-path angle
+# (v_m_p_s=None means level flight, lift = weight)
+def _calc_drag(p, g, rho, h_m_p_s, v_m_p_s=None, cd0=None):
+  q = 0.5*rho*h_m_p_s**2.0
+  weight_n = p['max_takeoff_mass_kg']*p['g_m_p_s2']
+  if v_m_p_s is None:
+    lift_n = weight_n
+  else:
+    lift_n = weight_n*_cos_flight_path(v_m_p_s, h_m_p_s)
+  di_n = \
+   (lift_n**2.0)/\
+   (q*g['wing_area_m2']*np.pi*g['wing_aspect_ratio']*p['span_effic_factor'])
+  if cd0 is None:
+    cd0 = g['total_drag_coef']
+  dp_n = q*g['wing_area_m2']*cd0
+  return q, weight_n, lift_n, di_n, dp_n
+
+# drag multiplier applied to every drag buildup
+def _drag_factor(p):
+  return p['trim_drag_factor']*p['excres_protub_factor']
+
+# induced (momentum theory) power for a required rotor thrust [W]
+def _induced_power_w(g, rho, thrust_n):
+  v_i_hover = np.sqrt(thrust_n/(2.0*rho*g['disk_area_m2']))
+  return thrust_n*v_i_hover
+
+# {segment name: air density} of the designs in p; mirrors
+# Aircraft._calc_segment_air_density_kg_p_m3. An ISA environ (field_alt_m in p)
+# uses the densities <segment>_air_density_kg_p_m3 in p if present (see
+# solve_batch_mtow) and table lookups otherwise
+def _calc_segment_air_density(p):
+  if 'field_alt_m' not in p:
+    return {
+     segment: p['air_density_max_alt_kg_p_m3'] if segment in CRUISE_SEGMENTS
+     else p['air_density_sea_lvl_kg_p_m3']
+     for segment, duration_name in SEGMENTS
+    }
+  if 'cruise_air_density_kg_p_m3' in p:
+    return {
+     segment: p[segment+'_air_density_kg_p_m3'] for segment, duration_name in SEGMENTS
+    }
+  return calc_segment_air_density_kg_p_m3(
+   p, p['field_alt_m'], p['max_alt_m'], p['temp_offset_k']
+  )
+
+# taxi segments: horizontal acceleration from rest only
+def _taxi_shaft_power_kw(p, avg_h_m_p_s, s):
+  d_h_m = avg_h_m_p_s*s
+  vf_h_m_p_s = 2.0*avg_h_m_p_s
+  a_h_m_p_s2 = vf_h_m_p_s**2.0/(2.0*d_h_m)
+  return \
+   (p['max_takeoff_mass_kg']*a_h_m_p_s2*avg_h_m_p_s)/\
+   (p['rotor_effic']*W_P_KW)
+
+# hover climb segments: vertical acceleration from rest plus weight
+def _hover_climb_shaft_power_kw(p, g, rho, avg_v_m_p_s, s):
+  d_v_m = avg_v_m_p_s*s
+  vf_v_m_p_s = (2.0*d_v_m)/s
+  a_v_m_p_s2 = vf_v_m_p_s**2.0/(2.0*d_v_m)
+  thrust_n = p['max_takeoff_mass_kg']*(p['g_m_p_s2']+a_v_m_p_s2)
+  return _induced_power_w(g, rho, thrust_n)/(p['rotor_effic']*W_P_KW)
+
+# hover descend segments: vertical deceleration to rest
+def _hover_descend_shaft_power_kw(p, g, rho, avg_v_m_p_s, s):
+  v0_v_m_p_s = 2.0*avg_v_m_p_s
+  d_v_m = avg_v_m_p_s*s
+  a_v_m_p_s2 = -v0_v_m_p_s**2.0/(2.0*d_v_m)
+  thrust_n = \
+   np.maximum(0.0, p['max_takeoff_mass_kg']*(p['g_m_p_s2']+a_v_m_p_s2))
+  return _induced_power_w(g, rho, thrust_n)/(p['rotor_effic']*W_P_KW)
+
+# transition climb segments: horizontal acceleration from rest, constant climb
+def _trans_climb_shaft_power_kw(p, g, rho, avg_h_m_p_s, v_m_p_s, s):
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, avg_h_m_p_s, v_m_p_s)
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  vf_h_m_p_s = 2.0*avg_h_m_p_s
+  d_h_m = avg_h_m_p_s*s
+  a_h_m_p_s2 = vf_h_m_p_s**2.0/(2.0*d_h_m)
+  thrust_n = np.maximum(0.0, weight_n-lift_n)
+  force_h_n = total_drag_n+p['max_takeoff_mass_kg']*a_h_m_p_s2
+  return \
+   (_induced_power_w(g, rho, thrust_n)+force_h_n*avg_h_m_p_s)/\
+   (p['rotor_effic']*W_P_KW)
+
+# procedure segments: level, constant-velocity flight
+def _proc_shaft_power_kw(p, g, rho, h_m_p_s):
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, h_m_p_s)
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  return (total_drag_n*h_m_p_s)/(p['rotor_effic']*W_P_KW)
+
+# cruise segments: level flight at max altitude with wing and stopped rotor drag
+def _cruise_shaft_power_kw(p, g, rho, h_m_p_s):
+  cd0_cruise = \
+   g['total_drag_coef']+p['wing_airfoil_cd_at_cruise_cl']+g['stopped_rotor_cd0']
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, h_m_p_s, cd0=cd0_cruise)
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  return (total_drag_n*h_m_p_s)/(p['rotor_effic']*W_P_KW)
+
+# decelerate descend segments: vertical assist if gravity is insufficient and
+# spoiler drag if the resulting shaft power is negative
+def _decel_descend_shaft_power_kw(p, g, rho, avg_h_m_p_s, v_m_p_s, s, v0_h_m_p_s):
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, avg_h_m_p_s, v_m_p_s)
+  mass_kg = p['max_takeoff_mass_kg']
+  denom = p['rotor_effic']*W_P_KW
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  vf_h_m_p_s = 2.0*avg_h_m_p_s-v0_h_m_p_s
+  d_h_m = avg_h_m_p_s*s
+  a_h_m_p_s2 = (vf_h_m_p_s**2.0-v0_h_m_p_s**2.0)/(2.0*d_h_m)
+  avg_v_m_p_s = 0.5*v_m_p_s
+  d_v_m = avg_v_m_p_s*s
+  a_v_m_p_s2 = v_m_p_s**2.0/(2.0*d_v_m)
+  force_h_n = total_drag_n+mass_kg*a_h_m_p_s2
+  force_v_n = (weight_n-lift_n)-mass_kg*a_v_m_p_s2
+  vertical_deficit_n = mass_kg*a_v_m_p_s2-(weight_n-lift_n)
+  shaft_power_deficit_kw = \
+   np.where(vertical_deficit_n > 0.0, vertical_deficit_n*avg_v_m_p_s/denom, 0.0)
+  shaft_power_kw = \
+   (force_h_n*avg_h_m_p_s+force_v_n*avg_v_m_p_s)/denom+shaft_power_deficit_kw
+  delta_cd_spoiler = np.maximum(-force_h_n/(q*g['wing_area_m2']), 0.0)
+  dp_spoiler_n = q*g['wing_area_m2']*delta_cd_spoiler
+  force_h_spoiler_n = \
+   (di_n+dp_n+dp_spoiler_n)*_drag_factor(p)+mass_kg*a_h_m_p_s2
+  shaft_power_spoiler_kw = \
+   (force_h_spoiler_n*avg_h_m_p_s+force_v_n*avg_v_m_p_s)/denom+\
+   shaft_power_deficit_kw
+  return np.where(shaft_power_kw < 0.0, shaft_power_spoiler_kw, shaft_power_kw)
+
+# transition descend segments: decelerate to a horizontal stop with hover assist
+# and spoiler drag if the resulting shaft power is negative
+def _trans_descend_shaft_power_kw(
+ p, g, rho, avg_h_m_p_s, v_m_p_s, s, v0_h_m_p_s, v0_v_m_p_s, d_v_m
+):
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, avg_h_m_p_s, v_m_p_s)
+  mass_kg = p['max_takeoff_mass_kg']
+  denom = p['rotor_effic']*W_P_KW
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  d_h_m = avg_h_m_p_s*s
+  a_h_m_p_s2 = -v0_h_m_p_s**2.0/(2.0*d_h_m)
+  a_v_m_p_s2 = (v_m_p_s**2.0-v0_v_m_p_s**2.0)/(2.0*d_v_m)
+  force_h_n = total_drag_n+mass_kg*a_h_m_p_s2
+  thrust_n = np.maximum(0.0, (weight_n-lift_n)+mass_kg*a_v_m_p_s2)
+  p_hover_w = _induced_power_w(g, rho, thrust_n)
+  shaft_power_kw = (p_hover_w+force_h_n*avg_h_m_p_s)/denom
+  delta_cd_spoiler = np.maximum(-force_h_n/(q*g['wing_area_m2']), 0.0)
+  dp_spoiler_n = q*g['wing_area_m2']*delta_cd_spoiler
+  force_h_spoiler_n = \
+   (di_n+dp_n+dp_spoiler_n)*_drag_factor(p)+mass_kg*a_h_m_p_s2
+  shaft_power_spoiler_kw = (p_hover_w+force_h_spoiler_n*avg_h_m_p_s)/denom
+  return np.where(shaft_power_kw < 0.0, shaft_power_spoiler_kw, shaft_power_kw)
+
+# accelerate climb (Segment E): horizontal and vertical acceleration
+def _accel_climb_shaft_power_kw(p, g, rho):
+  avg_h_m_p_s = p['accel_climb_avg_h_m_p_s']
+  v_m_p_s = p['accel_climb_v_m_p_s']
+  s = p['accel_climb_s']
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, avg_h_m_p_s, v_m_p_s)
+  mass_kg = p['max_takeoff_mass_kg']
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  v0_h_m_p_s = p['depart_proc_h_m_p_s']
+  vf_h_m_p_s = 2.0*avg_h_m_p_s-v0_h_m_p_s
+  d_h_m = avg_h_m_p_s*s
+  a_h_m_p_s2 = (vf_h_m_p_s**2.0-v0_h_m_p_s**2.0)/(2.0*d_h_m)
+  avg_v_m_p_s = 0.5*v_m_p_s
+  d_v_m = avg_v_m_p_s*s
+  a_v_m_p_s2 = v_m_p_s**2.0/(2.0*d_v_m)
+  force_h_n = total_drag_n+mass_kg*a_h_m_p_s2
+  force_v_n = (weight_n-lift_n)+mass_kg*a_v_m_p_s2
+  return \
+   (force_h_n*avg_h_m_p_s+force_v_n*avg_v_m_p_s)/(p['rotor_effic']*W_P_KW)
+
+# reserve accelerate climb (Segment E'): horizontal acceleration, constant climb
+def _reserve_accel_climb_shaft_power_kw(p, g, rho):
+  avg_h_m_p_s = p['reserve_accel_climb_avg_h_m_p_s']
+  v_m_p_s = p['reserve_accel_climb_v_m_p_s']
+  s = p['reserve_accel_climb_s']
+  q, weight_n, lift_n, di_n, dp_n = _calc_drag(p, g, rho, avg_h_m_p_s, v_m_p_s)
+  total_drag_n = (di_n+dp_n)*_drag_factor(p)
+  v0_h_m_p_s = 2.0*p['reserve_trans_climb_avg_h_m_p_s']
+  vf_h_m_p_s = 2.0*avg_h_m_p_s-v0_h_m_p_s
+  d_h_m = avg_h_m_p_s*s
+  a_h_m_p_s2 = (vf_h_m_p_s**2.0-v0_h_m_p_s**2.0)/(2.0*d_h_m)
+  force_h_n = total_drag_n+p['max_takeoff_mass_kg']*a_h_m_p_s2
+  force_v_n = weight_n-lift_n
+  return \
+   (force_h_n*avg_h_m_p_s+force_v_n*v_m_p_s)/(p['rotor_effic']*W_P_KW)
+
+# return {segment name: shaft power [kW]} for all 18 mission segments
+def _calc_segment_shaft_power_kw(p, g):
+  rho = _calc_segment_air_density(p)
+  return {
+   'depart_taxi': _taxi_shaft_power_kw(
+    p, p['depart_taxi_avg_h_m_p_s'], p['depart_taxi_s']
+   ),
+   'hover_climb': _hover_climb_shaft_power_kw(
+    p, g, rho['hover_climb'], p['hover_climb_avg_v_m_p_s'],
+    p['hover_climb_s']
+   ),
+   'trans_climb': _trans_climb_shaft_power_kw(
+    p, g, rho['trans_climb'], p['trans_climb_avg_h_m_p_s'],
+    p['trans_climb_v_m_p_s'], p['trans_climb_s']
+   ),
+   'depart_proc': _proc_shaft_power_kw(
+    p, g, rho['depart_proc'], p['depart_proc_h_m_p_s']
+   ),
+   'accel_climb': _accel_climb_shaft_power_kw(p, g, rho['accel_climb']),
+   'cruise': _cruise_shaft_power_kw(p, g, rho['cruise'], p['cruise_h_m_p_s']),
+   'decel_descend': _decel_descend_shaft_power_kw(
+    p, g, rho['decel_descend'], p['decel_descend_avg_h_m_p_s'],
+    p['decel_descend_v_m_p_s'], p['decel_descend_s'], p['cruise_h_m_p_s']
+   ),
+   'arrive_proc': _proc_shaft_power_kw(
+    p, g, rho['arrive_proc'], p['arrive_proc_h_m_p_s']
+   ),
+   'trans_descend': _trans_descend_shaft_power_kw(
+    p, g, rho['trans_descend'], p['trans_descend_avg_h_m_p_s'],
+    p['trans_descend_v_m_p_s'], p['trans_descend_s'],
+    2.0*p['trans_descend_avg_h_m_p_s'],
+    p['decel_descend_v_m_p_s'],
+    0.5*(_abs(p['decel_descend_v_m_p_s'])+\
+         _abs(p['trans_descend_v_m_p_s']))*p['trans_descend_s']
+   ),
+   'hover_descend': _hover_descend_shaft_power_kw(
+    p, g, rho['hover_descend'], p['hover_descend_avg_v_m_p_s'],
+    p['hover_descend_s']
+   ),
+   'arrive_taxi': _taxi_shaft_power_kw(
+    p, p['arrive_taxi_avg_h_m_p_s'], p['arrive_taxi_s']
+   ),
+   'reserve_hover_climb': _hover_climb_shaft_power_kw(
+    p, g, rho['reserve_hover_climb'], p['reserve_hover_climb_avg_v_m_p_s'],
+    p['reserve_hover_climb_s']
+   ),
+   'reserve_trans_climb': _trans_climb_shaft_power_kw(
+    p, g, rho['reserve_trans_climb'], p['reserve_trans_climb_avg_h_m_p_s'],
+    p['reserve_trans_climb_v_m_p_s'], p['reserve_trans_climb_s']
+   ),
+   'reserve_accel_climb': _reserve_accel_climb_shaft_power_kw(
+    p, g, rho['reserve_accel_climb']
+   ),
+   'reserve_cruise': _cruise_shaft_power_kw(
+    p, g, rho['reserve_cruise'], p['reserve_cruise_h_m_p_s']
+   ),
+   'reserve_decel_descend': _decel_descend_shaft_power_kw(
+    p, g, rho['reserve_decel_descend'], p['reserve_decel_descend_avg_h_m_p_s'],
+    p['reserve_decel_descend_v_m_p_s'], p['reserve_decel_descend_s'],
+    p['reserve_cruise_h_m_p_s']
+   ),
+   'reserve_trans_descend': _trans_descend_shaft_power_kw(
+    p, g, rho['reserve_trans_descend'], p['reserve_trans_descend_avg_h_m_p_s'],
+    p['reserve_trans_descend_v_m_p_s'], p['reserve_trans_descend_s'],
+    2.0*p['reserve_decel_descend_avg_h_m_p_s']-p['reserve_cruise_h_m_p_s'],
+    p['reserve_decel_descend_v_m_p_s'],
+    0.5*(p['reserve_decel_descend_v_m_p_s']+\
+         p['reserve_trans_descend_v_m_p_s'])*p['reserve_trans_descend_s']
+   ),
+   'reserve_hover_descend': _hover_descend_shaft_power_kw(
+    p, g, rho['reserve_hover_descend'], p['reserve_hover_descend_avg_v_m_p_s'],
+    p['reserve_hover_descend_s']
+   )
+  }
+
+# vectorized mission power and energy for a batch of aircraft designs
+# params: {field name: scalar or array}; arrays must broadcast to one shape
+# returns {name: array} with the same names as the Aircraft properties:
+#  <segment>_avg_shaft_power_kw, <segment>_avg_electric_power_kw,
+#  <segment>_energy_kw_hr for all 18 segments, total_mission_energy_kw_hr,
+#  total_reserve_mission_energy_kw_hr, and battery_mass_kg
+# where Aircraft returns None (non-positive total energy), the result is NaN
+def calc_batch_mission_energy(params: dict):
+  p = broadcast_params(params)
+  g = _calc_geometry(p)
+  shaft_power_kw = _calc_segment_shaft_power_kw(p, g)
+  result = {}
+  total_kw_hr = 0.0
+  total_reserve_kw_hr = 0.0
+  for segment, duration_name in SEGMENTS:
+    electric_power_kw = shaft_power_kw[segment]/p['epu_effic']
+    energy_kw_hr = (electric_power_kw*p[duration_name])/S_P_HR
+    result[segment+'_avg_shaft_power_kw'] = shaft_power_kw[segment]
+    result[segment+'_avg_electric_power_kw'] = electric_power_kw
+    result[segment+'_energy_kw_hr'] = energy_kw_hr
+    total_kw_hr = total_kw_hr+energy_kw_hr
+    if segment.startswith('reserve_'):
+      total_reserve_kw_hr = total_reserve_kw_hr+energy_kw_hr
+  result['total_mission_energy_kw_hr'] = \
+   np.where(total_kw_hr > 0.0, total_kw_hr, np.nan)
+  result['total_reserve_mission_energy_kw_hr'] = \
+   np.where(total_reserve_kw_hr > 0.0, total_reserve_kw_hr, np.nan)
+  result['battery_mass_kg'] = \
+   (result['total_mission_energy_kw_hr']*1000.0)/\
+   (p['batt_spec_energy_w_h_p_kg']*(1.0-p['batt_inaccessible_energy_frac'])*\
+    p['batt_int_factor'])
+  return result
+
+# NDARC AFDD00 rotor + hub mass [kg] for rotor_count rotors of blade_count
+# blades; tilt rotors apply the 1.1794 tilt factor
+def _calc_rotor_mass_kg(p, g, rotor_count, blade_count, tilt_factor):
+  rotor_radius_ft = (p['rotor_diameter_m']/2.0)*M_2_FT
+  term_common = \
+   (np.pi/2.0/blade_count)*p['rotor_diameter_m']*g['rotor_solidity']*M_2_FT
+  rotor_mass_lb = (
+    (
+      0.0024419*tilt_factor
+      *rotor_count
+      *(blade_count**0.53479)
+      *(rotor_radius_ft**1.74231)
+      *(term_common**0.77291)
+      *(g['tip_speed_ft_s']**0.87562)
+      *(1.1**2.51048)
+    )
+    + (
+      0.00037547*(tilt_factor**1.02958)
+      *rotor_count
+      *(blade_count**0.71443)
+      *(rotor_radius_ft**1.99321)
+      *(term_common**0.79577)
+      *(g['tip_speed_ft_s']**0.96323)
+      *(1.1**0.46203)
+      *(1.1**2.58473)
+    )
+  )
+  return rotor_mass_lb/KG_2_LB
+
+# component masses [kg]; mirrors the Aircraft _calc_*_mass_kg methods
+def _calc_masses(p, g):
+  m = {}
+  mtow_kg = p['max_takeoff_mass_kg']
+  mtow_lb = mtow_kg*KG_2_LB
+  rotor_count = p['rotor_count']
+  rho_sl = p['air_density_sea_lvl_kg_p_m3']
+  rho_alt = p['air_density_max_alt_kg_p_m3']
+  # structures
+  m['wing_mass_kg'] = (
+    5.66411
+    *(mtow_lb/1000.0)**0.847
+    *(3.8*1.5)**0.39579
+    *(g['wing_area_m2']*(M_2_FT**2))**0.21754
+    *(g['wing_aspect_ratio'])**0.50016
+    *((1.0+p['wing_taper_ratio'])/p['wing_t_p_c'])**0.09359
+    *0.9
+  )/KG_2_LB
+  dive_speed_kts = 1.4*p['cruise_h_m_p_s']*M_P_S_2_KTS
+  horiz_tail_area_ft2 = g['horiz_tail_area_m2']*(M_2_FT**2)
+  m['horiz_tail_mass_kg'] = (
+    horiz_tail_area_ft2
+    *(0.00395*(horiz_tail_area_ft2**0.2)*dive_speed_kts-0.4885)
+    *0.9
+  )/KG_2_LB
+  vert_tail_area_ft2 = g['vert_tail_area_m2']*(M_2_FT**2)
+  m['vert_tail_mass_kg'] = (
+    vert_tail_area_ft2
+    *(0.00395*(vert_tail_area_ft2**0.2)*dive_speed_kts-0.4885)
+    *0.9
+  )/KG_2_LB
+  dyn_pressure_lb_ft2 = \
+   0.5*rho_sl*(p['cruise_h_m_p_s']**2.0)*N_P_M2_2_LB_P_FT2
+  m['fuselage_mass_kg'] = (
+    0.052
+    *((g['fuselage_wetted_area_m2']*(M_2_FT**2))**1.086)
+    *((3.8*1.5*mtow_lb)**0.177)
+    *((p['fuselage_l_m']*0.5*M_2_FT)**-0.051)
+    *(g['fuselage_fineness_ratio']**-0.072)
+    *(dyn_pressure_lb_ft2**0.241)
+    *0.9
+  )/KG_2_LB
+  # electric propulsion units
+  over_torque_factor = rotor_count/(rotor_count-2)+0.3
+  rpm_hover_rpm = \
+   (p['sound_speed_m_p_s']*p['tip_mach']/(p['rotor_diameter_m']/2.0))*\
+   60.0/(2.0*np.pi)
+  omega_hover_rad_s = 2.0*np.pi*rpm_hover_rpm/60.0
+  hover_shaft_power_kw = \
+   ((p['g_m_p_s2']*mtow_kg)**1.5/(2.0*rho_sl*g['disk_area_m2'])**0.5)/\
+   p['hover_power_effic']/W_P_KW
+  torque_max_nm = \
+   over_torque_factor*(hover_shaft_power_kw*1000.0/rotor_count)/\
+   omega_hover_rad_s
+  rpm_max_rpm = \
+   rpm_hover_rpm*np.sqrt(rho_sl/rho_alt)*np.sqrt(over_torque_factor)
+  power_max_kw = (torque_max_nm*2.0*np.pi*rpm_max_rpm/60.0)/1000.0
+  m['single_epu_mass_kg'] = single_epu_mass_kg = \
+   1.15*((power_max_kw/12.67)+(torque_max_nm/52.2)+2.55)
+  m['boom_mass_kg'] = (
+    0.0412*((single_epu_mass_kg*KG_2_LB)**1.1433)*(rotor_count**1.3762)/KG_2_LB
+    + 6*0.2315*((1.2*p['rotor_diameter_m']+g['wing_mac_m'])**1.3476)
+  )*2
+  m['landing_gear_mass_kg'] = 0.0325*mtow_kg*1.14*1.08
+  # rotors
+  omega_hover_sl_rad_s = rpm_hover_rpm*np.pi/30.0
+  ct_hover = \
+   (mtow_kg*p['g_m_p_s2']/rotor_count)/\
+   (rho_sl*np.pi*(p['rotor_diameter_m']/2.0)**4*(omega_hover_sl_rad_s**2.0))
+  g['rotor_solidity'] = ct_hover*6.0/p['rotor_avg_cl']
+  g['tip_speed_ft_s'] = \
+   p['sound_speed_m_p_s']*p['tip_mach']*np.sqrt(rho_sl/rho_alt)*\
+   np.sqrt(over_torque_factor)*M_2_FT
+  m['lift_rotor_hub_mass_kg'] = \
+   _calc_rotor_mass_kg(p, g, p['lift_rotor_count'], 2.0, 1.0)
+  m['tilt_rotor_mass_kg'] = \
+   _calc_rotor_mass_kg(p, g, p['tilt_rotor_count'], 3.0, 1.1794)
+  m['epu_mass_kg'] = single_epu_mass_kg*rotor_count
+  structural_mass_kg = \
+   m['wing_mass_kg']+m['horiz_tail_mass_kg']+m['vert_tail_mass_kg']+\
+   m['fuselage_mass_kg']+m['boom_mass_kg']+m['landing_gear_mass_kg']+\
+   m['lift_rotor_hub_mass_kg']+m['tilt_rotor_mass_kg']
+  subsys_mass_kg = \
+   m['epu_mass_kg']+p['actuator_mass_kg']+p['furnishings_mass_kg']+\
+   p['environmental_control_system_mass_kg']+p['avionics_mass_kg']+\
+   p['hivolt_power_dist_mass_kg']+p['lovolt_power_coms_mass_kg']
+  m['empty_mass_kg'] = \
+   (structural_mass_kg+subsys_mass_kg)*(1.0+p['mass_margin_factor'])
+  return m
+
+# vectorized component and empty masses for a batch of aircraft designs
+# returns {name: array} with the same names as the Aircraft properties
+def calc_batch_masses(params: dict):
+  p = broadcast_params(params)
+  return _calc_masses(p, _calc_geometry(p))
+
+# default ABU specification of Aircraft.evaluate_abu_detach_candidates
+ABU_SPEC = {
+ 'n_abus': 1,
+ 'E_mission_kwh_per_abu': 4.0,
+ 'E_ops_kwh_per_abu': 1.0,
+ 'm_struct_kg_per_abu': 20.0,
+ 'm_integration_kg_per_abu': 2.0
+}
+
+# {segment name: energy [kWh]} for the designs in p at their MTOW
+def _calc_segment_energy_kw_hr(p):
+  shaft_power_kw = _calc_segment_shaft_power_kw(p, _calc_geometry(p))
+  return {
+   segment: (shaft_power_kw[segment]/p['epu_effic'])*p[duration_name]/S_P_HR
+   for segment, duration_name in SEGMENTS
+  }
+
+# vectorized ABU assisted-takeoff evaluation of one detach candidate for a
+# batch of aircraft designs; mirrors Aircraft.evaluate_abu_detach_candidates
+#  segments: pre-detach segment names in flight order, e.g.
+#            ['depart_taxi', 'hover_climb', 'trans_climb', 'depart_proc', 'accel_climb']
+#  abu_spec: as in the Aircraft method; None uses ABU_SPEC
+# returns {name: array} with the candidate result names of the Aircraft method:
+#  E_abu_used_kwh, batt_mass_offloaded_kg, baseline_batt_mass_kg,
+#  main_batt_new_kg, MTOW_attached_kg, MTOW_detached_kg,
+#  baseline_total_mission_kwh, aircraft_total_kwh_after, total_system_kwh_after
+def calc_batch_abu_detach(params: dict, segments, abu_spec=None):
+  if abu_spec is None:
+    abu_spec = ABU_SPEC
+  p = broadcast_params(params)
+  g = _calc_geometry(p)
+  _calc_masses(p, g)
+  n_abus = int(abu_spec.get('n_abus', 1))
+  E_abu_mission_total_kwh = float(abu_spec.get('E_mission_kwh_per_abu', 0.0))*n_abus
+  E_abu_ops_total_kwh = float(abu_spec.get('E_ops_kwh_per_abu', 0.0))*n_abus
+  usable_wh_p_kg = \
+   p['batt_spec_energy_w_h_p_kg']*(1.0-p['batt_inaccessible_energy_frac'])*\
+   p['batt_int_factor']
+  def energy_to_batt_kg(e_kwh):
+    return np.where((e_kwh > 0.0) & (usable_wh_p_kg > 0.0),
+                    e_kwh*1000.0/usable_wh_p_kg, 0.0)
+  # baseline (no ABU attached)
+  baseline_kw_hr = _calc_segment_energy_kw_hr(p)
+  baseline_total_kwh = sum(baseline_kw_hr.values())
+  baseline_batt_mass_kg = \
+   np.where(baseline_total_kwh > 0.0, baseline_total_kwh, np.nan)*1000.0/usable_wh_p_kg
+  # ABU masses
+  m_abu_per_abu_kg = \
+   float(abu_spec.get('m_struct_kg_per_abu', 0.0))+\
+   float(abu_spec.get('m_integration_kg_per_abu', 0.0))+\
+   _calc_rotor_mass_kg(p, g, n_abus, 2.0, 1.0)+\
+   energy_to_batt_kg(float(abu_spec.get('E_mission_kwh_per_abu', 0.0)))+\
+   energy_to_batt_kg(float(abu_spec.get('E_ops_kwh_per_abu', 0.0)))
+  m_abu_all_kg = m_abu_per_abu_kg*n_abus
+  # pre-detach segments with the ABUs attached; the ABUs supply energy first
+  mtow_attached_kg = p['max_takeoff_mass_kg']+m_abu_all_kg
+  attached_kw_hr = _calc_segment_energy_kw_hr(dict(p, max_takeoff_mass_kg=mtow_attached_kg))
+  E_abu_remaining_kwh = np.full(mtow_attached_kg.shape, E_abu_mission_total_kwh)
+  E_abu_used_kwh = 0.0
+  aircraft_pre_kwh = 0.0
+  for segment in segments:
+    supplied_kwh = np.minimum(attached_kw_hr[segment], E_abu_remaining_kwh)
+    E_abu_remaining_kwh = E_abu_remaining_kwh-supplied_kwh
+    E_abu_used_kwh = E_abu_used_kwh+supplied_kwh
+    aircraft_pre_kwh = aircraft_pre_kwh+attached_kw_hr[segment]-supplied_kwh
+  # post-detach segments at the detached MTOW
+  mass_offloaded_kg = energy_to_batt_kg(E_abu_used_kwh)
+  main_batt_new_kg = np.maximum(0.0, baseline_batt_mass_kg-mass_offloaded_kg)
+  mtow_detached_kg = mtow_attached_kg-baseline_batt_mass_kg-m_abu_all_kg+main_batt_new_kg
+  names = [segment for segment, duration_name in SEGMENTS]
+  remaining = names[names.index(segments[-1])+1:] if segments and segments[-1] in names else names
+  detached_kw_hr = _calc_segment_energy_kw_hr(dict(p, max_takeoff_mass_kg=mtow_detached_kg))
+  aircraft_post_kwh = sum((detached_kw_hr[segment] for segment in remaining), 0.0)
+  aircraft_total_kwh_after = aircraft_pre_kwh+aircraft_post_kwh
+  shape = mtow_attached_kg.shape
+  return {
+   'E_abu_used_kwh': np.broadcast_to(E_abu_used_kwh, shape),
+   'batt_mass_offloaded_kg': np.broadcast_to(mass_offloaded_kg, shape),
+   'baseline_batt_mass_kg': baseline_batt_mass_kg,
+   'main_batt_new_kg': main_batt_new_kg,
+   'MTOW_attached_kg': mtow_attached_kg,
+   'MTOW_detached_kg': mtow_detached_kg,
+   'baseline_total_mission_kwh': baseline_total_kwh,
+   'aircraft_total_kwh_after': np.broadcast_to(aircraft_total_kwh_after, shape),
+   'total_system_kwh_after': \
+    aircraft_total_kwh_after+E_abu_used_kwh+E_abu_ops_total_kwh
+  }
+
+# vectorized no-ABU common case economics for a batch of aircraft designs;
+# mirrors Aircraft._evaluate_common_case_baseline with a pack sized to the
+# mission (E_pack_kwh=None), a full-DoD recharge (soc_start=None) and the
+# flight time of the main mission segments (mission_time_s=None)
+# returns {name: array} with
+#  E_mission_kwh, t_flight_hr, t_charge_hr, t_cycle_hr, n_feasible_flights
+# NaN where the Aircraft method returns None
+def calc_batch_common_case_baseline(params: dict,
+                                    P_charger_ac_kw=115.0,
+                                    eta_charger_dc=0.95,
+                                    c_rate_max=1.0,
+                                    v_pack_nom_v=800.0,
+                                    i_term_c=0.05,
+                                    soc_target=1.0,
+                                    soc_cc_end=0.80,
+                                    t_ground_ops_hr=0.2833,
+                                    daily_operation_hr=24.0):
+  p = broadcast_params(params)
+  E_mission_kwh = sum(_calc_segment_energy_kw_hr(p).values())
+  t_flight_hr = sum(p[duration_name] for segment, duration_name in SEGMENTS
+                    if not segment.startswith('reserve_'))/S_P_HR
+  # the pack equals the mission energy, so the mission uses the full DoD
+  soc_target = min(1.0, max(0.0, soc_target))
+  chg = calc_cccv_charge_time_hr(
+    np.where(E_mission_kwh > 0.0, E_mission_kwh, np.nan), P_charger_ac_kw,
+    eta_charger_dc, c_rate_max, v_pack_nom_v, i_term_c,
+    soc_start=max(0.0, soc_target-1.0), soc_target=soc_target,
+    soc_cc_end=soc_cc_end
+  )
+  t_cycle_hr = t_flight_hr+chg['t_charge_hr']+t_ground_ops_hr
+  with np.errstate(invalid='ignore'):
+    n_feasible = np.where(t_cycle_hr > 0.0, np.floor(daily_operation_hr/t_cycle_hr), np.nan)
+  shape = t_cycle_hr.shape
+  return {
+   'E_mission_kwh': np.where(E_mission_kwh > 0.0, E_mission_kwh, np.nan),
+   't_flight_hr': np.broadcast_to(t_flight_hr, shape),
+   't_charge_hr': chg['t_charge_hr'],
+   't_cycle_hr': t_cycle_hr,
+   'n_feasible_flights': n_feasible
+  }
+
+# sized MTOW for the designs in p at MTOW guess mtow_kg:
+#  empty mass + payload + battery mass (NaN if the mission is infeasible)
+def _calc_sized_mtow_kg(p, mtow_kg):
+  p = dict(p)
+  p['max_takeoff_mass_kg'] = mtow_kg
+  g = _calc_geometry(p)
+  total_kw_hr = 0.0
+  shaft_power_kw = _calc_segment_shaft_power_kw(p, g)
+  for segment, duration_name in SEGMENTS:
+    total_kw_hr = total_kw_hr+\
+     (shaft_power_kw[segment]/p['epu_effic'])*p[duration_name]/S_P_HR
+  battery_mass_kg = \
+   (np.where(total_kw_hr > 0.0, total_kw_hr, np.nan)*1000.0)/\
+   (p['batt_spec_energy_w_h_p_kg']*(1.0-p['batt_inaccessible_energy_frac'])*\
+    p['batt_int_factor'])
+  return _calc_masses(p, g)['empty_mass_kg']+p['payload_kg']+battery_mass_kg
+
+# converge MTOW for a batch of aircraft designs at once
+# params: {field name: scalar or array}; the max_takeoff_mass_kg values are
+#  the initial guesses
+# method: 'fixed_point' repeats mtow <- sized_mtow(mtow) exactly like
+#  Aircraft._iterate_mtow; 'secant' applies secant steps to the residual
+#  sized_mtow(mtow)-mtow after one fixed-point step
+# only designs that have not yet converged or diverged are evaluated each pass
+# a design diverges if its sized MTOW is not finite or leaves (0, max_mtow_kg)
+# returns {
+#  'max_takeoff_mass_kg': converged (or last) MTOW per design,
+#  'iterations': sized-MTOW evaluations per design,
+#  'converged': True where |sized_mtow-mtow| < tol,
+#  'diverged': True where the iteration left the feasible region
+# }
+# designs with neither flag set reached max_iter without converging
+def solve_batch_mtow(params: dict, tol=1e-3, max_iter=150,
+                     method='secant', max_mtow_kg=1.0e6):
+  if method not in ('fixed_point', 'secant'):
+    raise ValueError(f"Unknown MTOW solver method {method!r}")
+  p = broadcast_params(params)
+  shape = p['max_takeoff_mass_kg'].shape
+  p = {name: values.ravel() for name, values in p.items()}
+  # segment air densities do not depend on MTOW: look them up once
+  if 'field_alt_m' in p:
+    for segment, density in _calc_segment_air_density(p).items():
+      p[segment+'_air_density_kg_p_m3'] = density
+  mtow_kg = p['max_takeoff_mass_kg'].copy()
+  iterations = np.zeros(mtow_kg.shape, dtype=np.int64)
+  converged = np.zeros(mtow_kg.shape, dtype=bool)
+  diverged = np.zeros(mtow_kg.shape, dtype=bool)
+  # previous iterate and residual per design, for secant steps
+  prev_mtow_kg = np.full(mtow_kg.shape, np.nan)
+  prev_residual_kg = np.full(mtow_kg.shape, np.nan)
+  active = np.arange(mtow_kg.size)
+  for i in range(max_iter):
+    if active.size == 0:
+      break
+    p_active = {name: values[active] for name, values in p.items()}
+    guess_kg = mtow_kg[active]
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+      sized_kg = _calc_sized_mtow_kg(p_active, guess_kg)
+    iterations[active] += 1
+    residual_kg = sized_kg-guess_kg
+    # diverged: infeasible mission or MTOW outside the physical range
+    bad = ~np.isfinite(sized_kg) | (sized_kg <= 0.0) | (sized_kg > max_mtow_kg)
+    diverged[active[bad]] = True
+    # converged: same acceptance rule as Aircraft._iterate_mtow
+    done = ~bad & (np.abs(residual_kg) < tol)
+    converged[active[done]] = True
+    mtow_kg[active[done]] = sized_kg[done]
+    # next iterate for the remaining designs
+    step_kg = sized_kg
+    if method == 'secant':
+      with np.errstate(invalid='ignore', divide='ignore'):
+        slope = \
+         (residual_kg-prev_residual_kg[active])/(guess_kg-prev_mtow_kg[active])
+        secant_kg = guess_kg-residual_kg/slope
+      use_secant = np.isfinite(secant_kg) & (secant_kg > 0.0)
+      step_kg = np.where(use_secant, secant_kg, sized_kg)
+      prev_mtow_kg[active] = guess_kg
+      prev_residual_kg[active] = residual_kg
+    keep = ~bad & ~done
+    mtow_kg[active[keep]] = step_kg[keep]
+    active = active[keep]
+  return {
+   'max_takeoff_mass_kg': mtow_kg.reshape(shape),
+   'iterations': iterations.reshape(shape),
+   'converged': converged.reshape(shape),
+   'diverged': diverged.reshape(shape)
+  }
@@ -0,0 +1,78 @@
+# cache.py
+#
+# A Python class containing a dependency-tracked cache for derived quantities
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import collections # defaultdict
+
+class DerivedCache:
+  # class constructor
+  def __init__(self, enabled=True):
+    # derived quantity name -> cached value
+    self._values = {}
+    # input or derived quantity name -> derived quantities that read it
+    self._dependents = collections.defaultdict(set)
+    # derived quantities currently being computed (innermost last)
+    self._stack = []
+    self.enabled = enabled
+
+  # return the cached value of derived quantity name, calling calc() on a miss
+  # the read is recorded as a dependency of the quantity being computed, if any
+  def get(self, name, calc):
+    if not self.enabled:
+      return calc()
+    stack = self._stack
+    if stack:
+      self._dependents[name].add(stack[-1])
+    values = self._values
+    if name in values:
+      return values[name]
+    stack.append(name)
+    try:
+      value = calc()
+    finally:
+      stack.pop()
+    values[name] = value
+    return value
+
+  # record that the quantity being computed reads input name
+  # input names are free-form, e.g. 'max_takeoff_mass_kg' or 'mission'
+  def note_input(self, name):
+    if self.enabled and self._stack:
+      self._dependents[name].add(self._stack[-1])
+
+  # evict every cached quantity that depends, directly or transitively, on the
+  # given input or derived quantity names
+  def invalidate(self, *names):
+    pending = list(names)
+    while pending:
+      name = pending.pop()
+      self._values.pop(name, None)
+      for dependent in self._dependents.pop(name, ()):
+        pending.append(dependent)
+
+  # evict all cached quantities and recorded dependencies
+  def clear(self):
+    self._values.clear()
+    self._dependents.clear()
+
+  # return an independent cache holding the same values and dependencies
+  def copy(self):
+    other = DerivedCache(self.enabled)
+    other._values = dict(self._values)
+    for name, dependents in self._dependents.items():
+      other._dependents[name] = set(dependents)
+    return other
+
+  # return True if derived quantity name currently holds a cached value
+  def is_cached(self, name):
+    return name in self._values
+
+  # number of cached quantities
+  def __len__(self):
+    return len(self._values)
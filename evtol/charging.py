@@ -0,0 +1,200 @@
+# charging.py
+#
+# Python functions and classes for vectorized CC-CV battery charge time
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import numpy as np # arrays, vectorized math
+
+# (charger and pack energy range parameters) -> CCCVChargeTable
+_TABLE_CACHE = {}
+
+# vectorized CC-CV charge time; mirrors Aircraft._estimate_cccv_charge_time_hr
+#  t_CC = dSOC_CC * Q / I_cc
+#  t_CV = dSOC_CV * Q / I_cc * ln(1/k) / (1 - k)
+# all inputs are scalars or arrays that broadcast to one shape; soc_start, dod
+# and Q_Ah may be None as in the scalar method
+# returns {name: array} with
+#  t_cc_hr, t_cv_hr, t_charge_hr, P_dc_kw, P_cc_cap_kw, P_cc_kw, I_cc_A,
+#  I_term_A, k_ratio, dSOC_cc, dSOC_cv
+# where the scalar method returns None (non-positive pack energy or charger
+# power, efficiency outside (0, 1]), the result is NaN
+def calc_cccv_charge_time_hr(E_pack_kwh,
+                             P_charger_ac_kw,
+                             eta_charger_dc=0.95,
+                             c_rate_max=1.0,
+                             v_pack_nom_v=800.0,
+                             i_term_c=0.05,
+                             soc_start=None,
+                             soc_target=1.0,
+                             soc_cc_end=0.80,
+                             dod=None,
+                             Q_Ah=None):
+  E_pack_kwh = np.asarray(E_pack_kwh, dtype=float)
+  P_charger_ac_kw = np.asarray(P_charger_ac_kw, dtype=float)
+  eta_charger_dc = np.asarray(eta_charger_dc, dtype=float)
+  valid = (E_pack_kwh > 0.0) & (P_charger_ac_kw > 0.0) & \
+          (eta_charger_dc > 0.0) & (eta_charger_dc <= 1.0)
+
+  soc_target = np.clip(soc_target, 0.0, 1.0)
+  soc_cc_end = np.clip(soc_cc_end, 0.0, 1.0)
+
+  # infer SOC_start from DoD if not provided; full recharge if neither
+  if soc_start is None:
+    if dod is None:
+      soc_start = 0.0
+    else:
+      soc_start = np.maximum(0.0, soc_target-np.asarray(dod, dtype=float))
+  soc_start = np.clip(soc_start, 0.0, 1.0)
+
+  # CC power limited by charger or C-rate (1C power = pack energy)
+  P_dc_kw = eta_charger_dc*P_charger_ac_kw
+  P_c_rate_cap_kw = c_rate_max*E_pack_kwh
+  P_cc_kw = np.minimum(P_dc_kw, P_c_rate_cap_kw)
+
+  v_pack_nom_v = np.maximum(v_pack_nom_v, 1e-6)
+  if Q_Ah is None:
+    Q_Ah = (E_pack_kwh*1000.0)/v_pack_nom_v
+  I_cc_A = (P_cc_kw*1000.0)/v_pack_nom_v
+  I_term_A = np.maximum(i_term_c, 1e-6)*Q_Ah
+  k = np.maximum(I_term_A/np.maximum(I_cc_A, 1e-9), 1e-6)
+
+  # split the SOC interval into CC and CV portions
+  soc_cc_stop = np.minimum(soc_target, soc_cc_end)
+  dSOC_cc = np.maximum(0.0, soc_cc_stop-soc_start)
+  dSOC_cv = np.maximum(0.0, soc_target-np.maximum(soc_start, soc_cc_end))
+
+  t_1soc_hr = Q_Ah/np.maximum(I_cc_A, 1e-9)
+  t_cc_hr = dSOC_cc*t_1soc_hr
+  with np.errstate(divide='ignore', invalid='ignore'):
+    cv_factor = np.where(k < 1.0, np.log(1.0/k)/(1.0-k), 0.0)
+  t_cv_hr = np.where((dSOC_cv > 0.0) & (k < 1.0), (dSOC_cv*t_1soc_hr)*cv_factor, 0.0)
+
+  # already at or above target: no charge
+  done = soc_start >= soc_target
+  t_cc_hr = np.where(done, 0.0, t_cc_hr)
+  t_cv_hr = np.where(done, 0.0, t_cv_hr)
+
+  out = {
+    't_cc_hr': t_cc_hr,
+    't_cv_hr': t_cv_hr,
+    't_charge_hr': t_cc_hr+t_cv_hr,
+    'P_dc_kw': P_dc_kw,
+    'P_cc_cap_kw': P_c_rate_cap_kw,
+    'P_cc_kw': P_cc_kw,
+    'I_cc_A': I_cc_A,
+    'I_term_A': I_term_A,
+    'k_ratio': k,
+    'dSOC_cc': dSOC_cc,
+    'dSOC_cv': dSOC_cv,
+  }
+  shape = np.broadcast_shapes(*(np.shape(v) for v in out.values()), np.shape(valid))
+  return {
+    name: np.where(valid, np.broadcast_to(value, shape), np.nan) for name, value in out.items()
+  }
+
+# CCCVChargeTable class
+# precomputed CC-CV charge times of one charger for packs in
+# [E_pack_kwh_min, E_pack_kwh_max]; with the capacity inferred from pack energy
+# the pack voltage cancels, so
+#  t_charge = dSOC_CC * a(E) + dSOC_CV * b(E)
+#  a(E) = E / P_cc(E), b(E) = a(E) * ln(1/k(E)) / (1 - k(E)), k(E) = i_term * a(E)
+# a and b are tabulated and interpolated linearly in pack energy; the SOC
+# dependence is exact, and the grid includes the charger/C-rate limit
+# breakpoint so that a(E) interpolates exactly
+class CCCVChargeTable:
+  # class constructor
+  def __init__(self,
+               P_charger_ac_kw,
+               E_pack_kwh_min,
+               E_pack_kwh_max,
+               eta_charger_dc=0.95,
+               c_rate_max=1.0,
+               i_term_c=0.05,
+               n_points=257):
+    if E_pack_kwh_min <= 0.0 or E_pack_kwh_max <= E_pack_kwh_min:
+      raise ValueError('pack energy range must satisfy 0 < min < max')
+    self.P_charger_ac_kw = P_charger_ac_kw
+    self.eta_charger_dc = eta_charger_dc
+    self.c_rate_max = c_rate_max
+    self.i_term_c = i_term_c
+    self.E_pack_kwh_min = E_pack_kwh_min
+    self.E_pack_kwh_max = E_pack_kwh_max
+
+    E_grid_kwh = np.linspace(E_pack_kwh_min, E_pack_kwh_max, n_points)
+    E_break_kwh = eta_charger_dc*P_charger_ac_kw/c_rate_max
+    if E_pack_kwh_min < E_break_kwh < E_pack_kwh_max:
+      E_grid_kwh = np.union1d(E_grid_kwh, [E_break_kwh])
+    self.E_grid_kwh = E_grid_kwh
+
+    # per-unit-SOC CC and CV times from a full-range charge with no CV taper
+    # (dSOC_CC = 1) and an all-CV charge (dSOC_CV = 1)
+    cc = calc_cccv_charge_time_hr(E_grid_kwh, P_charger_ac_kw, eta_charger_dc,
+                                  c_rate_max, i_term_c=i_term_c,
+                                  soc_start=0.0, soc_target=1.0, soc_cc_end=1.0)
+    cv = calc_cccv_charge_time_hr(E_grid_kwh, P_charger_ac_kw, eta_charger_dc,
+                                  c_rate_max, i_term_c=i_term_c,
+                                  soc_start=0.0, soc_target=1.0, soc_cc_end=0.0)
+    self.a_hr = cc['t_cc_hr']
+    self.b_hr = cv['t_cv_hr']
+
+  # charge times for packs of E_pack_kwh charged from soc_start to soc_target
+  # (scalars or arrays that broadcast); packs outside the tabulated range are
+  # computed exactly
+  # returns {'t_cc_hr', 't_cv_hr', 't_charge_hr'} arrays
+  def t_charge_hr(self, E_pack_kwh, soc_start, soc_target=1.0, soc_cc_end=0.80):
+    E_pack_kwh = np.asarray(E_pack_kwh, dtype=float)
+    soc_target = np.clip(soc_target, 0.0, 1.0)
+    soc_cc_end = np.clip(soc_cc_end, 0.0, 1.0)
+    soc_start = np.clip(soc_start, 0.0, 1.0)
+
+    a_hr = np.interp(E_pack_kwh, self.E_grid_kwh, self.a_hr)
+    b_hr = np.interp(E_pack_kwh, self.E_grid_kwh, self.b_hr)
+    outside = (E_pack_kwh < self.E_pack_kwh_min) | (E_pack_kwh > self.E_pack_kwh_max)
+    if np.any(outside):
+      E_exact_kwh = np.where(outside, E_pack_kwh, self.E_pack_kwh_min)
+      cc = calc_cccv_charge_time_hr(E_exact_kwh, self.P_charger_ac_kw,
+                                    self.eta_charger_dc, self.c_rate_max,
+                                    i_term_c=self.i_term_c, soc_start=0.0,
+                                    soc_target=1.0, soc_cc_end=1.0)
+      cv = calc_cccv_charge_time_hr(E_exact_kwh, self.P_charger_ac_kw,
+                                    self.eta_charger_dc, self.c_rate_max,
+                                    i_term_c=self.i_term_c, soc_start=0.0,
+                                    soc_target=1.0, soc_cc_end=0.0)
+      a_hr = np.where(outside, cc['t_cc_hr'], a_hr)
+      b_hr = np.where(outside, cv['t_cv_hr'], b_hr)
+
+    dSOC_cc = np.maximum(0.0, np.minimum(soc_target, soc_cc_end)-soc_start)
+    dSOC_cv = np.maximum(0.0, soc_target-np.maximum(soc_start, soc_cc_end))
+    t_cc_hr = dSOC_cc*a_hr
+    t_cv_hr = dSOC_cv*b_hr
+    return {
+      't_cc_hr': t_cc_hr,
+      't_cv_hr': t_cv_hr,
+      't_charge_hr': t_cc_hr+t_cv_hr,
+    }
+
+# return the CCCVChargeTable for these parameters, building it on first use;
+# repeated charger/pack combinations share one table
+def get_cccv_charge_table(P_charger_ac_kw,
+                          E_pack_kwh_min,
+                          E_pack_kwh_max,
+                          eta_charger_dc=0.95,
+                          c_rate_max=1.0,
+                          i_term_c=0.05,
+                          n_points=257):
+  key = (float(P_charger_ac_kw), float(E_pack_kwh_min), float(E_pack_kwh_max),
+         float(eta_charger_dc), float(c_rate_max), float(i_term_c), int(n_points))
+  table = _TABLE_CACHE.get(key)
+  if table is None:
+    table = CCCVChargeTable(*key)
+    _TABLE_CACHE[key] = table
+  return table
+
+# forget all cached charge tables
+def clear_cccv_charge_table_cache():
+  _TABLE_CACHE.clear()
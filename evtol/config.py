@@ -0,0 +1,34 @@
+# config.py
+#
+# Python functions for loading JSON specifications with an in-process cache
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import json # json parsing
+import os   # path, stat
+
+# absolute path -> (mtime_ns, size, parsed JSON specification)
+_CONFIG_CACHE = {}
+
+# return the parsed JSON specification at path_to_json
+# the file is parsed once per (path, mtime, size); later calls return the same
+# dict, which callers must treat as read-only
+def load_config(path_to_json: str):
+  path = os.path.abspath(path_to_json)
+  stat = os.stat(path)
+  entry = _CONFIG_CACHE.get(path)
+  if entry is not None and entry[0] == stat.st_mtime_ns and \
+   entry[1] == stat.st_size:
+    return entry[2]
+  with open(path, 'r') as ifile:
+    ijson = json.load(ifile)
+  _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, ijson)
+  return ijson
+
+# forget all cached JSON specifications
+def clear_config_cache():
+  _CONFIG_CACHE.clear()
@@ -8,41 +8,131 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import json # json parsing
+import sys  # not needed when using as a package
+
+# path to directory with other modules; use before deploying as package
+sys.path.append('../evtol')
+from atmosphere import ISA_DERIVED_FIELDS, ISA_TABLE, calc_environ_air_properties
+from config import load_config
+from record import Record
+
+# comment above and uncomment below when ready to deploy as package
+#from .atmosphere import ISA_DERIVED_FIELDS, ISA_TABLE, calc_environ_air_properties
+#from .config import load_config
+#from .record import Record
+
+# An environ is 'fixed' (the default), with the air properties given in JSON,
+# or 'isa' ("atmosphere": "isa"), with the air properties of an ISA day of
+# temperature offset temp_offset_k [K] (default 0): the sea-level properties
+# at the field elevation field_alt_m [m] (default 0), the max-altitude
+# properties at the cruise altitude max_alt_m [m] and the speed of sound at
+# the field, all above mean sea level. An ISA environ also gives the segment
+# models the air density at mid-segment altitude (see atmosphere.py). The
+# altitude fields of a fixed environ are None.
+
+class Environ(Record):
+  # input fields loaded from JSON
+  FIELDS = (
+   'g_m_p_s2',
+   'sound_speed_m_p_s',
+   'air_density_sea_lvl_kg_p_m3',
+   'air_density_max_alt_kg_p_m3',
+   'kinematic_viscosity_sea_lvl_m2_p_s',
+   'kinematic_viscosity_max_alt_m2_p_s',
+   'atmosphere',
+   'field_alt_m',
+   'max_alt_m',
+   'temp_offset_k',
+  )
+  __slots__ = tuple('_'+name for name in FIELDS)
+
+  # fields replace() accepts in each atmosphere: an ISA environ computes its
+  # air properties, and a fixed environ does not model altitude or
+  # temperature offset
+  INPUTS = {
+   'isa': ('g_m_p_s2', 'field_alt_m', 'max_alt_m', 'temp_offset_k'),
+   'fixed': ('g_m_p_s2',)+ISA_DERIVED_FIELDS
+  }
 
-class Environ:
   # class constructor
   def __init__(self, path_to_json: str):
-    # open and load JSON specification
-    ifile = open(path_to_json, 'r')
-    ijson = json.load(ifile)
+    # load JSON specification; parsed once per file version
+    self._load(load_config(path_to_json))
+
+  # alternate constructor from an already parsed JSON specification
+  @classmethod
+  def from_dict(cls, ijson: dict):
+    obj = cls.__new__(cls)
+    obj._load(ijson)
+    return obj
+
+  # populate properties from a parsed JSON specification
+  def _load(self, ijson: dict):
     # environ properties
     self._g_m_p_s2 = ijson['environ']['g_m_p_s2']
-    self._sound_speed_m_p_s = ijson['environ']['sound_speed_m_p_s']
-    self._air_density_sea_lvl_kg_p_m3 = \
-     ijson['environ']['air_density_sea_lvl_kg_p_m3']
-    self._air_density_max_alt_kg_p_m3 = \
-     ijson['environ']['air_density_max_alt_kg_p_m3']
-    self._kinematic_viscosity_sea_lvl_m2_p_s = \
-     ijson['environ']['kinematic_viscosity_sea_lvl_m2_p_s']
-    self._kinematic_viscosity_max_alt_m2_p_s = \
-     ijson['environ']['kinematic_viscosity_max_alt_m2_p_s']
-    # close JSON file
-    ifile.close()
-
-  # defines equivalence check for this class
-  def __eq__(self, other):
-    if isinstance(other, Environ):
-      return (\
-       self.g_m_p_s2 == other.g_m_p_s2 and
-       self.sound_speed_m_p_s == other.sound_speed_m_p_s and
-       self.air_density_sea_lvl_kg_p_m3 == other.air_density_sea_lvl_kg_p_m3 and
-       self.air_density_max_alt_kg_p_m3 == other.air_density_max_alt_kg_p_m3 and
-       self.kinematic_viscosity_sea_lvl_m2_p_s == \
-        other.kinematic_viscosity_sea_lvl_m2_p_s
-       )
+    self._atmosphere = ijson['environ'].get('atmosphere', 'fixed')
+    if self._atmosphere == 'isa':
+      self._field_alt_m = ijson['environ'].get('field_alt_m', 0.0)
+      self._max_alt_m = ijson['environ']['max_alt_m']
+      self._temp_offset_k = ijson['environ'].get('temp_offset_k', 0.0)
+      # calculate the air properties
+      self._calc_derived()
+    elif self._atmosphere == 'fixed':
+      self._field_alt_m = None
+      self._max_alt_m = None
+      self._temp_offset_k = None
+      self._sound_speed_m_p_s = ijson['environ']['sound_speed_m_p_s']
+      self._air_density_sea_lvl_kg_p_m3 = \
+       ijson['environ']['air_density_sea_lvl_kg_p_m3']
+      self._air_density_max_alt_kg_p_m3 = \
+       ijson['environ']['air_density_max_alt_kg_p_m3']
+      self._kinematic_viscosity_sea_lvl_m2_p_s = \
+       ijson['environ']['kinematic_viscosity_sea_lvl_m2_p_s']
+      self._kinematic_viscosity_max_alt_m2_p_s = \
+       ijson['environ']['kinematic_viscosity_max_alt_m2_p_s']
     else:
-      return NotImplemented
+      raise ValueError(f"Unknown atmosphere {self._atmosphere!r}")
+
+  # return a copy with the given input fields of this atmosphere changed, e.g.
+  # environ.replace(temp_offset_k=20.0); other fields raise ValueError, and a
+  # different atmosphere needs a new Environ
+  def replace(self, **changes):
+    for name in changes:
+      if name in self._field_index and name not in self.INPUTS[self._atmosphere]:
+        raise ValueError(
+            f"{name} is not an input of an {self._atmosphere!r} environ"
+        )
+    return super().replace(**changes)
+
+  # set the air properties of an ISA environ from its altitudes and
+  # temperature offset; replace() calls this, so e.g.
+  # environ.replace(temp_offset_k=20.0) gives a hot day
+  def _calc_derived(self):
+    super()._calc_derived()
+    if self._atmosphere == 'isa':
+      for name, value in calc_environ_air_properties(
+        self._field_alt_m, self._max_alt_m, self._temp_offset_k
+      ).items():
+        setattr(self, '_'+name, float(value))
+
+  # air density [kg/m^3] at altitude alt_m [m] above mean sea level
+  def calc_air_density_kg_p_m3(self, alt_m):
+    return self._calc_air_property('air_density_kg_p_m3', alt_m)
+
+  # kinematic viscosity [m^2/s] at altitude alt_m [m] above mean sea level
+  def calc_kinematic_viscosity_m2_p_s(self, alt_m):
+    return self._calc_air_property('kinematic_viscosity_m2_p_s', alt_m)
+
+  # speed of sound [m/s] at altitude alt_m [m] above mean sea level
+  def calc_sound_speed_m_p_s(self, alt_m):
+    return self._calc_air_property('sound_speed_m_p_s', alt_m)
+
+  # air property name at altitude alt_m (scalar or array) of an ISA environ
+  def _calc_air_property(self, name, alt_m):
+    if self._atmosphere != 'isa':
+      raise ValueError(f"{name} at altitude requires an 'isa' atmosphere")
+    value = ISA_TABLE.lookup(alt_m, self._temp_offset_k)[name]
+    return float(value) if value.ndim == 0 else value
 
   @property
   def g_m_p_s2(self):
@@ -67,3 +157,19 @@ class Environ:
   @property
   def kinematic_viscosity_max_alt_m2_p_s(self):
     return self._kinematic_viscosity_max_alt_m2_p_s
+
+  @property
+  def atmosphere(self):
+    return self._atmosphere
+
+  @property
+  def field_alt_m(self):
+    return self._field_alt_m
+
+  @property
+  def max_alt_m(self):
+    return self._max_alt_m
+
+  @property
+  def temp_offset_k(self):
+    return self._temp_offset_k
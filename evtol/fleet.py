@@ -0,0 +1,245 @@
+# fleet.py
+#
+# A Python function for discrete-event simulation of an eVTOL fleet operating
+# between vertiports with shared chargers and ABU pools
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys # not needed when using as a package
+
+# path to directory containing queuing functions; use before deploying as package
+sys.path.append('../evtol')
+from queuing import EventQueue, FifoResource
+from timeline import TimelineColumns
+
+# comment above and uncomment below when ready to deploy as package
+#from .queuing import EventQueue, FifoResource
+#from .timeline import TimelineColumns
+
+# simulate daily operations of n_aircraft aircraft flying round-robin between
+# n_vertiports vertiports: aircraft i starts at vertiport i % n_vertiports and
+# each flight goes from vertiport v to (v+1) % n_vertiports (one vertiport is
+# an out-and-back operation)
+#
+# each vertiport has n_chargers_per_vertiport chargers shared by aircraft main
+# packs and ABUs, and a pool of n_abu_pool_per_vertiport takeoff ABUs; with no
+# ABU pool, flights need no ABU
+#
+# flight cycle:
+#   aircraft ready → waits for an ABU at origin → departs
+#   ABU detaches after t_attach_hr → returns to origin after t_return_abu_hr
+#   → waits for a charger → charges for t_charge_hr_abu → available
+#   aircraft arrives after t_flight_hr → ground ops for t_ground_ops_hr
+#   → waits for a charger → main pack charges for t_charge_hr_main → ready
+#
+# a flight departs only if it can arrive by daily_operation_hr; chargers and
+# ABU pools serve requests first come, first served
+#
+# Inputs:
+#   n_aircraft                 : fleet size
+#   n_vertiports               : number of vertiports
+#   n_chargers_per_vertiport   : chargers at each vertiport (>= 1)
+#   n_abu_pool_per_vertiport   : takeoff ABUs at each vertiport (0 = no ABUs)
+#   t_flight_hr                : mission flight time [hr]
+#   t_ground_ops_hr            : ground turnaround ops [hr]
+#   t_charge_hr_main           : main pack charge time [hr]
+#   t_attach_hr                : ABU attached time after departure [hr]
+#   t_return_abu_hr            : ABU return time after detach [hr]
+#   t_charge_hr_abu            : ABU charge time [hr]
+#   daily_operation_hr         : operation window [hr]
+#   record_timeline            : True to return the event timeline
+#   timeline_format            : "dicts" (one dict per event) or "columns"
+#                                (TimelineColumns with vertiport_index,
+#                                aircraft_index and abu_index columns)
+#
+# Returns:
+#   fleet throughput, aircraft waiting time for chargers and ABUs (including
+#   waits still open at the end of the window), fleet-wide
+#   charger utilization and queue length (summed over vertiports), and
+#   per-vertiport charger and ABU pool statistics; None if inputs are invalid
+def simulate_fleet_ops(n_aircraft,
+                       n_vertiports,
+                       n_chargers_per_vertiport,
+                       n_abu_pool_per_vertiport,
+                       t_flight_hr,
+                       t_ground_ops_hr,
+                       t_charge_hr_main,
+                       t_attach_hr=0.0,
+                       t_return_abu_hr=0.0,
+                       t_charge_hr_abu=0.0,
+                       daily_operation_hr=24.0,
+                       record_timeline=False,
+                       timeline_format="dicts"):
+
+  if n_aircraft < 1 or n_vertiports < 1 or n_chargers_per_vertiport < 1:
+    return None
+  if timeline_format not in ("dicts", "columns"):
+    raise ValueError(f"unknown timeline_format: {timeline_format}")
+
+  use_abus = n_abu_pool_per_vertiport > 0
+
+  chargers = [FifoResource(n_chargers_per_vertiport) for _ in range(n_vertiports)]
+  abu_pools = [FifoResource(n_abu_pool_per_vertiport) for _ in range(n_vertiports)] if use_abus else None
+
+  location = [i % n_vertiports for i in range(n_aircraft)]
+  flights_per_aircraft = [0 for _ in range(n_aircraft)]
+  n_departures = [0 for _ in range(n_vertiports)]
+  n_arrivals = [0 for _ in range(n_vertiports)]
+
+  # aircraft waiting for a charger: aircraft index -> request time [hr]
+  t_charger_request_hr = {}
+  t_wait_charger_aircraft_hr = 0.0
+
+  if timeline_format == "columns":
+    timeline = TimelineColumns(('vertiport_index', 'aircraft_index', 'abu_index'))
+    def log(t_hr, event, vertiport_index, aircraft_index=None, abu_index=None):
+      timeline.append(t_hr, timeline.event_code(event), vertiport_index, aircraft_index, abu_index)
+  else:
+    timeline = []
+    def log(t_hr, event, vertiport_index, aircraft_index=None, abu_index=None):
+      entry = {"t_hr": t_hr, "event": event, "vertiport_index": vertiport_index}
+      if aircraft_index is not None:
+        entry["aircraft_index"] = aircraft_index
+      if abu_index is not None:
+        entry["abu_index"] = abu_index
+      timeline.append(entry)
+
+  events = EventQueue()
+
+  # depart aircraft i from its vertiport with ABU j (None if no ABU)
+  # returns False if the flight cannot arrive within the operating window
+  def depart(t_hr, i, j):
+    v = location[i]
+    if t_hr+t_flight_hr > daily_operation_hr:
+      return False
+    n_departures[v] += 1
+    if record_timeline:
+      log(t_hr, "aircraft_depart", v, aircraft_index=i, abu_index=j)
+    events.push(t_hr+t_flight_hr, "aircraft_arrive", i)
+    if j is not None:
+      events.push(t_hr+t_attach_hr+t_return_abu_hr, "abu_return", (v, j))
+    return True
+
+  # return ABU j to the pool at vertiport v and hand it to the longest-waiting
+  # aircraft that can still fly
+  def release_abu(t_hr, v, j):
+    i = abu_pools[v].release(t_hr, j)
+    while i is not None and not depart(t_hr, i, j):
+      i = abu_pools[v].release(t_hr, j)
+
+  # start charging token on charger c at vertiport v
+  def start_charge(t_hr, v, c, token):
+    kind, index = token
+    if kind == "aircraft":
+      t_request_hr = t_charger_request_hr.pop(index, None)
+      if t_request_hr is not None:
+        nonlocal t_wait_charger_aircraft_hr
+        t_wait_charger_aircraft_hr += (t_hr-t_request_hr)
+      t_charge_hr = t_charge_hr_main
+    else:
+      t_charge_hr = t_charge_hr_abu
+    if record_timeline:
+      log(t_hr, kind+"_charge_start", v, **{kind+"_index": index})
+    events.push(t_hr+t_charge_hr, "charge_done", (v, c, token))
+
+  for i in range(n_aircraft):
+    events.push(0.0, "aircraft_ready", i)
+
+  while events and events.peek_time_hr() <= daily_operation_hr:
+    t_hr, event, payload = events.pop()
+
+    if event == "aircraft_ready":
+      i = payload
+      if use_abus:
+        v = location[i]
+        j = abu_pools[v].request(t_hr, i)
+        if j is not None and not depart(t_hr, i, j):
+          release_abu(t_hr, v, j)
+      else:
+        depart(t_hr, i, None)
+
+    elif event == "aircraft_arrive":
+      i = payload
+      v = (location[i]+1) % n_vertiports
+      location[i] = v
+      flights_per_aircraft[i] += 1
+      n_arrivals[v] += 1
+      if record_timeline:
+        log(t_hr, "aircraft_arrive", v, aircraft_index=i)
+      events.push(t_hr+t_ground_ops_hr, "aircraft_ground_ops_done", i)
+
+    elif event == "aircraft_ground_ops_done":
+      i = payload
+      v = location[i]
+      token = ("aircraft", i)
+      c = chargers[v].request(t_hr, token)
+      if c is None:
+        t_charger_request_hr[i] = t_hr
+      else:
+        start_charge(t_hr, v, c, token)
+
+    elif event == "abu_return":
+      v, j = payload
+      if record_timeline:
+        log(t_hr, "abu_return_done", v, abu_index=j)
+      token = ("abu", j)
+      c = chargers[v].request(t_hr, token)
+      if c is not None:
+        start_charge(t_hr, v, c, token)
+
+    elif event == "charge_done":
+      v, c, token = payload
+      kind, index = token
+      if record_timeline:
+        log(t_hr, kind+"_charge_done", v, **{kind+"_index": index})
+      next_token = chargers[v].release(t_hr, c)
+      if next_token is not None:
+        start_charge(t_hr, v, c, next_token)
+      if kind == "aircraft":
+        events.push(t_hr, "aircraft_ready", index)
+      else:
+        release_abu(t_hr, v, index)
+
+  n_flights_completed = sum(flights_per_aircraft)
+
+  vertiports = []
+  for v in range(n_vertiports):
+    vertiports.append({
+      "vertiport_index": v,
+      "n_departures": n_departures[v],
+      "n_arrivals": n_arrivals[v],
+      "charger": chargers[v].summary(daily_operation_hr),
+      "abu": abu_pools[v].summary(daily_operation_hr) if use_abus else None,
+    })
+
+  return {
+    "n_aircraft": n_aircraft,
+    "n_vertiports": n_vertiports,
+    "n_chargers_per_vertiport": n_chargers_per_vertiport,
+    "n_abu_pool_per_vertiport": n_abu_pool_per_vertiport,
+    "daily_operation_hr": daily_operation_hr,
+
+    # throughput
+    "n_flights_completed": n_flights_completed,
+    "throughput_flights_per_hr": n_flights_completed / daily_operation_hr if daily_operation_hr > 0.0 else 0.0,
+    "flights_per_aircraft": flights_per_aircraft,
+    "flights_per_aircraft_avg": n_flights_completed / float(n_aircraft),
+    "t_flight_fleet_hr": n_flights_completed * t_flight_hr,
+
+    # queuing
+    "t_wait_charger_aircraft_hr": t_wait_charger_aircraft_hr + sum(
+      max(0.0, daily_operation_hr-t_request_hr) for t_request_hr in t_charger_request_hr.values()
+    ),
+    "t_wait_abu_hr": sum(vp["abu"]["wait_time_hr"] for vp in vertiports) if use_abus else 0.0,
+    "charger_utilization_avg": sum(vp["charger"]["utilization_avg"] for vp in vertiports) / n_vertiports,
+    "charger_queue_length_avg": sum(vp["charger"]["queue_length_avg"] for vp in vertiports),
+    "charger_queue_length_max": max(vp["charger"]["queue_length_max"] for vp in vertiports),
+    "abu_utilization_avg": sum(vp["abu"]["utilization_avg"] for vp in vertiports) / n_vertiports if use_abus else 0.0,
+
+    "vertiports": vertiports,
+    "timeline": timeline if record_timeline else None,
+  }
@@ -0,0 +1,166 @@
+# hot_high.py
+#
+# Python functions for hot/high-day evaluation of one design and mission over
+# a grid of altitudes and ISA temperature offsets in one vectorized call
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv         # writer
+import sys         # not needed when using as a package
+import numpy as np # arrays, vectorized math
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from atmosphere import calc_segment_mid_height_m
+from batch import SEGMENTS, broadcast_params, calc_batch_masses, calc_batch_mission_energy, \
+ solve_batch_mtow
+
+# comment above and uncomment below when ready to deploy as package
+#from .atmosphere import calc_segment_mid_height_m
+#from .batch import SEGMENTS, broadcast_params, calc_batch_masses, calc_batch_mission_energy, \
+# solve_batch_mtow
+
+# climb and descent segments of the main and reserve missions (with the
+# reserve_ prefix), whose durations set the cruise height
+VERTICAL_SEGMENTS = (
+ 'hover_climb', 'trans_climb', 'accel_climb', 'decel_descend', 'trans_descend',
+ 'hover_descend'
+)
+
+# vertical segments with forward flight and their horizontal speed fields; a
+# change of their durations moves horizontal distance into or out of cruise
+CLIMB_DESCEND_RANGE_SEGMENTS = (
+ ('trans_climb', 'trans_climb_avg_h_m_p_s'),
+ ('accel_climb', 'accel_climb_avg_h_m_p_s'),
+ ('decel_descend', 'decel_descend_avg_h_m_p_s'),
+ ('trans_descend', 'trans_descend_avg_h_m_p_s')
+)
+
+# outputs of calc_condition_grid besides the per-segment powers and energies
+GRID_OUTPUTS = (
+ 'alt_m', 'temp_offset_k', 'field_alt_m', 'max_alt_m', 'cruise_s', 'reserve_cruise_s',
+ 'max_takeoff_mass_kg', 'converged', 'empty_mass_kg', 'single_epu_mass_kg',
+ 'battery_mass_kg', 'total_mission_energy_kw_hr', 'total_reserve_mission_energy_kw_hr'
+)
+
+# The case studies fly each mission profile at several cruise heights, with
+# every climb and descent duration scaled by the height ratio and the cruise
+# times adjusted so that the main and reserve ranges are unchanged (e.g. the
+# 1500 ft configs from the 3000 ft ones). scale_cruise_height derives such a
+# profile from one config, so that a single config covers all heights, and
+# calc_condition_grid sizes the design at every (altitude, temperature
+# offset) pair of a grid with one batch MTOW solve.
+# The nominal cruise height of a profile is the one it was laid out for (e.g.
+# 3000 ft), which an ISA config states as max_alt_m-field_alt_m. The height
+# its climbs reach under the power models' kinematics, which accelerate from
+# zero vertical speed in the accel climb, is lower (calc_segment_mid_height_m);
+# it is the default for a fixed environ, which states no altitudes.
+
+# nominal cruise height [m] above the field of the mission profile in params:
+# max_alt_m-field_alt_m for an ISA environ, else the height of the top of the
+# climb from calc_segment_mid_height_m
+def calc_profile_height_m(params: dict):
+  if 'field_alt_m' in params:
+    return params['max_alt_m']-params['field_alt_m']
+  return calc_segment_mid_height_m(params)['cruise']
+
+# mission profile rescaled to the cruise height cruise_height_m [m] above the
+# field (scalar or array)
+#  params          : {field name: scalar or array} with the Mission fields
+#  profile_height_m: nominal cruise height of the profile in params; None uses
+#                    calc_profile_height_m
+# returns params with the main and reserve climb and descent durations scaled
+# by cruise_height_m over profile_height_m and cruise_s and reserve_cruise_s
+# changed to keep both ranges; a negative cruise time marks a height the
+# mission range cannot reach
+def scale_cruise_height(params: dict, cruise_height_m, profile_height_m=None):
+  if profile_height_m is None:
+    profile_height_m = calc_profile_height_m(params)
+  p = dict(params)
+  k = np.asarray(cruise_height_m, dtype=np.float64)/profile_height_m
+  for prefix in ('', 'reserve_'):
+    d_range_m = 0.0
+    for segment, speed_name in CLIMB_DESCEND_RANGE_SEGMENTS:
+      d_s = params[prefix+segment+'_s']*(k-1.0)
+      d_range_m = d_range_m+params[prefix+speed_name]*d_s
+    for segment in VERTICAL_SEGMENTS:
+      p[prefix+segment+'_s'] = params[prefix+segment+'_s']*k
+    p[prefix+'cruise_s'] = params[prefix+'cruise_s']-d_range_m/params[prefix+'cruise_h_m_p_s']
+  return p
+
+# size one design over a grid of altitudes and ISA temperature offsets
+#  params          : {field name: scalar} from params_from_config, with a
+#                    fixed or an ISA environ
+#  alts_m          : altitudes [m], the grid rows; with altitude='cruise' the
+#                    cruise height above the field (profile rescaled by
+#                    scale_cruise_height), with altitude='field' the field
+#                    elevation (profile kept, cruise at profile_height_m above
+#                    the field)
+#  temp_offsets_k  : ISA temperature offsets [K], the grid columns
+#  altitude        : 'cruise' or 'field'
+#  field_alt_m     : field elevation [m] with altitude='cruise'; None uses the
+#                    config's field_alt_m, or 0 for a fixed environ
+#  profile_height_m: nominal cruise height of the profile in params; None uses
+#                    calc_profile_height_m
+# returns {name: (len(alts_m), len(temp_offsets_k)) array} with GRID_OUTPUTS
+# and <segment>_avg_electric_power_kw and <segment>_energy_kw_hr of all 18
+# segments at the sized MTOW; points that do not converge, or whose cruise
+# time would be negative, are NaN (converged False)
+def calc_condition_grid(params: dict, alts_m, temp_offsets_k, altitude='cruise',
+                        field_alt_m=None, profile_height_m=None):
+  alt_m, temp_offset_k = np.meshgrid(np.asarray(alts_m, dtype=np.float64),
+                                     np.asarray(temp_offsets_k, dtype=np.float64),
+                                     indexing='ij')
+  if altitude == 'cruise':
+    if field_alt_m is None:
+      field_alt_m = params.get('field_alt_m', 0.0)
+    p = scale_cruise_height(params, alt_m, profile_height_m)
+    p['field_alt_m'] = field_alt_m+0.0*alt_m
+    p['max_alt_m'] = p['field_alt_m']+alt_m
+  elif altitude == 'field':
+    p = dict(params)
+    p['field_alt_m'] = alt_m
+    if profile_height_m is None:
+      profile_height_m = calc_profile_height_m(params)
+    p['max_alt_m'] = alt_m+profile_height_m
+  else:
+    raise ValueError(f"Unknown grid altitude {altitude!r}")
+  p['temp_offset_k'] = temp_offset_k
+  p = broadcast_params(p)
+  solution = solve_batch_mtow(p)
+  converged = solution['converged'] & (p['cruise_s'] >= 0.0) & (p['reserve_cruise_s'] >= 0.0)
+  p['max_takeoff_mass_kg'] = np.where(converged, solution['max_takeoff_mass_kg'], np.nan)
+  with np.errstate(invalid='ignore'):
+    energy = calc_batch_mission_energy(p)
+    masses = calc_batch_masses(p)
+  result = {'alt_m': alt_m, 'converged': converged}
+  for name in GRID_OUTPUTS:
+    if name not in result:
+      result[name] = p[name] if name in p else energy[name] if name in energy else masses[name]
+  for segment, duration_name in SEGMENTS:
+    for name in (segment+'_avg_electric_power_kw', segment+'_energy_kw_hr'):
+      result[name] = energy[name]
+  return result
+
+# compact 2-D table of the grid output name: one row per altitude, one column
+# per temperature offset
+def format_condition_table(result: dict, name, fmt='{:10.2f}'):
+  width = len(fmt.format(0.0))
+  lines = [f"{name} (rows: altitude [m], columns: temperature offset [K])",
+           ' '*10+''.join(f"{dt:>{width}.1f}" for dt in result['temp_offset_k'][0])]
+  for alt_m, row in zip(result['alt_m'][:, 0], result[name]):
+    lines.append(f"{alt_m:>10.1f}"+''.join(fmt.format(value) for value in row))
+  return '\n'.join(lines)
+
+# write the grid as CSV, one row per (altitude, temperature offset) point
+def write_condition_csv(result: dict, path):
+  names = list(result)
+  columns = [np.asarray(result[name]).ravel().tolist() for name in names]
+  with open(path, mode='w', newline='') as csv_file:
+    writer = csv.writer(csv_file)
+    writer.writerow(names)
+    writer.writerows(zip(*columns))
@@ -0,0 +1,120 @@
+# integrator.py
+#
+# Python functions for time-stepped integration of mission power, energy,
+# state of charge and mass
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import numpy as np # arrays, vectorized math
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from batch import S_P_HR, SEGMENTS, _calc_geometry, _calc_segment_shaft_power_kw, \
+ broadcast_params, calc_batch_mission_energy
+
+# comment above and uncomment below when ready to deploy as package
+#from .batch import S_P_HR, SEGMENTS, _calc_geometry, _calc_segment_shaft_power_kw, \
+# broadcast_params, calc_batch_mission_energy
+
+# default maximum time step [s]
+DT_S = 0.1
+
+# The mission is marched in time steps of at most dt_s. Every segment boundary
+# and mass change falls on a step boundary, so each segment's steps shrink to
+# fit it exactly. At each step the per-segment force models of batch.py are
+# evaluated at the aircraft's current mass. Geometry (wing area, rotor disk
+# area) stays sized for the design MTOW. All steps are evaluated in one
+# vectorized pass.
+# Mass is constant over each step, so energy, state of charge (SOC) and mass
+# are exact at every step for any dt_s. With no mass changes, the segment
+# energies equal the average-power energies of calc_batch_mission_energy and
+# Aircraft.
+
+# return [(time [s], mass change [kg])] sorted by time; a time given as a
+# segment name is the end of that segment
+def _mass_change_times(mass_changes, segment_end_s):
+  return sorted(
+    (segment_end_s[t] if isinstance(t, str) else float(t), float(delta_kg))
+    for t, delta_kg in mass_changes
+  )
+
+# integrate the mission of one design over time
+#  params      : {field name: scalar}, e.g. from params_from_config or
+#                params_from_aircraft; max_takeoff_mass_kg is the design MTOW
+#                and the mass at the start of the mission
+#  dt_s        : maximum time step [s]
+#  mass_changes: [(time, delta_kg)] mass changes during the mission, e.g. an
+#                ABU detaching; time is in seconds or the name of the segment at
+#                whose end the change happens, e.g. ('accel_climb', -120.0)
+#  soc_start   : pack SOC at the start of the mission
+#  E_pack_kwh  : pack nameplate energy; None uses the pack sized for the full
+#                mission at the design MTOW
+#  segments    : names of the segments to fly, in flight order; None flies all
+#                18 segments, including reserves
+# returns {name: array} with step boundaries (n+1 values)
+#  t_s, energy_kw_hr (cumulative electric energy), soc
+# per-step values (n values)
+#  dt_s, segment (index into 'segments'), mass_kg, shaft_power_kw,
+#  electric_power_kw
+# and 'segments' (tuple of names), 'segment_energy_kw_hr' ({name: kWh}) and
+# 'E_pack_kwh'
+# the SOC at the end of the mission, result['soc'][-1], is the soc_start of the
+# charging models (see charging.py)
+def integrate_mission(params: dict, dt_s=DT_S, mass_changes=(), soc_start=1.0,
+                      E_pack_kwh=None, segments=None):
+  p = broadcast_params(params)
+  g = _calc_geometry(p)
+  names = tuple(s for s, duration_name in SEGMENTS if segments is None or s in segments)
+  durations_s = np.array([float(p[d]) for s, d in SEGMENTS if s in names])
+  bounds_s = np.concatenate([[0.0], np.cumsum(durations_s)])
+  events = _mass_change_times(mass_changes, dict(zip(names, bounds_s[1:])))
+  event_s = np.array([t for t, delta_kg in events])
+  event_kg = np.cumsum([0.0]+[delta_kg for t, delta_kg in events])
+
+  # step boundaries: each interval between breakpoints split into equal steps
+  breaks_s = np.unique(np.concatenate([bounds_s, event_s[(event_s > 0.0) & (event_s < bounds_s[-1])]]))
+  lengths_s = np.diff(breaks_s)
+  n_steps = np.ceil(lengths_s/dt_s-1e-9).astype(int)
+  interval = np.repeat(np.arange(len(lengths_s)), n_steps)
+  k = np.arange(len(interval))-np.repeat(np.cumsum(n_steps)-n_steps, n_steps)
+  step_dt_s = lengths_s[interval]/n_steps[interval]
+  t_s = np.append(breaks_s[interval]+k*step_dt_s, breaks_s[-1])
+  t_mid_s = t_s[:-1]+0.5*step_dt_s
+
+  # segment and mass of every step
+  segment = np.searchsorted(bounds_s, t_mid_s, side='right')-1
+  mass_kg = float(p['max_takeoff_mass_kg'])+event_kg[np.searchsorted(event_s, t_mid_s)]
+
+  # per-segment force models at the mass of each step
+  p_steps = dict(p)
+  p_steps['max_takeoff_mass_kg'] = mass_kg
+  shaft_power_kw = _calc_segment_shaft_power_kw(p_steps, g)
+  shaft_power_kw = np.stack(
+    [np.broadcast_to(shaft_power_kw[s], mass_kg.shape) for s in names]
+  )[segment, np.arange(len(segment))]
+  electric_power_kw = shaft_power_kw/float(p['epu_effic'])
+
+  step_kw_hr = electric_power_kw*step_dt_s/S_P_HR
+  energy_kw_hr = np.concatenate([[0.0], np.cumsum(step_kw_hr)])
+  if E_pack_kwh is None:
+    E_pack_kwh = float(calc_batch_mission_energy(params)['total_mission_energy_kw_hr'])/\
+                 (1.0-float(p['batt_inaccessible_energy_frac']))
+  segment_kw_hr = np.bincount(segment, weights=step_kw_hr, minlength=len(names))
+  return {
+    't_s': t_s,
+    'dt_s': step_dt_s,
+    'segment': segment,
+    'mass_kg': mass_kg,
+    'shaft_power_kw': shaft_power_kw,
+    'electric_power_kw': electric_power_kw,
+    'energy_kw_hr': energy_kw_hr,
+    'soc': soc_start-energy_kw_hr/E_pack_kwh,
+    'segments': names,
+    'segment_energy_kw_hr': dict(zip(names, segment_kw_hr.tolist())),
+    'E_pack_kwh': E_pack_kwh
+  }
@@ -8,14 +8,81 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import json # json parsing
+import sys  # not needed when using as a package
+
+# path to directory with other modules; use before deploying as package
+sys.path.append('../evtol')
+from config import load_config
+from record import Record
+
+# comment above and uncomment below when ready to deploy as package
+#from .config import load_config
+#from .record import Record
+
+class Mission(Record):
+  # input fields loaded from JSON
+  FIELDS = (
+   'depart_taxi_avg_h_m_p_s',
+   'depart_taxi_s',
+   'hover_climb_avg_v_m_p_s',
+   'hover_climb_s',
+   'trans_climb_avg_h_m_p_s',
+   'trans_climb_v_m_p_s',
+   'trans_climb_s',
+   'depart_proc_h_m_p_s',
+   'depart_proc_s',
+   'accel_climb_avg_h_m_p_s',
+   'accel_climb_v_m_p_s',
+   'accel_climb_s',
+   'cruise_h_m_p_s',
+   'cruise_s',
+   'decel_descend_avg_h_m_p_s',
+   'decel_descend_v_m_p_s',
+   'decel_descend_s',
+   'arrive_proc_h_m_p_s',
+   'arrive_proc_s',
+   'trans_descend_avg_h_m_p_s',
+   'trans_descend_v_m_p_s',
+   'trans_descend_s',
+   'hover_descend_avg_v_m_p_s',
+   'hover_descend_s',
+   'arrive_taxi_avg_h_m_p_s',
+   'arrive_taxi_s',
+   'reserve_hover_climb_avg_v_m_p_s',
+   'reserve_hover_climb_s',
+   'reserve_trans_climb_avg_h_m_p_s',
+   'reserve_trans_climb_v_m_p_s',
+   'reserve_trans_climb_s',
+   'reserve_accel_climb_avg_h_m_p_s',
+   'reserve_accel_climb_v_m_p_s',
+   'reserve_accel_climb_s',
+   'reserve_cruise_h_m_p_s',
+   'reserve_cruise_s',
+   'reserve_decel_descend_avg_h_m_p_s',
+   'reserve_decel_descend_v_m_p_s',
+   'reserve_decel_descend_s',
+   'reserve_trans_descend_avg_h_m_p_s',
+   'reserve_trans_descend_v_m_p_s',
+   'reserve_trans_descend_s',
+   'reserve_hover_descend_avg_v_m_p_s',
+   'reserve_hover_descend_s',
+  )
+  __slots__ = tuple('_'+name for name in FIELDS)
 
-class Mission:
   # class constructor
   def __init__(self, path_to_json: str):
-    # open and load JSON specification
-    ifile = open(path_to_json, 'r')
-    ijson = json.load(ifile)
+    # load JSON specification; parsed once per file version
+    self._load(load_config(path_to_json))
+
+  # alternate constructor from an already parsed JSON specification
+  @classmethod
+  def from_dict(cls, ijson: dict):
+    obj = cls.__new__(cls)
+    obj._load(ijson)
+    return obj
+
+  # populate properties from a parsed JSON specification
+  def _load(self, ijson: dict):
     # mission properties
     self._depart_taxi_avg_h_m_p_s = ijson['mission']['depart_taxi_avg_h_m_p_s']
     self._depart_taxi_s = ijson['mission']['depart_taxi_s']
@@ -74,68 +141,6 @@ class Mission:
     self._reserve_hover_descend_avg_v_m_p_s = \
      ijson['mission']['reserve_hover_descend_avg_v_m_p_s']
     self._reserve_hover_descend_s = ijson['mission']['reserve_hover_descend_s']
-    # close JSON file
-    ifile.close()
-
-  # defines equivalence check for this class
-  def __eq__(self, other):
-    if isinstance(other, Mission):
-      return (\
-       self.depart_taxi_avg_h_m_p_s == other.depart_taxi_avg_h_m_p_s and
-       self.depart_taxi_s == other.depart_taxi_s and
-       self.hover_climb_avg_v_m_p_s == other.hover_climb_avg_v_m_p_s and
-       self.hover_climb_s == other.hover_climb_s and
-       self.trans_climb_avg_h_m_p_s == other.trans_climb_avg_h_m_p_s and
-       self.trans_climb_v_m_p_s == other.trans_climb_v_m_p_s and
-       self.trans_climb_s == other.trans_climb_s and
-       self.depart_proc_h_m_p_s == other.depart_proc_h_m_p_s and
-       self.depart_proc_s == other.depart_proc_s and
-       self.accel_climb_avg_h_m_p_s == other.accel_climb_avg_h_m_p_s and
-       self.accel_climb_v_m_p_s == other.accel_climb_v_m_p_s and
-       self.accel_climb_s == other.accel_climb_s and
-       self.cruise_h_m_p_s == other.cruise_h_m_p_s and
-       self.cruise_s == other.cruise_s and
-       self.decel_descend_avg_h_m_p_s == other.decel_descend_avg_h_m_p_s and
-       self.decel_descend_v_m_p_s == other.decel_descend_v_m_p_s and
-       self.decel_descend_s == other.decel_descend_s and
-       self.arrive_proc_h_m_p_s == other.arrive_proc_h_m_p_s and
-       self.arrive_proc_s == other.arrive_proc_s and
-       self.trans_descend_avg_h_m_p_s == other.trans_descend_avg_h_m_p_s and
-       self.trans_descend_v_m_p_s == other.trans_descend_v_m_p_s and
-       self.trans_descend_s == other.trans_descend_s and
-       self.hover_descend_avg_v_m_p_s == other.hover_descend_avg_v_m_p_s and
-       self.hover_descend_s == other.hover_descend_s and
-       self.arrive_taxi_avg_h_m_p_s == other.arrive_taxi_avg_h_m_p_s and
-       self.arrive_taxi_s == other.arrive_taxi_s and
-       self.reserve_hover_climb_avg_v_m_p_s == \
-        other.reserve_hover_climb_avg_v_m_p_s and
-       self.reserve_hover_climb_s == other.reserve_hover_climb_s and
-       self.reserve_trans_climb_avg_h_m_p_s == \
-        other.reserve_trans_climb_avg_h_m_p_s and
-       self.reserve_trans_climb_v_m_p_s == other.reserve_trans_climb_v_m_p_s and
-       self.reserve_trans_climb_s == other.reserve_trans_climb_s and
-       self.reserve_accel_climb_avg_h_m_p_s == \
-        other.reserve_accel_climb_avg_h_m_p_s and
-       self.reserve_accel_climb_v_m_p_s == other.reserve_accel_climb_v_m_p_s and
-       self.reserve_accel_climb_s == other.reserve_accel_climb_s and
-       self.reserve_cruise_h_m_p_s == other.reserve_cruise_h_m_p_s and
-       self.reserve_cruise_s == other.reserve_cruise_s and
-       self.reserve_decel_descend_avg_h_m_p_s == \
-        other.reserve_decel_descend_avg_h_m_p_s and
-       self.reserve_decel_descend_v_m_p_s == \
-        other.reserve_decel_descend_v_m_p_s and
-       self.reserve_decel_descend_s == other.reserve_decel_descend_s and
-       self.reserve_trans_descend_avg_h_m_p_s == \
-        other.reserve_trans_descend_avg_h_m_p_s and
-       self.reserve_trans_descend_v_m_p_s == \
-        other.reserve_trans_descend_v_m_p_s and
-       self.reserve_trans_descend_s == other.reserve_trans_descend_s and
-       self.reserve_hover_descend_avg_v_m_p_s == \
-        other.reserve_hover_descend_avg_v_m_p_s and
-       self.reserve_hover_descend_s == other.reserve_hover_descend_s
-       )
-    else:
-      return NotImplemented
 
   @property
   def depart_taxi_avg_h_m_p_s(self):
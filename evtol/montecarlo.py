@@ -0,0 +1,268 @@
+# montecarlo.py
+#
+# Python functions and classes for Monte Carlo uncertainty propagation through
+# the vectorized sizing model with streaming statistics
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import concurrent.futures # ProcessPoolExecutor
+import sys                # not needed when using as a package
+import numpy as np        # arrays, random generators
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from batch import calc_batch_abu_detach, calc_batch_mission_energy, solve_batch_mtow
+
+# comment above and uncomment below when ready to deploy as package
+#from .batch import calc_batch_abu_detach, calc_batch_mission_energy, solve_batch_mtow
+
+# samples evaluated per batch by default
+BATCH_SIZE = 10000
+
+# quantiles reported by default
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# items kept per level of a quantile sketch; quantiles are exact up to this
+# many samples and otherwise within a rank error of about
+# (samples/SKETCH_SIZE)*log2(samples/SKETCH_SIZE)
+SKETCH_SIZE = 8192
+
+# A distribution is a tuple (kind, ...) with numpy Generator parameters:
+#  ('normal', mean, std)
+#  ('lognormal', mean, sigma)     mean and sigma of the underlying normal
+#  ('uniform', low, high)
+#  ('triangular', low, mode, high)
+# distributions: {field name: distribution} of the uncertain parameters, e.g.
+#  {'batt_spec_energy_w_h_p_kg': ('normal', 250.0, 15.0),
+#   'mass_margin_factor': ('triangular', 0.05, 0.1, 0.2)}
+# Samples are drawn in batches; batch i uses the i-th random stream spawned
+# from the seed (numpy SeedSequence), so results depend only on the seed and
+# batch size, not on the number of worker processes
+
+# return n samples of distribution spec
+def _sample(rng, spec, n):
+  kind = spec[0]
+  if kind == 'normal':
+    return rng.normal(spec[1], spec[2], n)
+  if kind == 'lognormal':
+    return rng.lognormal(spec[1], spec[2], n)
+  if kind == 'uniform':
+    return rng.uniform(spec[1], spec[2], n)
+  if kind == 'triangular':
+    return rng.triangular(spec[1], spec[2], spec[3], n)
+  raise ValueError(f"Unknown distribution {kind!r}")
+
+# QuantileSketch class
+# a compactor sketch of a stream of values: level h holds items of weight 2**h;
+# a level exceeding its size is sorted and every other item is promoted to the
+# next level, alternating between the even and odd items
+class QuantileSketch:
+  # class constructor
+  def __init__(self, size=SKETCH_SIZE):
+    self.size = size
+    self.levels = [np.empty(0)]
+    self._offset = 0
+
+  # add an array of values
+  def add(self, values):
+    self.levels[0] = np.concatenate([self.levels[0], values])
+    h = 0
+    while h < len(self.levels):
+      if len(self.levels[h]) > self.size:
+        items = np.sort(self.levels[h])
+        # an odd item out stays at this level, from alternating ends
+        if len(items)%2 == 0:
+          kept = items[:0]
+        elif self._offset == 0:
+          kept, items = items[-1:], items[:-1]
+        else:
+          kept, items = items[:1], items[1:]
+        if h+1 == len(self.levels):
+          self.levels.append(np.empty(0))
+        self.levels[h+1] = np.concatenate([self.levels[h+1], items[self._offset::2]])
+        self.levels[h] = kept
+        self._offset ^= 1
+      h += 1
+
+  # number of values added
+  def __len__(self):
+    return int(sum(len(level)*2**h for h, level in enumerate(self.levels)))
+
+  # return the values at quantiles q (array-like in [0, 1]); the smallest
+  # value whose cumulative weight reaches q of the total, as
+  # numpy.quantile(method='inverted_cdf')
+  def quantile(self, q):
+    values = np.concatenate(self.levels)
+    if values.size == 0:
+      return np.full(np.shape(q), np.nan)
+    weights = np.concatenate([np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)])
+    order = np.argsort(values, kind='stable')
+    cumulative = np.cumsum(weights[order])
+    index = np.searchsorted(cumulative, np.asarray(q)*cumulative[-1], side='left')
+    return values[order][np.clip(index, 0, values.size-1)]
+
+# RunningStats class
+# count, mean, standard deviation, extremes and quantiles of a stream of
+# values; non-finite values (e.g. designs whose MTOW did not converge) are
+# counted as invalid and excluded
+class RunningStats:
+  # class constructor
+  def __init__(self, sketch_size=SKETCH_SIZE):
+    self.n = 0
+    self.n_invalid = 0
+    self.mean = 0.0
+    self._m2 = 0.0
+    self.min = np.inf
+    self.max = -np.inf
+    self.sketch = QuantileSketch(sketch_size)
+
+  # add an array of values; moments are merged per batch (Chan et al.)
+  def update(self, values):
+    values = np.asarray(values, dtype=np.float64).ravel()
+    finite = np.isfinite(values)
+    self.n_invalid += int(values.size-np.count_nonzero(finite))
+    values = values[finite]
+    if values.size == 0:
+      return
+    n_batch = values.size
+    mean_batch = values.mean()
+    n = self.n+n_batch
+    delta = mean_batch-self.mean
+    self._m2 += ((values-mean_batch)**2).sum()+delta**2*self.n*n_batch/n
+    self.mean += delta*n_batch/n
+    self.n = n
+    self.min = min(self.min, float(values.min()))
+    self.max = max(self.max, float(values.max()))
+    self.sketch.add(values)
+
+  # sample standard deviation
+  @property
+  def std(self):
+    return float(np.sqrt(self._m2/(self.n-1))) if self.n > 1 else np.nan
+
+  # return {'count', 'invalid', 'mean', 'std', 'sem', 'min', 'max',
+  # 'quantiles': {q: value}}; sem is the standard error of the mean
+  def summary(self, quantiles=QUANTILES):
+    return {
+      'count': self.n,
+      'invalid': self.n_invalid,
+      'mean': float(self.mean) if self.n else np.nan,
+      'std': self.std,
+      'sem': self.std/float(np.sqrt(self.n)) if self.n > 1 else np.nan,
+      'min': self.min if self.n else np.nan,
+      'max': self.max if self.n else np.nan,
+      'quantiles': dict(zip(quantiles, self.sketch.quantile(quantiles).tolist()))
+    }
+
+# default Monte Carlo outputs for a batch of designs
+#  mtow_converged_kg, total_mission_energy_kw_hr and battery_mass_kg at the
+#  converged MTOW (NaN where the MTOW did not converge), and with abu_segments
+#  (pre-detach segments of an ABU assisted takeoff, see
+#  batch.calc_batch_abu_detach) the ABU benefit metrics
+#  abu_mtow_detached_kg, abu_mtow_reduction_kg (converged minus detached MTOW)
+#  and abu_aircraft_energy_saved_kwh (aircraft battery energy no longer needed)
+def calc_batch_outputs(params: dict, abu_segments=None, abu_spec=None):
+  solution = solve_batch_mtow(params)
+  mtow_kg = np.where(solution['converged'], solution['max_takeoff_mass_kg'], np.nan)
+  sized = dict(params, max_takeoff_mass_kg=mtow_kg)
+  with np.errstate(invalid='ignore'):
+    energy = calc_batch_mission_energy(sized)
+    outputs = {
+      'mtow_converged_kg': mtow_kg,
+      'total_mission_energy_kw_hr': energy['total_mission_energy_kw_hr'],
+      'battery_mass_kg': energy['battery_mass_kg']
+    }
+    if abu_segments:
+      abu = calc_batch_abu_detach(sized, abu_segments, abu_spec)
+      outputs['abu_mtow_detached_kg'] = abu['MTOW_detached_kg']
+      outputs['abu_mtow_reduction_kg'] = mtow_kg-abu['MTOW_detached_kg']
+      outputs['abu_aircraft_energy_saved_kwh'] = \
+       abu['baseline_total_mission_kwh']-abu['aircraft_total_kwh_after']
+  return outputs
+
+# draw one batch of samples from its random stream and evaluate the outputs
+def _evaluate_batch(params, distributions, evaluator, evaluator_kwargs, seed_seq, n):
+  rng = np.random.default_rng(seed_seq)
+  p = dict(params)
+  for name, spec in distributions.items():
+    p[name] = _sample(rng, spec, n)
+  return evaluator(p, **evaluator_kwargs)
+
+# Monte Carlo state of a worker process, set once per worker by _init_worker
+_WORKER = {}
+
+def _init_worker(params, distributions, evaluator, evaluator_kwargs):
+  _WORKER['args'] = (params, distributions, evaluator, evaluator_kwargs)
+
+def _evaluate_worker_batch(seed_seq, n):
+  return _evaluate_batch(*_WORKER['args'], seed_seq, n)
+
+# yield batch outputs in batch order, keeping at most two batches per worker in
+# flight so that memory does not grow with n_samples
+def _iter_batch_outputs(args, seeds, sizes, n_workers):
+  if n_workers == 1 or len(sizes) <= 1:
+    for seed_seq, n in zip(seeds, sizes):
+      yield _evaluate_batch(*args, seed_seq, n)
+    return
+  with concurrent.futures.ProcessPoolExecutor(
+    max_workers=n_workers, initializer=_init_worker, initargs=args
+  ) as executor:
+    window = 2*(n_workers or executor._max_workers)
+    pending = []
+    for seed_seq, n in zip(seeds, sizes):
+      pending.append(executor.submit(_evaluate_worker_batch, seed_seq, n))
+      if len(pending) >= window:
+        yield pending.pop(0).result()
+    for future in pending:
+      yield future.result()
+
+# run a Monte Carlo propagation and yield (samples evaluated, {output name:
+# RunningStats}) after every batch; the statistics are updated in place
+#  params          : {field name: scalar} nominal design, e.g. from
+#                    params_from_config; max_takeoff_mass_kg is the MTOW guess
+#  distributions   : {field name: distribution} of the uncertain inputs (above)
+#  n_samples       : total samples
+#  seed            : seed of the random streams
+#  batch_size      : samples per vectorized batch
+#  evaluator       : function(params, **evaluator_kwargs) -> {name: array} of
+#                    a batch, module-level when n_workers != 1;
+#                    calc_batch_outputs by default
+#  evaluator_kwargs: e.g. {'abu_segments': [...], 'abu_spec': {...}}
+#  n_workers       : worker processes; 1 evaluates in this process, None uses
+#                    one per CPU
+# scripts that use n_workers != 1 must guard their top-level code with
+# if __name__ == '__main__'
+def iter_monte_carlo(params: dict, distributions: dict, n_samples, seed=0,
+                     batch_size=BATCH_SIZE, evaluator=calc_batch_outputs,
+                     evaluator_kwargs=None, n_workers=1, sketch_size=SKETCH_SIZE):
+  # reject unknown distributions before any batch is evaluated
+  for spec in distributions.values():
+    _sample(np.random.default_rng(seed), spec, 0)
+  sizes = [min(batch_size, n_samples-start) for start in range(0, n_samples, batch_size)]
+  seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+  args = (params, distributions, evaluator, dict(evaluator_kwargs or {}))
+  stats = {}
+  n_done = 0
+  for n, outputs in zip(sizes, _iter_batch_outputs(args, seeds, sizes, n_workers)):
+    for name, values in outputs.items():
+      if name not in stats:
+        stats[name] = RunningStats(sketch_size)
+      stats[name].update(values)
+    n_done += n
+    yield n_done, stats
+
+# run a Monte Carlo propagation to completion and return {output name:
+# summary} (see RunningStats.summary); arguments as iter_monte_carlo
+def run_monte_carlo(params: dict, distributions: dict, n_samples, seed=0,
+                    batch_size=BATCH_SIZE, evaluator=calc_batch_outputs,
+                    evaluator_kwargs=None, n_workers=1, quantiles=QUANTILES):
+  stats = {}
+  for n_done, stats in iter_monte_carlo(params, distributions, n_samples, seed,
+                                        batch_size, evaluator, evaluator_kwargs,
+                                        n_workers):
+    pass
+  return {name: running.summary(quantiles) for name, running in stats.items()}
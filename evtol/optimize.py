@@ -0,0 +1,228 @@
+# optimize.py
+#
+# Python functions for complex-step design derivatives and gradient-based
+# design optimization
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import numpy as np # arrays, linear algebra
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from atmosphere import ISA_DERIVED_FIELDS
+from batch import _calc_sized_mtow_kg, broadcast_params, \
+ calc_batch_masses, calc_batch_mission_energy, solve_batch_mtow
+
+# comment above and uncomment below when ready to deploy as package
+#from .atmosphere import ISA_DERIVED_FIELDS
+#from .batch import _calc_sized_mtow_kg, broadcast_params, \
+# calc_batch_masses, calc_batch_mission_energy, solve_batch_mtow
+
+# complex step size; complex-step derivatives have no subtractive cancellation,
+# so they are exact to machine precision for any step this small
+H_COMPLEX_STEP = 1e-30
+
+# step halvings before a line search gives up
+MAX_LINE_SEARCH_TRIALS = 20
+
+# default design variables
+DESIGN_VARIABLES = (
+ 'wingspan_m', 'rotor_diameter_m', 'cruise_h_m_p_s', 'batt_spec_energy_w_h_p_kg'
+)
+
+# quantities with derivatives
+OUTPUTS = ('max_takeoff_mass_kg', 'total_mission_energy_kw_hr', 'empty_mass_kg')
+
+# Derivatives use the complex step f'(x) = Im(f(x+ih))/h on the vectorized
+# batch engine: row k of one batch perturbs design variable k, so a single
+# batch evaluation returns the values and the full gradient
+# Sized designs are differentiated through the converged MTOW m = s(m, x), where
+# s is the sized MTOW, without differentiating the iterations:
+#  dm/dx = (ds/dx)/(1-ds/dm)
+# and every other output f gets the total derivative df/dx+(df/dm)(dm/dx)
+
+# return params as (n_rows,) arrays where row k has names[k] perturbed by
+# i*H_COMPLEX_STEP; with no names, one real row
+def _complex_step_params(params: dict, names):
+  n_rows = max(len(names), 1)
+  p = {name: np.full(n_rows, value, dtype=np.complex128 if names else np.float64)
+       for name, value in params.items()}
+  for k, name in enumerate(names):
+    p[name][k] += 1j*H_COMPLEX_STEP
+  return p
+
+# return {output: (value, gradient)} for a design, where gradient[k] is the
+# derivative with respect to names[k]
+#  params: flat parameter dict, e.g. from batch.params_from_config
+#  names : design variables to differentiate with respect to
+#  sized : if True, MTOW is converged first (starting from the params value)
+#          and every output is a total derivative through the converged MTOW;
+#          if False, outputs are evaluated at the given MTOW and
+#          max_takeoff_mass_kg is not returned
+#  tol   : MTOW convergence tolerance [kg]
+# raises ValueError if the MTOW of a sized design does not converge
+def calc_design_gradients(params: dict, names=DESIGN_VARIABLES, sized=True,
+                          tol=1e-9, max_iter=150):
+  names = tuple(names)
+  p = dict(params)
+  if sized:
+    if 'max_takeoff_mass_kg' in names:
+      raise ValueError('MTOW is an output of sized designs')
+    solution = solve_batch_mtow(p, tol=tol, max_iter=max_iter)
+    if not solution['converged']:
+      raise ValueError(
+        'MTOW did not converge; likely mission infeasible for this design'
+      )
+    p['max_takeoff_mass_kg'] = float(solution['max_takeoff_mass_kg'])
+    # last row: partial derivatives with respect to MTOW
+    names = names+('max_takeoff_mass_kg',)
+  p = broadcast_params(_complex_step_params(p, names))
+  values = {'total_mission_energy_kw_hr':
+             calc_batch_mission_energy(p)['total_mission_energy_kw_hr'],
+            'empty_mass_kg': calc_batch_masses(p)['empty_mass_kg']}
+  if sized:
+    values['max_takeoff_mass_kg'] = _calc_sized_mtow_kg(p, p['max_takeoff_mass_kg'])
+  partials = {output: value.imag/H_COMPLEX_STEP for output, value in values.items()}
+  if sized:
+    ds = partials['max_takeoff_mass_kg']
+    dm_dx = ds[:-1]/(1.0-ds[-1])
+    gradients = {output: d[:-1]+d[-1]*dm_dx for output, d in partials.items()}
+    gradients['max_takeoff_mass_kg'] = dm_dx
+    values['max_takeoff_mass_kg'] = p['max_takeoff_mass_kg']
+  elif names:
+    gradients = partials
+  else:
+    gradients = {output: np.zeros(0) for output in values}
+  return {output: (float(values[output][0].real), gradients[output])
+          for output in OUTPUTS if output in values}
+
+# return {name: dMTOW/dname} of a sized design for every input name, by
+# implicit differentiation of the fixed point m = s(m, x) at the design's MTOW
+#  params: flat parameter dict whose max_takeoff_mass_kg is already converged,
+#          e.g. params_from_aircraft after Aircraft._iterate_mtow
+#  names : inputs to differentiate with respect to; default every input but MTOW
+#          (and but the air properties of an ISA environ, which follow from
+#          field_alt_m, max_alt_m and temp_offset_k)
+# costs one batch evaluation with one row per input, instead of one MTOW
+# convergence per input for finite differences
+def calc_mtow_sensitivities(params: dict, names=None):
+  if names is None:
+    derived = ISA_DERIVED_FIELDS if 'field_alt_m' in params else ()
+    names = [name for name in params if name != 'max_takeoff_mass_kg' and name not in derived]
+  names = tuple(names)
+  p = broadcast_params(_complex_step_params(params, names+('max_takeoff_mass_kg',)))
+  ds = _calc_sized_mtow_kg(p, p['max_takeoff_mass_kg']).imag/H_COMPLEX_STEP
+  return dict(zip(names, (ds[:-1]/(1.0-ds[-1])).tolist()))
+
+# minimize (or maximize) a design output within box bounds by projected
+# quasi-Newton (BFGS) steps with a backtracking line search
+#  params   : flat parameter dict of the starting design
+#  bounds   : {design variable: (low, high)}
+#  objective: one of OUTPUTS
+#  sized    : evaluate each design at its converged MTOW (see
+#             calc_design_gradients); required for the MTOW objective
+#  gtol     : stop when the projected gradient, in variables scaled to [0, 1]
+#             by their bounds, is below gtol times the initial objective
+# returns {
+#  'x': {design variable: optimal value},
+#  'params': params with the optimal design variables (and sized MTOW),
+#  'objective': objective value at x,
+#  'gradient': {design variable: objective derivative at x},
+#  'iterations': quasi-Newton iterations,
+#  'evaluations': batch model evaluations (one per gradient or line-search trial),
+#  'converged': True if the projected gradient test was met
+# }
+def minimize_design(params: dict, bounds: dict, objective='max_takeoff_mass_kg',
+                    maximize=False, sized=True, gtol=1e-6, max_iter=100,
+                    tol=1e-9):
+  if objective not in OUTPUTS:
+    raise ValueError(f"Unknown objective {objective!r}")
+  if objective == 'max_takeoff_mass_kg' and not sized:
+    raise ValueError('The MTOW objective requires sized designs')
+  names = tuple(bounds)
+  low = np.array([bounds[name][0] for name in names], dtype=np.float64)
+  span = np.array([bounds[name][1] for name in names], dtype=np.float64)-low
+  sign = -1.0 if maximize else 1.0
+  evaluations = [0]
+
+  # objective, gradient in scaled variables u = (x-low)/span, and converged
+  # MTOW (None if not sized)
+  def evaluate(u, with_gradient):
+    p = dict(params)
+    p.update(zip(names, (low+u*span).tolist()))
+    evaluations[0] += 1
+    try:
+      outputs = calc_design_gradients(
+        p, names if with_gradient else (), sized=sized, tol=tol
+      )
+    except ValueError:
+      return np.inf, None, None
+    value, gradient = outputs[objective]
+    mtow_kg = outputs['max_takeoff_mass_kg'][0] if sized else None
+    if not with_gradient:
+      return sign*value, None, mtow_kg
+    return sign*value, sign*gradient*span, mtow_kg
+
+  u = np.clip((np.array([params[name] for name in names])-low)/span, 0.0, 1.0)
+  f, g, mtow_kg = evaluate(u, True)
+  if g is None:
+    raise ValueError('The starting design is infeasible')
+  scale = max(abs(f), 1.0)
+  H = np.eye(len(names))
+  first_step = True
+  converged = False
+  iterations = 0
+  while iterations < max_iter:
+    # projected gradient: zero where a bound blocks descent
+    projected = u-np.clip(u-g, 0.0, 1.0)
+    if np.max(np.abs(projected)) < gtol*scale:
+      converged = True
+      break
+    free = ~(((u <= 0.0) & (g > 0.0)) | ((u >= 1.0) & (g < 0.0)))
+    d = np.where(free, -H@np.where(free, g, 0.0), 0.0)
+    if d@g >= 0.0:
+      H = np.eye(len(names))
+      d = np.where(free, -g, 0.0)
+    if first_step:
+      d = d*(0.1/np.max(np.abs(d)))
+    # backtracking line search on the projected path; stops without
+    # convergence where the model is not smooth (e.g. a segment power branch
+    # switch) and no descent step remains
+    for trial in range(MAX_LINE_SEARCH_TRIALS):
+      u_new = np.clip(u+0.5**trial*d, 0.0, 1.0)
+      f_new, g_new, mtow_new_kg = evaluate(u_new, False)
+      if f_new <= f+1e-4*(g@(u_new-u)):
+        break
+    else:
+      break
+    f_new, g_new, mtow_new_kg = evaluate(u_new, True)
+    s = u_new-u
+    y = g_new-g
+    if s@y > 1e-12*np.sqrt((s@s)*(y@y)):
+      if first_step:
+        H = np.eye(len(names))*(s@y)/(y@y)
+      rho = 1.0/(s@y)
+      V = np.eye(len(names))-rho*np.outer(s, y)
+      H = V@H@V.T+rho*np.outer(s, s)
+      first_step = False
+    u, f, g, mtow_kg = u_new, f_new, g_new, mtow_new_kg
+    iterations += 1
+  x = dict(zip(names, (low+u*span).tolist()))
+  p = dict(params)
+  p.update(x)
+  if sized:
+    p['max_takeoff_mass_kg'] = mtow_kg
+  return {
+   'x': x,
+   'params': p,
+   'objective': sign*f,
+   'gradient': dict(zip(names, (sign*g/span).tolist())),
+   'iterations': iterations,
+   'evaluations': evaluations[0],
+   'converged': converged
+  }
@@ -0,0 +1,172 @@
+# payload_range.py
+#
+# Python functions for payload-range and range-endurance envelopes by
+# bisection on the cruise time of the vectorized sizing model
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv         # writer
+import sys         # not needed when using as a package
+import numpy as np # arrays, vectorized math
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from batch import SEGMENTS, _calc_sized_mtow_kg, broadcast_params, calc_batch_masses, \
+ calc_batch_mission_energy, solve_batch_mtow
+
+# comment above and uncomment below when ready to deploy as package
+#from .batch import SEGMENTS, _calc_sized_mtow_kg, broadcast_params, calc_batch_masses, \
+# calc_batch_mission_energy, solve_batch_mtow
+
+# constants
+M_2_MI = 0.000621371
+
+# default upper bracket [s] and tolerance [s] of the cruise time bisection
+CRUISE_S_MAX = 36000.0
+TOL_S = 0.1
+
+# main mission segments with forward flight and their horizontal speed fields;
+# the mission range is the sum of speed*duration over these segments
+RANGE_SEGMENTS = (
+ ('depart_taxi', 'depart_taxi_avg_h_m_p_s'),
+ ('trans_climb', 'trans_climb_avg_h_m_p_s'),
+ ('depart_proc', 'depart_proc_h_m_p_s'),
+ ('accel_climb', 'accel_climb_avg_h_m_p_s'),
+ ('cruise', 'cruise_h_m_p_s'),
+ ('decel_descend', 'decel_descend_avg_h_m_p_s'),
+ ('arrive_proc', 'arrive_proc_h_m_p_s'),
+ ('trans_descend', 'trans_descend_avg_h_m_p_s'),
+ ('arrive_taxi', 'arrive_taxi_avg_h_m_p_s')
+)
+
+# The maximum cruise time of a design is the longest cruise_s for which the
+# sized MTOW converges within the MTOW limit and the battery mass at the
+# converged MTOW stays within the pack limit. Both grow with cruise_s, so the
+# feasible cruise times form an interval [0, max] that is bisected for all
+# designs at once, one vectorized MTOW solve per bisection step. The reserve
+# mission is flown and sized as specified; only its range is not counted.
+# Where the MTOW iteration converges, the sized MTOW grows with the MTOW guess
+# at a slope below one, so the converged MTOW is within the limit exactly when
+# one sizing at the limit does not exceed it. Each step screens the designs
+# with that single sizing and converges only the remaining ones, starting at
+# the limit.
+
+# vectorized horizontal distance [m] of the main mission segments
+def calc_batch_mission_range_m(params: dict):
+  p = broadcast_params(params)
+  return sum(p[speed_name]*p[segment+'_s'] for segment, speed_name in RANGE_SEGMENTS)
+
+# converged MTOW, battery mass and feasibility of designs p (arrays of one
+# shape) at cruise_s; the MTOW is NaN where it exceeds the limit
+def _evaluate_cruise(p, cruise_s, mtow_limit_kg, batt_mass_limit_kg):
+  sized = dict(p, cruise_s=cruise_s, max_takeoff_mass_kg=mtow_limit_kg)
+  with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+    within = _calc_sized_mtow_kg(sized, mtow_limit_kg) <= mtow_limit_kg
+  solution = solve_batch_mtow({name: values[within] for name, values in sized.items()})
+  mtow_kg = np.full(within.shape, np.nan)
+  mtow_kg[within] = np.where(solution['converged'], solution['max_takeoff_mass_kg'], np.nan)
+  sized['max_takeoff_mass_kg'] = mtow_kg
+  with np.errstate(invalid='ignore'):
+    energy = calc_batch_mission_energy(sized)
+    mtow_ok = mtow_kg <= mtow_limit_kg
+    feasible = mtow_ok & (energy['battery_mass_kg'] <= batt_mass_limit_kg)
+  return sized, energy, mtow_ok, feasible
+
+# solve the maximum cruise time of a batch of designs
+#  params            : {field name: scalar or array}, e.g. from
+#                      params_from_config with payload_kg or cruise_h_m_p_s
+#                      replaced by arrays
+#  mtow_limit_kg     : MTOW limit, scalar or array; None uses the designs'
+#                      max_takeoff_mass_kg; the MTOW iteration must converge
+#                      when started at the limit, as it does from a design MTOW
+#  batt_mass_limit_kg: battery (pack) mass limit, scalar or array; None for
+#                      no limit
+#  cruise_s_max      : upper end of the bisection bracket [s]
+#  tol_s             : bisection tolerance [s]; the result is feasible and
+#                      within tol_s of the maximum
+# returns {name: array} with
+#  cruise_s, cruise_range_m, mission_range_m, mission_range_mi, endurance_s
+#  (main mission flight time), max_takeoff_mass_kg (converged),
+#  battery_mass_kg, empty_mass_kg, total_mission_energy_kw_hr, and limit:
+#  'mtow' or 'battery' for the binding constraint, 'cruise_s_max' if
+#  cruise_s_max is feasible, or 'infeasible' if cruise_s=0 is not (all other
+#  outputs NaN)
+def solve_max_cruise_s(params: dict, mtow_limit_kg=None, batt_mass_limit_kg=None,
+                       cruise_s_max=CRUISE_S_MAX, tol_s=TOL_S):
+  p = broadcast_params(params)
+  shape = p['max_takeoff_mass_kg'].shape
+  if mtow_limit_kg is None:
+    mtow_limit_kg = p['max_takeoff_mass_kg']
+  mtow_limit_kg = np.broadcast_to(np.asarray(mtow_limit_kg, dtype=np.float64), shape)
+  batt_mass_limit_kg = np.broadcast_to(
+    np.asarray(np.inf if batt_mass_limit_kg is None else batt_mass_limit_kg, dtype=np.float64),
+    shape
+  )
+  low_s = np.zeros(shape)
+  high_s = np.full(shape, float(cruise_s_max))
+  feasible_low = _evaluate_cruise(p, low_s, mtow_limit_kg, batt_mass_limit_kg)[3]
+  feasible_high = _evaluate_cruise(p, high_s, mtow_limit_kg, batt_mass_limit_kg)[3]
+  for i in range(int(np.ceil(np.log2(max(cruise_s_max/tol_s, 1.0))))):
+    mid_s = 0.5*(low_s+high_s)
+    feasible = _evaluate_cruise(p, mid_s, mtow_limit_kg, batt_mass_limit_kg)[3]
+    low_s = np.where(feasible, mid_s, low_s)
+    high_s = np.where(feasible, high_s, mid_s)
+  cruise_s = np.where(feasible_high, high_s, np.where(feasible_low, low_s, np.nan))
+  # binding constraint just past the maximum
+  mtow_ok = _evaluate_cruise(p, high_s, mtow_limit_kg, batt_mass_limit_kg)[2]
+  limit = np.where(~feasible_low, 'infeasible',
+                   np.where(feasible_high, 'cruise_s_max', np.where(mtow_ok, 'battery', 'mtow')))
+  sized, energy, mtow_ok, feasible = \
+   _evaluate_cruise(p, cruise_s, mtow_limit_kg, batt_mass_limit_kg)
+  with np.errstate(invalid='ignore'):
+    empty_mass_kg = calc_batch_masses(sized)['empty_mass_kg']
+  mission_range_m = np.where(feasible_low, calc_batch_mission_range_m(sized), np.nan)
+  return {
+    'cruise_s': cruise_s,
+    'cruise_range_m': cruise_s*sized['cruise_h_m_p_s'],
+    'mission_range_m': mission_range_m,
+    'mission_range_mi': mission_range_m*M_2_MI,
+    'endurance_s': np.where(feasible_low, sum(
+      sized[duration_name] for segment, duration_name in SEGMENTS
+      if not segment.startswith('reserve_')
+    ), np.nan),
+    'max_takeoff_mass_kg': sized['max_takeoff_mass_kg'],
+    'battery_mass_kg': energy['battery_mass_kg'],
+    'empty_mass_kg': empty_mass_kg,
+    'total_mission_energy_kw_hr': energy['total_mission_energy_kw_hr'],
+    'limit': limit
+  }
+
+# payload-range envelope: the maximum cruise time at each payload [kg];
+# arguments and results as solve_max_cruise_s, with payload_kg added
+def calc_payload_range(params: dict, payloads_kg, mtow_limit_kg=None,
+                       batt_mass_limit_kg=None, cruise_s_max=CRUISE_S_MAX, tol_s=TOL_S):
+  payloads_kg = np.asarray(payloads_kg, dtype=np.float64)
+  result = {'payload_kg': payloads_kg}
+  result.update(solve_max_cruise_s(dict(params, payload_kg=payloads_kg), mtow_limit_kg,
+                                   batt_mass_limit_kg, cruise_s_max, tol_s))
+  return result
+
+# range-endurance envelope: the maximum cruise time at each cruise speed
+# [m/s]; arguments and results as solve_max_cruise_s, with cruise_h_m_p_s
+# added
+def calc_range_endurance(params: dict, cruise_speeds_m_p_s, mtow_limit_kg=None,
+                         batt_mass_limit_kg=None, cruise_s_max=CRUISE_S_MAX, tol_s=TOL_S):
+  cruise_speeds_m_p_s = np.asarray(cruise_speeds_m_p_s, dtype=np.float64)
+  result = {'cruise_h_m_p_s': cruise_speeds_m_p_s}
+  result.update(solve_max_cruise_s(dict(params, cruise_h_m_p_s=cruise_speeds_m_p_s),
+                                   mtow_limit_kg, batt_mass_limit_kg, cruise_s_max, tol_s))
+  return result
+
+# write an envelope (any result of this module) as CSV, one row per point
+def write_envelope_csv(result: dict, path):
+  names = list(result)
+  columns = [np.asarray(result[name]).ravel().tolist() for name in names]
+  with open(path, mode='w', newline='') as csv_file:
+    writer = csv.writer(csv_file)
+    writer.writerow(names)
+    writer.writerows(zip(*columns))
@@ -8,14 +8,48 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import json # json parsing
+import sys  # not needed when using as a package
+
+# path to directory with other modules; use before deploying as package
+sys.path.append('../evtol')
+from config import load_config
+from record import Record
+
+# comment above and uncomment below when ready to deploy as package
+#from .config import load_config
+#from .record import Record
+
+class Power(Record):
+  # input fields loaded from JSON
+  FIELDS = (
+   'batt_spec_energy_w_h_p_kg',
+   'batt_inaccessible_energy_frac',
+   'batt_eol_capacity',
+   'batt_int_factor',
+   'epu_effic',
+   'hover_power_effic',
+  )
+  # fields derived from the input fields
+  DERIVED = (
+   'batt_bol_usable_spec_energy_w_h_p_kg',
+   'batt_eol_usable_spec_energy_w_h_p_kg',
+  )
+  __slots__ = tuple('_'+name for name in FIELDS+DERIVED)
 
-class Power:
   # class constructor
   def __init__(self, path_to_json: str):
-    # open and load JSON specification
-    ifile = open(path_to_json, 'r')
-    ijson = json.load(ifile)
+    # load JSON specification; parsed once per file version
+    self._load(load_config(path_to_json))
+
+  # alternate constructor from an already parsed JSON specification
+  @classmethod
+  def from_dict(cls, ijson: dict):
+    obj = cls.__new__(cls)
+    obj._load(ijson)
+    return obj
+
+  # populate properties from a parsed JSON specification
+  def _load(self, ijson: dict):
     # power properties
     self._batt_spec_energy_w_h_p_kg = \
      ijson['power']['batt_spec_energy_w_h_p_kg']
@@ -26,12 +60,7 @@ class Power:
     self._epu_effic = ijson['power']['epu_effic']
     self._hover_power_effic = ijson['power']['hover_power_effic']
     # calculate initial values of derived fields
-    self._batt_bol_usable_spec_energy_w_h_p_kg = \
-     self._calc_batt_bol_usable_spec_energy_w_h_p_kg()
-    self._batt_eol_usable_spec_energy_w_h_p_kg = \
-     self._calc_batt_eol_usable_spec_energy_w_h_p_kg()
-    # close JSON file
-    ifile.close()
+    self._calc_derived()
 
   # scale the battery specific energy to the accessible energy fraction and
   # account for the integration factor; BOL = beginning of life
@@ -45,21 +74,6 @@ class Power:
     return \
      self.batt_eol_capacity*self._calc_batt_bol_usable_spec_energy_w_h_p_kg()
 
-  # defines equivalence check for this class
-  def __eq__(self, other):
-    if isinstance(other, Power):
-      return (\
-       self.batt_spec_energy_w_h_p_kg == other.batt_spec_energy_w_h_p_kg and
-       self.batt_inaccessible_energy_frac == \
-        other.batt_inaccessible_energy_frac and
-       self.batt_eol_capacity == other.batt_eol_capacity and
-       self.batt_int_factor == other.batt_int_factor and
-       self.epu_effic == other.epu_effic and
-       self.hover_power_effic == other.hover_power_effic
-       )
-    else:
-      return NotImplemented
-
   @property
   def batt_spec_energy_w_h_p_kg(self):
     return self._batt_spec_energy_w_h_p_kg
@@ -0,0 +1,83 @@
+# power_profile.py
+#
+# Python functions for streaming piecewise-constant mission power profiles
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import numpy as np # arange, empty
+
+# samples generated per chunk by default
+CHUNK_SIZE = 65536
+
+# A power profile is described by an iterable of segments
+#  (name, duration_s, P_kw)
+# where the power is constant over the segment; segments may be a generator,
+# so long profiles are never held in memory
+
+# return repeated flights of segments separated by ground segments
+#  segments   : one flight as a list of (name, duration_s, P_kw)
+#  n_flights  : number of consecutive flights
+#  t_ground_s : ground time between flights (none after the last flight)
+#  P_ground_kw: power drawn on the ground
+def repeat_segments(segments, n_flights, t_ground_s=0.0, P_ground_kw=0.0):
+  for i in range(n_flights):
+    if i > 0 and t_ground_s > 0.0:
+      yield ("ground", t_ground_s, P_ground_kw)
+    yield from segments
+
+# return the piecewise-constant breakpoints of a profile as a list of
+# (name, t_start_s, t_end_s, P_kw)
+def power_breakpoints(segments):
+  breakpoints = []
+  t0_s = 0.0
+  for name, duration_s, P_kw in segments:
+    breakpoints.append((name, t0_s, t0_s+duration_s, P_kw))
+    t0_s += duration_s
+  return breakpoints
+
+# yield (t_s, P_kw) NumPy array chunks sampled every dt_s within each segment
+# samples of a segment are at t_start + k*dt_s for k in [0, int(duration/dt_s))
+def iter_power_chunks(segments, dt_s=1.0, chunk_size=CHUNK_SIZE):
+  if dt_s <= 0.0:
+    raise ValueError('dt_s must be positive')
+  t_buf = np.empty(chunk_size)
+  P_buf = np.empty(chunk_size)
+  n = 0
+  t0_s = 0.0
+  for name, duration_s, P_kw in segments:
+    n_samples = int(duration_s/dt_s)
+    k = 0
+    while k < n_samples:
+      m = min(n_samples-k, chunk_size-n)
+      t_buf[n:n+m] = t0_s+np.arange(k, k+m)*dt_s
+      P_buf[n:n+m] = P_kw
+      n += m
+      k += m
+      if n == chunk_size:
+        yield t_buf.copy(), P_buf.copy()
+        n = 0
+    t0_s += duration_s
+  if n > 0:
+    yield t_buf[:n].copy(), P_buf[:n].copy()
+
+# yield (t_s, P_kw) samples one at a time
+def iter_power_samples(segments, dt_s=1.0):
+  for t_s, P_kw in iter_power_chunks(segments, dt_s):
+    yield from zip(t_s.tolist(), P_kw.tolist())
+
+# write a profile to a CSV file one chunk at a time; same format as the
+# per-row csv.writer output of the power profile log scripts
+# returns the number of samples written
+def write_power_profile_csv(path, segments, dt_s=1.0, chunk_size=CHUNK_SIZE):
+  row_format = '{:.3f},{:.6f}\r\n'.format
+  n_rows = 0
+  with open(path, mode='w', newline='') as csv_file:
+    csv_file.write('time,avg_electric_power_kw\r\n')
+    for t_s, P_kw in iter_power_chunks(segments, dt_s, chunk_size):
+      csv_file.write(''.join(map(row_format, t_s.tolist(), P_kw.tolist())))
+      n_rows += len(t_s)
+  return n_rows
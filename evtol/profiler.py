@@ -0,0 +1,168 @@
+# profiler.py
+#
+# A Python class containing call counts and wall times of Aircraft derived
+# quantity calculations, with call tree and flame graph output
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import contextlib # contextmanager
+import time       # perf_counter
+import types      # MethodType
+
+# prefix of the profiled methods; a quantity's name is its method name without it
+CALC_PREFIX = '_calc_'
+
+# Profiling is opt-in and costs nothing when disabled: profile_calls binds
+# timing wrappers of the _calc_* methods on the profiled aircraft itself (not
+# its class) only while the context is open, and removes them on exit
+# Only aircraft being profiled (and what-if views made from them while
+# profiling) are recorded; other aircraft, in this or other threads, run the
+# class methods untouched
+# With the derived-quantity cache enabled (the default), each quantity is
+# computed once per change of its inputs and cache hits are not calls; disable
+# the cache (aircraft._cache.enabled = False) to count every evaluation
+
+# one call path in the call tree
+class CallNode:
+  __slots__ = ('name', 'calls', 'total_s', 'children')
+
+  def __init__(self, name):
+    self.name = name
+    self.calls = 0
+    self.total_s = 0.0
+    self.children = {}
+
+  # wall time not spent in profiled callees
+  @property
+  def self_s(self):
+    return self.total_s-sum(child.total_s for child in self.children.values())
+
+# CallProfiler class
+class CallProfiler:
+  # class constructor
+  def __init__(self):
+    self.root = CallNode('')
+    self._stack = [self.root]
+
+  # record the start of a call of quantity name and return its start time
+  def enter(self, name):
+    parent = self._stack[-1]
+    node = parent.children.get(name)
+    if node is None:
+      node = parent.children[name] = CallNode(name)
+    node.calls += 1
+    self._stack.append(node)
+    return time.perf_counter()
+
+  # record the end of the innermost call
+  def exit(self, t_start):
+    self._stack.pop().total_s += time.perf_counter()-t_start
+
+  # return {quantity name: {'calls', 'total_s', 'self_s'}} summed over call
+  # paths; total_s of a quantity that calls itself counts the nested calls again
+  def stats(self):
+    totals = {}
+    pending = list(self.root.children.values())
+    while pending:
+      node = pending.pop()
+      entry = totals.setdefault(node.name, {'calls': 0, 'total_s': 0.0, 'self_s': 0.0})
+      entry['calls'] += node.calls
+      entry['total_s'] += node.total_s
+      entry['self_s'] += node.self_s
+      pending.extend(node.children.values())
+    return totals
+
+  # return a table of the quantities by descending self time; top limits rows
+  def format_stats(self, top=None):
+    rows = sorted(self.stats().items(), key=lambda item: -item[1]['self_s'])[:top]
+    lines = [f"{'quantity':<50}{'calls':>9}{'total_ms':>11}{'self_ms':>10}"]
+    for name, entry in rows:
+      lines.append(
+        f"{name:<50}{entry['calls']:>9}{entry['total_s']*1e3:>11.3f}{entry['self_s']*1e3:>10.3f}"
+      )
+    return '\n'.join(lines)
+
+  # return the call tree as indented lines of calls and inclusive time;
+  # max_depth limits the levels shown
+  def format_tree(self, max_depth=None):
+    lines = []
+    def visit(node, depth):
+      for child in sorted(node.children.values(), key=lambda n: -n.total_s):
+        lines.append(f"{'  '*depth}{child.name} calls={child.calls} total_ms={child.total_s*1e3:.3f}")
+        if max_depth is None or depth+1 < max_depth:
+          visit(child, depth+1)
+    visit(self.root, 0)
+    return '\n'.join(lines)
+
+  # yield 'outer;...;inner self_us' lines in the folded-stack format read by
+  # flamegraph.pl, speedscope and inferno
+  def iter_folded(self):
+    pending = [(child, child.name) for child in self.root.children.values()]
+    while pending:
+      node, path = pending.pop()
+      yield f"{path} {max(int(round(node.self_s*1e6)), 0)}"
+      pending.extend((child, path+';'+child.name) for child in node.children.values())
+
+  # write the folded stacks to path
+  def write_folded(self, path):
+    with open(path, 'w') as ofile:
+      for line in self.iter_folded():
+        ofile.write(line+'\n')
+
+def _profiled(name, func, profiler):
+  def wrapper(self, *args, **kwargs):
+    t_start = profiler.enter(name)
+    try:
+      return func(self, *args, **kwargs)
+    finally:
+      profiler.exit(t_start)
+  wrapper.__name__ = func.__name__
+  wrapper.__qualname__ = func.__qualname__
+  return wrapper
+
+# bind wrappers of the _calc_* methods on aircraft that record in profiler;
+# instances lists every aircraft bound by one profiling context
+def _bind(aircraft, profiler, instances):
+  cls = type(aircraft)
+  for name in dir(cls):
+    if name.startswith(CALC_PREFIX) and callable(getattr(cls, name)):
+      wrapper = _profiled(name[len(CALC_PREFIX):], getattr(cls, name), profiler)
+      setattr(aircraft, name, types.MethodType(wrapper, aircraft))
+  aircraft._profiling = (profiler, instances)
+  instances.append(aircraft)
+
+# remove the wrappers bound on aircraft, if any
+def _unbind(aircraft):
+  for name in [name for name in vars(aircraft) if name.startswith(CALC_PREFIX)]:
+    delattr(aircraft, name)
+  aircraft.__dict__.pop('_profiling', None)
+
+# profile a what-if view copied from a profiled aircraft in the same context;
+# the copied wrappers are bound to the original and are replaced
+def bind_view(view):
+  context = view.__dict__.get('_profiling')
+  if context is not None:
+    _bind(view, *context)
+
+# record the _calc_* calls of aircraft until the context exits, in profiler or
+# a new CallProfiler, e.g.
+#  with profile_calls(aircraft) as profiler:
+#    aircraft._iterate_mtow()
+#  print(profiler.format_tree())
+@contextlib.contextmanager
+def profile_calls(aircraft, profiler=None):
+  profiler = CallProfiler() if profiler is None else profiler
+  outer = aircraft.__dict__.get('_profiling')
+  instances = []
+  _bind(aircraft, profiler, instances)
+  try:
+    yield profiler
+  finally:
+    for instance in instances:
+      _unbind(instance)
+    if outer is not None:
+      _bind(aircraft, *outer)
@@ -8,15 +8,49 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import json # json parsing
 import math # pi
+import sys  # not needed when using as a package
+
+# path to directory with other modules; use before deploying as package
+sys.path.append('../evtol')
+from config import load_config
+from record import Record
+
+# comment above and uncomment below when ready to deploy as package
+#from .config import load_config
+#from .record import Record
+
+class Propulsion(Record):
+  # input fields loaded from JSON
+  FIELDS = (
+   'rotor_effic',
+   'rotor_count',
+   'lift_rotor_count',
+   'tilt_rotor_count',
+   'rotor_diameter_m',
+   'tip_mach',
+   'rotor_avg_cl',
+  )
+  # fields derived from the input fields
+  DERIVED = (
+   'disk_area_m2',
+  )
+  __slots__ = tuple('_'+name for name in FIELDS+DERIVED)
 
-class Propulsion:
   # class constructor
   def __init__(self, path_to_json: str):
-    # open and load JSON specification
-    ifile = open(path_to_json, 'r')
-    ijson = json.load(ifile)
+    # load JSON specification; parsed once per file version
+    self._load(load_config(path_to_json))
+
+  # alternate constructor from an already parsed JSON specification
+  @classmethod
+  def from_dict(cls, ijson: dict):
+    obj = cls.__new__(cls)
+    obj._load(ijson)
+    return obj
+
+  # populate properties from a parsed JSON specification
+  def _load(self, ijson: dict):
     # propulsion properties
     self._rotor_effic = ijson['propulsion']['rotor_effic']
     self._rotor_count = ijson['propulsion']['rotor_count']
@@ -26,29 +60,12 @@ class Propulsion:
     self._tip_mach = ijson['propulsion']['tip_mach']
     self._rotor_avg_cl = ijson['propulsion']['rotor_avg_cl']
     # calculate initial values of derived fields
-    self._disk_area_m2 = self._calc_disk_area_m2()
-    # close JSON file
-    ifile.close()
+    self._calc_derived()
 
   # area of circle swept by rotor times rotor count
   def _calc_disk_area_m2(self):
     return self.rotor_count*math.pi*(self.rotor_diameter_m/2.0)**2.0
 
-  # defines equivalence check for this class
-  def __eq__(self, other):
-    if isinstance(other, Propulsion):
-      return (\
-       self.rotor_effic == other.rotor_effic and
-       self.rotor_count == other.rotor_count and
-       self.lift_rotor_count == other.lift_rotor_count and
-       self.tilt_rotor_count == other.tilt_rotor_count and
-       self.rotor_diameter_m == other.rotor_diameter_m and
-       self.tip_mach == other.tip_mach and
-       self.rotor_avg_cl == other.rotor_avg_cl
-       )
-    else:
-      return NotImplemented
-
   @property
   def rotor_effic(self):
     return self._rotor_effic
@@ -58,11 +75,13 @@ class Propulsion:
     return self._rotor_count
 
   # the setter is called automatically with the code p.rotor_count = 4
+  # it changes this record in place and recomputes the derived disk area; the
+  # record's hash changes too, so use p.replace(rotor_count=4) instead for a
+  # record held in a set or a cache (Aircraft.propulsion returns a copy)
   @rotor_count.setter
   def rotor_count(self, new_count):
-    # TODO: ensure cascading update calculations if rotor count changes
     self._rotor_count = new_count
-    self._disk_area_m2 = self._calc_disk_area_m2()
+    self._calc_derived()
 
   @property
   def lift_rotor_count(self):
@@ -0,0 +1,302 @@
+# queuing.py
+#
+# Python classes and functions for discrete-event simulation of aircraft
+# operations with finite ABU pools and shared chargers
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import collections # deque
+import heapq       # heappop, heappush
+import sys         # not needed when using as a package
+
+# path to directory containing TimelineColumns class; use before deploying as package
+sys.path.append('../evtol')
+from timeline import TimelineColumns
+
+# comment above and uncomment below when ready to deploy as package
+#from .timeline import TimelineColumns
+
+# aircraft events logged for every flight, in order
+AIRCRAFT_EVENTS = ("aircraft_depart", "aircraft_arrive",
+                   "aircraft_ground_ops_done", "aircraft_charge_done")
+
+# ResourcePool class
+# a pool of identical units (e.g. ABUs) that become available at known times
+# acquire() returns the lowest-index unit already available at the request
+# time, otherwise the unit that becomes available first (lowest index on ties)
+# request times must be non-decreasing; each operation is O(log n)
+class ResourcePool:
+  # class constructor
+  def __init__(self, n_units):
+    self.n_units = max(1, int(n_units))
+    # indices of units available at the latest request time
+    self._ready = list(range(self.n_units))
+    # (available time, index) for units still busy at the latest request time
+    self._busy = []
+    self._available_times_hr = [0.0 for _ in range(self.n_units)]
+    self.busy_time_hr = [0.0 for _ in range(self.n_units)]
+
+  # return (index, available time [hr]) of the unit to use at t_hr
+  # the unit is removed from the pool until it is released
+  def acquire(self, t_hr):
+    ready = self._ready
+    busy = self._busy
+    while busy and busy[0][0] <= t_hr:
+      heapq.heappush(ready, heapq.heappop(busy)[1])
+    if ready:
+      j = heapq.heappop(ready)
+    else:
+      j = heapq.heappop(busy)[1]
+    return j, self._available_times_hr[j]
+
+  # return unit j to the pool, busy from t_start_hr until t_available_hr
+  def release(self, j, t_start_hr, t_available_hr):
+    self._available_times_hr[j] = t_available_hr
+    self.busy_time_hr[j] += (t_available_hr-t_start_hr)
+    heapq.heappush(self._busy, (t_available_hr, j))
+
+  # total busy time of all units [hr]
+  def total_busy_time_hr(self):
+    return sum(self.busy_time_hr)
+
+# simulate flights of a single aircraft until the next flight would end after
+# daily_operation_hr; each flight needs one unit from every leg's pool
+# legs: list of dicts, one per ABU role, with keys
+#  "pool": ResourcePool
+#  "t_attach_offset_hr": time after departure of the attach event
+#  "t_carry_start_hr": time after departure when the attached duration starts
+#  "t_attach_hr": attached duration; detach = depart+t_carry_start+t_attach
+#  "t_return_hr": return time after detach
+#  "t_charge_hr": charge time after return
+#  "events": names of the (attach, detach, return done, charge start,
+#   charge done) events in the unit timelines
+#  "log_abu_index": True to add "abu_index" to unit timeline events
+#  "log_detach_on_aircraft": True to add the detach event to the aircraft
+#   timeline
+# timeline_format: "dicts" for one dict per event, or "columns" for
+#  TimelineColumns (the unit timeline of a leg is then a single table with an
+#  abu_index column)
+# returns {
+#  "n_flights_completed", "t_aircraft_ready_hr",
+#  "t_wait_hr": ABU-caused wait per leg (attributed to the first leg with the
+#   latest availability),
+#  "aircraft_timeline", "timelines": per leg {unit index: event list} or
+#   TimelineColumns
+# }
+def simulate_daily_ops(t_flight_hr, t_ground_ops_hr, t_charge_hr_main,
+                       daily_operation_hr, legs, timeline_format="dicts"):
+  if timeline_format not in ("dicts", "columns"):
+    raise ValueError(f"unknown timeline_format: {timeline_format}")
+  columns = timeline_format == "columns"
+
+  t_aircraft_ready_hr = 0.0
+  if columns:
+    aircraft_timeline = TimelineColumns(('flight_index',), AIRCRAFT_EVENTS)
+    timelines = [
+      TimelineColumns(('flight_index', 'abu_index'), leg["events"]) for leg in legs
+    ]
+    # event codes: aircraft depart, arrive, ground ops done, charge done and
+    # each leg's detach on the aircraft timeline
+    aircraft_codes = [aircraft_timeline.event_code(name) for name in AIRCRAFT_EVENTS]
+    detach_codes = [aircraft_timeline.event_code(leg["events"][1]) for leg in legs]
+  else:
+    aircraft_timeline = []
+    timelines = [{j: [] for j in range(leg["pool"].n_units)} for leg in legs]
+  t_wait_hr = [0.0 for _ in legs]
+  n_flights_completed = 0
+
+  while True:
+    t_earliest_hr = t_aircraft_ready_hr
+
+    # one unit per leg; departure waits for the latest of them
+    picks = [leg["pool"].acquire(t_earliest_hr) for leg in legs]
+    t_block_hr = max(t_abu_hr for j, t_abu_hr in picks)
+    t_depart_hr = max(t_earliest_hr, t_block_hr)
+
+    # stop if the flight cannot complete within the operating window
+    if t_depart_hr+t_flight_hr > daily_operation_hr:
+      break
+
+    # ABU bottleneck wait
+    if t_block_hr > t_earliest_hr:
+      i_block = [t_abu_hr for j, t_abu_hr in picks].index(t_block_hr)
+      t_wait_hr[i_block] += (t_block_hr-t_earliest_hr)
+
+    flight_idx = n_flights_completed
+    if columns:
+      aircraft_timeline.append(t_depart_hr, aircraft_codes[0], flight_idx)
+    else:
+      aircraft_timeline.append({
+        "t_hr": t_depart_hr,
+        "event": "aircraft_depart",
+        "flight_index": flight_idx
+      })
+
+    # unit timelines
+    for i_leg, (leg, (j, t_abu_hr), leg_timelines) in enumerate(zip(legs, picks, timelines)):
+      t_attach_hr = t_depart_hr+leg["t_attach_offset_hr"]
+      t_detach_hr = t_depart_hr+leg["t_carry_start_hr"]+leg["t_attach_hr"]
+      t_return_done_hr = t_detach_hr+leg["t_return_hr"]
+      t_charge_done_hr = t_return_done_hr+leg["t_charge_hr"]
+      unit_times_hr = (t_attach_hr, t_detach_hr, t_return_done_hr,
+                       t_return_done_hr, t_charge_done_hr)
+      if columns:
+        for code, t_hr in enumerate(unit_times_hr):
+          leg_timelines.append(t_hr, code, flight_idx, j)
+        if leg["log_detach_on_aircraft"]:
+          aircraft_timeline.append(t_detach_hr, detach_codes[i_leg], flight_idx)
+      else:
+        for t_hr, event in zip(unit_times_hr, leg["events"]):
+          entry = {"t_hr": t_hr, "event": event, "flight_index": flight_idx}
+          if leg["log_abu_index"]:
+            entry["abu_index"] = j
+          leg_timelines[j].append(entry)
+        if leg["log_detach_on_aircraft"]:
+          aircraft_timeline.append({
+            "t_hr": t_detach_hr,
+            "event": leg["events"][1],
+            "flight_index": flight_idx
+          })
+      leg["pool"].release(j, t_depart_hr, t_charge_done_hr)
+
+    # aircraft turnaround
+    t_arrive_hr = t_depart_hr+t_flight_hr
+    t_after_ground_hr = t_arrive_hr+t_ground_ops_hr
+    t_after_charge_hr = t_after_ground_hr+t_charge_hr_main
+    if columns:
+      aircraft_timeline.append(t_arrive_hr, aircraft_codes[1], flight_idx)
+      aircraft_timeline.append(t_after_ground_hr, aircraft_codes[2], flight_idx)
+      aircraft_timeline.append(t_after_charge_hr, aircraft_codes[3], flight_idx)
+    else:
+      aircraft_timeline.append({
+        "t_hr": t_arrive_hr,
+        "event": "aircraft_arrive",
+        "flight_index": flight_idx
+      })
+      aircraft_timeline.append({
+        "t_hr": t_after_ground_hr,
+        "event": "aircraft_ground_ops_done",
+        "flight_index": flight_idx
+      })
+      aircraft_timeline.append({
+        "t_hr": t_after_charge_hr,
+        "event": "aircraft_charge_done",
+        "flight_index": flight_idx
+      })
+    t_aircraft_ready_hr = t_after_charge_hr
+
+    n_flights_completed += 1
+
+  return {
+    "n_flights_completed": n_flights_completed,
+    "t_aircraft_ready_hr": t_aircraft_ready_hr,
+    "t_wait_hr": t_wait_hr,
+    "aircraft_timeline": aircraft_timeline,
+    "timelines": timelines,
+  }
+
+# EventQueue class
+# time-ordered queue of (time, event, payload); events at equal times are
+# returned in the order they were pushed
+class EventQueue:
+  # class constructor
+  def __init__(self):
+    self._heap = []
+    self._seq = 0
+
+  # schedule event with payload at t_hr
+  def push(self, t_hr, event, payload=None):
+    heapq.heappush(self._heap, (t_hr, self._seq, event, payload))
+    self._seq += 1
+
+  # return (time, event, payload) of the earliest event
+  def pop(self):
+    t_hr, seq, event, payload = heapq.heappop(self._heap)
+    return t_hr, event, payload
+
+  # time of the earliest event
+  def peek_time_hr(self):
+    return self._heap[0][0]
+
+  def __len__(self):
+    return len(self._heap)
+
+# FifoResource class
+# a pool of identical units (e.g. chargers) served first come, first served
+# a request takes the lowest-index free unit, otherwise it waits in line;
+# released units go to the longest-waiting request
+# requests and releases must be made in non-decreasing time order
+class FifoResource:
+  # class constructor
+  def __init__(self, n_units):
+    self.n_units = max(0, int(n_units))
+    self._free = list(range(self.n_units))
+    self._waiting = collections.deque()
+    self._busy_since_hr = [None for _ in range(self.n_units)]
+    self.busy_time_hr = [0.0 for _ in range(self.n_units)]
+    # time-weighted queue length statistics
+    self._t_last_hr = 0.0
+    self._queue_area_hr = 0.0
+    self.max_queue_length = 0
+    self.n_requests = 0
+    self.wait_time_hr = 0.0
+
+  # advance the queue-length integral to t_hr
+  def _advance(self, t_hr):
+    self._queue_area_hr += len(self._waiting)*(t_hr-self._t_last_hr)
+    self._t_last_hr = t_hr
+
+  # request a unit at t_hr for token
+  # returns the unit index if one is free, otherwise None (token waits)
+  def request(self, t_hr, token):
+    self._advance(t_hr)
+    self.n_requests += 1
+    if self._free:
+      j = heapq.heappop(self._free)
+      self._busy_since_hr[j] = t_hr
+      return j
+    self._waiting.append((t_hr, token))
+    self.max_queue_length = max(self.max_queue_length, len(self._waiting))
+    return None
+
+  # release unit j at t_hr
+  # returns the waiting token now holding unit j, otherwise None
+  def release(self, t_hr, j):
+    self._advance(t_hr)
+    self.busy_time_hr[j] += (t_hr-self._busy_since_hr[j])
+    if self._waiting:
+      t_request_hr, token = self._waiting.popleft()
+      self.wait_time_hr += (t_hr-t_request_hr)
+      self._busy_since_hr[j] = t_hr
+      return token
+    self._busy_since_hr[j] = None
+    heapq.heappush(self._free, j)
+    return None
+
+  # number of requests currently waiting
+  def queue_length(self):
+    return len(self._waiting)
+
+  # statistics over [0, t_end_hr]; units busy or requests waiting at t_end_hr
+  # are counted up to t_end_hr
+  def summary(self, t_end_hr):
+    self._advance(t_end_hr)
+    busy_hr = sum(self.busy_time_hr)
+    for t_since_hr in self._busy_since_hr:
+      if t_since_hr is not None:
+        busy_hr += max(0.0, t_end_hr-t_since_hr)
+    wait_hr = self.wait_time_hr
+    for t_request_hr, token in self._waiting:
+      wait_hr += max(0.0, t_end_hr-t_request_hr)
+    return {
+      "n_units": self.n_units,
+      "n_requests": self.n_requests,
+      "utilization_avg": busy_hr/(t_end_hr*self.n_units) if self.n_units > 0 and t_end_hr > 0.0 else 0.0,
+      "queue_length_avg": self._queue_area_hr/t_end_hr if t_end_hr > 0.0 else 0.0,
+      "queue_length_max": self.max_queue_length,
+      "wait_time_hr": wait_hr,
+    }
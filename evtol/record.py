@@ -0,0 +1,77 @@
+# record.py
+#
+# A Python base class for immutable, slotted parameter records
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import operator # attrgetter
+
+# Record class
+# subclasses list their input fields in FIELDS and their derived fields in
+# DERIVED, and declare __slots__ = ('_'+name for each field); field name is
+# read through a property returning self._name, and derived field name is
+# computed by method _calc_<name>() from the input fields
+# records have no setters (except Propulsion.rotor_count, kept for existing
+# code, which is why Aircraft hands out copies of its Propulsion record): use
+# replace() to obtain a changed copy, which makes records safe to share, hash
+# and use as cache keys
+class Record:
+  __slots__ = ()
+  FIELDS = ()
+  DERIVED = ()
+
+  # precompute the slot names and a getter of all input field values
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    cls._field_slots = tuple('_'+name for name in cls.FIELDS)
+    cls._field_index = {name: i for i, name in enumerate(cls.FIELDS)}
+    getter = operator.attrgetter(*cls._field_slots)
+    if len(cls.FIELDS) == 1:
+      getter = lambda obj, get=getter: (get(obj),)
+    cls._get_values = staticmethod(getter)
+
+  # tuple of input field values in FIELDS order
+  def values(self):
+    return self._get_values(self)
+
+  # {field name: value} of the input fields
+  def to_dict(self):
+    return dict(zip(self.FIELDS, self._get_values(self)))
+
+  # return a copy with the given input fields changed and derived fields
+  # recomputed, e.g. mission.replace(cruise_s=900.0)
+  def replace(self, **changes):
+    values = list(self._get_values(self))
+    for name, value in changes.items():
+      i = self._field_index.get(name)
+      if i is None:
+        raise ValueError(f"{type(self).__name__} has no field {name}")
+      values[i] = value
+    obj = type(self).__new__(type(self))
+    for slot, value in zip(self._field_slots, values):
+      setattr(obj, slot, value)
+    obj._calc_derived()
+    return obj
+
+  # set the derived fields from the input fields
+  def _calc_derived(self):
+    for name in self.DERIVED:
+      setattr(self, '_'+name, getattr(self, '_calc_'+name)())
+
+  # defines equivalence check: same class and equal input fields
+  def __eq__(self, other):
+    if isinstance(other, type(self)):
+      return self.values() == other.values()
+    else:
+      return NotImplemented
+
+  def __hash__(self):
+    return hash((type(self).__name__,)+self.values())
+
+  def __repr__(self):
+    fields = ', '.join(f"{name}={value!r}" for name, value in self.to_dict().items())
+    return f"{type(self).__name__}({fields})"
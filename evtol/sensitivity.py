@@ -0,0 +1,301 @@
+# sensitivity.py
+#
+# Python functions for global sensitivity analysis (Sobol indices and Morris
+# elementary effects) of the vectorized model over many inputs
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import concurrent.futures # ProcessPoolExecutor
+import sys                # not needed when using as a package
+import warnings           # catch_warnings
+import numpy as np        # arrays, random generator
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from batch import calc_batch_common_case_baseline, calc_batch_masses, \
+ calc_batch_mission_energy
+
+# comment above and uncomment below when ready to deploy as package
+#from .batch import calc_batch_common_case_baseline, calc_batch_masses, \
+# calc_batch_mission_energy
+
+# designs evaluated per vectorized batch
+BATCH_SIZE = 4096
+
+# bootstrap resamples and confidence level of the index confidence intervals
+N_BOOTSTRAP = 200
+CONFIDENCE = 0.95
+
+# Inputs are given as bounds {field name: (low, high)} of the batch parameters
+# (see batch.py) and sampled uniformly; all other parameters keep their
+# nominal values
+# Sobol: Saltelli design of n_base rows each of matrices A, B and AB_i (A with
+# input i taken from B), n_base*(inputs+2) evaluations. Every evaluation is
+# used by the first-order (Saltelli 2010) and total (Jansen 1999) estimators
+# of every input and output, and by every bootstrap resample
+# Morris: n_trajectories one-at-a-time trajectories of inputs+1 points on an
+# n_levels grid, n_trajectories*(inputs+1) evaluations; cheap screening before
+# a Sobol analysis of the most influential inputs
+
+# default outputs: mission energy and empty mass at the design MTOW, and
+# flights per day of the no-ABU common case (see
+# batch.calc_batch_common_case_baseline, which receives baseline_kwargs)
+def calc_batch_design_drivers(params: dict, **baseline_kwargs):
+  with np.errstate(invalid='ignore', divide='ignore'):
+    return {
+      'total_mission_energy_kw_hr':
+        calc_batch_mission_energy(params)['total_mission_energy_kw_hr'],
+      'empty_mass_kg': calc_batch_masses(params)['empty_mass_kg'],
+      'n_feasible_flights':
+        calc_batch_common_case_baseline(params, **baseline_kwargs)['n_feasible_flights']
+    }
+
+# return bounds of +/-rel around every non-zero float parameter, or of the
+# given names only
+def default_bounds(params: dict, rel=0.1, names=None):
+  if names is None:
+    names = [name for name, value in params.items()
+             if isinstance(value, float) and value != 0.0]
+  return {
+    name: tuple(sorted((params[name]*(1.0-rel), params[name]*(1.0+rel))))
+    for name in names
+  }
+
+# return the Saltelli design: (n_base*(inputs+2), inputs) points in the unit
+# hypercube, rows A, then B, then AB_1 ... AB_inputs
+def saltelli_design(n_inputs, n_base, seed=0):
+  rng = np.random.default_rng(seed)
+  A = rng.random((n_base, n_inputs))
+  B = rng.random((n_base, n_inputs))
+  AB = np.repeat(A[None, :, :], n_inputs, axis=0)
+  AB[np.arange(n_inputs), :, np.arange(n_inputs)] = B.T
+  return np.concatenate([A, B, AB.reshape(-1, n_inputs)])
+
+# return the Morris design: (n_trajectories*(inputs+1), inputs) points in the
+# unit hypercube and the input changed at each step, (n_trajectories, inputs);
+# each trajectory starts at a random grid point and moves every input once, in
+# random order, by +/-delta = n_levels/(2*(n_levels-1))
+def morris_design(n_inputs, n_trajectories, n_levels=4, seed=0):
+  rng = np.random.default_rng(seed)
+  delta = n_levels/(2.0*(n_levels-1))
+  X = np.empty((n_trajectories, n_inputs+1, n_inputs))
+  order = np.empty((n_trajectories, n_inputs), dtype=np.int64)
+  for t in range(n_trajectories):
+    x = rng.integers(0, n_levels, n_inputs)/(n_levels-1.0)
+    order[t] = rng.permutation(n_inputs)
+    X[t, 0] = x
+    for k, i in enumerate(order[t]):
+      x = x.copy()
+      x[i] = x[i]+delta if x[i]+delta <= 1.0+1e-12 else x[i]-delta
+      X[t, k+1] = x
+  return X.reshape(-1, n_inputs), order
+
+# Design evaluation state of a worker process, set once per worker by
+# _init_worker
+_WORKER = {}
+
+def _init_worker(params, names, low, high, evaluator, evaluator_kwargs):
+  _WORKER['args'] = (params, names, low, high, evaluator, evaluator_kwargs)
+
+def _evaluate_worker_rows(U):
+  return _evaluate_rows(*_WORKER['args'], U)
+
+# evaluate unit-hypercube rows U scaled to [low, high] in one batch
+def _evaluate_rows(params, names, low, high, evaluator, evaluator_kwargs, U):
+  p = dict(params)
+  X = low+U*(high-low)
+  for j, name in enumerate(names):
+    p[name] = X[:, j]
+  return {name: np.broadcast_to(values, (U.shape[0],)).astype(np.float64)
+          for name, values in evaluator(p, **evaluator_kwargs).items()}
+
+# evaluate every row of design U in batches, in parallel for n_workers != 1,
+# and return {output: (rows,) array}
+def _evaluate_design(params, bounds, U, evaluator, evaluator_kwargs, batch_size, n_workers):
+  names = tuple(bounds)
+  low = np.array([bounds[name][0] for name in names], dtype=np.float64)
+  high = np.array([bounds[name][1] for name in names], dtype=np.float64)
+  args = (params, names, low, high, evaluator, dict(evaluator_kwargs or {}))
+  chunks = [U[start:start+batch_size] for start in range(0, U.shape[0], batch_size)]
+  if n_workers == 1 or len(chunks) <= 1:
+    results = [_evaluate_rows(*args, chunk) for chunk in chunks]
+  else:
+    with concurrent.futures.ProcessPoolExecutor(
+      max_workers=n_workers, initializer=_init_worker, initargs=args
+    ) as executor:
+      results = list(executor.map(_evaluate_worker_rows, chunks))
+  return {name: np.concatenate([result[name] for result in results]) for name in results[0]}
+
+# first-order and total indices of every input from the Saltelli blocks
+# fA, fB (..., n) and fAB (..., inputs, n); leading axes are resamples
+# fB is centered in the first-order estimator, which leaves it unbiased and
+# removes the variance that a large output mean adds
+def _sobol_estimates(fA, fB, fAB):
+  # no valid rows or a constant output give NaN indices
+  with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+    warnings.simplefilter('ignore', RuntimeWarning)
+    fAfB = np.concatenate([fA, fB], axis=-1)
+    V = np.var(fAfB, axis=-1)[..., None]
+    fB_centered = fB-np.mean(fAfB, axis=-1)[..., None]
+    S1 = np.mean(fB_centered[..., None, :]*(fAB-fA[..., None, :]), axis=-1)/V
+    ST = 0.5*np.mean((fA[..., None, :]-fAB)**2, axis=-1)/V
+  return S1, ST, V[..., 0]
+
+# return Sobol indices of every output from the Saltelli design evaluations Y
+# ({output: array}); base rows with any non-finite evaluation are dropped
+def sobol_indices(Y: dict, n_inputs, n_base, n_bootstrap=N_BOOTSTRAP,
+                  confidence=CONFIDENCE, seed=0):
+  rng = np.random.default_rng(seed)
+  alpha = 0.5*(1.0-confidence)
+  outputs = {}
+  for name, values in Y.items():
+    blocks = values.reshape(n_inputs+2, n_base)
+    valid = np.all(np.isfinite(blocks), axis=0)
+    fA, fB, fAB = blocks[0, valid], blocks[1, valid], blocks[2:, valid]
+    n = fA.size
+    S1, ST, V = _sobol_estimates(fA, fB, fAB)
+    # bootstrap resamples of the base rows, a few at a time to bound memory
+    S1_boot = np.full((n_bootstrap, n_inputs), np.nan)
+    ST_boot = np.full((n_bootstrap, n_inputs), np.nan)
+    step = max(1, BATCH_SIZE*16//max(n*(n_inputs+2), 1))
+    for start in range(0, n_bootstrap if n else 0, step):
+      resample = rng.integers(0, n, (min(step, n_bootstrap-start), n))
+      S1_boot[start:start+step], ST_boot[start:start+step], V_boot = _sobol_estimates(
+        fA[resample], fB[resample], np.moveaxis(fAB[:, resample], 0, 1)
+      )
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore', RuntimeWarning)
+      outputs[name] = {
+        'variance': float(V),
+        'n_valid': int(n),
+        'S1': S1,
+        'S1_low': np.nanquantile(S1_boot, alpha, axis=0),
+        'S1_high': np.nanquantile(S1_boot, 1.0-alpha, axis=0),
+        'ST': ST,
+        'ST_low': np.nanquantile(ST_boot, alpha, axis=0),
+        'ST_high': np.nanquantile(ST_boot, 1.0-alpha, axis=0)
+      }
+  return outputs
+
+# return Morris statistics of every output from the evaluations Y ({output:
+# array}) of Morris design U with step order; elementary effects are per unit
+# of the normalized input, so they compare across inputs with different ranges
+# returns {output: {'mu', 'mu_star', 'mu_star_low', 'mu_star_high', 'sigma',
+# 'n_valid'}}; non-finite effects are dropped
+def morris_indices(Y: dict, U, order, n_bootstrap=N_BOOTSTRAP,
+                   confidence=CONFIDENCE, seed=0):
+  rng = np.random.default_rng(seed)
+  alpha = 0.5*(1.0-confidence)
+  n_trajectories, n_inputs = order.shape
+  U = U.reshape(n_trajectories, n_inputs+1, n_inputs)
+  t = np.arange(n_trajectories)[:, None]
+  k = np.arange(n_inputs)[None, :]
+  step = U[t, k+1, order]-U[t, k, order]
+  resample = rng.integers(0, n_trajectories, (n_bootstrap, n_trajectories))
+  outputs = {}
+  for name, values in Y.items():
+    f = values.reshape(n_trajectories, n_inputs+1)
+    EE = np.full((n_trajectories, n_inputs), np.nan)
+    with np.errstate(invalid='ignore'):
+      EE[t, order] = np.diff(f, axis=1)/step
+    EE[~np.isfinite(EE)] = np.nan
+    # inputs whose effects are all non-finite give NaN statistics
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore', RuntimeWarning)
+      mu_star_boot = np.nanmean(np.abs(EE)[resample], axis=1)
+      outputs[name] = {
+        'mu': np.nanmean(EE, axis=0),
+        'mu_star': np.nanmean(np.abs(EE), axis=0),
+        'mu_star_low': np.nanquantile(mu_star_boot, alpha, axis=0),
+        'mu_star_high': np.nanquantile(mu_star_boot, 1.0-alpha, axis=0),
+        'sigma': np.nanstd(EE, axis=0, ddof=1),
+        'n_valid': np.isfinite(EE).sum(axis=0)
+      }
+  return outputs
+
+# Sobol analysis of evaluator over bounds
+#  params          : {field name: scalar} nominal design, e.g. from
+#                    params_from_config
+#  bounds          : {field name: (low, high)} of the uncertain inputs, e.g.
+#                    from default_bounds
+#  n_base          : rows of the A and B matrices; n_base*(inputs+2)
+#                    evaluations
+#  evaluator       : function(params, **evaluator_kwargs) -> {name: array} of
+#                    a batch, module-level when n_workers != 1;
+#                    calc_batch_design_drivers by default
+#  n_workers       : worker processes; 1 evaluates in this process, None uses
+#                    one per CPU
+# returns {'method': 'sobol', 'names', 'n_evaluations', 'outputs': {output:
+# {'variance', 'n_valid', 'S1', 'S1_low', 'S1_high', 'ST', 'ST_low',
+# 'ST_high'}}} with one index per input, in names order; _low and _high bound
+# the bootstrap confidence interval
+# scripts that use n_workers != 1 must guard their top-level code with
+# if __name__ == '__main__'
+def run_sobol(params: dict, bounds: dict, n_base=512, evaluator=calc_batch_design_drivers,
+              evaluator_kwargs=None, n_bootstrap=N_BOOTSTRAP, confidence=CONFIDENCE,
+              seed=0, batch_size=BATCH_SIZE, n_workers=1):
+  U = saltelli_design(len(bounds), n_base, seed)
+  Y = _evaluate_design(params, bounds, U, evaluator, evaluator_kwargs, batch_size, n_workers)
+  return {
+    'method': 'sobol',
+    'names': tuple(bounds),
+    'n_evaluations': U.shape[0],
+    'outputs': sobol_indices(Y, len(bounds), n_base, n_bootstrap, confidence, seed)
+  }
+
+# Morris screening of evaluator over bounds; arguments as run_sobol
+#  n_trajectories: trajectories; n_trajectories*(inputs+1) evaluations
+#  n_levels      : grid levels per input
+# returns {'method': 'morris', 'names', 'n_evaluations', 'outputs': {output:
+# {'mu', 'mu_star', 'mu_star_low', 'mu_star_high', 'sigma', 'n_valid'}}}
+def run_morris(params: dict, bounds: dict, n_trajectories=20, n_levels=4,
+               evaluator=calc_batch_design_drivers, evaluator_kwargs=None,
+               n_bootstrap=N_BOOTSTRAP, confidence=CONFIDENCE, seed=0,
+               batch_size=BATCH_SIZE, n_workers=1):
+  U, order = morris_design(len(bounds), n_trajectories, n_levels, seed)
+  Y = _evaluate_design(params, bounds, U, evaluator, evaluator_kwargs, batch_size, n_workers)
+  return {
+    'method': 'morris',
+    'names': tuple(bounds),
+    'n_evaluations': U.shape[0],
+    'outputs': morris_indices(Y, U, order, n_bootstrap, confidence, seed)
+  }
+
+# ranking measure of each method: total index or mean absolute effect
+_RANK_BY = {'sobol': 'ST', 'morris': 'mu_star'}
+
+# return the names of the n most influential inputs of output, most
+# influential first
+def top_inputs(result: dict, output, n=None):
+  measure = np.nan_to_num(result['outputs'][output][_RANK_BY[result['method']]], nan=-np.inf)
+  return [result['names'][i] for i in np.argsort(-measure, kind='stable')[:n]]
+
+# return a report of every output with its inputs ranked by influence; top
+# limits the inputs listed per output
+def format_sensitivity_report(result: dict, top=None):
+  columns = ('S1', 'S1_low', 'S1_high', 'ST', 'ST_low', 'ST_high') \
+            if result['method'] == 'sobol' else \
+            ('mu_star', 'mu_star_low', 'mu_star_high', 'mu', 'sigma')
+  width = max(len(name) for name in result['names'])+2
+  lines = [f"{result['method']} sensitivity analysis, {len(result['names'])} inputs, "
+           f"{result['n_evaluations']} evaluations"]
+  for output, indices in result['outputs'].items():
+    lines.append('')
+    lines.append(output+(f" (variance {indices['variance']:.6g}, {indices['n_valid']} valid base rows)"
+                         if result['method'] == 'sobol' else ''))
+    lines.append(f"{'rank':>4}  {'input':<{width}}"+''.join(f"{column:>14}" for column in columns))
+    names = list(result['names'])
+    for rank, name in enumerate(top_inputs(result, output, top)):
+      i = names.index(name)
+      lines.append(f"{rank+1:>4}  {name:<{width}}"+
+                   ''.join(f"{indices[column][i]:>14.6g}" for column in columns))
+  return '\n'.join(lines)
+
+# write the report of format_sensitivity_report to path
+def write_sensitivity_report(result: dict, path, top=None):
+  with open(path, 'w') as ofile:
+    ofile.write(format_sensitivity_report(result, top)+'\n')
@@ -0,0 +1,245 @@
+# surrogate.py
+#
+# A Python class containing Gaussian process surrogate models of evaluators
+# with error estimates, persistence and fallback to the true model
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import importlib   # import_module
+import json        # dumps, loads
+import sys         # not needed when using as a package
+import numpy as np # arrays, linear algebra
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from config import load_config
+from sweep import evaluate_point, latin_hypercube, run_sweep
+
+# comment above and uncomment below when ready to deploy as package
+#from .config import load_config
+#from .sweep import evaluate_point, latin_hypercube, run_sweep
+
+# candidate kernel length scales, in input ranges normalized to [0, 1]
+LENGTH_SCALES = np.geomspace(0.05, 20.0, 14)
+
+# length-scale search passes over the inputs
+LENGTH_SCALE_PASSES = 3
+
+# initial kernel diagonal jitter; the evaluators are deterministic, so it is
+# only raised (by factors of 100) when the kernel matrix is not numerically
+# positive definite
+NUGGET = 1e-12
+
+# default trust region error bound: predicted standard deviation as a fraction
+# of the output's standard deviation over the training samples
+REL_STD_TOL = 1e-3
+
+# output name of evaluators that return a number
+VALUE = 'value'
+
+# A surrogate models the outputs of a sweep evaluator (see sweep.py) over a box
+# of sweep point inputs with a Gaussian process: squared-exponential kernel with
+# one length scale per input, constant mean and a signal variance per output
+# Queries inside the box with a small enough predicted error are answered by
+# the surrogate; all others are evaluated with the true model
+
+# squared-exponential kernel matrix between normalized inputs A and B
+def _kernel(A, B, inv_l2):
+  d2 = (((A[:, None, :]-B[None, :, :])**2)*inv_l2).sum(axis=2)
+  return np.exp(-0.5*d2)
+
+# Cholesky factor of the kernel matrix of normalized inputs X with the smallest
+# jitter that factorizes
+def _cholesky(X, inv_l2):
+  K = _kernel(X, X, inv_l2)
+  nugget = NUGGET
+  while True:
+    try:
+      return np.linalg.cholesky(K+nugget*np.eye(X.shape[0]))
+    except np.linalg.LinAlgError:
+      nugget *= 100.0
+
+# profiled log marginal likelihood of standardized outputs Y, summed over outputs
+def _log_likelihood(X, Y, length_scales):
+  n = X.shape[0]
+  L = _cholesky(X, 1.0/length_scales**2)
+  Z = np.linalg.solve(L, Y)
+  s2 = np.maximum((Z**2).sum(axis=0)/n, 1e-300)
+  return -0.5*n*np.log(s2).sum()-Y.shape[1]*np.log(np.diag(L)).sum()
+
+# return the mean and standard deviation of outputs Y, and Y standardized
+def _standardize(Y):
+  mean = Y.mean(axis=0)
+  scale = Y.std(axis=0)
+  scale[scale == 0.0] = 1.0
+  return mean, scale, (Y-mean)/scale
+
+# return evaluator results as an (n, outputs) float array; rows of results that
+# are None or lack an output are NaN
+def _output_array(results, outputs):
+  Y = np.full((len(results), len(outputs)), np.nan)
+  for i, result in enumerate(results):
+    if isinstance(result, dict):
+      Y[i] = [result.get(output, np.nan) for output in outputs]
+    elif result is not None:
+      Y[i] = result
+  return Y
+
+def _evaluator_name(evaluator):
+  if isinstance(evaluator, str):
+    return 'Aircraft.'+evaluator
+  return evaluator.__module__+'.'+evaluator.__qualname__
+
+# return the evaluator named by _evaluator_name, or None if it cannot be imported
+def _resolve_evaluator(name):
+  module_name, attr = name.rsplit('.', 1)
+  if module_name == 'Aircraft':
+    return attr
+  try:
+    return getattr(importlib.import_module(module_name), attr)
+  except (ImportError, AttributeError):
+    return None
+
+# Surrogate class
+class Surrogate:
+  # class constructor; use fit_surrogate or Surrogate.load
+  #  names       : input names (sweep point names)
+  #  low, high   : input bounds
+  #  outputs     : output names (evaluator result keys, or VALUE)
+  #  X, Y        : training inputs and outputs
+  #  length_scales: kernel length scale per normalized input
+  #  config, evaluator, evaluator_kwargs: true model, as in sweep.run_sweep
+  def __init__(self, names, low, high, outputs, X, Y, length_scales,
+               config=None, evaluator=None, evaluator_kwargs=None,
+               rel_std_tol=REL_STD_TOL):
+    self.names = tuple(names)
+    self.outputs = tuple(outputs)
+    self.low = np.asarray(low, dtype=np.float64)
+    self.high = np.asarray(high, dtype=np.float64)
+    self.X = np.asarray(X, dtype=np.float64)
+    self.Y = np.asarray(Y, dtype=np.float64)
+    self.length_scales = np.asarray(length_scales, dtype=np.float64)
+    self.config = config
+    self.evaluator = evaluator
+    self.evaluator_kwargs = dict(evaluator_kwargs or {})
+    self.rel_std_tol = rel_std_tol
+    # queries answered and queries evaluated with the true model
+    self.n_queries = 0
+    self.n_fallbacks = 0
+    self._fit()
+
+  # precompute the standardized-output weights and inverse Cholesky factor
+  def _fit(self):
+    n = self.X.shape[0]
+    self._span = self.high-self.low
+    self._inv_l2 = 1.0/self.length_scales**2
+    self._y_mean, self._y_scale, Ys = _standardize(self.Y)
+    self._L_inv = np.linalg.solve(_cholesky(self.X, self._inv_l2), np.eye(n))
+    self._alpha = self._L_inv.T@(self._L_inv@Ys)
+    self._s2 = (Ys*self._alpha).sum(axis=0)/n
+
+  # return (mean, std) arrays of shape (k, outputs) at raw inputs x (k, inputs)
+  def predict_array(self, x):
+    u = (np.atleast_2d(x)-self.low)/self._span
+    k = _kernel(u, self.X, self._inv_l2)
+    mean = self._y_mean+(k@self._alpha)*self._y_scale
+    v = k@self._L_inv.T
+    var = np.maximum(1.0-(v*v).sum(axis=1), 0.0)
+    std = np.sqrt(var[:, None]*self._s2)*self._y_scale
+    return mean, std
+
+  # return ({output: mean}, {output: std}) at a point {input name: value}
+  def predict(self, point: dict):
+    mean, std = self.predict_array([[point[name] for name in self.names]])
+    return dict(zip(self.outputs, mean[0].tolist())), \
+           dict(zip(self.outputs, std[0].tolist()))
+
+  # True if x lies in the input box and every predicted std is within the
+  # error bound
+  def _in_trust_region(self, x, std):
+    return bool(np.all(x >= self.low) and np.all(x <= self.high) and \
+                np.all(std <= self.rel_std_tol*self._y_scale))
+
+  # return {output: value} at a point, from the surrogate inside its trust
+  # region and from the true model elsewhere; point may also set evaluator
+  # arguments that are not surrogate inputs
+  def query(self, point: dict):
+    self.n_queries += 1
+    x = np.array([point[name] for name in self.names], dtype=np.float64)
+    mean, std = self.predict_array(x[None, :])
+    if self._in_trust_region(x, std[0]):
+      return dict(zip(self.outputs, mean[0].tolist()))
+    if self.config is None or self.evaluator is None:
+      raise ValueError('Query outside the trust region and no true model is available')
+    self.n_fallbacks += 1
+    result = evaluate_point(self.config, point, self.evaluator, self.evaluator_kwargs)
+    return dict(zip(self.outputs, _output_array([result], self.outputs)[0].tolist()))
+
+  # write the surrogate and its true model description to an .npz file; the
+  # evaluator is stored by name, and evaluator_kwargs must be JSON data
+  def save(self, path):
+    meta = {
+      'names': self.names,
+      'outputs': self.outputs,
+      'config': self.config,
+      'evaluator': None if self.evaluator is None else _evaluator_name(self.evaluator),
+      'evaluator_kwargs': self.evaluator_kwargs,
+      'rel_std_tol': self.rel_std_tol
+    }
+    np.savez(path, meta=np.array(json.dumps(meta)), low=self.low, high=self.high,
+             X=self.X, Y=self.Y, length_scales=self.length_scales)
+
+  # read a surrogate written by save; evaluator replaces the stored evaluator,
+  # which is required for functions that cannot be imported by name (e.g.
+  # functions defined in a script)
+  @classmethod
+  def load(cls, path, evaluator=None):
+    with np.load(path, allow_pickle=False) as data:
+      meta = json.loads(str(data['meta']))
+      if evaluator is None and meta['evaluator'] is not None:
+        evaluator = _resolve_evaluator(meta['evaluator'])
+      return cls(meta['names'], data['low'], data['high'], meta['outputs'],
+                 data['X'], data['Y'], data['length_scales'], meta['config'],
+                 evaluator, meta['evaluator_kwargs'], meta['rel_std_tol'])
+
+# sample evaluator at Latin hypercube points of bounds and fit a surrogate
+#  config, evaluator, evaluator_kwargs: true model, as in sweep.run_sweep
+#  bounds   : {input name: (low, high)} of sweep point inputs
+#  outputs  : result keys to model; None for evaluators that return a number
+#  n_samples: training evaluations
+#  n_workers, cache_dir: sweep execution, as in sweep.run_sweep
+# samples where the evaluator returns None or a non-finite output are dropped
+def fit_surrogate(config, bounds: dict, evaluator, outputs=None, n_samples=64,
+                  evaluator_kwargs=None, seed=0, rel_std_tol=REL_STD_TOL,
+                  n_workers=1, cache_dir=None):
+  outputs = (VALUE,) if outputs is None else tuple(outputs)
+  names = tuple(bounds)
+  low = np.array([bounds[name][0] for name in names], dtype=np.float64)
+  high = np.array([bounds[name][1] for name in names], dtype=np.float64)
+  points = latin_hypercube(bounds, n_samples, seed)
+  results = run_sweep(config, points, evaluator, evaluator_kwargs,
+                      n_workers=n_workers, cache_dir=cache_dir)
+  Y = _output_array(results, outputs)
+  X = (np.array([[point[name] for name in names] for point in points])-low)/(high-low)
+  keep = np.all(np.isfinite(Y), axis=1)
+  X = X[keep]
+  Y = Y[keep]
+  # coordinate search of the length scales on the standardized outputs
+  Ys = _standardize(Y)[2]
+  length_scales = np.full(len(names), 0.5)
+  for i in range(LENGTH_SCALE_PASSES):
+    for j in range(len(names)):
+      candidates = []
+      for length_scale in LENGTH_SCALES:
+        trial = length_scales.copy()
+        trial[j] = length_scale
+        candidates.append(_log_likelihood(X, Ys, trial))
+      length_scales[j] = LENGTH_SCALES[int(np.argmax(candidates))]
+  if isinstance(config, str):
+    config = load_config(config)
+  return Surrogate(names, low, high, outputs, X, Y, length_scales, config,
+                   evaluator, evaluator_kwargs, rel_std_tol)
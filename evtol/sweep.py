@@ -0,0 +1,207 @@
+# sweep.py
+#
+# Python functions for design-space sweeps over aircraft, mission and ABU
+# inputs with parallel execution and on-disk result caching
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import concurrent.futures # ProcessPoolExecutor
+import hashlib            # sha256
+import inspect            # signature
+import itertools          # product
+import json               # dumps
+import os                 # makedirs, path, replace
+import pickle             # dump, load
+import sys                # not needed when using as a package
+import tempfile           # NamedTemporaryFile
+import numpy as np        # random generator
+
+# path to directory with other classes; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import SECTIONS
+from config import load_config
+
+# comment above and uncomment below when ready to deploy as package
+#from .aircraft import Aircraft
+#from .batch import SECTIONS
+#from .config import load_config
+
+# points evaluated per worker task by default
+CHUNK_SIZE = 16
+
+# A sweep point is a dict {name: value} where each name is either
+#  - a JSON specification field (e.g. 'max_takeoff_mass_kg', 'cruise_s',
+#    'batt_spec_energy_w_h_p_kg'), applied before the aircraft is built
+#  - an evaluator keyword argument (e.g. 'n_abu_pool'), or a key of a dict
+#    keyword argument written as 'argument.key' (e.g. 'abu_spec.n_abus')
+# An evaluator is the name of an Aircraft method (e.g. '_evaluate_extended_flight')
+# or a module-level function evaluator(aircraft, **kwargs); functions are sent
+# to worker processes by reference, so they cannot be lambdas or closures
+
+# return the points of a full-factorial grid as a list of {name: value}
+# axes: {name: list of values}; the last axis varies fastest, e.g.
+#  grid({'n_abus': [1, 2], 'cruise_s': [600.0, 900.0]})
+def grid(axes: dict):
+  names = list(axes)
+  return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+# return n_points Latin hypercube samples as a list of {name: value}
+# bounds: {name: (low, high)}; each input's range is split into n_points equal
+# strata and every stratum is sampled exactly once
+def latin_hypercube(bounds: dict, n_points, seed=None):
+  rng = np.random.default_rng(seed)
+  points = [{} for i in range(n_points)]
+  for name, (low, high) in bounds.items():
+    u = (rng.permutation(n_points)+rng.random(n_points))/n_points
+    for point, value in zip(points, low+u*(high-low)):
+      point[name] = float(value)
+  return points
+
+# return the keyword argument names of an evaluator, or None if it accepts any
+def _evaluator_arguments(evaluator):
+  function = getattr(Aircraft, evaluator) if isinstance(evaluator, str) else evaluator
+  parameters = list(inspect.signature(function).parameters.values())[1:]
+  if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters):
+    return None
+  return {p.name for p in parameters}
+
+# split a point into a JSON specification with the point's specification fields
+# replaced and the evaluator keyword arguments; ijson and kwargs are not modified
+# with an evaluator, a name that is neither a specification field nor one of
+# its keyword arguments raises ValueError
+def apply_point(ijson: dict, kwargs: dict, point: dict, evaluator=None):
+  arguments = None if evaluator is None else _evaluator_arguments(evaluator)
+  spec = dict(ijson)
+  kwargs = dict(kwargs)
+  for name, value in point.items():
+    section = next((s for s in SECTIONS if name in ijson.get(s, {})), None)
+    if section is not None:
+      if spec[section] is ijson[section]:
+        spec[section] = dict(ijson[section])
+      spec[section][name] = value
+      continue
+    argument = name.split('.', 1)[0]
+    if arguments is not None and argument not in arguments:
+      raise ValueError(
+          f"Unknown sweep field '{name}': not a specification field or a "
+          f"keyword argument of the evaluator"
+      )
+    if '.' in name:
+      key = name.split('.', 1)[1]
+      kwargs[argument] = dict(kwargs.get(argument) or {})
+      kwargs[argument][key] = value
+    else:
+      kwargs[name] = value
+  return spec, kwargs
+
+# return the cache key of a point: a content hash of the specification,
+# evaluator, shared keyword arguments and point
+# the hash covers inputs only; clear the cache directory when the model changes
+def sweep_key(ijson: dict, evaluator, kwargs: dict, point: dict):
+  if isinstance(evaluator, str):
+    evaluator_name = 'Aircraft.'+evaluator
+  else:
+    evaluator_name = evaluator.__module__+'.'+evaluator.__qualname__
+  content = json.dumps(
+    [ijson, evaluator_name, kwargs, point], sort_keys=True, default=repr
+  )
+  return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+# evaluate the points of one task; consecutive points with the same
+# specification share one aircraft, each evaluated on a what-if copy so that
+# evaluators that modify their aircraft do not affect later points
+def _evaluate_chunk(ijson, evaluator, kwargs, points):
+  results = []
+  last_spec = None
+  aircraft = None
+  for point in points:
+    spec, point_kwargs = apply_point(ijson, kwargs, point, evaluator)
+    if aircraft is None or spec != last_spec:
+      aircraft = Aircraft.from_dict(spec)
+      last_spec = spec
+    view = aircraft.with_overrides()
+    if isinstance(evaluator, str):
+      results.append(getattr(view, evaluator)(**point_kwargs))
+    else:
+      results.append(evaluator(view, **point_kwargs))
+  return results
+
+# evaluate evaluator at one point in this process and return its result
+def evaluate_point(config, point, evaluator, evaluator_kwargs=None):
+  ijson = load_config(config) if isinstance(config, str) else config
+  return _evaluate_chunk(ijson, evaluator, dict(evaluator_kwargs or {}), [point])[0]
+
+# sweep state of a worker process, set once per worker by _init_worker
+_WORKER = {}
+
+def _init_worker(ijson, evaluator, kwargs):
+  _WORKER['args'] = (ijson, evaluator, kwargs)
+
+def _evaluate_worker_chunk(points):
+  return _evaluate_chunk(*_WORKER['args'], points)
+
+def _cache_path(cache_dir, key):
+  return os.path.join(cache_dir, key[:2], key+'.pkl')
+
+# write a result file atomically, so concurrent sweeps sharing cache_dir never
+# read a partial file
+def _write_cached(path, result):
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp_file:
+    pickle.dump(result, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+  os.replace(tmp_file.name, path)
+
+# evaluate evaluator at every point and return the results in point order
+#  config          : path to a JSON specification or a parsed specification
+#  points          : iterable of {name: value}, e.g. from grid or latin_hypercube
+#  evaluator       : Aircraft method name or module-level function (see above)
+#  evaluator_kwargs: keyword arguments shared by all points
+#  n_workers       : worker processes; 1 evaluates in this process, None uses
+#                    one per CPU
+#  chunk_size      : points per worker task
+#  cache_dir       : directory of memoized results; points already evaluated
+#                    with the same inputs are read instead of recomputed
+# evaluator results must be picklable; scripts that use n_workers != 1 must
+# guard their top-level code with if __name__ == '__main__'
+def run_sweep(config, points, evaluator, evaluator_kwargs=None, n_workers=None,
+              chunk_size=CHUNK_SIZE, cache_dir=None):
+  ijson = load_config(config) if isinstance(config, str) else config
+  kwargs = dict(evaluator_kwargs or {})
+  points = list(points)
+  results = [None]*len(points)
+  paths = [None]*len(points)
+  pending = []
+  for i, point in enumerate(points):
+    if cache_dir is not None:
+      paths[i] = _cache_path(cache_dir, sweep_key(ijson, evaluator, kwargs, point))
+      if os.path.exists(paths[i]):
+        with open(paths[i], 'rb') as cache_file:
+          results[i] = pickle.load(cache_file)
+        continue
+    pending.append(i)
+  chunks = [pending[k:k+chunk_size] for k in range(0, len(pending), chunk_size)]
+  chunk_points = [[points[i] for i in chunk] for chunk in chunks]
+  if n_workers == 1 or len(chunks) <= 1:
+    chunk_results = (_evaluate_chunk(ijson, evaluator, kwargs, cp) for cp in chunk_points)
+    _store_results(chunks, chunk_results, results, paths)
+  else:
+    with concurrent.futures.ProcessPoolExecutor(
+      max_workers=n_workers, initializer=_init_worker,
+      initargs=(ijson, evaluator, kwargs)
+    ) as executor:
+      chunk_results = executor.map(_evaluate_worker_chunk, chunk_points)
+      _store_results(chunks, chunk_results, results, paths)
+  return results
+
+# place chunk results in point order and memoize them as they arrive
+def _store_results(chunks, chunk_results, results, paths):
+  for chunk, values in zip(chunks, chunk_results):
+    for i, value in zip(chunk, values):
+      results[i] = value
+      if paths[i] is not None:
+        _write_cached(paths[i], value)
@@ -0,0 +1,139 @@
+# timeline.py
+#
+# A Python class containing a compact, columnar event timeline
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import array # array
+import csv   # writer
+import numpy # frombuffer, load, savez, zeros
+
+# typecodes of the stored columns
+T_HR_TYPECODE  = 'd'                                           # float64
+EVENT_TYPECODE = 'h'                                           # int16
+INT_TYPECODE   = 'i' if array.array('i').itemsize == 4 else 'l' # int32
+
+# value stored in an integer column when the event has no such index
+MISSING_INDEX = -1
+
+# TimelineColumns class
+# events are stored as typed columns instead of one dict per event:
+#  t_hr            : event time [hr] (float64)
+#  event           : event code (int16); event_names[code] is the event name
+#  <int_columns>   : e.g. flight_index, abu_index (int32; MISSING_INDEX if none)
+# rows append in O(1) and use 10 + 4*len(int_columns) bytes each
+class TimelineColumns:
+  # class constructor
+  def __init__(self, int_columns=('flight_index',), event_names=()):
+    self.int_columns = tuple(int_columns)
+    self.event_names = []
+    self._event_codes = {}
+    for name in event_names:
+      self.event_code(name)
+    self.t_hr = array.array(T_HR_TYPECODE)
+    self.event = array.array(EVENT_TYPECODE)
+    self.columns = {name: array.array(INT_TYPECODE) for name in self.int_columns}
+    self._int_arrays = [self.columns[name] for name in self.int_columns]
+
+  # return the code of event name, registering it if new
+  def event_code(self, name):
+    code = self._event_codes.get(name)
+    if code is None:
+      code = len(self.event_names)
+      self.event_names.append(name)
+      self._event_codes[name] = code
+    return code
+
+  # append one event; values are given in int_columns order
+  def append(self, t_hr, event_code, *values):
+    self.t_hr.append(t_hr)
+    self.event.append(event_code)
+    for column, value in zip(self._int_arrays, values):
+      column.append(MISSING_INDEX if value is None else value)
+
+  def __len__(self):
+    return len(self.t_hr)
+
+  # return {column name: NumPy array} copied from the stored columns
+  def arrays(self):
+    out = {
+      't_hr': numpy.frombuffer(self.t_hr, dtype=numpy.float64).copy(),
+      'event': numpy.frombuffer(self.event, dtype=numpy.int16).copy(),
+    }
+    for name in self.int_columns:
+      out[name] = numpy.frombuffer(self.columns[name], dtype=numpy.int32).copy()
+    return out
+
+  # return the timeline as a NumPy structured array
+  def to_numpy(self):
+    dtype = [('t_hr', 'f8'), ('event', 'i2')]+[(name, 'i4') for name in self.int_columns]
+    out = numpy.zeros(len(self), dtype=dtype)
+    for name, values in self.arrays().items():
+      out[name] = values
+    return out
+
+  # return the timeline as one dict per event, matching the dict timelines
+  # (missing indices are omitted)
+  def to_dicts(self):
+    rows = []
+    for k in range(len(self)):
+      row = {"t_hr": self.t_hr[k], "event": self.event_names[self.event[k]]}
+      for name, column in zip(self.int_columns, self._int_arrays):
+        if column[k] != MISSING_INDEX:
+          row[name] = column[k]
+      rows.append(row)
+    return rows
+
+  # write the timeline to a CSV file with event names and blank missing indices
+  # extra: optional {column name: constant value} prepended to every row
+  def write_csv(self, path, extra=None, write_header=True, mode='w'):
+    extra = extra or {}
+    extra_values = list(extra.values())
+    names = self.event_names
+    with open(path, mode=mode, newline='') as csv_file:
+      writer = csv.writer(csv_file)
+      if write_header:
+        writer.writerow(list(extra.keys())+['t_hr', 'event']+list(self.int_columns))
+      int_arrays = self._int_arrays
+      for k in range(len(self)):
+        writer.writerow(
+          extra_values+[f"{self.t_hr[k]:.6f}", names[self.event[k]]]+
+          ['' if column[k] == MISSING_INDEX else column[k] for column in int_arrays]
+        )
+
+  # write the timeline to an uncompressed NumPy .npz archive
+  def write_npz(self, path):
+    numpy.savez(path, event_names=numpy.array(self.event_names, dtype=str), **self.arrays())
+
+  # read a timeline written by write_npz
+  @classmethod
+  def read_npz(cls, path):
+    with numpy.load(path) as data:
+      int_columns = [name for name in data.files if name not in ('t_hr', 'event', 'event_names')]
+      timeline = cls(int_columns, [str(name) for name in data['event_names']])
+      timeline.t_hr.frombytes(data['t_hr'].astype(numpy.float64).tobytes())
+      timeline.event.frombytes(data['event'].astype(numpy.int16).tobytes())
+      for name in int_columns:
+        timeline.columns[name].frombytes(data[name].astype(numpy.int32).tobytes())
+    return timeline
+
+  # write the timeline to a Parquet file with a dictionary-encoded event column
+  # requires the optional pyarrow package
+  def write_parquet(self, path):
+    import pyarrow         # not a required dependency
+    import pyarrow.parquet # write_table
+    arrays = self.arrays()
+    table = {
+      't_hr': pyarrow.array(arrays['t_hr']),
+      'event': pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(arrays['event']),
+        pyarrow.array(self.event_names, type=pyarrow.string())
+      ),
+    }
+    for name in self.int_columns:
+      table[name] = pyarrow.array(arrays[name], mask=(arrays[name] == MISSING_INDEX))
+    pyarrow.parquet.write_table(pyarrow.table(table), path)
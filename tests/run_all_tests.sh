@@ -18,8 +18,27 @@
 #
 # See the LICENSE file for the license
 
+python3 test_cache.py
+python3 test_config.py
 python3 test_environ.py
+python3 test_fleet.py
 python3 test_mission.py
 python3 test_power.py
 python3 test_propulsion.py
 python3 test_aircraft.py
+python3 test_power_profile.py
+python3 test_batch.py
+python3 test_charging.py
+python3 test_queuing.py
+python3 test_timeline.py
+python3 test_record.py
+python3 test_sweep.py
+python3 test_optimize.py
+python3 test_surrogate.py
+python3 test_profiler.py
+python3 test_integrator.py
+python3 test_montecarlo.py
+python3 test_sensitivity.py
+python3 test_payload_range.py
+python3 test_atmosphere.py
+python3 test_hot_high.py
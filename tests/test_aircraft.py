@@ -8,12 +8,17 @@
 # See the LICENSE file for the license
 
 # import Python modules
-import sys      # not needed when using as a package
-import unittest # unittest
+import concurrent.futures # ThreadPoolExecutor
+import copy               # deepcopy
+import sys                # not needed when using as a package
+import unittest           # unittest
+import warnings           # catch_warnings
+import numpy as np        # exceptions
 
 # path to directory containing Aircraft class; use before deploying as package
 sys.path.append('../evtol')
 from aircraft import Aircraft
+from config import load_config
 from environ import Environ
 from mission import Mission
 from power import Power
@@ -21,6 +26,7 @@ from propulsion import Propulsion
 
 # comment above and uncomment below when ready to deploy as package
 #from ..evtol.aircraft import Aircraft
+#from ..evtol.config import load_config
 #from ..evtol.environ import Environ
 #from ..evtol.mission import Mission
 #from ..evtol.power import Power
@@ -96,6 +102,141 @@ class TestAircraft(unittest.TestCase):
     self.assertEqual(
      aircraft.propulsion,Propulsion('../sample-inputs/test-all.json')
     )
-    
+
+  def test_aircraft_cache_mtow_invalidation(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    energy_kw_hr = aircraft.total_mission_energy_kw_hr
+    fuselage_cd0_p_cf = aircraft.fuselage_cd0_p_cf
+    aircraft.max_takeoff_mass_kg = 3500.0
+    reference = Aircraft('../sample-inputs/test-all.json')
+    reference._cache.enabled = False
+    reference.max_takeoff_mass_kg = 3500.0
+    self.assertNotEqual(aircraft.total_mission_energy_kw_hr, energy_kw_hr)
+    self.assertEqual(
+     aircraft.total_mission_energy_kw_hr, reference.total_mission_energy_kw_hr
+    )
+    self.assertEqual(aircraft.empty_mass_kg, reference.empty_mass_kg)
+    # MTOW-independent quantities survive the MTOW change
+    self.assertTrue(aircraft._cache.is_cached('fuselage_cd0_p_cf'))
+    self.assertEqual(aircraft.fuselage_cd0_p_cf, fuselage_cd0_p_cf)
+
+  def test_aircraft_rotor_hub_mass_count(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    m_kg = aircraft._calc_lift_rotor_hub_mass_kg()
+    self.assertEqual(m_kg, aircraft.lift_rotor_hub_mass_kg)
+    n = aircraft.propulsion.lift_rotor_count
+    self.assertAlmostEqual(aircraft._calc_lift_rotor_hub_mass_kg(1)*n, m_kg, places=9)
+    self.assertEqual(aircraft.propulsion.lift_rotor_count, n)
+
+  def test_aircraft_segment_energy_override(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    energy_kw_hr = aircraft.hover_descend_energy_kw_hr
+    ijson = copy.deepcopy(load_config('../sample-inputs/test-all.json'))
+    ijson['mission']['hover_descend_s'] = 45.0
+    reference = Aircraft.from_dict(ijson)
+    self.assertEqual(
+     aircraft.segment_energy_kw_hr('hover_descend', 45.0),
+     reference.hover_descend_energy_kw_hr
+    )
+    # the aircraft and its cached quantities are unchanged
+    self.assertEqual(aircraft.mission.hover_descend_s, 12.0)
+    self.assertTrue(aircraft._cache.is_cached('hover_descend_energy_kw_hr'))
+    self.assertEqual(aircraft.segment_energy_kw_hr('hover_descend'), energy_kw_hr)
+
+  def test_aircraft_with_overrides(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    empty_mass_kg = aircraft.empty_mass_kg
+    aircraft.fuselage_cd0_p_cf
+    view = aircraft.with_overrides(max_takeoff_mass_kg=3500.0)
+    # MTOW-independent quantities are shared, the rest are recomputed
+    self.assertTrue(view._cache.is_cached('fuselage_cd0_p_cf'))
+    self.assertFalse(view._cache.is_cached('empty_mass_kg'))
+    reference = Aircraft('../sample-inputs/test-all.json')
+    reference.max_takeoff_mass_kg = 3500.0
+    self.assertEqual(view.empty_mass_kg, reference.empty_mass_kg)
+    self.assertEqual(aircraft.max_takeoff_mass_kg, 3175.0)
+    self.assertEqual(aircraft.empty_mass_kg, empty_mass_kg)
+    # inputs without recorded dependencies recompute everything
+    view = aircraft.with_overrides(wingspan_m=16.0)
+    ijson = copy.deepcopy(load_config('../sample-inputs/test-all.json'))
+    ijson['aircraft']['wingspan_m'] = 16.0
+    self.assertEqual(view.empty_mass_kg, Aircraft.from_dict(ijson).empty_mass_kg)
+    with self.assertRaises(ValueError):
+      aircraft.with_overrides(empty_mass_kg=1000.0)
+
+  def test_aircraft_mtow_sensitivities(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    mtow_kg, history, sensitivities = aircraft._iterate_mtow(sensitivities=True)
+    self.assertEqual(aircraft.max_takeoff_mass_kg, mtow_kg)
+    self.assertNotIn('max_takeoff_mass_kg', sensitivities)
+    self.assertEqual(len(sensitivities), 90)
+    # central differences of the fully converged sizing loop
+    ijson = load_config('../sample-inputs/test-all.json')
+    for section, name in (('aircraft', 'payload_kg'), ('aircraft', 'wingspan_m'),
+                          ('mission', 'cruise_s'), ('power', 'batt_spec_energy_w_h_p_kg'),
+                          ('propulsion', 'rotor_diameter_m')):
+      h = 1e-5*ijson[section][name]
+      sized_kg = []
+      for value in (ijson[section][name]+h, ijson[section][name]-h):
+        perturbed = copy.deepcopy(ijson)
+        perturbed[section][name] = value
+        sized_kg.append(Aircraft.from_dict(perturbed)._iterate_mtow(tol=1e-9)[0])
+      fd = (sized_kg[0]-sized_kg[1])/(2.0*h)
+      self.assertAlmostEqual(sensitivities[name], fd, delta=1e-5*abs(fd), msg=name)
+    self.assertEqual(len(Aircraft('../sample-inputs/test-all.json')._iterate_mtow()), 2)
+    # no sensitivities without a converged fixed point
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    mtow_kg, history, sensitivities = aircraft._iterate_mtow(max_iter=1, sensitivities=True)
+    self.assertGreater(abs(history[-1]['delta_kg']), 1e-3)
+    self.assertEqual(aircraft.max_takeoff_mass_kg, mtow_kg)
+    self.assertIsNone(sensitivities)
+
+  def test_aircraft_isa_mtow_sensitivities(self):
+    ijson = copy.deepcopy(load_config('../sample-inputs/test-all.json'))
+    ijson['environ'] = {
+     'g_m_p_s2': 9.81, 'atmosphere': 'isa', 'field_alt_m': 457.2, 'max_alt_m': 1371.6,
+     'temp_offset_k': 15.0
+    }
+    with warnings.catch_warnings():
+      warnings.simplefilter('error', np.exceptions.ComplexWarning)
+      mtow_kg, history, sensitivities = \
+       Aircraft.from_dict(ijson)._iterate_mtow(sensitivities=True)
+    # the air properties follow the altitudes and are not inputs themselves
+    self.assertNotIn('air_density_sea_lvl_kg_p_m3', sensitivities)
+    for name in ('field_alt_m', 'max_alt_m', 'temp_offset_k'):
+      h = 1e-3
+      sized_kg = []
+      for value in (ijson['environ'][name]+h, ijson['environ'][name]-h):
+        perturbed = copy.deepcopy(ijson)
+        perturbed['environ'][name] = value
+        sized_kg.append(Aircraft.from_dict(perturbed)._iterate_mtow(tol=1e-11)[0])
+      fd = (sized_kg[0]-sized_kg[1])/(2.0*h)
+      self.assertNotEqual(fd, 0.0)
+      self.assertAlmostEqual(sensitivities[name], fd, delta=1e-5*abs(fd), msg=name)
+
+  def test_aircraft_evaluators_keep_mtow(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    aircraft._evaluate_extended_flight([5.0, 10.0])
+    aircraft._evaluate_landing_safety_divert_baseline(10.0, 300.0, 30.0)
+    self.assertEqual(aircraft.max_takeoff_mass_kg, 3175.0)
+
+  def test_aircraft_evaluators_thread_pool(self):
+    def run(n_abus):
+      aircraft = Aircraft('../sample-inputs/test-all.json')
+      abu_spec = {
+        "n_abus": n_abus, "E_ops_kwh_per_abu": 1.0,
+        "struct_frac": 0.20, "integration_frac": 0.05,
+      }
+      return (
+        aircraft._evaluate_landing_safety_loiter([5.0, 10.0, 20.0], 10.0, 300.0, 30.0*n_abus, abu_spec),
+        aircraft._evaluate_landing_safety_divert_baseline(10.0, 300.0, 30.0*n_abus),
+        aircraft._evaluate_extended_flight([5.0, 10.0, 20.0], dict(abu_spec, E_ops_kwh_per_abu=0.5)),
+        aircraft.empty_mass_kg,
+      )
+    n_abus_list = [1, 2, 3, 4]*3
+    expected = [run(n_abus) for n_abus in n_abus_list]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+      self.assertEqual(list(pool.map(run, n_abus_list)), expected)
+
 if __name__ == '__main__':
   unittest.main()
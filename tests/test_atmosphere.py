@@ -0,0 +1,114 @@
+# test_atmosphere.py
+#
+# Tests ISA atmosphere functions and the AtmosphereTable class
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import unittest    # unittest
+import warnings    # catch_warnings
+import numpy as np # arrays
+
+# path to directory containing atmosphere module; use before deploying as package
+sys.path.append('../evtol')
+from atmosphere import ISA_TABLE, AtmosphereTable, calc_isa, calc_segment_air_density_kg_p_m3, \
+ calc_segment_mid_height_m
+from config import load_config
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.atmosphere import ISA_TABLE, AtmosphereTable, calc_isa, \
+# calc_segment_air_density_kg_p_m3, calc_segment_mid_height_m
+#from ..evtol.config import load_config
+
+class TestAtmosphere(unittest.TestCase):
+  def test_isa_standard_values(self):
+    sea_level = calc_isa(0.0)
+    self.assertAlmostEqual(float(sea_level['air_density_kg_p_m3']), 1.225, places=4)
+    self.assertAlmostEqual(float(sea_level['sound_speed_m_p_s']), 340.294, places=3)
+    self.assertAlmostEqual(float(sea_level['kinematic_viscosity_m2_p_s']), 1.4607e-5, places=8)
+    tropopause = calc_isa(11000.0)
+    self.assertAlmostEqual(float(tropopause['temperature_k']), 216.65, places=6)
+    self.assertAlmostEqual(float(tropopause['air_density_kg_p_m3']), 0.36392, places=5)
+    # pressure is continuous across the tropopause
+    self.assertAlmostEqual(
+     float(calc_isa(11000.0-1e-6)['pressure_pa']), float(calc_isa(11000.0+1e-6)['pressure_pa']),
+     places=3
+    )
+    # a hot day keeps the pressure and lowers the density
+    hot = calc_isa(1000.0, 20.0)
+    self.assertEqual(float(hot['pressure_pa']), float(calc_isa(1000.0)['pressure_pa']))
+    self.assertLess(float(hot['air_density_kg_p_m3']), float(calc_isa(1000.0)['air_density_kg_p_m3']))
+
+  def test_table_matches_analytic(self):
+    rng = np.random.default_rng(0)
+    alt_m = rng.uniform(-1000.0, 20000.0, 10000)
+    temp_offset_k = rng.uniform(-30.0, 40.0, 10000)
+    analytic = calc_isa(alt_m, temp_offset_k)
+    table = ISA_TABLE.lookup(alt_m, temp_offset_k)
+    for name, values in analytic.items():
+      np.testing.assert_allclose(table[name], values, rtol=1e-6, err_msg=name)
+    np.testing.assert_allclose(
+     ISA_TABLE.air_density_kg_p_m3(alt_m, temp_offset_k), analytic['air_density_kg_p_m3'],
+     rtol=1e-6
+    )
+    # grid points are exact, altitudes beyond the table are clamped
+    coarse = AtmosphereTable(0.0, 5000.0, 500.0)
+    self.assertEqual(
+     float(coarse.lookup(1500.0)['pressure_pa']), float(calc_isa(1500.0)['pressure_pa'])
+    )
+    self.assertEqual(
+     float(coarse.air_density_kg_p_m3(9000.0)), float(coarse.air_density_kg_p_m3(5000.0))
+    )
+
+  def test_complex_step(self):
+    h = 1e-30
+    alt_m = np.array([457.2, 1371.6, 12345.6])
+    with warnings.catch_warnings():
+      warnings.simplefilter('error', np.exceptions.ComplexWarning)
+      table = ISA_TABLE.lookup(alt_m+1j*h, 15.0+1j*h)
+      analytic = calc_isa(alt_m+1j*h, 15.0)
+      clamped = ISA_TABLE.air_density_kg_p_m3(25000.0+1j*h)
+    # slopes of the table cells and of the analytic atmosphere (altitude plus
+    # temperature offset for the table)
+    d_m = 1e-3
+    above = ISA_TABLE.lookup(alt_m+d_m, 15.0+d_m)
+    below = ISA_TABLE.lookup(alt_m-d_m, 15.0-d_m)
+    for name, values in table.items():
+      np.testing.assert_allclose(values.real, ISA_TABLE.lookup(alt_m, 15.0)[name], rtol=1e-15)
+      np.testing.assert_allclose(values.imag/h, (above[name]-below[name])/(2.0*d_m),
+                                 rtol=1e-6, err_msg=name)
+    np.testing.assert_allclose(
+     analytic['air_density_kg_p_m3'].imag/h,
+     (calc_isa(alt_m+d_m, 15.0)['air_density_kg_p_m3']-
+      calc_isa(alt_m-d_m, 15.0)['air_density_kg_p_m3'])/(2.0*d_m), rtol=1e-6
+    )
+    # the density is constant beyond the table
+    self.assertEqual(clamped.imag, 0.0)
+
+  def test_segment_air_density(self):
+    mission = load_config('../sample-inputs/test-all.json')['mission']
+    height_m = calc_segment_mid_height_m(mission)
+    self.assertEqual(height_m['depart_taxi'], 0.0)
+    self.assertEqual(height_m['arrive_taxi'], 0.0)
+    self.assertAlmostEqual(
+     height_m['hover_climb'], 0.5*mission['hover_climb_avg_v_m_p_s']*mission['hover_climb_s']
+    )
+    self.assertLess(height_m['trans_climb'], height_m['accel_climb'])
+    self.assertLess(height_m['accel_climb'], height_m['cruise'])
+    self.assertLess(height_m['trans_descend'], height_m['decel_descend'])
+    density = calc_segment_air_density_kg_p_m3(mission, 500.0, 1500.0, 10.0)
+    self.assertEqual(set(density), set(height_m))
+    self.assertEqual(float(density['cruise']), float(ISA_TABLE.air_density_kg_p_m3(1500.0, 10.0)))
+    self.assertEqual(float(density['depart_taxi']), float(ISA_TABLE.air_density_kg_p_m3(500.0, 10.0)))
+    self.assertLess(float(density['accel_climb']), float(density['hover_climb']))
+    # arrays of fields and offsets broadcast
+    density = calc_segment_air_density_kg_p_m3(mission, np.array([0.0, 2000.0]), 3000.0, 0.0)
+    self.assertEqual(density['hover_climb'].shape, (2,))
+    self.assertGreater(density['hover_climb'][0], density['hover_climb'][1])
+
+if __name__ == '__main__':
+  unittest.main()
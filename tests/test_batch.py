@@ -0,0 +1,165 @@
+# test_batch.py
+#
+# Tests vectorized batch mission energy and MTOW sizing functions
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy     # deepcopy
+import sys      # not needed when using as a package
+import unittest # unittest
+
+# path to directory containing batch module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from atmosphere import ISA_DERIVED_FIELDS
+from batch import broadcast_params, calc_batch_abu_detach, calc_batch_common_case_baseline, \
+ calc_batch_mission_energy, params_from_aircraft, params_from_config, solve_batch_mtow
+from config import load_config
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.atmosphere import ISA_DERIVED_FIELDS
+#from ..evtol.batch import broadcast_params, calc_batch_abu_detach, calc_batch_common_case_baseline, \
+# calc_batch_mission_energy, params_from_aircraft, params_from_config, solve_batch_mtow
+#from ..evtol.config import load_config
+
+# (section, field, values) perturbations checked against the scalar model
+PERTURBATIONS = [
+ ('aircraft', 'max_takeoff_mass_kg', [2500.0, 3000.0, 3500.0]),
+ ('aircraft', 'wingspan_m', [10.0, 12.0, 14.0]),
+ ('mission', 'cruise_s', [300.0, 664.0, 1200.0]),
+ ('mission', 'decel_descend_v_m_p_s', [2.0, 5.1, 8.0]),
+ ('power', 'batt_spec_energy_w_h_p_kg', [200.0, 250.0, 300.0]),
+ ('propulsion', 'rotor_diameter_m', [2.5, 3.0, 3.5])
+]
+
+class TestBatch(unittest.TestCase):
+  def setUp(self):
+    self.ijson = load_config('../sample-inputs/test-all.json')
+
+  def assert_matches_aircraft(self, result, i, ijson):
+    aircraft = Aircraft.from_dict(ijson)
+    for name, values in result.items():
+      self.assertAlmostEqual(
+       float(values[i]), getattr(aircraft, name),
+       delta=1e-9*max(1.0, abs(getattr(aircraft, name))), msg=name
+      )
+
+  def test_params_from_aircraft(self):
+    params = params_from_aircraft(Aircraft.from_dict(self.ijson))
+    # every JSON field plus the derived propulsion disk area
+    self.assertEqual(set(params)-set(params_from_config(self.ijson)), {'disk_area_m2'})
+    for name, value in params_from_config(self.ijson).items():
+      self.assertEqual(params[name], value, msg=name)
+
+  def test_batch_matches_aircraft(self):
+    for section, field, values in PERTURBATIONS:
+      params = params_from_config(self.ijson)
+      params[field] = values
+      result = calc_batch_mission_energy(params)
+      self.assertEqual(result['battery_mass_kg'].shape, (len(values),))
+      for i, value in enumerate(values):
+        ijson = copy.deepcopy(self.ijson)
+        ijson[section][field] = value
+        self.assert_matches_aircraft(result, i, ijson)
+
+  def test_batch_mtow_fixed_point_matches_aircraft(self):
+    params = params_from_config(self.ijson)
+    params['payload_kg'] = [300.0, 400.0, 500.0]
+    result = solve_batch_mtow(params, method='fixed_point')
+    for i, payload_kg in enumerate(params['payload_kg']):
+      ijson = copy.deepcopy(self.ijson)
+      ijson['aircraft']['payload_kg'] = payload_kg
+      mtow_kg, history = Aircraft.from_dict(ijson)._iterate_mtow()
+      self.assertAlmostEqual(
+       result['max_takeoff_mass_kg'][i], mtow_kg, delta=1e-9*mtow_kg
+      )
+      self.assertEqual(result['iterations'][i], len(history))
+      self.assertTrue(result['converged'][i])
+      self.assertFalse(result['diverged'][i])
+
+  def test_batch_isa_matches_aircraft(self):
+    ijson = copy.deepcopy(self.ijson)
+    ijson['environ'] = {
+     'g_m_p_s2': 9.81, 'atmosphere': 'isa', 'field_alt_m': 1000.0, 'max_alt_m': 1500.0,
+     'temp_offset_k': 20.0
+    }
+    aircraft = Aircraft.from_dict(ijson)
+    params = params_from_config(ijson)
+    aircraft_params = params_from_aircraft(aircraft)
+    # the air properties are left to broadcast_params
+    self.assertEqual(set(params)-set(aircraft_params), set(ISA_DERIVED_FIELDS))
+    for name, value in params.items():
+      self.assertEqual(broadcast_params(aircraft_params)[name], value, msg=name)
+    self.assert_matches_aircraft(calc_batch_mission_energy(params), (), ijson)
+    # segment densities at mid-segment altitude, below the field density
+    density = aircraft.segment_air_density_kg_p_m3
+    self.assertLess(density['accel_climb'], density['depart_taxi'])
+    self.assertEqual(density['cruise'], aircraft.environ.air_density_max_alt_kg_p_m3)
+    mtow_kg, history = aircraft._iterate_mtow()
+    result = solve_batch_mtow(params, method='fixed_point')
+    self.assertAlmostEqual(float(result['max_takeoff_mass_kg']), mtow_kg, delta=1e-9*mtow_kg)
+    self.assertEqual(int(result['iterations']), len(history))
+
+  def test_batch_mtow_secant(self):
+    params = params_from_config(self.ijson)
+    params['payload_kg'] = [300.0, 400.0, 500.0]
+    fixed_point = solve_batch_mtow(params, method='fixed_point')
+    secant = solve_batch_mtow(params, method='secant')
+    self.assertTrue(secant['converged'].all())
+    self.assertTrue(
+     (secant['iterations'] < fixed_point['iterations']).all()
+    )
+    for i in range(3):
+      self.assertAlmostEqual(
+       secant['max_takeoff_mass_kg'][i],
+       fixed_point['max_takeoff_mass_kg'][i], delta=1e-2
+      )
+
+  def test_batch_mtow_diverged(self):
+    params = params_from_config(self.ijson)
+    params['batt_spec_energy_w_h_p_kg'] = [250.0, 5.0]
+    for method in ('fixed_point', 'secant'):
+      result = solve_batch_mtow(params, method=method)
+      self.assertEqual(list(result['converged']), [True, False])
+      self.assertEqual(list(result['diverged']), [False, True])
+
+  def test_batch_abu_detach_matches_aircraft(self):
+    segments = ['depart_taxi', 'hover_climb', 'trans_climb', 'depart_proc', 'accel_climb']
+    abu_spec = {'n_abus': 2, 'E_mission_kwh_per_abu': 30.0, 'E_ops_kwh_per_abu': 1.0,
+                'm_struct_kg_per_abu': 20.0, 'm_integration_kg_per_abu': 2.0}
+    params = params_from_config(self.ijson)
+    params['max_takeoff_mass_kg'] = [2800.0, 3175.0]
+    for spec in (None, abu_spec):
+      for candidate in (segments, segments[:2]):
+        result = calc_batch_abu_detach(params, candidate, spec)
+        for i, mtow_kg in enumerate(params['max_takeoff_mass_kg']):
+          ijson = copy.deepcopy(self.ijson)
+          ijson['aircraft']['max_takeoff_mass_kg'] = mtow_kg
+          expected = Aircraft.from_dict(ijson).evaluate_abu_detach_candidates(
+           [{'name': 'candidate', 'segments': candidate}], spec
+          )[0]
+          for name, values in result.items():
+            self.assertAlmostEqual(float(values[i]), expected[name],
+                                   delta=1e-9*max(1.0, abs(expected[name])), msg=name)
+
+  def test_batch_common_case_baseline_matches_aircraft(self):
+    params = params_from_config(self.ijson)
+    params['max_takeoff_mass_kg'] = [2500.0, 3175.0, 4000.0]
+    for kwargs in ({}, {'P_charger_ac_kw': 50.0, 'daily_operation_hr': 12.0},
+                   {'soc_target': 0.9, 'soc_cc_end': 0.95}):
+      result = calc_batch_common_case_baseline(params, **kwargs)
+      for i, mtow_kg in enumerate(params['max_takeoff_mass_kg']):
+        ijson = copy.deepcopy(self.ijson)
+        ijson['aircraft']['max_takeoff_mass_kg'] = mtow_kg
+        expected = Aircraft.from_dict(ijson)._evaluate_common_case_baseline(**kwargs)
+        for name, values in result.items():
+          self.assertAlmostEqual(float(values[i]), expected[name],
+                                 delta=1e-9*max(1.0, abs(expected[name])), msg=name)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,84 @@
+# test_cache.py
+#
+# Tests DerivedCache class
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys      # not needed when using as a package
+import unittest # unittest
+
+# path to directory containing DerivedCache class; use before deploying as package
+sys.path.append('../evtol')
+from cache import DerivedCache
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.cache import DerivedCache
+
+class TestDerivedCache(unittest.TestCase):
+  def setUp(self):
+    self.inputs = {'a': 1.0, 'b': 2.0}
+    self.calls = {'x': 0, 'y': 0}
+    self.cache = DerivedCache()
+
+  def read(self, name):
+    self.cache.note_input(name)
+    return self.inputs[name]
+
+  # x depends on a; y depends on x and b
+  def x(self):
+    return self.cache.get('x', self._calc_x)
+
+  def _calc_x(self):
+    self.calls['x'] += 1
+    return 10.0*self.read('a')
+
+  def y(self):
+    return self.cache.get('y', self._calc_y)
+
+  def _calc_y(self):
+    self.calls['y'] += 1
+    return self.x()+self.read('b')
+
+  def test_cache_hit(self):
+    self.assertEqual(self.y(), 12.0)
+    self.assertEqual(self.y(), 12.0)
+    self.assertEqual(self.calls, {'x': 1, 'y': 1})
+
+  def test_cache_invalidate_transitive(self):
+    self.y()
+    self.inputs['a'] = 3.0
+    self.cache.invalidate('a')
+    self.assertFalse(self.cache.is_cached('x'))
+    self.assertFalse(self.cache.is_cached('y'))
+    self.assertEqual(self.y(), 32.0)
+    self.assertEqual(self.calls, {'x': 2, 'y': 2})
+
+  def test_cache_invalidate_selective(self):
+    self.y()
+    self.inputs['b'] = 5.0
+    self.cache.invalidate('b')
+    self.assertTrue(self.cache.is_cached('x'))
+    self.assertEqual(self.y(), 15.0)
+    self.assertEqual(self.calls, {'x': 1, 'y': 2})
+
+  def test_cache_copy(self):
+    self.y()
+    other = self.cache.copy()
+    other.invalidate('b')
+    self.assertTrue(self.cache.is_cached('y'))
+    self.assertFalse(other.is_cached('y'))
+    self.assertTrue(other.is_cached('x'))
+
+  def test_cache_disabled(self):
+    self.cache.enabled = False
+    self.y()
+    self.y()
+    self.assertEqual(self.calls, {'x': 2, 'y': 2})
+    self.assertEqual(len(self.cache), 0)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,81 @@
+# test_charging.py
+#
+# Tests vectorized CC-CV charge time functions and CCCVChargeTable class
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import unittest    # unittest
+import numpy as np # random designs
+
+# path to directory containing charging functions; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from charging import calc_cccv_charge_time_hr, CCCVChargeTable, get_cccv_charge_table
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.charging import calc_cccv_charge_time_hr, CCCVChargeTable, get_cccv_charge_table
+
+class TestCharging(unittest.TestCase):
+  def setUp(self):
+    self.aircraft = Aircraft('../sample-inputs/test-all.json')
+    rng = np.random.default_rng(0)
+    n = 500
+    self.args = {
+      'E_pack_kwh': rng.uniform(5.0, 400.0, n),
+      'P_charger_ac_kw': rng.uniform(20.0, 400.0, n),
+      'eta_charger_dc': rng.uniform(0.8, 1.0, n),
+      'c_rate_max': rng.uniform(0.5, 4.0, n),
+      'v_pack_nom_v': rng.uniform(300.0, 900.0, n),
+      'i_term_c': rng.uniform(0.01, 0.3, n),
+      'soc_start': rng.uniform(-0.1, 1.1, n),
+      'soc_target': rng.uniform(0.5, 1.0, n),
+      'soc_cc_end': rng.uniform(0.6, 0.95, n),
+    }
+
+  def test_matches_scalar(self):
+    vec = calc_cccv_charge_time_hr(**self.args)
+    names = ('t_cc_hr', 't_cv_hr', 't_charge_hr', 'P_cc_kw', 'I_cc_A',
+             'I_term_A', 'k_ratio', 'dSOC_cc', 'dSOC_cv')
+    ref = {name: [] for name in names}
+    for i in range(len(self.args['E_pack_kwh'])):
+      out = self.aircraft._estimate_cccv_charge_time_hr(
+        **{name: float(value[i]) for name, value in self.args.items()}
+      )
+      # packs already at target return only the zero times
+      for name in names:
+        ref[name].append(out.get(name, vec[name][i]))
+    for name in names:
+      np.testing.assert_allclose(vec[name], ref[name], rtol=1e-12, atol=1e-15)
+
+  def test_dod_and_invalid(self):
+    vec = calc_cccv_charge_time_hr([100.0, 0.0, 100.0], [115.0, 115.0, -1.0], dod=0.6)
+    ref = self.aircraft._estimate_cccv_charge_time_hr(100.0, 115.0, dod=0.6)
+    self.assertAlmostEqual(vec['t_charge_hr'][0], ref['t_charge_hr'], places=12)
+    self.assertTrue(np.isnan(vec['t_charge_hr'][1]))
+    self.assertTrue(np.isnan(vec['t_charge_hr'][2]))
+
+  def test_table(self):
+    table = CCCVChargeTable(115.0, 10.0, 300.0, c_rate_max=1.5, i_term_c=0.05)
+    rng = np.random.default_rng(1)
+    # includes packs outside the tabulated range
+    E_pack_kwh = rng.uniform(5.0, 350.0, 1000)
+    soc_start = rng.uniform(0.0, 1.0, 1000)
+    exact = calc_cccv_charge_time_hr(E_pack_kwh, 115.0, c_rate_max=1.5,
+                                     i_term_c=0.05, soc_start=soc_start)
+    approx = table.t_charge_hr(E_pack_kwh, soc_start)
+    np.testing.assert_allclose(approx['t_cc_hr'], exact['t_cc_hr'], rtol=1e-12)
+    np.testing.assert_allclose(approx['t_charge_hr'], exact['t_charge_hr'], rtol=1e-4)
+
+  def test_table_cache(self):
+    table = get_cccv_charge_table(115.0, 10.0, 300.0)
+    self.assertIs(get_cccv_charge_table(115, 10, 300), table)
+    self.assertIsNot(get_cccv_charge_table(150.0, 10.0, 300.0), table)
+
+if __name__ == '__main__':
+  unittest.main()
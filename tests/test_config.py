@@ -0,0 +1,69 @@
+# test_config.py
+#
+# Tests config loading functions and from_dict constructors
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import json     # json parsing
+import os       # remove, stat, utime
+import sys      # not needed when using as a package
+import tempfile # NamedTemporaryFile
+import unittest # unittest
+
+# path to directory containing config module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from config import clear_config_cache, load_config
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.config import clear_config_cache, load_config
+
+class TestConfig(unittest.TestCase):
+  def setUp(self):
+    clear_config_cache()
+
+  def test_config_cache_hit(self):
+    ijson_a = load_config('../sample-inputs/test-all.json')
+    ijson_b = load_config('../sample-inputs/test-all.json')
+    self.assertIs(ijson_a, ijson_b)
+
+  def test_config_cache_reload_on_change(self):
+    with open('../sample-inputs/test-environ.json', 'r') as ifile:
+      ijson = json.load(ifile)
+    ofile = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+    try:
+      json.dump(ijson, ofile)
+      ofile.close()
+      self.assertEqual(load_config(ofile.name)['environ']['g_m_p_s2'], 9.81)
+      ijson['environ']['g_m_p_s2'] = 9.8
+      with open(ofile.name, 'w') as ifile:
+        json.dump(ijson, ifile)
+      stat = os.stat(ofile.name)
+      os.utime(ofile.name, ns=(stat.st_atime_ns, stat.st_mtime_ns+1000000000))
+      self.assertEqual(load_config(ofile.name)['environ']['g_m_p_s2'], 9.8)
+    finally:
+      os.remove(ofile.name)
+
+  def test_config_from_dict(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    ijson = load_config('../sample-inputs/test-all.json')
+    aircraft_from_dict = Aircraft.from_dict(ijson)
+    self.assertEqual(aircraft_from_dict.environ, aircraft.environ)
+    self.assertEqual(aircraft_from_dict.mission, aircraft.mission)
+    self.assertEqual(aircraft_from_dict.power, aircraft.power)
+    self.assertEqual(aircraft_from_dict.propulsion, aircraft.propulsion)
+    self.assertEqual(
+     aircraft_from_dict.max_takeoff_mass_kg, aircraft.max_takeoff_mass_kg
+    )
+    self.assertEqual(
+     aircraft_from_dict.total_mission_energy_kw_hr,
+     aircraft.total_mission_energy_kw_hr
+    )
+
+if __name__ == '__main__':
+  unittest.main()
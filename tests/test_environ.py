@@ -27,6 +27,46 @@ class TestEnviron(unittest.TestCase):
     self.assertEqual(environ.air_density_max_alt_kg_p_m3, 1.056)
     self.assertEqual(environ.kinematic_viscosity_sea_lvl_m2_p_s, 1.412e-5)
     self.assertEqual(environ.kinematic_viscosity_max_alt_m2_p_s, 1.281e-5)
+    self.assertEqual(environ.atmosphere, 'fixed')
+    self.assertEqual(environ.field_alt_m, None)
+    with self.assertRaises(ValueError):
+      environ.calc_air_density_kg_p_m3(1000.0)
+    # a fixed environ takes its air properties, not altitudes, as inputs
+    changed = environ.replace(air_density_sea_lvl_kg_p_m3=1.0)
+    self.assertEqual(changed.air_density_sea_lvl_kg_p_m3, 1.0)
+    for name in ('temp_offset_k', 'max_alt_m', 'atmosphere'):
+      with self.assertRaisesRegex(ValueError, name):
+        environ.replace(**{name: 20.0})
+
+  def test_environ_isa(self):
+    environ = Environ('../sample-inputs/test-environ-isa.json')
+    self.assertEqual(environ.atmosphere, 'isa')
+    self.assertEqual(environ.field_alt_m, 457.2)
+    self.assertEqual(environ.max_alt_m, 914.4)
+    self.assertEqual(environ.temp_offset_k, 15.0)
+    self.assertEqual(
+     environ.air_density_sea_lvl_kg_p_m3, environ.calc_air_density_kg_p_m3(457.2)
+    )
+    self.assertEqual(
+     environ.air_density_max_alt_kg_p_m3, environ.calc_air_density_kg_p_m3(914.4)
+    )
+    self.assertEqual(
+     environ.kinematic_viscosity_max_alt_m2_p_s,
+     environ.calc_kinematic_viscosity_m2_p_s(914.4)
+    )
+    self.assertEqual(environ.sound_speed_m_p_s, environ.calc_sound_speed_m_p_s(457.2))
+    # 15 K above the standard day at 1500 ft
+    self.assertAlmostEqual(environ.air_density_sea_lvl_kg_p_m3, 1.1136, places=4)
+    self.assertAlmostEqual(environ.sound_speed_m_p_s, 347.32, places=2)
+    # replace() recomputes the air properties
+    standard = environ.replace(temp_offset_k=0.0)
+    self.assertAlmostEqual(standard.air_density_sea_lvl_kg_p_m3, 1.1721, places=4)
+    self.assertEqual(standard, environ.replace(temp_offset_k=0.0))
+    self.assertNotEqual(standard, environ)
+    # the computed air properties are not inputs
+    for name in ('air_density_sea_lvl_kg_p_m3', 'sound_speed_m_p_s', 'atmosphere'):
+      with self.assertRaisesRegex(ValueError, name):
+        environ.replace(**{name: 1.0})
 
 if __name__ == '__main__':
   unittest.main()
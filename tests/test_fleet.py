@@ -0,0 +1,106 @@
+# test_fleet.py
+#
+# Tests simulate_fleet_ops function and FifoResource class
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys      # not needed when using as a package
+import unittest # unittest
+
+# path to directory containing fleet functions; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from fleet import simulate_fleet_ops
+from queuing import FifoResource, ResourcePool, simulate_daily_ops
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.fleet import simulate_fleet_ops
+#from ..evtol.queuing import FifoResource, ResourcePool, simulate_daily_ops
+
+class TestFleet(unittest.TestCase):
+  def test_fifo_resource(self):
+    res = FifoResource(1)
+    self.assertEqual(res.request(0.0, 'a'), 0)
+    self.assertIsNone(res.request(1.0, 'b'))
+    self.assertIsNone(res.request(2.0, 'c'))
+    self.assertEqual(res.queue_length(), 2)
+    self.assertEqual(res.release(3.0, 0), 'b')
+    self.assertEqual(res.release(4.0, 0), 'c')
+    self.assertIsNone(res.release(5.0, 0))
+    summary = res.summary(10.0)
+    self.assertEqual(summary['queue_length_max'], 2)
+    self.assertAlmostEqual(summary['utilization_avg'], 0.5)
+    # 'b' waits 2 hr, 'c' waits 2 hr
+    self.assertAlmostEqual(summary['wait_time_hr'], 4.0)
+    self.assertAlmostEqual(summary['queue_length_avg'], 0.4)
+
+  def test_single_aircraft_matches_daily_ops(self):
+    # ample chargers: one aircraft at one vertiport is the common case
+    for n_abu_pool in (1, 2):
+      fleet = simulate_fleet_ops(
+        1, 1, 4, n_abu_pool, 0.5, 0.2, 0.7,
+        t_attach_hr=0.1, t_return_abu_hr=0.15, t_charge_hr_abu=1.3,
+        daily_operation_hr=48.0
+      )
+      sim = simulate_daily_ops(0.5, 0.2, 0.7, 48.0, [{
+        "pool": ResourcePool(n_abu_pool),
+        "t_attach_offset_hr": 0.0,
+        "t_carry_start_hr": 0.0,
+        "t_attach_hr": 0.1,
+        "t_return_hr": 0.15,
+        "t_charge_hr": 1.3,
+        "events": ("abu_attach", "abu_detach", "abu_return_done",
+                   "abu_charge_start", "abu_charge_done"),
+        "log_abu_index": False,
+        "log_detach_on_aircraft": False,
+      }])
+      self.assertEqual(fleet['n_flights_completed'], sim['n_flights_completed'])
+      # the fleet also counts a final wait that ends without a flight
+      self.assertGreaterEqual(fleet['t_wait_abu_hr'], sim['t_wait_hr'][0]-1e-9)
+      self.assertEqual(fleet['t_wait_charger_aircraft_hr'], 0.0)
+
+  def test_charger_bottleneck(self):
+    # one charger serves four aircraft; it is never idle once queued
+    fleet = simulate_fleet_ops(
+      4, 1, 1, 0, 0.5, 0.0, 1.0, daily_operation_hr=10.0
+    )
+    self.assertEqual(fleet['n_flights_completed'], 13)
+    self.assertGreater(fleet['t_wait_charger_aircraft_hr'], 0.0)
+    self.assertEqual(fleet['charger_queue_length_max'], 3)
+    self.assertAlmostEqual(fleet['charger_utilization_avg'], 0.95)
+
+  def test_round_robin_vertiports(self):
+    fleet = simulate_fleet_ops(
+      12, 3, 2, 2, 0.4, 0.1, 0.6,
+      t_attach_hr=0.05, t_return_abu_hr=0.05, t_charge_hr_abu=0.5,
+      daily_operation_hr=24.0, record_timeline=True
+    )
+    n_departures = sum(vp['n_departures'] for vp in fleet['vertiports'])
+    n_arrivals = sum(vp['n_arrivals'] for vp in fleet['vertiports'])
+    self.assertEqual(n_departures, fleet['n_flights_completed'])
+    self.assertEqual(n_arrivals, fleet['n_flights_completed'])
+    self.assertEqual(sum(fleet['flights_per_aircraft']), fleet['n_flights_completed'])
+    departs = [e for e in fleet['timeline'] if e['event'] == 'aircraft_depart']
+    self.assertEqual(len(departs), fleet['n_flights_completed'])
+    self.assertTrue(all(e['t_hr']+0.4 <= 24.0 for e in departs))
+    self.assertTrue(all(0.0 <= vp['abu']['utilization_avg'] <= 1.0 for vp in fleet['vertiports']))
+
+  def test_aircraft_fleet_ops(self):
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    results = aircraft._evaluate_common_case_fleet_ops(
+      n_aircraft=8, n_vertiports=2, n_chargers_per_vertiport=8
+    )
+    base = aircraft._evaluate_common_case_baseline()
+    # with a charger per aircraft, each aircraft flies the baseline cycle
+    # until a flight can no longer arrive within the window
+    n_flights = int((24.0-base['t_flight_hr']) // base['t_cycle_hr'])+1
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0]['flights_per_aircraft'], [n_flights]*8)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,124 @@
+# test_hot_high.py
+#
+# Tests hot/high-day evaluation over altitude and temperature offset grids
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy        # deepcopy
+import csv         # reader
+import os          # path
+import sys         # not needed when using as a package
+import tempfile    # TemporaryDirectory
+import unittest    # unittest
+import numpy as np # arrays
+
+# path to directory containing hot_high module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from atmosphere import calc_segment_mid_height_m
+from batch import params_from_config
+from config import load_config
+from hot_high import calc_condition_grid, calc_profile_height_m, format_condition_table, \
+ scale_cruise_height, write_condition_csv
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.atmosphere import calc_segment_mid_height_m
+#from ..evtol.batch import params_from_config
+#from ..evtol.config import load_config
+#from ..evtol.hot_high import calc_condition_grid, calc_profile_height_m, format_condition_table, \
+# scale_cruise_height, write_condition_csv
+
+CFG = '../sample-inputs/test-all.json'
+CASE_STUDY = '../analysis/cfg-case-study/'
+CFG_3000_FT = CASE_STUDY+'high-altitude-3000-ft/archer-midnight/60-miles/Archer-Midnight-3000-60.json'
+CFG_1500_FT = CASE_STUDY+'low-altitude-1500-ft/archer-midnight/60-miles/Archer-Midnight-1500-60.json'
+CFG_HOT_HIGH = '../analysis/hot-high/cfg/archer-midnight-60.json'
+
+class TestHotHigh(unittest.TestCase):
+  def setUp(self):
+    self.ijson = load_config(CFG)
+    self.params = params_from_config(self.ijson)
+
+  def test_scale_cruise_height_matches_case_study(self):
+    high = params_from_config(load_config(CFG_3000_FT))
+    low = params_from_config(load_config(CFG_1500_FT))
+    # the fixed-environ configs do not state their 3000 ft cruise height
+    scaled = scale_cruise_height(high, 457.2, profile_height_m=914.4)
+    self.assertAlmostEqual(float(calc_segment_mid_height_m(scaled)['cruise']),
+                           0.5*calc_segment_mid_height_m(high)['cruise'])
+    for name, value in low.items():
+      # the case-study reserve cruise time is rounded to the second
+      self.assertAlmostEqual(float(scaled[name]), value, delta=1.0, msg=name)
+    # the ISA copy of the 3000 ft config states it as max_alt_m
+    isa = params_from_config(load_config(CFG_HOT_HIGH))
+    self.assertEqual(calc_profile_height_m(isa), 914.4)
+    scaled = scale_cruise_height(isa, 457.2)
+    for name, value in load_config(CFG_1500_FT)['mission'].items():
+      self.assertAlmostEqual(float(scaled[name]), value, delta=1.0, msg=name)
+
+  def test_grid_matches_aircraft(self):
+    result = calc_condition_grid(self.params, [200.0, 600.0], [-10.0, 0.0, 25.0],
+                                 field_alt_m=500.0)
+    self.assertEqual(result['max_takeoff_mass_kg'].shape, (2, 3))
+    self.assertTrue(result['converged'].all())
+    i, j = 1, 2
+    ijson = copy.deepcopy(self.ijson)
+    ijson['environ'] = {
+     'g_m_p_s2': self.ijson['environ']['g_m_p_s2'], 'atmosphere': 'isa',
+     'field_alt_m': 500.0, 'max_alt_m': 1100.0, 'temp_offset_k': 25.0
+    }
+    scaled = scale_cruise_height(self.params, 600.0)
+    for name in ijson['mission']:
+      ijson['mission'][name] = float(scaled[name])
+    mtow_kg = Aircraft.from_dict(ijson)._iterate_mtow()[0]
+    self.assertAlmostEqual(result['max_takeoff_mass_kg'][i, j], mtow_kg, delta=0.01)
+    ijson['aircraft']['max_takeoff_mass_kg'] = float(result['max_takeoff_mass_kg'][i, j])
+    aircraft = Aircraft.from_dict(ijson)
+    for name in ('single_epu_mass_kg', 'empty_mass_kg', 'battery_mass_kg',
+                 'total_mission_energy_kw_hr', 'hover_climb_avg_electric_power_kw',
+                 'cruise_avg_electric_power_kw'):
+      self.assertAlmostEqual(result[name][i, j], getattr(aircraft, name),
+                             delta=1e-9*abs(getattr(aircraft, name)), msg=name)
+
+  def test_hot_high_trends(self):
+    result = calc_condition_grid(self.params, [0.0, 1000.0, 2000.0], [0.0, 15.0, 30.0],
+                                 altitude='field')
+    np.testing.assert_allclose(result['max_alt_m']-result['field_alt_m'],
+                               calc_segment_mid_height_m(self.params)['cruise'])
+    isa = calc_condition_grid(params_from_config(load_config(CFG_HOT_HIGH)), [1000.0], [0.0],
+                              altitude='field')
+    self.assertAlmostEqual(float(isa['max_alt_m'][0, 0]), 1914.4)
+    # hover power grows on hotter days and at higher fields; the MTOW need
+    # not, as the thinner air also lowers the cruise drag
+    power_kw = result['hover_climb_avg_electric_power_kw']
+    self.assertTrue(np.all(np.diff(power_kw, axis=0) > 0.0))
+    self.assertTrue(np.all(np.diff(power_kw, axis=1) > 0.0))
+    self.assertGreater(result['single_epu_mass_kg'][2, 2], result['single_epu_mass_kg'][0, 0])
+    with self.assertRaises(ValueError):
+      calc_condition_grid(self.params, [0.0], [0.0], altitude='density')
+
+  def test_unreachable_height_and_output(self):
+    result = calc_condition_grid(self.params, [100.0, 1.0e5], [0.0])
+    self.assertEqual(list(result['converged'][:, 0]), [True, False])
+    self.assertLess(result['cruise_s'][1, 0], 0.0)
+    self.assertTrue(np.isnan(result['max_takeoff_mass_kg'][1, 0]))
+    table = format_condition_table(result, 'max_takeoff_mass_kg').split('\n')
+    self.assertEqual(len(table), 4)
+    self.assertIn('nan', table[3])
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'hot-high.csv')
+      write_condition_csv(result, path)
+      with open(path, 'r', newline='') as csv_file:
+        rows = list(csv.reader(csv_file))
+    self.assertEqual(rows[0], list(result))
+    self.assertEqual(len(rows), 3)
+    self.assertEqual(float(rows[1][rows[0].index('max_takeoff_mass_kg')]),
+                     result['max_takeoff_mass_kg'][0, 0])
+
+if __name__ == '__main__':
+  unittest.main()
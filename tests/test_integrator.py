@@ -0,0 +1,96 @@
+# test_integrator.py
+#
+# Tests time-stepped mission integration
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import unittest    # unittest
+import numpy as np # arrays
+
+# path to directory containing integrator module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import SEGMENTS, calc_batch_mission_energy, params_from_config
+from charging import calc_cccv_charge_time_hr
+from config import load_config
+from integrator import integrate_mission
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.batch import SEGMENTS, calc_batch_mission_energy, params_from_config
+#from ..evtol.charging import calc_cccv_charge_time_hr
+#from ..evtol.config import load_config
+#from ..evtol.integrator import integrate_mission
+
+CFG = '../sample-inputs/test-all.json'
+
+class TestIntegrator(unittest.TestCase):
+  def setUp(self):
+    self.params = params_from_config(load_config(CFG))
+
+  def test_constant_mass_matches_average_power(self):
+    result = integrate_mission(self.params)
+    expected = calc_batch_mission_energy(self.params)
+    for segment, duration_name in SEGMENTS:
+      self.assertAlmostEqual(result['segment_energy_kw_hr'][segment],
+                             float(expected[segment+'_energy_kw_hr']), places=9)
+    self.assertAlmostEqual(result['energy_kw_hr'][-1],
+                           float(expected['total_mission_energy_kw_hr']), places=9)
+    # the default pack is sized for the mission, ending at the inaccessible SOC
+    self.assertAlmostEqual(result['soc'][-1], self.params['batt_inaccessible_energy_frac'])
+    self.assertTrue(np.all(result['mass_kg'] == self.params['max_takeoff_mass_kg']))
+
+  def test_steps_fit_segments(self):
+    result = integrate_mission(self.params, dt_s=0.7)
+    total_s = sum(self.params[duration_name] for segment, duration_name in SEGMENTS)
+    self.assertAlmostEqual(result['t_s'][-1], total_s)
+    self.assertTrue(np.all(result['dt_s'] <= 0.7+1e-12))
+    np.testing.assert_allclose(np.diff(result['t_s']), result['dt_s'])
+    t_end_s = 0.0
+    for i, (segment, duration_name) in enumerate(SEGMENTS):
+      t_end_s += self.params[duration_name]
+      self.assertAlmostEqual(np.min(np.abs(result['t_s']-t_end_s)), 0.0, places=9)
+      self.assertEqual(result['segment'][np.searchsorted(result['t_s'], t_end_s)-1], i)
+    coarse = integrate_mission(self.params, dt_s=5.0)
+    self.assertAlmostEqual(coarse['energy_kw_hr'][-1], result['energy_kw_hr'][-1], places=9)
+
+  def test_mass_changes(self):
+    baseline = integrate_mission(self.params)
+    detach = integrate_mission(self.params, mass_changes=[('accel_climb', -150.0)])
+    t_detach_s = sum(self.params[duration_name] for segment, duration_name in SEGMENTS[:5])
+    i = np.searchsorted(detach['t_s'], t_detach_s)
+    self.assertEqual(detach['mass_kg'][i-1], self.params['max_takeoff_mass_kg'])
+    self.assertEqual(detach['mass_kg'][i], self.params['max_takeoff_mass_kg']-150.0)
+    self.assertAlmostEqual(detach['energy_kw_hr'][i], baseline['energy_kw_hr'][i], places=9)
+    self.assertLess(detach['energy_kw_hr'][-1], baseline['energy_kw_hr'][-1])
+    # the same change given in seconds, and a change inside a segment
+    timed = integrate_mission(self.params, mass_changes=[(t_detach_s, -150.0)])
+    self.assertAlmostEqual(timed['energy_kw_hr'][-1], detach['energy_kw_hr'][-1], places=9)
+    inside = integrate_mission(self.params, dt_s=1.0, mass_changes=[(400.05, -150.0)])
+    self.assertIn(400.05, inside['t_s'])
+    cruise = [segment for segment, duration_name in SEGMENTS].index('cruise')
+    self.assertLess(inside['segment_energy_kw_hr']['cruise'], baseline['segment_energy_kw_hr']['cruise'])
+    self.assertGreater(inside['segment_energy_kw_hr']['cruise'], detach['segment_energy_kw_hr']['cruise'])
+    self.assertEqual(inside['segment'][np.searchsorted(inside['t_s'], 400.05)], cruise)
+
+  def test_soc_feeds_charging(self):
+    result = integrate_mission(self.params, soc_start=0.9, E_pack_kwh=250.0)
+    self.assertAlmostEqual(result['soc'][-1], 0.9-result['energy_kw_hr'][-1]/250.0)
+    self.assertTrue(np.all(np.diff(result['soc']) <= 0.0))
+    charge = calc_cccv_charge_time_hr(250.0, 115.0, soc_start=result['soc'][-1], soc_target=0.9)
+    self.assertGreater(float(charge['t_charge_hr']), 0.0)
+
+  def test_aircraft_integrate_mission(self):
+    aircraft = Aircraft(CFG)
+    result = aircraft.integrate_mission(dt_s=1.0, include_reserve=False)
+    self.assertEqual(len(result['segments']), 11)
+    expected = sum(getattr(aircraft, segment+'_energy_kw_hr') for segment in result['segments'])
+    self.assertAlmostEqual(result['energy_kw_hr'][-1], expected, places=9)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,104 @@
+# test_montecarlo.py
+#
+# Tests Monte Carlo uncertainty propagation and streaming statistics
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import unittest    # unittest
+import numpy as np # arrays, random generators
+
+# path to directory containing montecarlo module; use before deploying as package
+sys.path.append('../evtol')
+from batch import params_from_config, solve_batch_mtow
+from config import load_config
+from montecarlo import QuantileSketch, RunningStats, iter_monte_carlo, run_monte_carlo
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.batch import params_from_config, solve_batch_mtow
+#from ..evtol.config import load_config
+#from ..evtol.montecarlo import QuantileSketch, RunningStats, iter_monte_carlo, run_monte_carlo
+
+CFG = '../sample-inputs/test-all.json'
+
+ABU_SEGMENTS = ['depart_taxi', 'hover_climb', 'trans_climb', 'depart_proc', 'accel_climb']
+
+# returns a single output of a batch; module-level so worker processes can use it
+def mtow_only(params):
+  return {'mtow_kg': solve_batch_mtow(params)['max_takeoff_mass_kg']}
+
+class TestMonteCarlo(unittest.TestCase):
+  def setUp(self):
+    self.params = params_from_config(load_config(CFG))
+    self.distributions = {
+      'batt_spec_energy_w_h_p_kg': ('normal', 232.5, 10.0),
+      'hover_power_effic': ('uniform', 0.65, 0.75),
+      'mass_margin_factor': ('triangular', 0.03, 0.05, 0.1)
+    }
+
+  def test_running_stats_match_numpy(self):
+    values = np.random.default_rng(3).lognormal(0.0, 0.5, 5000)
+    values[::97] = np.nan
+    stats = RunningStats()
+    for start in range(0, len(values), 700):
+      stats.update(values[start:start+700])
+    finite = values[np.isfinite(values)]
+    summary = stats.summary((0.1, 0.5, 0.9))
+    self.assertEqual(summary['count'], len(finite))
+    self.assertEqual(summary['invalid'], len(values)-len(finite))
+    self.assertAlmostEqual(summary['mean'], finite.mean(), places=12)
+    self.assertAlmostEqual(summary['std'], finite.std(ddof=1), places=12)
+    self.assertEqual(summary['min'], finite.min())
+    self.assertEqual(summary['max'], finite.max())
+    # below the sketch size quantiles are exact
+    for q, value in summary['quantiles'].items():
+      self.assertEqual(value, np.quantile(finite, q, method='inverted_cdf'))
+
+  def test_quantile_sketch_bounded(self):
+    values = np.random.default_rng(4).normal(size=400000)
+    sketch = QuantileSketch(1024)
+    for start in range(0, len(values), 10000):
+      sketch.add(values[start:start+10000])
+    self.assertEqual(len(sketch), len(values))
+    self.assertLess(sum(len(level) for level in sketch.levels), 1024*len(sketch.levels))
+    qs = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(qs))/len(values)
+    np.testing.assert_allclose(ranks, qs, atol=0.005)
+
+  def test_reproducible(self):
+    kwargs = {'n_samples': 600, 'seed': 7, 'batch_size': 200, 'evaluator': mtow_only}
+    serial = run_monte_carlo(self.params, self.distributions, **kwargs)
+    again = run_monte_carlo(self.params, self.distributions, **kwargs)
+    parallel = run_monte_carlo(self.params, self.distributions, n_workers=2, **kwargs)
+    self.assertEqual(serial, again)
+    self.assertEqual(serial, parallel)
+    other = run_monte_carlo(self.params, self.distributions, **dict(kwargs, seed=8))
+    self.assertNotEqual(serial['mtow_kg']['mean'], other['mtow_kg']['mean'])
+
+  def test_outputs_and_streaming(self):
+    updates = []
+    for n_done, stats in iter_monte_carlo(self.params, self.distributions, 250,
+                                          batch_size=100,
+                                          evaluator_kwargs={'abu_segments': ABU_SEGMENTS}):
+      updates.append((n_done, stats['mtow_converged_kg'].n+stats['mtow_converged_kg'].n_invalid))
+    self.assertEqual(updates, [(100, 100), (200, 200), (250, 250)])
+    summary = {name: running.summary() for name, running in stats.items()}
+    self.assertEqual(set(summary), {
+      'mtow_converged_kg', 'total_mission_energy_kw_hr', 'battery_mass_kg',
+      'abu_mtow_detached_kg', 'abu_mtow_reduction_kg', 'abu_aircraft_energy_saved_kwh'
+    })
+    self.assertGreater(summary['abu_mtow_reduction_kg']['min'], 0.0)
+    self.assertGreater(summary['abu_aircraft_energy_saved_kwh']['min'], 0.0)
+    mtow = summary['mtow_converged_kg']
+    self.assertTrue(mtow['min'] <= mtow['quantiles'][0.5] <= mtow['max'])
+
+  def test_unknown_distribution(self):
+    with self.assertRaises(ValueError):
+      run_monte_carlo(self.params, {'hover_power_effic': ('beta', 2.0, 5.0)}, 10)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,128 @@
+# test_optimize.py
+#
+# Tests complex-step design derivatives and the gradient-based design optimizer
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import sys         # not needed when using as a package
+import unittest    # unittest
+import numpy as np # random samples
+
+# path to directory containing optimize module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import calc_batch_masses, calc_batch_mission_energy, \
+ params_from_config, solve_batch_mtow
+from config import load_config
+from optimize import DESIGN_VARIABLES, calc_design_gradients, minimize_design
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.batch import calc_batch_masses, calc_batch_mission_energy, \
+# params_from_config, solve_batch_mtow
+#from ..evtol.config import load_config
+#from ..evtol.optimize import DESIGN_VARIABLES, calc_design_gradients, minimize_design
+
+CFG = '../sample-inputs/test-all.json'
+
+BOUNDS = {
+ 'wingspan_m': (8.0, 16.0),
+ 'rotor_diameter_m': (2.0, 4.0),
+ 'cruise_h_m_p_s': (40.0, 80.0),
+ 'batt_spec_energy_w_h_p_kg': (200.0, 400.0)
+}
+
+# sized outputs of a design, evaluated without derivatives
+def sized_outputs(params):
+  p = dict(params)
+  p['max_takeoff_mass_kg'] = float(solve_batch_mtow(p, tol=1e-10)['max_takeoff_mass_kg'])
+  return {
+   'max_takeoff_mass_kg': p['max_takeoff_mass_kg'],
+   'total_mission_energy_kw_hr':
+    float(calc_batch_mission_energy(p)['total_mission_energy_kw_hr']),
+   'empty_mass_kg': float(calc_batch_masses(p)['empty_mass_kg'])
+  }
+
+class TestOptimize(unittest.TestCase):
+  def setUp(self):
+    self.params = params_from_config(load_config(CFG))
+
+  def test_sized_gradients_match_finite_differences(self):
+    result = calc_design_gradients(self.params)
+    base = sized_outputs(self.params)
+    for output, (value, gradient) in result.items():
+      self.assertAlmostEqual(value, base[output], delta=1e-6*abs(base[output]))
+    for k, name in enumerate(DESIGN_VARIABLES):
+      h = 1e-5*self.params[name]
+      plus = sized_outputs(dict(self.params, **{name: self.params[name]+h}))
+      minus = sized_outputs(dict(self.params, **{name: self.params[name]-h}))
+      for output, (value, gradient) in result.items():
+        fd = (plus[output]-minus[output])/(2.0*h)
+        self.assertAlmostEqual(gradient[k], fd, delta=1e-5*max(1.0, abs(fd)), msg=(output, name))
+
+  def test_unsized_gradients(self):
+    result = calc_design_gradients(self.params, ('wingspan_m', 'max_takeoff_mass_kg'), sized=False)
+    self.assertNotIn('max_takeoff_mass_kg', result)
+    aircraft = Aircraft(CFG)
+    value, gradient = result['total_mission_energy_kw_hr']
+    self.assertAlmostEqual(value, aircraft.total_mission_energy_kw_hr, delta=1e-9*value)
+    h = 1e-3
+    plus = aircraft.with_overrides(max_takeoff_mass_kg=aircraft.max_takeoff_mass_kg+h)
+    minus = aircraft.with_overrides(max_takeoff_mass_kg=aircraft.max_takeoff_mass_kg-h)
+    fd = (plus.total_mission_energy_kw_hr-minus.total_mission_energy_kw_hr)/(2.0*h)
+    self.assertAlmostEqual(gradient[1], fd, delta=1e-6*abs(fd))
+    with self.assertRaises(ValueError):
+      calc_design_gradients(self.params, ('max_takeoff_mass_kg',))
+
+  def test_sized_mtow_matches_aircraft(self):
+    aircraft = Aircraft(CFG)
+    mtow_kg, history = aircraft._iterate_mtow()
+    value, gradient = calc_design_gradients(self.params)['max_takeoff_mass_kg']
+    self.assertAlmostEqual(value, mtow_kg, delta=1e-2)
+
+  def test_minimize_mtow(self):
+    result = minimize_design(self.params, BOUNDS)
+    self.assertTrue(result['converged'])
+    self.assertLess(result['evaluations'], 50)
+    self.assertEqual(result['params']['max_takeoff_mass_kg'], result['objective'])
+    # no sampled design is lighter than the optimum
+    rng = np.random.default_rng(0)
+    n = 2000
+    samples = dict(self.params)
+    for name, (low, high) in BOUNDS.items():
+      samples[name] = rng.uniform(low, high, n)
+    solution = solve_batch_mtow(samples)
+    sampled_kg = solution['max_takeoff_mass_kg'][solution['converged']]
+    self.assertLessEqual(result['objective'], np.min(sampled_kg))
+    # variables at a bound have a gradient pointing out of the box
+    for name, (low, high) in BOUNDS.items():
+      if result['x'][name] == low:
+        self.assertGreater(result['gradient'][name], 0.0)
+      elif result['x'][name] == high:
+        self.assertLess(result['gradient'][name], 0.0)
+      else:
+        self.assertLess(abs(result['gradient'][name]), 1e-2)
+
+  def test_maximize(self):
+    bounds = {'wingspan_m': (8.0, 16.0)}
+    result = minimize_design(self.params, bounds, 'empty_mass_kg', maximize=True)
+    self.assertEqual(result['x']['wingspan_m'], 16.0)
+    with self.assertRaises(ValueError):
+      minimize_design(self.params, bounds, 'battery_mass_kg')
+
+  def test_energy_objective_params(self):
+    bounds = {'wingspan_m': (8.0, 16.0), 'cruise_h_m_p_s': (40.0, 80.0)}
+    result = minimize_design(self.params, bounds, 'total_mission_energy_kw_hr')
+    # the returned design carries its sized MTOW, not the objective
+    p = result['params']
+    self.assertAlmostEqual(p['max_takeoff_mass_kg'], sized_outputs(p)['max_takeoff_mass_kg'],
+                           delta=1e-6)
+    self.assertAlmostEqual(sized_outputs(p)['total_mission_energy_kw_hr'], result['objective'],
+                           delta=1e-6)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,97 @@
+# test_payload_range.py
+#
+# Tests payload-range and range-endurance envelopes
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv         # reader
+import os          # path
+import sys         # not needed when using as a package
+import tempfile    # TemporaryDirectory
+import unittest    # unittest
+import numpy as np # arrays
+
+# path to directory containing payload_range module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from batch import params_from_config
+from config import load_config
+from payload_range import M_2_MI, calc_payload_range, calc_range_endurance, \
+ solve_max_cruise_s, write_envelope_csv
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.batch import params_from_config
+#from ..evtol.config import load_config
+#from ..evtol.payload_range import M_2_MI, calc_payload_range, calc_range_endurance, \
+# solve_max_cruise_s, write_envelope_csv
+
+CFG = '../sample-inputs/test-all.json'
+
+# converged MTOW of the scalar model at a cruise time
+def aircraft_mtow_kg(ijson, cruise_s):
+  ijson = dict(ijson, mission=dict(ijson['mission'], cruise_s=cruise_s))
+  return Aircraft.from_dict(ijson)._iterate_mtow()[0]
+
+class TestPayloadRange(unittest.TestCase):
+  def setUp(self):
+    self.ijson = load_config(CFG)
+    self.params = params_from_config(self.ijson)
+
+  def test_max_cruise_matches_aircraft(self):
+    result = solve_max_cruise_s(self.params, tol_s=0.01)
+    mtow_limit_kg = self.params['max_takeoff_mass_kg']
+    self.assertEqual(str(result['limit']), 'mtow')
+    cruise_s = float(result['cruise_s'])
+    self.assertLessEqual(aircraft_mtow_kg(self.ijson, cruise_s), mtow_limit_kg)
+    self.assertGreater(aircraft_mtow_kg(self.ijson, cruise_s+0.02), mtow_limit_kg)
+    self.assertAlmostEqual(float(result['max_takeoff_mass_kg']), mtow_limit_kg, delta=0.1)
+    self.assertAlmostEqual(float(result['mission_range_mi']),
+                           float(result['mission_range_m'])*M_2_MI)
+    self.assertAlmostEqual(float(result['cruise_range_m']),
+                           cruise_s*self.params['cruise_h_m_p_s'])
+
+  def test_payload_range_envelope(self):
+    payloads_kg = np.linspace(0.0, 1500.0, 301)
+    result = calc_payload_range(self.params, payloads_kg, batt_mass_limit_kg=1000.0)
+    limit = result['limit']
+    # battery-limited at light payloads, MTOW-limited at heavier ones, and no
+    # mission at all past the maximum payload
+    self.assertEqual(limit[0], 'battery')
+    self.assertEqual(limit[150], 'mtow')
+    self.assertEqual(limit[-1], 'infeasible')
+    self.assertTrue(np.all(np.isnan(result['cruise_s'][limit == 'infeasible'])))
+    feasible = limit != 'infeasible'
+    self.assertTrue(np.all(np.diff(result['mission_range_m'][feasible]) <= 1e-6))
+    self.assertTrue(np.all(result['battery_mass_kg'][feasible] <= 1000.0))
+    self.assertTrue(np.all(result['max_takeoff_mass_kg'][feasible] <=
+                           self.params['max_takeoff_mass_kg']))
+    np.testing.assert_allclose(result['battery_mass_kg'][limit == 'battery'], 1000.0, atol=0.2)
+    # each point equals a scalar solve
+    point = solve_max_cruise_s(dict(self.params, payload_kg=payloads_kg[150]),
+                               batt_mass_limit_kg=1000.0)
+    self.assertEqual(float(point['cruise_s']), result['cruise_s'][150])
+
+  def test_range_endurance_and_csv(self):
+    speeds_m_p_s = [40.0, 60.0, 80.0]
+    result = calc_range_endurance(self.params, speeds_m_p_s, cruise_s_max=600.0)
+    self.assertEqual(list(result['cruise_h_m_p_s']), speeds_m_p_s)
+    self.assertTrue(np.all(result['cruise_s'] <= 600.0))
+    np.testing.assert_allclose(result['endurance_s']-result['cruise_s'],
+                               result['endurance_s'][0]-result['cruise_s'][0])
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'range-endurance.csv')
+      write_envelope_csv(result, path)
+      with open(path, 'r', newline='') as csv_file:
+        rows = list(csv.reader(csv_file))
+    self.assertEqual(rows[0], list(result))
+    self.assertEqual(len(rows), 4)
+    self.assertEqual(float(rows[2][rows[0].index('cruise_s')]), result['cruise_s'][1])
+    self.assertEqual(rows[3][-1], str(result['limit'][2]))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,95 @@
+# test_power_profile.py
+#
+# Tests streaming power profile functions and Aircraft power profile methods
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv      # writer
+import io       # StringIO
+import os       # path
+import sys      # not needed when using as a package
+import tempfile # TemporaryDirectory
+import unittest # unittest
+
+# path to directory containing power profile functions; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from power_profile import iter_power_chunks, iter_power_samples, power_breakpoints, \
+ repeat_segments, write_power_profile_csv
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.power_profile import iter_power_chunks, iter_power_samples, power_breakpoints, \
+# repeat_segments, write_power_profile_csv
+
+SEGMENTS = [("a", 3.0, 10.0), ("b", 2.5, 20.0), ("c", 1.0, 5.0)]
+
+# per-second list building of the original power profile log script
+def build_lists(segments):
+  time_steps = []
+  avg_power = []
+  current_time = 0.0
+  for name, duration_s, power_kw in segments:
+    for t in range(int(duration_s)):
+      time_steps.append(current_time + t)
+      avg_power.append(power_kw)
+    current_time += duration_s
+  return time_steps, avg_power
+
+class TestPowerProfile(unittest.TestCase):
+  def setUp(self):
+    self.aircraft = Aircraft('../sample-inputs/test-all.json')
+
+  def test_samples_match_lists(self):
+    time_steps, avg_power = build_lists(SEGMENTS)
+    self.assertEqual(list(iter_power_samples(SEGMENTS)), list(zip(time_steps, avg_power)))
+
+  def test_resolution_and_chunks(self):
+    samples = list(iter_power_samples(SEGMENTS, dt_s=0.5))
+    self.assertEqual(len(samples), 6+5+2)
+    self.assertEqual(samples[6], (3.0, 20.0))
+    chunks = list(iter_power_chunks(SEGMENTS, dt_s=0.5, chunk_size=4))
+    self.assertEqual([len(t) for t, P in chunks], [4, 4, 4, 1])
+    self.assertEqual([s for t, P in chunks for s in zip(t.tolist(), P.tolist())], samples)
+    with self.assertRaises(ValueError):
+      next(iter_power_chunks(SEGMENTS, dt_s=0.0))
+
+  def test_breakpoints_and_repeat(self):
+    flights = list(repeat_segments(SEGMENTS, 2, t_ground_s=4.0))
+    self.assertEqual(len(flights), 7)
+    self.assertEqual(power_breakpoints(flights)[3], ("ground", 6.5, 10.5, 0.0))
+    self.assertEqual(power_breakpoints(flights)[-1], ("c", 16.0, 17.0, 5.0))
+
+  def test_csv_matches_csv_writer(self):
+    time_steps, avg_power = build_lists(SEGMENTS)
+    expected = io.StringIO(newline='')
+    writer = csv.writer(expected)
+    writer.writerow(['time', 'avg_electric_power_kw'])
+    for t, p in zip(time_steps, avg_power):
+      writer.writerow([f'{t:.3f}', f'{p:.6f}'])
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'profile.csv')
+      self.assertEqual(write_power_profile_csv(path, SEGMENTS, chunk_size=2), len(time_steps))
+      with open(path, newline='') as csv_file:
+        self.assertEqual(csv_file.read(), expected.getvalue())
+
+  def test_aircraft_profile(self):
+    segments = self.aircraft.power_profile_segments()
+    self.assertEqual(len(segments), 18)
+    self.assertEqual(segments[5], (
+      "cruise", self.aircraft.mission.cruise_s, self.aircraft.cruise_avg_electric_power_kw
+    ))
+    self.assertEqual(len(self.aircraft.power_profile_segments(include_reserve=False)), 11)
+    breakpoints = self.aircraft.power_profile_breakpoints(n_flights=3, t_ground_s=600.0)
+    self.assertEqual(len(breakpoints), 3*18+2)
+    total_s = sum(duration_s for name, duration_s, P_kw in segments)
+    self.assertAlmostEqual(breakpoints[-1][2], 3*total_s+2*600.0)
+    first = next(self.aircraft.iter_power_profile())
+    self.assertEqual(first, (0.0, self.aircraft.depart_taxi_avg_electric_power_kw))
+
+if __name__ == '__main__':
+  unittest.main()
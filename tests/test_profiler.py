@@ -0,0 +1,129 @@
+# test_profiler.py
+#
+# Tests CallProfiler class and Aircraft derived-quantity profiling
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import os        # path
+import sys       # not needed when using as a package
+import tempfile  # TemporaryDirectory
+import threading # Event, Thread
+import unittest  # unittest
+
+# path to directory containing profiler module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from profiler import CallProfiler, profile_calls
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.profiler import CallProfiler, profile_calls
+
+CFG = '../sample-inputs/test-all.json'
+
+class TestCallProfiler(unittest.TestCase):
+  def test_tree_and_stats(self):
+    profiler = CallProfiler()
+    t_outer = profiler.enter('a')
+    for i in range(2):
+      profiler.exit(profiler.enter('b'))
+    profiler.exit(t_outer)
+    profiler.exit(profiler.enter('b'))
+    node = profiler.root.children['a']
+    self.assertEqual(node.calls, 1)
+    self.assertEqual(node.children['b'].calls, 2)
+    self.assertGreaterEqual(node.total_s, node.children['b'].total_s)
+    stats = profiler.stats()
+    self.assertEqual(stats['b']['calls'], 3)
+    self.assertAlmostEqual(stats['a']['self_s']+stats['b']['total_s'],
+                           stats['a']['total_s']+profiler.root.children['b'].total_s)
+    self.assertEqual(profiler.format_tree().splitlines()[0].split()[0], 'a')
+    self.assertEqual(sorted(line.split()[0] for line in profiler.iter_folded()),
+                     ['a', 'a;b', 'b'])
+
+class TestAircraftProfile(unittest.TestCase):
+  def test_profile_mtow_iteration(self):
+    original = Aircraft._calc_total_drag_coef
+    expected = Aircraft(CFG)._iterate_mtow()
+    aircraft = Aircraft(CFG)
+    with aircraft.profile() as profiler:
+      self.assertIn('_calc_total_drag_coef', aircraft.__dict__)
+      result = aircraft._iterate_mtow()
+    # results are unchanged, the class is never patched and the wrappers are
+    # removed on exit
+    self.assertEqual(result, expected)
+    self.assertIs(Aircraft._calc_total_drag_coef, original)
+    self.assertFalse([name for name in vars(aircraft) if name.startswith('_calc_')])
+    self.assertNotIn('_profiling', aircraft.__dict__)
+    stats = profiler.stats()
+    self.assertGreaterEqual(stats['total_mission_energy_kw_hr']['calls'], len(result[1]))
+    self.assertIn('total_drag_coef', stats)
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'mtow.folded')
+      profiler.write_folded(path)
+      with open(path, 'r') as ifile:
+        lines = ifile.read().splitlines()
+    self.assertTrue(all(int(line.rsplit(' ', 1)[1]) >= 0 for line in lines))
+    self.assertTrue(any(line.startswith('empty_mass_kg;') for line in lines))
+
+  def test_profile_uncached_counts(self):
+    cached = Aircraft(CFG)
+    with cached.profile() as cached_profiler:
+      cached._calc_total_mission_energy_kw_hr()
+    uncached = Aircraft(CFG)
+    uncached._cache.enabled = False
+    with uncached.profile() as uncached_profiler:
+      uncached._calc_total_mission_energy_kw_hr()
+    self.assertEqual(cached_profiler.stats()['wing_area_m2']['calls'], 1)
+    self.assertGreater(uncached_profiler.stats()['wing_area_m2']['calls'], 1)
+
+  def test_profile_views_and_other_aircraft(self):
+    aircraft = Aircraft(CFG)
+    other = Aircraft(CFG)
+    with profile_calls(aircraft) as profiler:
+      view = aircraft.with_overrides(max_takeoff_mass_kg=3000.0)
+      self.assertEqual(view.empty_mass_kg, other.with_overrides(max_takeoff_mass_kg=3000.0).empty_mass_kg)
+      other.empty_mass_kg
+      self.assertNotIn('_calc_empty_mass_kg', other.__dict__)
+    self.assertEqual(profiler.stats()['empty_mass_kg']['calls'], 1)
+    self.assertNotIn('_calc_empty_mass_kg', view.__dict__)
+    # a view outlives the context unprofiled
+    view.with_overrides(max_takeoff_mass_kg=3100.0).empty_mass_kg
+    self.assertEqual(profiler.stats()['empty_mass_kg']['calls'], 1)
+
+  def test_profile_other_thread(self):
+    aircraft = Aircraft(CFG)
+    other = Aircraft(CFG)
+    entered = threading.Event()
+    done = threading.Event()
+    def run():
+      with profile_calls(aircraft) as profiler:
+        entered.set()
+        done.wait()
+    thread = threading.Thread(target=run)
+    thread.start()
+    entered.wait()
+    try:
+      # another thread's aircraft is not instrumented by an open context
+      self.assertIs(other._calc_empty_mass_kg.__func__, Aircraft._calc_empty_mass_kg)
+      other._iterate_mtow()
+    finally:
+      done.set()
+      thread.join()
+    self.assertIs(aircraft._calc_empty_mass_kg.__func__, Aircraft._calc_empty_mass_kg)
+
+  def test_profile_nested(self):
+    aircraft = Aircraft(CFG)
+    with profile_calls(aircraft) as outer:
+      with profile_calls(aircraft) as inner:
+        aircraft._calc_wing_area_m2()
+      aircraft._calc_wing_area_m2()
+    self.assertEqual(inner.stats()['wing_area_m2']['calls'], 1)
+    self.assertEqual(outer.stats()['wing_area_m2']['calls'], 1)
+
+if __name__ == '__main__':
+  unittest.main()
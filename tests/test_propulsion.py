@@ -29,5 +29,14 @@ class TestPropulsion(unittest.TestCase):
     self.assertEqual(propulsion.tip_mach, 0.4)
     self.assertEqual(propulsion.rotor_avg_cl, 0.625)
 
+  def test_propulsion_rotor_count_setter(self):
+    propulsion = Propulsion('../sample-inputs/test-propulsion.json')
+    disk_area_m2 = propulsion.disk_area_m2
+    propulsion.rotor_count = 8
+    self.assertEqual(propulsion.rotor_count, 8)
+    self.assertAlmostEqual(propulsion.disk_area_m2, disk_area_m2*8/12)
+    reference = Propulsion('../sample-inputs/test-propulsion.json').replace(rotor_count=8)
+    self.assertEqual(propulsion, reference)
+
 if __name__ == '__main__':
   unittest.main()
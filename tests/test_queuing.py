@@ -0,0 +1,142 @@
+# test_queuing.py
+#
+# Tests ResourcePool class and simulate_daily_ops function
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import random   # Random
+import sys      # not needed when using as a package
+import unittest # unittest
+
+# path to directory containing queuing functions; use before deploying as package
+sys.path.append('../evtol')
+from queuing import ResourcePool, simulate_daily_ops
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.queuing import ResourcePool, simulate_daily_ops
+
+# list-scan reference: lowest-index ready unit, else earliest available
+def reference_pick(available_times_hr, t_hr):
+  ready = [j for j in range(len(available_times_hr)) if available_times_hr[j] <= t_hr]
+  if len(ready) > 0:
+    return min(ready)
+  return min(range(len(available_times_hr)), key=lambda j: available_times_hr[j])
+
+# list-scan reference of the single-pool daily operations loop
+def reference_daily_ops(n_pool, t_flight_hr, t_charge_hr_main, t_attach_hr,
+                        t_return_hr, t_charge_hr_abu, t_ground_ops_hr,
+                        daily_operation_hr):
+  t_ready_hr = 0.0
+  available_times_hr = [0.0 for _ in range(n_pool)]
+  busy_time_hr = [0.0 for _ in range(n_pool)]
+  picks = []
+  t_wait_hr = 0.0
+  while True:
+    j = reference_pick(available_times_hr, t_ready_hr)
+    t_block_hr = available_times_hr[j]
+    t_depart_hr = max(t_ready_hr, t_block_hr)
+    if t_depart_hr+t_flight_hr > daily_operation_hr:
+      break
+    if t_block_hr > t_ready_hr:
+      t_wait_hr += (t_block_hr-t_ready_hr)
+    t_charge_done_hr = t_depart_hr+t_attach_hr+t_return_hr+t_charge_hr_abu
+    available_times_hr[j] = t_charge_done_hr
+    busy_time_hr[j] += (t_charge_done_hr-t_depart_hr)
+    picks.append(j)
+    t_ready_hr = t_depart_hr+t_flight_hr+t_ground_ops_hr+t_charge_hr_main
+  return picks, t_wait_hr, sum(busy_time_hr)
+
+def single_leg(pool, t_attach_hr, t_return_hr, t_charge_hr):
+  return {
+    "pool": pool,
+    "t_attach_offset_hr": 0.0,
+    "t_carry_start_hr": 0.0,
+    "t_attach_hr": t_attach_hr,
+    "t_return_hr": t_return_hr,
+    "t_charge_hr": t_charge_hr,
+    "events": ("abu_attach", "abu_detach", "abu_return_done",
+               "abu_charge_start", "abu_charge_done"),
+    "log_abu_index": True,
+    "log_detach_on_aircraft": False,
+  }
+
+class TestQueuing(unittest.TestCase):
+  def test_pool_selection_matches_list_scan(self):
+    rng = random.Random(0)
+    for n_units in (1, 2, 7, 64):
+      pool = ResourcePool(n_units)
+      available_times_hr = [0.0 for _ in range(n_units)]
+      t_hr = 0.0
+      for _ in range(500):
+        t_hr += rng.choice((0.0, 0.1, 0.25, 0.5))
+        j_ref = reference_pick(available_times_hr, t_hr)
+        j, t_available_hr = pool.acquire(t_hr)
+        self.assertEqual(j, j_ref)
+        self.assertEqual(t_available_hr, available_times_hr[j_ref])
+        # quantized durations produce ties between units
+        t_done_hr = max(t_hr, t_available_hr)+rng.choice((0.5, 1.0, 1.5))
+        available_times_hr[j] = t_done_hr
+        pool.release(j, max(t_hr, t_available_hr), t_done_hr)
+
+  def test_daily_ops_matches_list_scan(self):
+    rng = random.Random(1)
+    for n_pool in (1, 3, 50, 2000):
+      args = (
+        rng.uniform(0.2, 1.0), rng.uniform(0.0, 1.0), rng.uniform(0.05, 0.5),
+        rng.uniform(0.05, 0.5), rng.uniform(0.5, 3.0), rng.uniform(0.0, 0.3)
+      )
+      t_flight_hr, t_charge_hr_main, t_attach_hr, t_return_hr, \
+       t_charge_hr_abu, t_ground_ops_hr = args
+      daily_operation_hr = 24.0*14
+      picks_ref, t_wait_ref_hr, busy_ref_hr = reference_daily_ops(
+        n_pool, *args, daily_operation_hr
+      )
+      pool = ResourcePool(n_pool)
+      sim = simulate_daily_ops(
+        t_flight_hr, t_ground_ops_hr, t_charge_hr_main, daily_operation_hr,
+        [single_leg(pool, t_attach_hr, t_return_hr, t_charge_hr_abu)]
+      )
+      self.assertEqual(sim["n_flights_completed"], len(picks_ref))
+      departs = [
+        e for e in sim["aircraft_timeline"] if e["event"] == "aircraft_depart"
+      ]
+      self.assertEqual(len(departs), len(picks_ref))
+      picks = {}
+      for j, events in sim["timelines"][0].items():
+        for e in events:
+          self.assertEqual(e["abu_index"], j)
+          picks[e["flight_index"]] = j
+      self.assertEqual([picks[i] for i in range(len(picks_ref))], picks_ref)
+      self.assertAlmostEqual(sim["t_wait_hr"][0], t_wait_ref_hr, places=9)
+      self.assertAlmostEqual(pool.total_busy_time_hr(), busy_ref_hr, places=6)
+
+  def test_wait_attributed_to_bottleneck_leg(self):
+    # the second pool recharges slower, so every wait is charged to it
+    pool_a = ResourcePool(1)
+    pool_b = ResourcePool(1)
+    sim = simulate_daily_ops(
+      1.0, 0.0, 0.0, 10.0,
+      [single_leg(pool_a, 0.5, 0.5, 1.0), single_leg(pool_b, 0.5, 0.5, 2.0)]
+    )
+    self.assertEqual(sim["n_flights_completed"], 4)
+    self.assertEqual(sim["t_wait_hr"][0], 0.0)
+    self.assertAlmostEqual(sim["t_wait_hr"][1], 6.0)
+
+  def test_detach_logged_on_aircraft(self):
+    leg = single_leg(ResourcePool(2), 0.25, 0.5, 0.5)
+    leg["t_carry_start_hr"] = 0.25
+    leg["log_detach_on_aircraft"] = True
+    sim = simulate_daily_ops(1.0, 0.0, 0.0, 1.0, [leg])
+    self.assertEqual(
+      [e["event"] for e in sim["aircraft_timeline"]],
+      ["aircraft_depart", "abu_detach", "aircraft_arrive",
+       "aircraft_ground_ops_done", "aircraft_charge_done"]
+    )
+    self.assertAlmostEqual(sim["aircraft_timeline"][1]["t_hr"], 0.5)
+
+if __name__ == '__main__':
+  unittest.main()
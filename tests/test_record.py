@@ -0,0 +1,92 @@
+# test_record.py
+#
+# Tests Record base class of the Environ, Mission, Power and Propulsion records
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import copy     # copy, deepcopy
+import pickle   # dumps, loads
+import sys      # not needed when using as a package
+import unittest # unittest
+
+# path to directory containing record classes; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from environ import Environ
+from mission import Mission
+from power import Power
+from propulsion import Propulsion
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.environ import Environ
+#from ..evtol.mission import Mission
+#from ..evtol.power import Power
+#from ..evtol.propulsion import Propulsion
+
+CFG = '../sample-inputs/test-all.json'
+
+class TestRecord(unittest.TestCase):
+  def setUp(self):
+    self.records = [Environ(CFG), Mission(CFG), Power(CFG), Propulsion(CFG)]
+
+  def test_record_fields(self):
+    for record in self.records:
+      # every field is loaded, and there is no per-instance dict
+      self.assertFalse(hasattr(record, '__dict__'))
+      self.assertEqual(list(record.to_dict()), list(record.FIELDS))
+      for name in record.FIELDS:
+        self.assertEqual(getattr(record, name), record.to_dict()[name])
+
+  def test_record_hash(self):
+    for record in self.records:
+      other = type(record)(CFG)
+      self.assertEqual(record, other)
+      self.assertEqual(hash(record), hash(other))
+      for clone in (copy.copy(record), copy.deepcopy(record), pickle.loads(pickle.dumps(record))):
+        self.assertEqual(clone, record)
+    mission = self.records[1]
+    variants = {mission, mission.replace(cruise_s=900.0), mission.replace(cruise_s=900.0)}
+    self.assertEqual(len(variants), 2)
+    self.assertNotEqual(self.records[0], self.records[1])
+
+  def test_record_replace(self):
+    propulsion = self.records[3]
+    changed = propulsion.replace(rotor_count=8)
+    self.assertEqual(propulsion.rotor_count, 12)
+    self.assertEqual(changed.rotor_count, 8)
+    self.assertAlmostEqual(changed.disk_area_m2, propulsion.disk_area_m2*8/12)
+    self.assertEqual(changed.tip_mach, propulsion.tip_mach)
+    power = self.records[2].replace(batt_eol_capacity=0.5)
+    self.assertAlmostEqual(
+     power._batt_eol_usable_spec_energy_w_h_p_kg, 0.5*power._batt_bol_usable_spec_energy_w_h_p_kg
+    )
+    with self.assertRaises(ValueError):
+      propulsion.replace(disk_area_m2=1.0)
+    with self.assertRaises(AttributeError):
+      propulsion.tip_mach = 0.5
+
+  def test_record_shared_by_aircraft(self):
+    aircraft = Aircraft(CFG)
+    self.assertIs(aircraft.mission, aircraft.mission)
+    self.assertEqual(aircraft.mission, self.records[1])
+    # the mutable Propulsion record is handed out as a copy
+    power_kw = aircraft.hover_shaft_power_kw
+    view = aircraft.with_overrides()
+    for owner in (aircraft, view):
+      propulsion = owner.propulsion
+      propulsion.rotor_count = 2
+      self.assertEqual(propulsion.rotor_count, 2)
+    for owner in (aircraft, view):
+      self.assertEqual(owner.propulsion, self.records[3])
+      self.assertEqual(owner.hover_shaft_power_kw, power_kw)
+    changed = aircraft.with_overrides(propulsion=propulsion)
+    self.assertEqual(changed.propulsion.rotor_count, 2)
+    self.assertNotEqual(changed.hover_shaft_power_kw, power_kw)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,99 @@
+# test_sensitivity.py
+#
+# Tests Sobol and Morris global sensitivity analysis
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import os          # path
+import sys         # not needed when using as a package
+import tempfile    # TemporaryDirectory
+import unittest    # unittest
+import numpy as np # arrays
+
+# path to directory containing sensitivity module; use before deploying as package
+sys.path.append('../evtol')
+from batch import params_from_config
+from config import load_config
+from sensitivity import default_bounds, format_sensitivity_report, run_morris, \
+ run_sobol, top_inputs, write_sensitivity_report
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.batch import params_from_config
+#from ..evtol.config import load_config
+#from ..evtol.sensitivity import default_bounds, format_sensitivity_report, run_morris, \
+# run_sobol, top_inputs, write_sensitivity_report
+
+CFG = '../sample-inputs/test-all.json'
+
+# Ishigami function, whose Sobol indices are known analytically; module-level
+# so worker processes can use it
+def ishigami(params):
+  x1, x2, x3 = params['x1'], params['x2'], params['x3']
+  return {'y': np.sin(x1)+7.0*np.sin(x2)**2+0.1*x3**4*np.sin(x1)}
+
+# additive function with known elementary effects
+def linear(params):
+  return {'y': 2.0*params['x1']-3.0*params['x2']+0.0*params['x3']}
+
+ISHIGAMI_BOUNDS = {name: (-np.pi, np.pi) for name in ('x1', 'x2', 'x3')}
+ISHIGAMI_S1 = [0.3139, 0.4424, 0.0]
+ISHIGAMI_ST = [0.5576, 0.4424, 0.2437]
+
+class TestSensitivity(unittest.TestCase):
+  def test_sobol_ishigami(self):
+    result = run_sobol({}, ISHIGAMI_BOUNDS, n_base=8192, evaluator=ishigami)
+    self.assertEqual(result['n_evaluations'], 8192*5)
+    indices = result['outputs']['y']
+    np.testing.assert_allclose(indices['S1'], ISHIGAMI_S1, atol=0.05)
+    np.testing.assert_allclose(indices['ST'], ISHIGAMI_ST, atol=0.05)
+    self.assertTrue(np.all(indices['S1_low'] <= indices['S1']))
+    self.assertTrue(np.all(indices['ST'] <= indices['ST_high']))
+    self.assertEqual(top_inputs(result, 'y'), ['x1', 'x2', 'x3'])
+
+  def test_morris_linear(self):
+    bounds = {'x1': (0.0, 1.0), 'x2': (0.0, 2.0), 'x3': (0.0, 1.0)}
+    result = run_morris({}, bounds, n_trajectories=10, evaluator=linear)
+    self.assertEqual(result['n_evaluations'], 40)
+    indices = result['outputs']['y']
+    np.testing.assert_allclose(indices['mu'], [2.0, -6.0, 0.0], atol=1e-9)
+    np.testing.assert_allclose(indices['mu_star'], [2.0, 6.0, 0.0], atol=1e-9)
+    np.testing.assert_allclose(indices['sigma'], [0.0, 0.0, 0.0], atol=1e-9)
+    self.assertEqual(top_inputs(result, 'y', 2), ['x2', 'x1'])
+
+  def test_parallel_matches_serial(self):
+    kwargs = {'n_base': 64, 'evaluator': ishigami, 'batch_size': 50, 'seed': 3}
+    serial = run_sobol({}, ISHIGAMI_BOUNDS, **kwargs)
+    parallel = run_sobol({}, ISHIGAMI_BOUNDS, n_workers=2, **kwargs)
+    for name, values in serial['outputs']['y'].items():
+      np.testing.assert_array_equal(values, parallel['outputs']['y'][name])
+
+  def test_design_drivers_report(self):
+    params = params_from_config(load_config(CFG))
+    bounds = default_bounds(params, 0.1, ['max_takeoff_mass_kg', 'cruise_s',
+                                          'cruise_h_m_p_s', 'batt_spec_energy_w_h_p_kg'])
+    self.assertEqual(bounds['cruise_s'], (0.9*params['cruise_s'], 1.1*params['cruise_s']))
+    result = run_sobol(params, bounds, n_base=256)
+    self.assertEqual(set(result['outputs']),
+                     {'total_mission_energy_kw_hr', 'empty_mass_kg', 'n_feasible_flights'})
+    # empty mass depends on MTOW and cruise speed, not on cruise time or battery
+    empty = result['outputs']['empty_mass_kg']
+    self.assertEqual(top_inputs(result, 'empty_mass_kg', 2),
+                     ['max_takeoff_mass_kg', 'cruise_h_m_p_s'])
+    np.testing.assert_allclose(empty['ST'][[1, 3]], 0.0, atol=1e-12)
+    # battery specific energy does not change the mission energy at fixed MTOW
+    self.assertEqual(top_inputs(result, 'total_mission_energy_kw_hr')[-1],
+                     'batt_spec_energy_w_h_p_kg')
+    report = format_sensitivity_report(result, top=2)
+    self.assertIn('n_feasible_flights', report)
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'report.txt')
+      write_sensitivity_report(result, path)
+      with open(path, 'r') as ifile:
+        self.assertEqual(ifile.read(), format_sensitivity_report(result)+'\n')
+
+if __name__ == '__main__':
+  unittest.main()
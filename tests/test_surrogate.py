@@ -0,0 +1,101 @@
+# test_surrogate.py
+#
+# Tests Gaussian process surrogate fitting, queries, fallback and persistence
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import os          # path
+import sys         # not needed when using as a package
+import tempfile    # TemporaryDirectory
+import unittest    # unittest
+import numpy as np # arrays
+
+# path to directory containing surrogate module; use before deploying as package
+sys.path.append('../evtol')
+from surrogate import Surrogate, fit_surrogate
+from sweep import evaluate_point, latin_hypercube
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.surrogate import Surrogate, fit_surrogate
+#from ..evtol.sweep import evaluate_point, latin_hypercube
+
+CFG = '../sample-inputs/test-all.json'
+
+BOUNDS = {'wingspan_m': (10.0, 16.0), 'cruise_s': (300.0, 900.0)}
+
+DIVERT = '_evaluate_landing_safety_divert_baseline'
+DIVERT_BOUNDS = {'divert_distance_mi': (2.0, 15.0), 't_hover_s': (60.0, 300.0)}
+DIVERT_KWARGS = {'t_hover_descend_s': 30.0}
+
+def mission_energy(aircraft):
+  return aircraft.total_mission_energy_kw_hr
+
+class TestSurrogate(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.surrogate = fit_surrogate(CFG, BOUNDS, mission_energy, n_samples=32)
+
+  def test_accuracy(self):
+    for point in latin_hypercube(BOUNDS, 20, seed=3):
+      mean, std = self.surrogate.predict(point)
+      true_kw_hr = evaluate_point(CFG, point, mission_energy)
+      self.assertAlmostEqual(mean['value'], true_kw_hr, delta=1e-3*true_kw_hr)
+      self.assertLess(std['value'], 1e-3*true_kw_hr)
+    # training points are reproduced up to the kernel jitter
+    x = self.surrogate.low+self.surrogate.X[0]*(self.surrogate.high-self.surrogate.low)
+    mean, std = self.surrogate.predict_array(x)
+    self.assertAlmostEqual(mean[0, 0], self.surrogate.Y[0, 0], delta=1e-4*self.surrogate.Y[0, 0])
+    self.assertLess(std[0, 0], 1e-4*self.surrogate.Y[0, 0])
+
+  def test_query_and_fallback(self):
+    surrogate = fit_surrogate(CFG, BOUNDS, mission_energy, n_samples=32)
+    inside = {'wingspan_m': 13.0, 'cruise_s': 600.0}
+    self.assertAlmostEqual(surrogate.query(inside)['value'],
+                           evaluate_point(CFG, inside, mission_energy), delta=0.1)
+    self.assertEqual(surrogate.n_fallbacks, 0)
+    outside = {'wingspan_m': 13.0, 'cruise_s': 1200.0}
+    self.assertEqual(surrogate.query(outside)['value'],
+                     evaluate_point(CFG, outside, mission_energy))
+    self.assertEqual((surrogate.n_queries, surrogate.n_fallbacks), (2, 1))
+    # an error bound of zero sends every query to the true model
+    surrogate.rel_std_tol = 0.0
+    self.assertEqual(surrogate.query(inside)['value'], evaluate_point(CFG, inside, mission_energy))
+    self.assertEqual(surrogate.n_fallbacks, 2)
+
+  def test_method_outputs_and_persistence(self):
+    outputs = ('mtow_converged_kg', 'total_required_kwh')
+    surrogate = fit_surrogate(CFG, DIVERT_BOUNDS, DIVERT, outputs, n_samples=32,
+                              evaluator_kwargs=DIVERT_KWARGS)
+    point = {'divert_distance_mi': 8.0, 't_hover_s': 200.0}
+    result = evaluate_point(CFG, point, DIVERT, DIVERT_KWARGS)
+    mean, std = surrogate.predict(point)
+    for output in outputs:
+      self.assertAlmostEqual(mean[output], result[output], delta=1e-4*result[output])
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'divert.npz')
+      surrogate.save(path)
+      loaded = Surrogate.load(path)
+    self.assertEqual(loaded.evaluator, DIVERT)
+    self.assertEqual(loaded.predict(point), (mean, std))
+    outside = {'divert_distance_mi': 1.0, 't_hover_s': 200.0}
+    expected = evaluate_point(CFG, outside, DIVERT, DIVERT_KWARGS)
+    self.assertEqual(loaded.query(outside)['mtow_converged_kg'], expected['mtow_converged_kg'])
+
+  def test_load_without_evaluator(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'energy.npz')
+      self.surrogate.save(path)
+      loaded = Surrogate.load(path, evaluator=mission_energy)
+      self.assertIs(loaded.evaluator, mission_energy)
+      np.testing.assert_array_equal(loaded.length_scales, self.surrogate.length_scales)
+      loaded = Surrogate(loaded.names, loaded.low, loaded.high, loaded.outputs,
+                         loaded.X, loaded.Y, loaded.length_scales)
+    with self.assertRaises(ValueError):
+      loaded.query({'wingspan_m': 20.0, 'cruise_s': 600.0})
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,124 @@
+# test_sweep.py
+#
+# Tests design-space sweep points, parallel execution and result caching
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import os       # walk
+import sys      # not needed when using as a package
+import tempfile # TemporaryDirectory
+import unittest # unittest
+
+# path to directory containing sweep module; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from config import load_config
+from sweep import apply_point, grid, latin_hypercube, run_sweep
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.config import load_config
+#from ..evtol.sweep import apply_point, grid, latin_hypercube, run_sweep
+
+CFG = '../sample-inputs/test-all.json'
+
+ABU_SPEC = {
+  "n_abus": 1,
+  "E_ops_kwh_per_abu": 12.0,
+  "struct_frac": 0.20,
+  "integration_frac": 0.05,
+}
+
+# evaluator calls made in this process
+CALLS = []
+
+def mission_energy(aircraft, scale=1.0):
+  CALLS.append(aircraft.max_takeoff_mass_kg)
+  return scale*aircraft.total_mission_energy_kw_hr
+
+class TestSweep(unittest.TestCase):
+  def setUp(self):
+    CALLS.clear()
+
+  def test_grid(self):
+    points = grid({'a': [1, 2], 'b': [10.0, 20.0, 30.0]})
+    self.assertEqual(len(points), 6)
+    self.assertEqual(points[0], {'a': 1, 'b': 10.0})
+    self.assertEqual(points[1], {'a': 1, 'b': 20.0})
+    self.assertEqual(points[-1], {'a': 2, 'b': 30.0})
+
+  def test_latin_hypercube(self):
+    n = 20
+    points = latin_hypercube({'x': (0.0, 1.0), 'y': (100.0, 300.0)}, n, seed=1)
+    self.assertEqual(len(points), n)
+    self.assertEqual(sorted(int(p['x']*n) for p in points), list(range(n)))
+    self.assertEqual(sorted(int((p['y']-100.0)/200.0*n) for p in points), list(range(n)))
+    self.assertEqual(points, latin_hypercube({'x': (0.0, 1.0), 'y': (100.0, 300.0)}, n, seed=1))
+
+  def test_apply_point(self):
+    ijson = load_config(CFG)
+    kwargs = {'abu_spec': ABU_SPEC}
+    spec, point_kwargs = apply_point(ijson, kwargs, {
+      'cruise_s': 900.0, 'abu_spec.n_abus': 2, 'n_abu_pool': 3
+    })
+    self.assertEqual(spec['mission']['cruise_s'], 900.0)
+    self.assertIs(spec['power'], ijson['power'])
+    self.assertEqual(point_kwargs['abu_spec']['n_abus'], 2)
+    self.assertEqual(point_kwargs['n_abu_pool'], 3)
+    self.assertNotEqual(ijson['mission']['cruise_s'], 900.0)
+    self.assertEqual(ABU_SPEC['n_abus'], 1)
+    # sections missing from the specification hold no fields
+    ijson = {s: ijson[s] for s in ijson if s != 'power'}
+    spec, point_kwargs = apply_point(ijson, {}, {'cruise_s': 900.0, 'n_abu_pool': 3})
+    self.assertNotIn('power', spec)
+    self.assertEqual(point_kwargs, {'n_abu_pool': 3})
+    # with an evaluator, names it cannot take are rejected
+    with self.assertRaisesRegex(ValueError, "'cruse_s'"):
+      apply_point(ijson, {}, {'cruse_s': 900.0}, '_evaluate_extended_flight')
+    with self.assertRaisesRegex(ValueError, "'abu_specs.n_abus'"):
+      apply_point(ijson, {}, {'abu_specs.n_abus': 2}, '_evaluate_extended_flight')
+    with self.assertRaisesRegex(ValueError, "'n_abus'"):
+      run_sweep(CFG, [{'n_abus': 2}], mission_energy, n_workers=1)
+
+  def test_method_sweep(self):
+    points = grid({'abu_spec.n_abus': [1, 2], 'E_mission_kwh_per_abu_list': [[5.0], [25.0]]})
+    results = run_sweep(CFG, points, '_evaluate_extended_flight',
+                        evaluator_kwargs={'abu_spec': ABU_SPEC}, n_workers=1)
+    aircraft = Aircraft(CFG)
+    for point, result in zip(points, results):
+      abu_spec = dict(ABU_SPEC, n_abus=point['abu_spec.n_abus'])
+      expected = aircraft._evaluate_extended_flight(
+        point['E_mission_kwh_per_abu_list'], abu_spec=abu_spec
+      )
+      self.assertEqual(result, expected)
+
+  def test_parallel_matches_serial(self):
+    points = grid({'max_takeoff_mass_kg': [2500.0, 3000.0, 3500.0], 'cruise_s': [300.0, 900.0]})
+    serial = run_sweep(CFG, points, mission_energy, n_workers=1)
+    parallel = run_sweep(CFG, points, mission_energy, n_workers=2, chunk_size=2)
+    self.assertEqual(parallel, serial)
+    for point, result in zip(points, serial):
+      spec, kwargs = apply_point(load_config(CFG), {}, point)
+      self.assertEqual(result, Aircraft.from_dict(spec).total_mission_energy_kw_hr)
+
+  def test_cache(self):
+    points = grid({'max_takeoff_mass_kg': [2500.0, 3000.0]})
+    with tempfile.TemporaryDirectory() as tmp:
+      first = run_sweep(CFG, points, mission_energy, n_workers=1, cache_dir=tmp)
+      self.assertEqual(len(CALLS), 2)
+      again = run_sweep(CFG, points, mission_energy, n_workers=1, cache_dir=tmp)
+      self.assertEqual(again, first)
+      self.assertEqual(len(CALLS), 2)
+      more = grid({'max_takeoff_mass_kg': [2500.0, 3000.0, 3500.0]})
+      run_sweep(CFG, more, mission_energy, n_workers=1, cache_dir=tmp)
+      self.assertEqual(CALLS, [2500.0, 3000.0, 3500.0])
+      run_sweep(CFG, points, mission_energy, {'scale': 2.0}, n_workers=1, cache_dir=tmp)
+      self.assertEqual(len(CALLS), 5)
+      self.assertEqual(sum(len(files) for root, dirs, files in os.walk(tmp)), 5)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,130 @@
+# test_timeline.py
+#
+# Tests TimelineColumns class and columnar timeline output
+#
+# Written by First Last
+# Other contributors: Bradley Denby, Darshan Sarojini, Dylan Hogge, John Riris, Khoa Nguyen
+#
+# See the LICENSE file for the license
+
+# import Python modules
+import csv      # DictReader
+import os       # path
+import sys      # not needed when using as a package
+import tempfile # TemporaryDirectory
+import unittest # unittest
+
+# path to directory containing TimelineColumns class; use before deploying as package
+sys.path.append('../evtol')
+from aircraft import Aircraft
+from fleet import simulate_fleet_ops
+from queuing import ResourcePool, simulate_daily_ops
+from timeline import TimelineColumns
+
+# comment above and uncomment below when ready to deploy as package
+#from ..evtol.aircraft import Aircraft
+#from ..evtol.fleet import simulate_fleet_ops
+#from ..evtol.queuing import ResourcePool, simulate_daily_ops
+#from ..evtol.timeline import TimelineColumns
+
+try:
+  import pyarrow.parquet
+  HAVE_PYARROW = True
+except ImportError:
+  HAVE_PYARROW = False
+
+def legs(n_pool):
+  return [{
+    "pool": ResourcePool(n_pool),
+    "t_attach_offset_hr": 0.0,
+    "t_carry_start_hr": 0.1,
+    "t_attach_hr": 0.1,
+    "t_return_hr": 0.15,
+    "t_charge_hr": 1.3,
+    "events": ("abu_attached", "abu_detach", "abu_return_done",
+               "abu_charge_start", "abu_charge_done"),
+    "log_abu_index": True,
+    "log_detach_on_aircraft": True,
+  }]
+
+# flatten {unit index: event list} into a list ordered like TimelineColumns
+def flatten_by_flight(timelines):
+  rows = [entry for events in timelines.values() for entry in events]
+  return sorted(rows, key=lambda e: e["flight_index"])
+
+class TestTimeline(unittest.TestCase):
+  def setUp(self):
+    self.tl = TimelineColumns(('flight_index', 'abu_index'), ('a', 'b'))
+    self.tl.append(0.5, 0, 0, 3)
+    self.tl.append(1.5, self.tl.event_code('c'), 1, None)
+
+  def test_columns(self):
+    self.assertEqual(len(self.tl), 2)
+    self.assertEqual(self.tl.event_names, ['a', 'b', 'c'])
+    arr = self.tl.to_numpy()
+    self.assertEqual(arr.dtype.names, ('t_hr', 'event', 'flight_index', 'abu_index'))
+    self.assertEqual(arr['event'].tolist(), [0, 2])
+    self.assertEqual(arr['abu_index'].tolist(), [3, -1])
+    self.assertEqual(self.tl.to_dicts(), [
+      {"t_hr": 0.5, "event": "a", "flight_index": 0, "abu_index": 3},
+      {"t_hr": 1.5, "event": "c", "flight_index": 1},
+    ])
+
+  def test_export(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path_csv = os.path.join(tmp, 'tl.csv')
+      self.tl.write_csv(path_csv, extra={"candidate_name": "x"})
+      with open(path_csv, newline='') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+      self.assertEqual(rows[1], {
+        "candidate_name": "x", "t_hr": "1.500000", "event": "c",
+        "flight_index": "1", "abu_index": ""
+      })
+      path_npz = os.path.join(tmp, 'tl.npz')
+      self.tl.write_npz(path_npz)
+      tl = TimelineColumns.read_npz(path_npz)
+      self.assertEqual(tl.to_dicts(), self.tl.to_dicts())
+
+  @unittest.skipUnless(HAVE_PYARROW, 'pyarrow not installed')
+  def test_parquet(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'tl.parquet')
+      self.tl.write_parquet(path)
+      table = pyarrow.parquet.read_table(path)
+      self.assertEqual(table.column('abu_index').to_pylist(), [3, None])
+
+  def test_daily_ops_columns_match_dicts(self):
+    dicts = simulate_daily_ops(0.5, 0.2, 0.7, 72.0, legs(2))
+    cols = simulate_daily_ops(0.5, 0.2, 0.7, 72.0, legs(2), timeline_format="columns")
+    self.assertEqual(cols["aircraft_timeline"].to_dicts(), dicts["aircraft_timeline"])
+    self.assertEqual(cols["timelines"][0].to_dicts(), flatten_by_flight(dicts["timelines"][0]))
+
+  def test_fleet_columns_match_dicts(self):
+    args = (6, 2, 2, 2, 0.4, 0.1, 0.6, 0.05, 0.05, 0.5, 24.0)
+    dicts = simulate_fleet_ops(*args, record_timeline=True)
+    cols = simulate_fleet_ops(*args, record_timeline=True, timeline_format="columns")
+    self.assertEqual(cols["timeline"].to_dicts(), dicts["timeline"])
+
+  def test_aircraft_columns_match_dicts(self):
+    candidates = [{
+      "name": "after_accel_climb",
+      "segments": ["depart_taxi","hover_climb","trans_climb","depart_proc","accel_climb"]
+    }]
+    aircraft = Aircraft('../sample-inputs/test-all.json')
+    dicts = aircraft._evaluate_common_case_abu_combined_flight_overlap_charging_queuing(
+      candidates, [10.0], n_abu_pool_takeoff=2
+    )
+    cols = aircraft._evaluate_common_case_abu_combined_flight_overlap_charging_queuing(
+      candidates, [10.0], n_abu_pool_takeoff=2, timeline_format="columns"
+    )
+    self.assertEqual(cols[0]["n_flights_completed"], dicts[0]["n_flights_completed"])
+    self.assertEqual(cols[0]["aircraft_timeline"].to_dicts(), dicts[0]["aircraft_timeline"])
+    # dict ABU timelines of this evaluator carry no abu_index
+    for name in ("takeoff_abu_timelines", "cruise_abu_timelines"):
+      rows = cols[0][name].to_dicts()
+      for row in rows:
+        del row["abu_index"]
+      self.assertEqual(rows, flatten_by_flight(dicts[0][name]))
+
+if __name__ == '__main__':
+  unittest.main()